@@ -13,6 +13,7 @@ from pathlib import Path
 from core.client import create_client
 from linear_updater import (
     LinearTaskState,
+    flush_linear_updates,
     is_linear_enabled,
     linear_build_complete,
     linear_task_started,
@@ -25,6 +26,7 @@ from progress import (
     count_subtasks_detailed,
     get_current_phase,
     get_next_subtask,
+    get_parallel_subtasks,
     is_build_complete,
     print_build_complete_banner,
     print_progress_summary,
@@ -58,6 +60,7 @@ from ui import (
 
 from .base import AUTO_CONTINUE_DELAY_SECONDS, HUMAN_INTERVENTION_FILE
 from .memory_manager import debug_memory_system_status, get_graphiti_context
+from .parallel import ParallelSubtaskScheduler, get_max_parallel_subtasks
 from .session import post_session_processing, run_agent_session
 from .utils import (
     find_phase_for_subtask,
@@ -69,6 +72,98 @@ from .utils import (
 
 logger = logging.getLogger(__name__)
 
+# Failed attempts after which a subtask is marked as stuck
+MAX_SUBTASK_ATTEMPTS = 3
+
+
+async def build_subtask_prompt(
+    spec_dir: Path,
+    project_dir: Path,
+    subtask: dict,
+    recovery_manager: RecoveryManager,
+) -> str:
+    """
+    Build the coder prompt for a subtask.
+
+    Args:
+        spec_dir: Spec directory the coder works from
+        project_dir: Directory the coder works in
+        subtask: The subtask to implement
+        recovery_manager: Recovery manager (for attempt count and hints)
+
+    Returns:
+        Subtask prompt with file and Graphiti memory context appended
+    """
+    subtask_id = subtask.get("id")
+
+    # The prompt's recovery context reads memory/attempt_history.json
+    recovery_manager.flush()
+
+    # Get attempt count for recovery context
+    attempt_count = recovery_manager.get_attempt_count(subtask_id)
+    recovery_hints = (
+        recovery_manager.get_recovery_hints(subtask_id) if attempt_count > 0 else None
+    )
+
+    # Find the phase for this subtask
+    plan = load_implementation_plan(spec_dir)
+    phase = find_phase_for_subtask(plan, subtask_id) if plan else {}
+
+    # Generate focused, minimal prompt for this subtask
+    prompt = generate_subtask_prompt(
+        spec_dir=spec_dir,
+        project_dir=project_dir,
+        subtask=subtask,
+        phase=phase or {},
+        attempt_count=attempt_count,
+        recovery_hints=recovery_hints,
+    )
+
+    # Load and append relevant file context
+    context = load_subtask_context(spec_dir, project_dir, subtask)
+    if context.get("patterns") or context.get("files_to_modify"):
+        prompt += "\n\n" + format_context_for_prompt(context)
+
+    # Retrieve and append Graphiti memory context (if enabled)
+    graphiti_context = await get_graphiti_context(spec_dir, project_dir, subtask)
+    if graphiti_context:
+        prompt += "\n\n" + graphiti_context
+        print_status("Graphiti memory context loaded", "success")
+
+    return prompt
+
+
+async def check_stuck_subtask(
+    spec_dir: Path,
+    subtask_id: str,
+    success: bool,
+    recovery_manager: RecoveryManager,
+    linear_enabled: bool,
+) -> None:
+    """Mark a subtask as stuck after too many failed attempts."""
+    attempt_count = recovery_manager.get_attempt_count(subtask_id)
+    if success or attempt_count < MAX_SUBTASK_ATTEMPTS:
+        return
+
+    recovery_manager.mark_subtask_stuck(
+        subtask_id, f"Failed after {attempt_count} attempts"
+    )
+    print()
+    print_status(
+        f"Subtask {subtask_id} marked as STUCK after {attempt_count} attempts",
+        "error",
+    )
+    print(muted("Consider: manual intervention or skipping this subtask"))
+
+    # Record stuck subtask in Linear (if enabled)
+    if linear_enabled:
+        await linear_task_stuck(
+            spec_dir=spec_dir,
+            subtask_id=subtask_id,
+            attempt_count=attempt_count,
+        )
+        print_status("Linear notified of stuck subtask", "info")
+
 
 async def run_autonomous_agent(
     project_dir: Path,
@@ -84,6 +179,10 @@ async def run_autonomous_agent(
     The agent can use subagents (via Task tool) for parallel execution if needed.
     This is decided by the agent itself based on the task complexity.
 
+    The pending subtasks of a phase marked ``parallel_safe`` are run as
+    concurrent sessions, each in its own worktree (see agents.parallel);
+    MAX_PARALLEL_SUBTASKS caps how many run at once.
+
     Args:
         project_dir: Root directory for the project
         spec_dir: Directory containing the spec (auto-claude/specs/001-name/)
@@ -130,6 +229,25 @@ async def run_autonomous_agent(
             print_status("Linear enabled but no task created for this spec", "warning")
             print()
 
+    linear_is_enabled = linear_task is not None and linear_task.task_id is not None
+
+    # Scheduler for the subtasks of parallel-safe phases
+    max_parallel_subtasks = get_max_parallel_subtasks()
+    scheduler = ParallelSubtaskScheduler(
+        project_dir=project_dir,
+        spec_dir=spec_dir,
+        model=model,
+        recovery_manager=recovery_manager,
+        build_prompt=lambda wt_spec_dir, wt_dir, subtask: build_subtask_prompt(
+            wt_spec_dir, wt_dir, subtask, recovery_manager
+        ),
+        max_parallel=max_parallel_subtasks,
+        verbose=verbose,
+        linear_enabled=linear_is_enabled,
+        status_manager=status_manager,
+        source_spec_dir=source_spec_dir,
+    )
+
     # Check if this is a fresh start or continuation
     first_run = is_first_run(spec_dir)
 
@@ -156,6 +274,24 @@ async def run_autonomous_agent(
 
         return False, result.errors
 
+    async def _complete_build() -> None:
+        # Don't emit COMPLETE here - subtasks are done but QA hasn't run yet
+        # QA loop will emit COMPLETE after actual approval
+        print_build_complete_banner(spec_dir)
+        status_manager.update(state=BuildState.COMPLETE)
+
+        if task_logger:
+            task_logger.end_phase(
+                LogPhase.CODING,
+                success=True,
+                message="All subtasks completed successfully",
+            )
+
+        if linear_task and linear_task.task_id:
+            await linear_build_complete(spec_dir)
+            await flush_linear_updates(spec_dir)
+            print_status("Linear notified: build complete, ready for QA", "success")
+
     if first_run:
         print_status(
             "Fresh start - will use Planner Agent to create implementation plan", "info"
@@ -247,6 +383,47 @@ async def run_autonomous_agent(
         subtask_id = next_subtask.get("id") if next_subtask else None
         phase_name = next_subtask.get("phase_name") if next_subtask else None
 
+        # Run the pending subtasks of a parallel-safe phase concurrently
+        # (one session number per subtask, so max_iterations still applies)
+        if next_subtask and not is_planning_phase and max_parallel_subtasks > 1:
+            remaining = (
+                max_iterations - iteration + 1
+                if max_iterations
+                else max_parallel_subtasks
+            )
+            batch = get_parallel_subtasks(
+                spec_dir, min(max_parallel_subtasks, remaining)
+            )
+            results = (
+                await scheduler.run_batch(batch, first_session=iteration)
+                if len(batch) > 1
+                else None
+            )
+            if results is not None:
+                status_manager.update_session(iteration)
+                iteration += len(batch) - 1
+
+                for batch_subtask_id, success in results:
+                    await check_stuck_subtask(
+                        spec_dir,
+                        batch_subtask_id,
+                        success,
+                        recovery_manager,
+                        linear_is_enabled,
+                    )
+                if linear_is_enabled:
+                    await flush_linear_updates(spec_dir)
+
+                if is_build_complete(spec_dir):
+                    await _complete_build()
+                    break
+
+                print_progress_summary(spec_dir)
+                status_manager.update(state=BuildState.BUILDING)
+                print("\nPreparing next session...\n")
+                await asyncio.sleep(1)
+                continue
+
         # Update status for this session
         status_manager.update_session(iteration)
         if phase_name:
@@ -370,40 +547,10 @@ async def run_autonomous_agent(
                     print("No pending subtasks found - build may be complete!")
                     break
 
-            # Get attempt count for recovery context
-            attempt_count = recovery_manager.get_attempt_count(subtask_id)
-            recovery_hints = (
-                recovery_manager.get_recovery_hints(subtask_id)
-                if attempt_count > 0
-                else None
+            prompt = await build_subtask_prompt(
+                spec_dir, project_dir, next_subtask, recovery_manager
             )
-
-            # Find the phase for this subtask
-            plan = load_implementation_plan(spec_dir)
-            phase = find_phase_for_subtask(plan, subtask_id) if plan else {}
-
-            # Generate focused, minimal prompt for this subtask
-            prompt = generate_subtask_prompt(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask=next_subtask,
-                phase=phase or {},
-                attempt_count=attempt_count,
-                recovery_hints=recovery_hints,
-            )
-
-            # Load and append relevant file context
-            context = load_subtask_context(spec_dir, project_dir, next_subtask)
-            if context.get("patterns") or context.get("files_to_modify"):
-                prompt += "\n\n" + format_context_for_prompt(context)
-
-            # Retrieve and append Graphiti memory context (if enabled)
-            graphiti_context = await get_graphiti_context(
-                spec_dir, project_dir, next_subtask
-            )
-            if graphiti_context:
-                prompt += "\n\n" + graphiti_context
-                print_status("Graphiti memory context loaded", "success")
+            attempt_count = recovery_manager.get_attempt_count(subtask_id)
 
             # Show what we're working on
             print(f"Working on: {highlight(subtask_id)}")
@@ -463,9 +610,6 @@ async def run_autonomous_agent(
         # === POST-SESSION PROCESSING (100% reliable) ===
         # Only run post-session processing for coding sessions.
         if subtask_id and current_log_phase == LogPhase.CODING:
-            linear_is_enabled = (
-                linear_task is not None and linear_task.task_id is not None
-            )
             success = await post_session_processing(
                 spec_dir=spec_dir,
                 project_dir=project_dir,
@@ -480,26 +624,14 @@ async def run_autonomous_agent(
             )
 
             # Check for stuck subtasks
-            attempt_count = recovery_manager.get_attempt_count(subtask_id)
-            if not success and attempt_count >= 3:
-                recovery_manager.mark_subtask_stuck(
-                    subtask_id, f"Failed after {attempt_count} attempts"
-                )
-                print()
-                print_status(
-                    f"Subtask {subtask_id} marked as STUCK after {attempt_count} attempts",
-                    "error",
-                )
-                print(muted("Consider: manual intervention or skipping this subtask"))
+            await check_stuck_subtask(
+                spec_dir, subtask_id, success, recovery_manager, linear_is_enabled
+            )
+            recovery_manager.flush()
 
-                # Record stuck subtask in Linear (if enabled)
-                if linear_is_enabled:
-                    await linear_task_stuck(
-                        spec_dir=spec_dir,
-                        subtask_id=subtask_id,
-                        attempt_count=attempt_count,
-                    )
-                    print_status("Linear notified of stuck subtask", "info")
+            # Send this session's batched Linear updates
+            if linear_is_enabled:
+                await flush_linear_updates(spec_dir)
         elif plan_validated and source_spec_dir:
             # After planning phase, sync the newly created implementation plan back to source
             if sync_spec_to_source(spec_dir, source_spec_dir):
@@ -507,22 +639,7 @@ async def run_autonomous_agent(
 
         # Handle session status
         if status == "complete":
-            # Don't emit COMPLETE here - subtasks are done but QA hasn't run yet
-            # QA loop will emit COMPLETE after actual approval
-            print_build_complete_banner(spec_dir)
-            status_manager.update(state=BuildState.COMPLETE)
-
-            if task_logger:
-                task_logger.end_phase(
-                    LogPhase.CODING,
-                    success=True,
-                    message="All subtasks completed successfully",
-                )
-
-            if linear_task and linear_task.task_id:
-                await linear_build_complete(spec_dir)
-                print_status("Linear notified: build complete, ready for QA", "success")
-
+            await _complete_build()
             break
 
         elif status == "continue":
@@ -0,0 +1,415 @@
+"""
+Parallel Subtask Scheduler
+==========================
+
+Runs the ready subtasks of a ``parallel_safe`` phase as concurrent coder
+sessions, each in its own git worktree.
+
+Every subtask's worktree is created from the same base commit and gets its
+own copy of the spec directory. Once all sessions of a batch have finished,
+their commits are cherry-picked back into the project one subtask at a time,
+in plan order (not completion order), so the resulting history is
+deterministic. After each merge the subtask's plan entry and the memory its
+session recorded (codebase map, gotchas, patterns, session insights) are
+copied back and the usual post-session processing runs, so plan status, recovery tracking and
+Linear updates behave exactly as for a serial session. A subtask whose
+changes conflict with an earlier one in the batch is recorded as a failed
+attempt and left pending, to be retried against the merged result.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from core.client import create_client
+from core.file_utils import write_json_atomic
+from core.git_executable import run_git
+from core.workspace.setup import (
+    copy_env_files_to_worktree,
+    copy_spec_to_worktree,
+    symlink_node_modules_to_worktree,
+)
+from phase_config import get_phase_model, get_phase_thinking_budget
+from recovery import RecoveryManager
+from task_logger import LogPhase
+from ui import StatusManager, highlight, muted, print_status
+
+from .session import post_session_processing, run_agent_session
+from .utils import (
+    find_subtask_in_plan,
+    get_commit_count,
+    get_latest_commit,
+    load_implementation_plan,
+)
+
+logger = logging.getLogger(__name__)
+
+# Default number of subtask sessions run at the same time
+DEFAULT_MAX_PARALLEL_SUBTASKS = 3
+
+# Where subtask worktrees are created, relative to the project directory
+SUBTASK_WORKTREES_DIR = Path(".auto-claude") / "worktrees" / "subtasks"
+
+# Builds the prompt for a subtask: (spec_dir, project_dir, subtask) -> prompt
+PromptBuilder = Callable[[Path, Path, dict], Awaitable[str]]
+
+
+def get_max_parallel_subtasks() -> int:
+    """
+    Get the concurrency cap for parallel-safe phases.
+
+    Read from MAX_PARALLEL_SUBTASKS; 1 disables parallel sessions.
+    """
+    value = os.environ.get("MAX_PARALLEL_SUBTASKS", "")
+    try:
+        return max(1, int(value)) if value else DEFAULT_MAX_PARALLEL_SUBTASKS
+    except ValueError:
+        logger.warning(f"Invalid MAX_PARALLEL_SUBTASKS value: {value!r}")
+        return DEFAULT_MAX_PARALLEL_SUBTASKS
+
+
+@dataclass
+class SubtaskRun:
+    """One subtask session of a parallel batch."""
+
+    subtask: dict
+    session_num: int
+    worktree: Path
+    spec_dir: Path | None = None
+    status: str = "error"
+    error: str | None = None
+    # Memory files of the spec copy before the session: {relative path: content}
+    memory_base: dict[str, bytes] = field(default_factory=dict)
+
+    @property
+    def subtask_id(self) -> str:
+        return self.subtask["id"]
+
+
+class ParallelSubtaskScheduler:
+    """Runs batches of independent subtasks concurrently in isolated worktrees."""
+
+    def __init__(
+        self,
+        project_dir: Path,
+        spec_dir: Path,
+        model: str,
+        recovery_manager: RecoveryManager,
+        build_prompt: PromptBuilder,
+        max_parallel: int | None = None,
+        verbose: bool = False,
+        linear_enabled: bool = False,
+        status_manager: StatusManager | None = None,
+        source_spec_dir: Path | None = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            project_dir: Project (or build worktree) the subtasks are merged into
+            spec_dir: Spec directory of the build
+            model: Claude model to use
+            recovery_manager: Recovery manager for the build
+            build_prompt: Builds a subtask's prompt for its own worktree
+            max_parallel: Maximum concurrent sessions (default: from environment)
+            verbose: Whether to show detailed output
+            linear_enabled: Whether Linear integration is enabled
+            status_manager: Optional status manager for ccstatusline
+            source_spec_dir: Original spec directory (for syncing back from worktree)
+        """
+        self.project_dir = project_dir
+        self.spec_dir = spec_dir
+        self.model = model
+        self.recovery_manager = recovery_manager
+        self.build_prompt = build_prompt
+        self.max_parallel = max_parallel or get_max_parallel_subtasks()
+        self.verbose = verbose
+        self.linear_enabled = linear_enabled
+        self.status_manager = status_manager
+        self.source_spec_dir = source_spec_dir
+
+    async def run_batch(
+        self, subtasks: list[dict], first_session: int
+    ) -> list[tuple[str, bool]] | None:
+        """
+        Run a batch of subtasks concurrently and merge them back in plan order.
+
+        Args:
+            subtasks: Pending subtasks of one parallel-safe phase, in plan order
+            first_session: Session number of the first subtask; the others
+                get consecutive numbers
+
+        Returns:
+            (subtask_id, success) per subtask in plan order, or None if the
+            worktrees couldn't be set up (run the subtasks serially instead)
+        """
+        base_commit = get_latest_commit(self.project_dir)
+        if not base_commit:
+            return None
+
+        runs = [
+            SubtaskRun(
+                subtask=subtask,
+                session_num=first_session + i,
+                worktree=self._worktree_path(subtask["id"]),
+            )
+            for i, subtask in enumerate(subtasks)
+        ]
+
+        try:
+            # Each worktree gets a copy of the spec, recovery history included
+            self.recovery_manager.flush()
+            for run in runs:
+                if not self._create_worktree(run, base_commit):
+                    return None
+
+            print_status(
+                f"Running {len(runs)} subtasks in parallel "
+                f"(max {self.max_parallel} at a time)",
+                "progress",
+            )
+            if self.status_manager:
+                self.status_manager.update_subtasks(in_progress=len(runs))
+
+            semaphore = asyncio.Semaphore(self.max_parallel)
+            await asyncio.gather(*(self._run_session(run, semaphore) for run in runs))
+
+            results = []
+            for run in runs:
+                results.append((run.subtask_id, await self._merge(run, base_commit)))
+            return results
+        finally:
+            for run in runs:
+                self._remove_worktree(run.worktree)
+            run_git(["worktree", "prune"], cwd=self.project_dir)
+
+    # ------------------------------------------------------------------
+    # Worktrees
+    # ------------------------------------------------------------------
+
+    def _worktree_path(self, subtask_id: str) -> Path:
+        safe_id = "".join(c if c.isalnum() or c in "-_" else "-" for c in subtask_id)
+        return (
+            self.project_dir / SUBTASK_WORKTREES_DIR / f"{self.spec_dir.name}-{safe_id}"
+        )
+
+    def _create_worktree(self, run: SubtaskRun, base_commit: str) -> bool:
+        self._remove_worktree(run.worktree)
+        run.worktree.parent.mkdir(parents=True, exist_ok=True)
+        result = run_git(
+            ["worktree", "add", "--detach", str(run.worktree), base_commit],
+            cwd=self.project_dir,
+        )
+        if result.returncode != 0:
+            print_status(
+                f"Could not create worktree for subtask {run.subtask_id}: "
+                f"{result.stderr.strip()}",
+                "warning",
+            )
+            return False
+
+        run.spec_dir = copy_spec_to_worktree(
+            self.spec_dir, run.worktree, self.spec_dir.name
+        )
+        run.memory_base = {
+            path.relative_to(run.spec_dir / "memory").as_posix(): path.read_bytes()
+            for path in _memory_files(run.spec_dir)
+        }
+        copy_env_files_to_worktree(self.project_dir, run.worktree)
+        symlink_node_modules_to_worktree(self.project_dir, run.worktree)
+        return True
+
+    def _remove_worktree(self, worktree: Path) -> None:
+        if not worktree.exists():
+            return
+        result = run_git(
+            ["worktree", "remove", "--force", str(worktree)], cwd=self.project_dir
+        )
+        if result.returncode != 0:
+            shutil.rmtree(worktree, ignore_errors=True)
+
+    # ------------------------------------------------------------------
+    # Sessions
+    # ------------------------------------------------------------------
+
+    async def _run_session(self, run: SubtaskRun, semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            print(
+                f"Starting session {run.session_num}: {highlight(run.subtask_id)} - "
+                f"{run.subtask.get('description', 'No description')}"
+            )
+            try:
+                client = create_client(
+                    run.worktree,
+                    run.spec_dir,
+                    get_phase_model(self.spec_dir, "coding", self.model),
+                    agent_type="coder",
+                    max_thinking_tokens=get_phase_thinking_budget(
+                        self.spec_dir, "coding"
+                    ),
+                )
+                prompt = await self.build_prompt(
+                    run.spec_dir, run.worktree, run.subtask
+                )
+                async with client:
+                    # Log to the build's spec dir so all sessions share one task log
+                    run.status, _ = await run_agent_session(
+                        client, prompt, self.spec_dir, self.verbose, LogPhase.CODING
+                    )
+            except Exception as e:
+                logger.exception(f"Parallel session for {run.subtask_id} failed")
+                run.status = "error"
+                run.error = str(e)
+
+    # ------------------------------------------------------------------
+    # Merge-back
+    # ------------------------------------------------------------------
+
+    async def _merge(self, run: SubtaskRun, base_commit: str) -> bool:
+        """Merge one subtask's commits and plan status, then post-process it."""
+        print()
+        print(muted(f"--- Merging subtask {run.subtask_id} ---"))
+
+        commit_before = get_latest_commit(self.project_dir)
+        commit_count_before = get_commit_count(self.project_dir)
+
+        head = get_latest_commit(run.worktree)
+        if head and head != base_commit:
+            result = run_git(
+                # Commits whose changes an earlier subtask already made become
+                # empty; keep them rather than stopping the cherry-pick
+                [
+                    "cherry-pick",
+                    "--allow-empty",
+                    "--keep-redundant-commits",
+                    f"{base_commit}..{head}",
+                ],
+                cwd=self.project_dir,
+            )
+            if result.returncode != 0:
+                run_git(["cherry-pick", "--abort"], cwd=self.project_dir)
+                print_status(
+                    f"Subtask {run.subtask_id} conflicts with subtasks merged "
+                    "before it - will retry",
+                    "warning",
+                )
+                self.recovery_manager.record_attempt(
+                    subtask_id=run.subtask_id,
+                    session=run.session_num,
+                    success=False,
+                    approach="Parallel session in an isolated worktree",
+                    error="Changes conflicted with parallel subtasks merged before it",
+                )
+                return False
+
+        self._merge_plan_status(run)
+        self._merge_memory(run)
+
+        return await post_session_processing(
+            spec_dir=self.spec_dir,
+            project_dir=self.project_dir,
+            subtask_id=run.subtask_id,
+            session_num=run.session_num,
+            commit_before=commit_before,
+            commit_count_before=commit_count_before,
+            recovery_manager=self.recovery_manager,
+            linear_enabled=self.linear_enabled,
+            status_manager=self.status_manager,
+            source_spec_dir=self.source_spec_dir,
+        )
+
+    def _merge_plan_status(self, run: SubtaskRun) -> None:
+        """Copy the subtask's entry from the worktree's plan into the build's plan."""
+        worktree_plan = load_implementation_plan(run.spec_dir) if run.spec_dir else None
+        worktree_subtask = (
+            find_subtask_in_plan(worktree_plan, run.subtask_id)
+            if worktree_plan
+            else None
+        )
+        plan = load_implementation_plan(self.spec_dir)
+        subtask = find_subtask_in_plan(plan, run.subtask_id) if plan else None
+        if not worktree_subtask or subtask is None:
+            return
+
+        subtask.update(worktree_subtask)
+        write_json_atomic(self.spec_dir / "implementation_plan.json", plan)
+
+    def _merge_memory(self, run: SubtaskRun) -> None:
+        """
+        Merge the memory files the session wrote in its spec copy into the build's.
+
+        Files new to the build are copied; JSON files get the keys the session
+        added or changed, and text files (gotchas, patterns) the lines it
+        appended, so the entries of subtasks merged before it are kept.
+        """
+        if not run.spec_dir:
+            return
+        source_dir = run.spec_dir / "memory"
+        target_dir = self.spec_dir / "memory"
+        for source in _memory_files(run.spec_dir):
+            relative = source.relative_to(source_dir).as_posix()
+            content = source.read_bytes()
+            base = run.memory_base.get(relative)
+            if content == base:
+                continue
+            target = target_dir / relative
+            try:
+                if not target.exists():
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    target.write_bytes(content)
+                elif source.suffix == ".json":
+                    merged = json.loads(target.read_bytes())
+                    _merge_json(
+                        merged, json.loads(base) if base else {}, json.loads(content)
+                    )
+                    write_json_atomic(target, merged)
+                else:
+                    # A file the session created also starts with the header
+                    # an earlier subtask's copy wrote
+                    known = (base or target.read_bytes()).splitlines(keepends=True)
+                    lines = content.splitlines(keepends=True)
+                    shared = 0
+                    while (
+                        shared < min(len(known), len(lines))
+                        and known[shared] == lines[shared]
+                    ):
+                        shared += 1
+                    added = b"".join(lines[shared:])
+                    if added:
+                        existing = target.read_bytes()
+                        if existing and not existing.endswith(b"\n"):
+                            added = b"\n" + added
+                        with open(target, "ab") as f:
+                            f.write(added)
+            except (OSError, ValueError) as e:
+                logger.warning(
+                    f"Could not merge memory file {relative} of subtask "
+                    f"{run.subtask_id}: {e}"
+                )
+
+
+def _memory_files(spec_dir: Path) -> list[Path]:
+    memory_dir = spec_dir / "memory"
+    if not memory_dir.is_dir():
+        return []
+    return sorted(path for path in memory_dir.rglob("*") if path.is_file())
+
+
+def _merge_json(target: dict, base: dict, source: dict) -> None:
+    """Apply the keys ``source`` added or changed relative to ``base`` to ``target``."""
+    if not isinstance(target, dict) or not isinstance(source, dict):
+        return
+    if not isinstance(base, dict):
+        base = {}
+    for key, value in source.items():
+        if key in base and base[key] == value:
+            continue
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge_json(target[key], base.get(key), value)
+        else:
+            target[key] = value
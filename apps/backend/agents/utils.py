@@ -5,11 +5,13 @@ Utility Functions for Agent System
 Helper functions for git operations, plan management, and file syncing.
 """
 
+import fnmatch
 import json
 import logging
 import shutil
 from pathlib import Path
 
+from core.file_utils import RECOVERY_DB_GLOB
 from core.git_executable import run_git
 
 logger = logging.getLogger(__name__)
@@ -96,6 +98,9 @@ def sync_spec_to_source(spec_dir: Path, source_spec_dir: Path | None) -> bool:
     - spec.md, context.json, etc. - Original spec files (for completeness)
     - memory/ directory - Codebase map, patterns, gotchas, session insights
 
+    The recovery SQLite database (memory/recovery.db*) is not synced; its
+    JSON exports are, and the main project's store re-imports them.
+
     Args:
         spec_dir: Current spec directory (inside worktree)
         source_spec_dir: Original spec directory in main project (outside worktree)
@@ -130,6 +135,8 @@ def sync_spec_to_source(spec_dir: Path, source_spec_dir: Path | None) -> bool:
             source_item = source_spec_dir / item.name
 
             if item.is_file():
+                if _is_local_only_file(item):
+                    continue
                 # Copy file (preserves timestamps)
                 shutil.copy2(item, source_item)
                 logger.debug(f"Synced {item.name} to source")
@@ -146,6 +153,11 @@ def sync_spec_to_source(spec_dir: Path, source_spec_dir: Path | None) -> bool:
     return synced_any
 
 
+def _is_local_only_file(path: Path) -> bool:
+    """Whether a spec file belongs to one copy of the spec and must not be synced."""
+    return fnmatch.fnmatch(path.name, RECOVERY_DB_GLOB)
+
+
 def _sync_directory(source_dir: Path, target_dir: Path) -> None:
     """
     Recursively sync a directory from source to target.
@@ -168,6 +180,8 @@ def _sync_directory(source_dir: Path, target_dir: Path) -> None:
         target_item = target_dir / item.name
 
         if item.is_file():
+            if _is_local_only_file(item):
+                continue
             shutil.copy2(item, target_item)
             logger.debug(f"Synced {source_dir.name}/{item.name} to source")
         elif item.is_dir():
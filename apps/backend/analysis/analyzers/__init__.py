@@ -8,6 +8,7 @@ Main exports:
 - ServiceAnalyzer: Analyzes a single service/package
 - ProjectAnalyzer: Analyzes entire projects (single or monorepo)
 - analyze_project: Convenience function for project analysis
+- refresh_project_index: Incrementally update a saved project index
 - analyze_service: Convenience function for service analysis
 """
 
@@ -25,6 +26,7 @@ __all__ = [
     "ProjectAnalyzer",
     "analyze_project",
     "analyze_service",
+    "refresh_project_index",
 ]
 
 
@@ -53,6 +55,40 @@ def analyze_project(project_dir: Path, output_file: Path | None = None) -> dict:
     return results
 
 
+def refresh_project_index(project_dir: Path, output_file: Path) -> list[str]:
+    """
+    Update a saved project index, re-analyzing only changed services.
+
+    Services whose manifests and entry points are unchanged since the index
+    was written are reused from it; the result is the same as a full run.
+
+    Args:
+        project_dir: Path to the project root
+        output_file: Path of the saved project index (created if missing)
+
+    Returns:
+        Names of services whose entry in the index was added, removed or changed
+    """
+    import json
+
+    previous = None
+    try:
+        with open(output_file, encoding="utf-8") as f:
+            previous = json.load(f)
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+        pass
+
+    analyzer = ProjectAnalyzer(project_dir)
+    results = analyzer.analyze(previous_index=previous)
+
+    if results != previous:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    return analyzer.changed_services
+
+
 def analyze_service(
     project_dir: Path, service_name: str, output_file: Path | None = None
 ) -> dict:
@@ -3,15 +3,91 @@ Project Analyzer Module
 =======================
 
 Analyzes entire projects, detecting monorepo structures, services, infrastructure, and conventions.
+
+The generated index carries a fingerprint of each service's manifests and
+entry points, so a later run can reuse the analysis of unchanged services
+and only re-run ServiceAnalyzer for the ones that changed.
 """
 
 from __future__ import annotations
 
+import copy
 from pathlib import Path
 from typing import Any
 
+from ..discovery_cache import hash_path, stat_signature
 from .base import SERVICE_INDICATORS, SERVICE_ROOT_FILES, SKIP_DIRS
-from .service_analyzer import ServiceAnalyzer
+from .service_analyzer import ENTRY_POINT_PATTERNS, ServiceAnalyzer
+
+# Bump when service analysis changes so saved indexes are fully regenerated
+INDEX_FINGERPRINT_VERSION = 1
+
+# Paths (relative to a service directory) that decide whether a service must
+# be re-analyzed; "." fingerprints the directory's entry names
+SERVICE_FINGERPRINT_FILES = [
+    ".",
+    *sorted(SERVICE_ROOT_FILES),
+    "Pipfile",
+    "pytest.ini",
+    "tsconfig.json",
+    "Package.swift",
+    ".env",
+    ".env.example",
+    *ENTRY_POINT_PATTERNS,
+]
+
+# Paths (relative to the project root) that decide the project type, the set
+# of service directories, infrastructure and conventions
+PROJECT_FINGERPRINT_FILES = [
+    ".",
+    "packages",
+    "apps",
+    "services",
+    "docker",
+    ".github/workflows",
+    "docker-compose.yml",
+    "docker-compose.yaml",
+    "pyproject.toml",
+]
+
+
+def _fingerprint(base: Path, paths: list[str]) -> dict[str, list]:
+    """Fingerprint the existing paths as {path: [mtime_ns, size, sha256]}."""
+    files = {}
+    for rel_path in paths:
+        path = base / rel_path
+        stat = stat_signature(path)
+        digest = hash_path(path) if stat is not None else None
+        if digest is not None:
+            files[rel_path] = [*stat, digest]
+    return files
+
+
+def _fingerprint_matches(base: Path, paths: list[str], recorded: dict) -> bool:
+    """
+    Check a recorded fingerprint against the files on disk.
+
+    Only paths whose stat changed are re-hashed; if their content is the same,
+    the recorded stat is updated in place so the next check is cheap again.
+    """
+    if not isinstance(recorded, dict):
+        return False
+    seen = 0
+    for rel_path in paths:
+        path = base / rel_path
+        stat = stat_signature(path)
+        entry = recorded.get(rel_path)
+        if stat is None or entry is None:
+            if stat is not None or entry is not None:
+                return False  # Path appeared or disappeared
+            continue
+        seen += 1
+        if stat == entry[:2]:
+            continue
+        if hash_path(path) != entry[2]:
+            return False
+        entry[:2] = stat
+    return seen == len(recorded)
 
 
 class ProjectAnalyzer:
@@ -26,16 +102,96 @@ class ProjectAnalyzer:
             "infrastructure": {},
             "conventions": {},
         }
-
-    def analyze(self) -> dict[str, Any]:
-        """Run full project analysis."""
+        self._service_fingerprints: dict[str, dict] = {}
+        # Names of services run through ServiceAnalyzer by analyze()
+        self.reanalyzed_services: list[str] = []
+        # Names of services whose index entry differs from the previous index
+        self.changed_services: list[str] = []
+
+    def analyze(self, previous_index: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Run project analysis.
+
+        Args:
+            previous_index: A previously generated index. Services whose
+                fingerprint is unchanged are taken from it instead of being
+                re-analyzed; the result is the same as a full run.
+
+        Returns:
+            Project index as a dictionary
+        """
+        project_fingerprint = _fingerprint(self.project_dir, PROJECT_FINGERPRINT_FILES)
         self._detect_project_type()
-        self._find_and_analyze_services()
+        self._find_and_analyze_services(self._usable_fingerprints(previous_index))
         self._analyze_infrastructure()
         self._detect_conventions()
         self._map_dependencies()
+        self.index["fingerprints"] = {
+            "version": INDEX_FINGERPRINT_VERSION,
+            "project": project_fingerprint,
+            "services": self._service_fingerprints,
+        }
+
+        previous_services = (previous_index or {}).get("services", {})
+        services = self.index["services"]
+        self.changed_services = [
+            name
+            for name in {**previous_services, **services}
+            if previous_services.get(name) != services.get(name)
+        ]
         return self.index
 
+    def is_index_current(self, index: dict[str, Any]) -> bool:
+        """
+        Check whether a saved index still matches the project on disk.
+
+        Only stats (and, for touched files, content hashes) are compared; no
+        service is analyzed.
+
+        Args:
+            index: A previously generated index
+
+        Returns:
+            True if analyze() would return the same index
+        """
+        fingerprints = self._usable_fingerprints(index)
+        if fingerprints is None:
+            return False
+        if not _fingerprint_matches(
+            self.project_dir, PROJECT_FINGERPRINT_FILES, fingerprints.get("project")
+        ):
+            return False
+
+        self._detect_project_type()
+        recorded = fingerprints.get("services") or {}
+        service_dirs = self._find_service_dirs()
+        if {self._relative(path) for _, path in service_dirs} != set(recorded):
+            return False
+        return all(
+            _fingerprint_matches(
+                path,
+                SERVICE_FINGERPRINT_FILES,
+                (recorded[self._relative(path)] or {}).get("files"),
+            )
+            for _, path in service_dirs
+        )
+
+    def _usable_fingerprints(self, index: dict[str, Any] | None) -> dict | None:
+        """Return the index's fingerprints if they apply to this project."""
+        if not index or index.get("project_root") != str(self.project_dir):
+            return None
+        fingerprints = index.get("fingerprints")
+        if (
+            not isinstance(fingerprints, dict)
+            or fingerprints.get("version") != INDEX_FINGERPRINT_VERSION
+        ):
+            return None
+        # Services are reused from the index along with their fingerprints
+        return {**fingerprints, "index_services": index.get("services") or {}}
+
+    def _relative(self, path: Path) -> str:
+        return path.relative_to(self.project_dir).as_posix()
+
     def _detect_project_type(self) -> None:
         """Detect if this is a monorepo or single project."""
         monorepo_indicators = [
@@ -77,52 +233,99 @@ class ProjectAnalyzer:
         if service_dirs_found >= 2:
             self.index["project_type"] = "monorepo"
 
-    def _find_and_analyze_services(self) -> None:
-        """Find all services and analyze each."""
-        services = {}
+    def _find_service_dirs(self) -> list[tuple[str, Path]]:
+        """List candidate service directories as (name, path), in analysis order."""
+        if self.index["project_type"] != "monorepo":
+            # Single project - analyze root
+            return [("main", self.project_dir)]
+
+        candidates = []
+        # Look for services in common locations
+        service_locations = [
+            self.project_dir,
+            self.project_dir / "packages",
+            self.project_dir / "apps",
+            self.project_dir / "services",
+        ]
+
+        for location in service_locations:
+            if not location.exists():
+                continue
 
-        if self.index["project_type"] == "monorepo":
-            # Look for services in common locations
-            service_locations = [
-                self.project_dir,
-                self.project_dir / "packages",
-                self.project_dir / "apps",
-                self.project_dir / "services",
-            ]
-
-            for location in service_locations:
-                if not location.exists():
+            for item in location.iterdir():
+                if not item.is_dir():
+                    continue
+                if item.name in SKIP_DIRS:
+                    continue
+                if item.name.startswith("."):
                     continue
 
-                for item in location.iterdir():
-                    if not item.is_dir():
-                        continue
-                    if item.name in SKIP_DIRS:
-                        continue
-                    if item.name.startswith("."):
-                        continue
-
-                    # Check if this looks like a service
-                    has_root_file = any((item / f).exists() for f in SERVICE_ROOT_FILES)
-                    is_service_name = item.name.lower() in SERVICE_INDICATORS
-
-                    if has_root_file or (
-                        location == self.project_dir and is_service_name
-                    ):
-                        analyzer = ServiceAnalyzer(item, item.name)
-                        service_info = analyzer.analyze()
-                        if service_info.get(
-                            "language"
-                        ):  # Only include if we detected something
-                            services[item.name] = service_info
-        else:
-            # Single project - analyze root
-            analyzer = ServiceAnalyzer(self.project_dir, "main")
-            service_info = analyzer.analyze()
-            if service_info.get("language"):
-                services["main"] = service_info
+                # Check if this looks like a service
+                has_root_file = any((item / f).exists() for f in SERVICE_ROOT_FILES)
+                is_service_name = item.name.lower() in SERVICE_INDICATORS
+
+                if has_root_file or (location == self.project_dir and is_service_name):
+                    candidates.append((item.name, item))
+        return candidates
+
+    def _find_and_analyze_services(self, previous: dict | None = None) -> None:
+        """Find all services and analyze each, reusing unchanged ones."""
+        services = {}
+        fingerprints = {}
+        recorded = (previous or {}).get("services") or {}
+        previous_services = (previous or {}).get("index_services") or {}
+
+        for name, path in self._find_service_dirs():
+            rel_path = self._relative(path)
+            service_info = None
+            entry = recorded.get(rel_path)
+            if isinstance(entry, dict) and _fingerprint_matches(
+                path, SERVICE_FINGERPRINT_FILES, entry.get("files")
+            ):
+                service_info = self._reuse_service(
+                    previous_services, name, path, entry.get("service")
+                )
+            if service_info is None:
+                entry = None
+
+            if entry is None:
+                entry = {"files": _fingerprint(path, SERVICE_FINGERPRINT_FILES)}
+                analyzer = ServiceAnalyzer(path, name)
+                service_info = analyzer.analyze()
+                self.reanalyzed_services.append(name)
+
+            # Only include if we detected something
+            entry["service"] = bool(service_info and service_info.get("language"))
+            fingerprints[rel_path] = entry
+            if entry["service"]:
+                services[name] = service_info
 
         self.index["services"] = services
+        self._service_fingerprints = fingerprints
+
+    def _reuse_service(
+        self,
+        previous_services: dict[str, Any],
+        name: str,
+        path: Path,
+        was_service: bool | None,
+    ) -> dict[str, Any] | None:
+        """
+        Take an unchanged service's analysis from the previous index.
+
+        Returns an empty dict if the directory wasn't a service last time, or
+        None if its analysis isn't available (e.g. shadowed by a service with
+        the same name) and it must be re-analyzed.
+        """
+        if was_service is False:
+            return {}
+        service_info = previous_services.get(name)
+        if not isinstance(service_info, dict) or service_info.get("path") != str(path):
+            return None
+        service_info = copy.deepcopy(service_info)
+        # Recomputed by _map_dependencies() from the merged services
+        service_info.pop("consumes", None)
+        return service_info
 
     def _analyze_infrastructure(self) -> None:
         """Analyze infrastructure configuration."""
@@ -18,6 +18,37 @@ from .database_detector import DatabaseDetector
 from .framework_analyzer import FrameworkAnalyzer
 from .route_detector import RouteDetector
 
+# Entry point files, in order of preference
+ENTRY_POINT_PATTERNS = [
+    "main.py",
+    "app.py",
+    "__main__.py",
+    "server.py",
+    "wsgi.py",
+    "asgi.py",
+    "index.ts",
+    "index.js",
+    "main.ts",
+    "main.js",
+    "server.ts",
+    "server.js",
+    "app.ts",
+    "app.js",
+    "src/index.ts",
+    "src/index.js",
+    "src/main.ts",
+    "src/app.ts",
+    "src/server.ts",
+    "src/App.tsx",
+    "src/App.jsx",
+    "pages/_app.tsx",
+    "pages/_app.js",  # Next.js
+    "main.go",
+    "cmd/main.go",
+    "src/main.rs",
+    "src/lib.rs",
+]
+
 
 class ServiceAnalyzer(BaseAnalyzer):
     """Analyzes a single service/package within a project."""
@@ -153,37 +184,7 @@ class ServiceAnalyzer(BaseAnalyzer):
 
     def _find_entry_points(self) -> None:
         """Find main entry point files."""
-        entry_patterns = [
-            "main.py",
-            "app.py",
-            "__main__.py",
-            "server.py",
-            "wsgi.py",
-            "asgi.py",
-            "index.ts",
-            "index.js",
-            "main.ts",
-            "main.js",
-            "server.ts",
-            "server.js",
-            "app.ts",
-            "app.js",
-            "src/index.ts",
-            "src/index.js",
-            "src/main.ts",
-            "src/app.ts",
-            "src/server.ts",
-            "src/App.tsx",
-            "src/App.jsx",
-            "pages/_app.tsx",
-            "pages/_app.js",  # Next.js
-            "main.go",
-            "cmd/main.go",
-            "src/main.rs",
-            "src/lib.rs",
-        ]
-
-        for pattern in entry_patterns:
+        for pattern in ENTRY_POINT_PATTERNS:
             if self._exists(pattern):
                 self.analysis["entry_point"] = pattern
                 break
@@ -20,6 +20,10 @@ Usage:
     if result:
         print(f"CI System: {result.ci_system}")
         print(f"Test Commands: {result.test_commands}")
+
+Results are cached by a fingerprint of the CI config files, in memory and
+under .auto-claude/cache/, so repeated discovery is cheap and edits to a
+workflow are picked up immediately.
 """
 
 from __future__ import annotations
@@ -30,6 +34,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from .discovery_cache import DiscoveryCache
+
 # Try to import yaml, fall back gracefully
 try:
     import yaml
@@ -39,6 +45,15 @@ except ImportError:
     HAS_YAML = False
 
 
+# CI config locations checked by CIDiscovery.discover (relative to project root)
+CI_CONFIG_PATHS = [
+    ".github/workflows",
+    ".gitlab-ci.yml",
+    ".circleci/config.yml",
+    "Jenkinsfile",
+]
+
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
@@ -83,6 +98,18 @@ class CIConfig:
     workflows: list[CIWorkflow] = field(default_factory=list)
     environment_variables: list[str] = field(default_factory=list)
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CIConfig:
+        """Create from the dictionary produced by CIDiscovery.to_dict."""
+        return cls(
+            ci_system=data["ci_system"],
+            config_files=list(data.get("config_files", [])),
+            test_commands=dict(data.get("test_commands", {})),
+            coverage_command=data.get("coverage_command"),
+            workflows=[CIWorkflow(**w) for w in data.get("workflows", [])],
+            environment_variables=list(data.get("environment_variables", [])),
+        )
+
 
 # =============================================================================
 # CI PARSERS
@@ -102,7 +129,8 @@ class CIDiscovery:
 
     def __init__(self) -> None:
         """Initialize CI discovery."""
-        self._cache: dict[str, CIConfig | None] = {}
+        # Results are shared by all instances through the module-level cache
+        self._cache = _cache
 
     def discover(self, project_dir: Path) -> CIConfig | None:
         """
@@ -115,10 +143,14 @@ class CIDiscovery:
             CIConfig if CI found, None otherwise
         """
         project_dir = Path(project_dir)
-        cache_key = str(project_dir.resolve())
+        resolved_dir = project_dir.resolve()
+        watched = self._watched_paths(resolved_dir)
 
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        hit, cached = self._cache.get(resolved_dir, watched)
+        if hit:
+            return cached
+
+        fingerprint = self._cache.fingerprint(resolved_dir, watched)
 
         # Try each CI system
         result = None
@@ -146,9 +178,21 @@ class CIDiscovery:
             if jenkinsfile.exists():
                 result = self._parse_jenkinsfile(jenkinsfile)
 
-        self._cache[cache_key] = result
+        self._cache.put(resolved_dir, fingerprint, result)
         return result
 
+    def _watched_paths(self, project_dir: Path) -> list[str]:
+        """All files (and the workflows directory) that discovery may read."""
+        watched = list(CI_CONFIG_PATHS)
+        workflows_dir = project_dir / ".github" / "workflows"
+        if workflows_dir.is_dir():
+            for pattern in ("*.yml", "*.yaml"):
+                watched.extend(
+                    str(p.relative_to(project_dir).as_posix())
+                    for p in workflows_dir.glob(pattern)
+                )
+        return watched
+
     def _parse_github_actions(self, workflows_dir: Path) -> CIConfig:
         """Parse GitHub Actions workflow files."""
         result = CIConfig(ci_system="github_actions")
@@ -486,10 +530,19 @@ class CIDiscovery:
         }
 
     def clear_cache(self) -> None:
-        """Clear the internal cache."""
+        """Clear the in-memory cache (persisted entries are still validated)."""
         self._cache.clear()
 
 
+# Parsing differs with and without PyYAML, so cache entries do too
+_cache: DiscoveryCache[CIConfig | None] = DiscoveryCache(
+    "ci_discovery",
+    version=f"1-yaml{int(HAS_YAML)}",
+    encode=lambda config: CIDiscovery().to_dict(config) if config else None,
+    decode=lambda data: CIConfig.from_dict(data) if data else None,
+)
+
+
 # =============================================================================
 # CONVENIENCE FUNCTIONS
 # =============================================================================
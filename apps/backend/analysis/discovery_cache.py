@@ -0,0 +1,225 @@
+"""
+Discovery Cache
+===============
+
+Content-fingerprint cache for project discovery results (CI configuration,
+test frameworks).
+
+A cached result is keyed by a fingerprint of the files the discovery reads
+(directories are fingerprinted by their entry names). Lookups first compare
+each path's stat signature (mtime, size) with the one recorded when the
+result was computed; only paths whose stat changed are re-hashed, and the
+entry is reused if their content is unchanged. Adding or removing a watched
+path always invalidates the entry. Paths whose content doesn't matter (lock
+files, which change on every install) can be tracked by presence only.
+
+Results are kept in memory for the process and persisted under
+``.auto-claude/cache/`` so separate processes (spec pipeline, QA, validation
+strategy) reuse each other's work. Nothing is written for projects that have
+no ``.auto-claude/`` directory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+CACHE_DIR = Path(".auto-claude") / "cache"
+
+
+def stat_signature(path: Path) -> list[int] | None:
+    """Return [mtime_ns, size] for a path, or None if it doesn't exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def hash_path(path: Path) -> str | None:
+    """Return the sha256 of a file's content, or of a directory's entry names."""
+    digest = hashlib.sha256()
+    try:
+        if path.is_dir():
+            for name in sorted(os.listdir(path)):
+                digest.update(name.encode("utf-8", "surrogateescape") + b"\0")
+            return digest.hexdigest()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+class DiscoveryCache(Generic[T]):
+    """
+    Fingerprint-validated cache for one kind of discovery result.
+
+    Args:
+        name: Cache name, used for the file ``.auto-claude/cache/<name>.json``
+        version: Bump when the discovery logic or result format changes
+        encode: Convert a result to JSON-serializable data
+        decode: Rebuild a result from encoded data
+    """
+
+    def __init__(
+        self,
+        name: str,
+        version: str,
+        encode: Callable[[T], Any],
+        decode: Callable[[Any], T],
+    ):
+        self.name = name
+        self.version = version
+        self._encode = encode
+        self._decode = decode
+        # project key -> (entry as persisted, decoded result)
+        self._memory: dict[str, tuple[dict[str, Any], T]] = {}
+        self._lock = threading.Lock()
+
+    def _cache_file(self, project_dir: Path) -> Path:
+        return project_dir / CACHE_DIR / f"{self.name}.json"
+
+    def _load_persisted(self, project_dir: Path) -> dict | None:
+        try:
+            with open(self._cache_file(project_dir), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != self.version:
+            return None
+        return entry
+
+    def get(
+        self,
+        project_dir: Path,
+        watched: list[str],
+        presence: list[str] | None = None,
+    ) -> tuple[bool, T | None]:
+        """
+        Get the cached result if the watched paths are unchanged.
+
+        Args:
+            project_dir: Resolved project root
+            watched: Paths (relative to project_dir) of everything the
+                discovery reads, including ones that don't exist
+            presence: Paths whose existence (not content) the discovery uses
+
+        Returns:
+            Tuple of (hit, result). Within a process, a hit returns the
+            same result object every time.
+        """
+        key = str(project_dir)
+        memory = self._memory.get(key)
+        from_disk = memory is None
+        entry = self._load_persisted(project_dir) if from_disk else memory[0]
+        if entry is None or not self._is_fresh(project_dir, entry, watched, presence):
+            return False, None
+
+        if from_disk:
+            try:
+                value = self._decode(entry.get("result"))
+            except (KeyError, TypeError, ValueError):
+                return False, None
+            with self._lock:
+                self._memory[key] = (entry, value)
+            return True, value
+        return True, memory[1]
+
+    def _is_fresh(
+        self,
+        project_dir: Path,
+        entry: dict,
+        watched: list[str],
+        presence: list[str] | None,
+    ) -> bool:
+        if entry.get("present", {}) != self._presence(project_dir, presence):
+            return False
+
+        files: dict[str, dict] = entry.get("files", {})
+        if sorted(watched) != sorted(files):
+            return False
+
+        stat_changed = False
+        for rel_path, recorded in files.items():
+            path = project_dir / rel_path
+            stat = stat_signature(path)
+            if stat == recorded.get("stat"):
+                continue
+            # Stat differs (or path appeared/disappeared): compare content
+            if stat is None or recorded.get("stat") is None:
+                return False
+            if hash_path(path) != recorded.get("sha256"):
+                return False
+            recorded["stat"] = stat
+            stat_changed = True
+
+        if stat_changed:
+            # Touched but unchanged: remember new stats to keep hits cheap
+            self._persist(project_dir, entry)
+        return True
+
+    @staticmethod
+    def _presence(project_dir: Path, presence: list[str] | None) -> dict[str, bool]:
+        return {rel: (project_dir / rel).exists() for rel in presence or []}
+
+    @classmethod
+    def fingerprint(
+        cls,
+        project_dir: Path,
+        watched: list[str],
+        presence: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Fingerprint the watched paths.
+
+        Take the fingerprint *before* running the discovery, so an edit made
+        while it runs invalidates the stored result instead of hiding behind it.
+        """
+        files = {}
+        for rel_path in watched:
+            path = project_dir / rel_path
+            stat = stat_signature(path)
+            files[rel_path] = {
+                "stat": stat,
+                "sha256": hash_path(path) if stat is not None else None,
+            }
+        return {"files": files, "present": cls._presence(project_dir, presence)}
+
+    def put(self, project_dir: Path, fingerprint: dict[str, Any], value: T) -> None:
+        """Store a result with the fingerprint taken before computing it."""
+        entry = {
+            "version": self.version,
+            **fingerprint,
+            "result": self._encode(value),
+        }
+        with self._lock:
+            self._memory[str(project_dir)] = (entry, value)
+        self._persist(project_dir, entry)
+
+    def _persist(self, project_dir: Path, entry: dict) -> None:
+        if not (project_dir / ".auto-claude").is_dir():
+            return
+        cache_file = self._cache_file(project_dir)
+        tmp_file = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            # Caching is best-effort
+            tmp_file.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Forget in-memory entries (persisted entries are still validated)."""
+        with self._lock:
+            self._memory.clear()
@@ -0,0 +1,452 @@
+"""
+Import Graph
+============
+
+Persisted reverse import graph (module -> importers) for Python and
+JavaScript/TypeScript projects.
+
+Each source file's import specifiers are parsed once and stored with the
+file's stat signature under ``.auto-claude/cache/import_graph.json``. Later
+refreshes ask git what changed since the recorded HEAD (plus untracked files)
+and only re-parse those, so finding the importers of a file or resolving an
+import is an in-memory lookup instead of a walk of the whole tree. Outside a
+git repository the tree is walked once per refresh and files are re-parsed
+when their stat changes.
+
+Nothing is written for projects that have no ``.auto-claude/`` directory.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import os
+import posixpath
+import re
+import threading
+from pathlib import Path
+from typing import Any
+
+from core.git_executable import run_git
+
+from .discovery_cache import CACHE_DIR, stat_signature
+
+# Bump when the parsing or the persisted format changes
+GRAPH_VERSION = "1"
+
+JS_SUFFIXES = (".ts", ".tsx", ".js", ".jsx")
+SOURCE_SUFFIXES = (*JS_SUFFIXES, ".py")
+
+# Directories never indexed (vendored, generated or VCS data)
+EXCLUDE_DIRS = {
+    "node_modules",
+    ".git",
+    "dist",
+    "build",
+    "__pycache__",
+    ".venv",
+    "venv",
+}
+
+# from '...', export ... from '...', import '...', import('...'), require('...')
+_JS_IMPORT_PATTERN = re.compile(
+    r"""(?:\bfrom\s+|\bimport\s*\(?\s*|\brequire\s*\(\s*)['"]([^'"\n]+)['"]"""
+)
+
+
+def iter_import_specifiers(content: str, suffix: str) -> list[str]:
+    """
+    Extract the project-relevant import specifiers of a source file.
+
+    JS/TS specifiers are kept as written when they are relative ('./x') or
+    path aliases ('@/x', '~/x'); bare package names are dropped. Python
+    imports are returned as dotted names with one leading dot per relative
+    level ('..pkg.mod'); ``from pkg import name`` also yields 'pkg.name' in
+    case the name is a submodule.
+
+    Args:
+        content: Source code
+        suffix: File suffix, e.g. '.ts' or '.py'
+
+    Returns:
+        Unique specifiers in source order
+    """
+    specifiers: list[str] = []
+    if suffix in JS_SUFFIXES:
+        specifiers = [
+            match.group(1)
+            for match in _JS_IMPORT_PATTERN.finditer(content)
+            if match.group(1)[0] in ".@~"
+        ]
+    elif suffix == ".py":
+        try:
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError):
+            return []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                specifiers.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                prefix = "." * node.level
+                module = node.module or ""
+                if module:
+                    specifiers.append(prefix + module)
+                for alias in node.names:
+                    if alias.name != "*":
+                        name = f"{module}.{alias.name}" if module else alias.name
+                        specifiers.append(prefix + name)
+    return list(dict.fromkeys(specifiers))
+
+
+def resolve_path_alias(import_path: str, paths: dict[str, list[str]]) -> str | None:
+    """
+    Resolve a tsconfig path alias to a project-relative path.
+
+    Args:
+        import_path: Import path like '@/utils/helpers' or '~/config'
+        paths: tsconfig ``compilerOptions.paths`` mapping
+
+    Returns:
+        Resolved path like 'src/utils/helpers', or None if no alias matches
+    """
+    for alias_pattern, target_paths in paths.items():
+        # Skip empty target_paths (malformed tsconfig entry)
+        if not target_paths:
+            continue
+        # Convert '@/*' to regex pattern '^@/(.*)$'
+        regex_pattern = "^" + re.escape(alias_pattern).replace(r"\*", "(.*)") + "$"
+        match = re.match(regex_pattern, import_path)
+        if match:
+            suffix = match.group(1) if match.lastindex else ""
+            # Use first target path, replace * with suffix
+            return target_paths[0].replace("*", suffix)
+    return None
+
+
+class ImportGraph:
+    """
+    Reverse import graph of one project.
+
+    Use ``get_import_graph()`` to get the shared, refreshed graph of a
+    project. Paths are project-relative and use forward slashes.
+    """
+
+    def __init__(self, project_dir: Path):
+        self.project_dir = Path(project_dir)
+        self.cache_file = self.project_dir / CACHE_DIR / "import_graph.json"
+        self.ts_paths: dict[str, list[str]] = {}
+        # Files parsed by the last refresh (for diagnostics and benchmarks)
+        self.parsed_files = 0
+        self._files: set[str] = set()
+        self._state: dict[str, Any] | None = None
+        # importer -> resolved import targets, and the reverse
+        self._targets: dict[str, set[str]] = {}
+        self._importers: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def has_file(self, rel_path: str) -> bool:
+        """Whether the project has this (non-ignored) file."""
+        return rel_path in self._files
+
+    def files(self) -> frozenset[str]:
+        """All (non-ignored) project files."""
+        return frozenset(self._files)
+
+    def dependents(self, rel_path: str) -> set[str]:
+        """Files that import the given file."""
+        return set(self._importers.get(rel_path, ()))
+
+    def resolve(self, specifier: str, source_path: str) -> str | None:
+        """
+        Resolve an import specifier to a project file.
+
+        Args:
+            specifier: Specifier as returned by ``iter_import_specifiers()``
+            source_path: Project-relative path of the importing file
+
+        Returns:
+            Project-relative path of the imported file, or None if it isn't
+            a project file
+        """
+        source_path = source_path.replace("\\", "/")
+        if source_path.endswith(".py"):
+            return self._resolve_python(specifier, source_path)
+        if specifier.startswith("."):
+            base_dir = posixpath.dirname(source_path)
+            return self._resolve_js(posixpath.join(base_dir, specifier))
+        if self.ts_paths:
+            target = resolve_path_alias(specifier, self.ts_paths)
+            if target:
+                # Path aliases are relative to the project root
+                return self._resolve_js(target)
+        return None
+
+    def _resolve_js(self, rel_path: str) -> str | None:
+        rel_path = posixpath.normpath(rel_path)
+        if rel_path == ".." or rel_path.startswith("../"):
+            return None
+        if rel_path in self._files:
+            return rel_path
+        for ext in JS_SUFFIXES:
+            if rel_path + ext in self._files:
+                return rel_path + ext
+        for ext in JS_SUFFIXES:
+            index_file = posixpath.join(rel_path, f"index{ext}")
+            if index_file in self._files:
+                return index_file
+        return None
+
+    def _resolve_python(self, specifier: str, source_path: str) -> str | None:
+        module = specifier.lstrip(".")
+        level = len(specifier) - len(module)
+        if not module:
+            return None
+        module_path = module.replace(".", "/")
+
+        if level:
+            base_dir = posixpath.dirname(source_path)
+            for _ in range(level - 1):
+                base_dir = posixpath.dirname(base_dir)
+            base_dirs = [base_dir]
+        else:
+            # Project root first, then the importer's ancestors (scripts and
+            # packages inside a monorepo put their own directory on sys.path)
+            base_dirs = [""]
+            base_dir = posixpath.dirname(source_path)
+            while base_dir:
+                base_dirs.append(base_dir)
+                base_dir = posixpath.dirname(base_dir)
+
+        for base_dir in base_dirs:
+            candidate = posixpath.join(base_dir, module_path)
+            if candidate.startswith("../"):
+                continue
+            if f"{candidate}.py" in self._files:
+                return f"{candidate}.py"
+            if f"{candidate}/__init__.py" in self._files:
+                return f"{candidate}/__init__.py"
+        return None
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def refresh(self, ts_paths: dict[str, list[str]] | None = None) -> None:
+        """
+        Bring the graph up to date with the working tree.
+
+        Args:
+            ts_paths: tsconfig path aliases used to resolve JS/TS imports
+        """
+        with self._lock:
+            state = self._state or self._load()
+            scan = self._scan_git(state)
+            if scan is None:
+                scan = self._scan_walk()
+            files, candidates, head, dirty = scan
+
+            entries: dict[str, dict] = state["files"]
+            sources = {f for f in files if f.endswith(SOURCE_SUFFIXES)}
+            removed = [f for f in entries if f not in sources]
+            for rel_path in removed:
+                del entries[rel_path]
+
+            check = sources - entries.keys()
+            check |= sources & (
+                candidates if candidates is not None else entries.keys()
+            )
+            changed = set(removed)
+            for rel_path in check:
+                stat = stat_signature(self.project_dir / rel_path)
+                entry = entries.get(rel_path)
+                if stat is None or (entry and entry["stat"] == stat):
+                    continue
+                entries[rel_path] = {"stat": stat, "imports": self._parse(rel_path)}
+                changed.add(rel_path)
+            self.parsed_files = len(changed) - len(removed)
+
+            state_changed = (
+                bool(changed) or state.get("head") != head or state["dirty"] != dirty
+            )
+            state["head"] = head
+            state["dirty"] = dirty
+            ts_paths = ts_paths or {}
+            if files != self._files or ts_paths != self.ts_paths or not self._state:
+                # Any import may resolve differently: re-resolve everything
+                self._files = files
+                self.ts_paths = ts_paths
+                self._targets = {}
+                self._importers = {}
+                changed = set(entries)
+            for rel_path in changed:
+                self._link(rel_path, entries.get(rel_path))
+            self._state = state
+            if state_changed:
+                self._persist()
+
+    def _parse(self, rel_path: str) -> list[str]:
+        try:
+            content = (self.project_dir / rel_path).read_text(
+                encoding="utf-8", errors="ignore"
+            )
+        except OSError:
+            return []
+        return iter_import_specifiers(content, posixpath.splitext(rel_path)[1])
+
+    def _link(self, rel_path: str, entry: dict | None) -> None:
+        for target in self._targets.pop(rel_path, ()):
+            importers = self._importers.get(target)
+            if importers is not None:
+                importers.discard(rel_path)
+        if entry is None:
+            return
+        targets = set()
+        for specifier in entry["imports"]:
+            target = self.resolve(specifier, rel_path)
+            if target and target != rel_path:
+                targets.add(target)
+                self._importers.setdefault(target, set()).add(rel_path)
+        self._targets[rel_path] = targets
+
+    def _git(self, *args: str) -> str | None:
+        result = run_git(list(args), cwd=self.project_dir)
+        return result.stdout if result.returncode == 0 else None
+
+    def _scan_git(
+        self, state: dict
+    ) -> tuple[set[str], set[str] | None, str | None, list[str]] | None:
+        """
+        List the project's files and what may have changed, using git.
+
+        Returns:
+            (files, candidates to re-check or None for all, HEAD, dirty files),
+            or None if the project isn't in a git work tree
+        """
+        listing = self._git(
+            "ls-files",
+            "-z",
+            "-t",
+            "--cached",
+            "--others",
+            "--deleted",
+            "--exclude-standard",
+        )
+        if listing is None:
+            return None
+
+        files: set[str] = set()
+        deleted: set[str] = set()
+        untracked: set[str] = set()
+        for item in listing.split("\0"):
+            if len(item) < 3:
+                continue
+            tag, rel_path = item[0], item[2:]
+            if EXCLUDE_DIRS.intersection(rel_path.split("/")[:-1]):
+                continue
+            if tag == "R":
+                deleted.add(rel_path)
+            else:
+                files.add(rel_path)
+                if tag == "?":
+                    untracked.add(rel_path)
+        files -= deleted
+
+        head = (self._git("rev-parse", "--verify", "-q", "HEAD") or "").strip() or None
+        changed = None
+        if head and state.get("head"):
+            diff = self._git("diff", "--name-only", "-z", "--relative", state["head"])
+            if diff is not None:
+                changed = set(filter(None, diff.split("\0")))
+
+        # Files that differ from HEAD now; re-checked next time even if a
+        # later checkout makes them match the recorded HEAD again
+        dirty = set(untracked)
+        if changed is not None and head == state.get("head"):
+            dirty |= changed
+        else:
+            committed = self._git("diff", "--name-only", "-z", "--relative", "HEAD")
+            dirty |= set(filter(None, (committed or "").split("\0")))
+        dirty &= files
+
+        if changed is None:
+            return files, None, head, sorted(dirty)
+        candidates = changed | untracked | set(state["dirty"])
+        return files, candidates, head, sorted(dirty)
+
+    def _scan_walk(self) -> tuple[set[str], None, None, list[str]]:
+        """List the project's files by walking it (outside git)."""
+        files: set[str] = set()
+        for root, dirs, names in os.walk(self.project_dir):
+            dirs[:] = [d for d in dirs if d not in EXCLUDE_DIRS]
+            try:
+                rel_root = Path(root).relative_to(self.project_dir).as_posix()
+            except ValueError:
+                continue
+            prefix = "" if rel_root == "." else f"{rel_root}/"
+            files.update(prefix + name for name in names)
+        return files, None, None, []
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            state = None
+        if not isinstance(state, dict) or state.get("version") != GRAPH_VERSION:
+            state = {"version": GRAPH_VERSION, "head": None, "dirty": [], "files": {}}
+        return state
+
+    def _persist(self) -> None:
+        if not (self.project_dir / ".auto-claude").is_dir():
+            return
+        tmp_file = self.cache_file.with_name(
+            f".{self.cache_file.name}.{os.getpid()}.tmp"
+        )
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(self._state, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            # Caching is best-effort
+            tmp_file.unlink(missing_ok=True)
+
+
+_graphs: dict[str, ImportGraph] = {}
+_graphs_lock = threading.Lock()
+
+
+def get_import_graph(
+    project_dir: Path, ts_paths: dict[str, list[str]] | None = None
+) -> ImportGraph:
+    """
+    Get the project's import graph, refreshed against the working tree.
+
+    The graph is shared within the process (a long-running reviewer reuses
+    it between PRs) and persisted between processes.
+
+    Args:
+        project_dir: Project root
+        ts_paths: tsconfig path aliases used to resolve JS/TS imports
+    """
+    key = str(Path(project_dir).resolve())
+    with _graphs_lock:
+        graph = _graphs.get(key)
+        if graph is None:
+            graph = _graphs[key] = ImportGraph(Path(key))
+    graph.refresh(ts_paths)
+    return graph
+
+
+def clear_import_graphs() -> None:
+    """Forget in-memory graphs (persisted graphs are still refreshed)."""
+    with _graphs_lock:
+        _graphs.clear()
@@ -20,6 +20,10 @@ Usage:
 
     print(f"Test frameworks: {result['frameworks']}")
     print(f"Test command: {result['test_command']}")
+
+Results are cached by a fingerprint of the manifests and test configs, in
+memory and under .auto-claude/cache/, so repeated discovery is cheap and
+edits to package.json or pytest config are picked up immediately.
 """
 
 from __future__ import annotations
@@ -29,6 +33,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from .discovery_cache import DiscoveryCache
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
@@ -81,6 +87,18 @@ class TestDiscoveryResult:
     has_tests: bool = False
     coverage_command: str | None = None
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TestDiscoveryResult:
+        """Create from the dictionary produced by TestDiscovery.to_dict."""
+        return cls(
+            frameworks=[TestFramework(**f) for f in data.get("frameworks", [])],
+            test_command=data.get("test_command", ""),
+            test_directories=list(data.get("test_directories", [])),
+            package_manager=data.get("package_manager", ""),
+            has_tests=data.get("has_tests", False),
+            coverage_command=data.get("coverage_command"),
+        )
+
 
 # =============================================================================
 # FRAMEWORK DETECTORS
@@ -182,6 +200,38 @@ FRAMEWORK_PATTERNS = {
 }
 
 
+# Lock files: only their presence matters (package manager detection)
+LOCK_FILES = [
+    "pnpm-lock.yaml",
+    "yarn.lock",
+    "package-lock.json",
+    "bun.lockb",
+    "bun.lock",
+    "uv.lock",
+    "poetry.lock",
+    "Pipfile.lock",
+    "Cargo.lock",
+    "go.sum",
+    "Gemfile.lock",
+]
+
+# Manifests and configs whose content discovery reads (relative to project root)
+WATCHED_FILES = sorted(
+    {
+        "package.json",
+        "pyproject.toml",
+        "requirements.txt",
+        "setup.py",
+        "tests/conftest.py",
+        "Gemfile",
+    }
+    | {cf for pattern in FRAMEWORK_PATTERNS.values() for cf in pattern["config_files"]}
+)
+
+# Exact-name test directories checked by _find_test_directories
+TEST_DIR_NAMES = ["tests", "test", "spec", "__tests__", "specs"]
+
+
 # =============================================================================
 # TEST DISCOVERY
 # =============================================================================
@@ -201,7 +251,8 @@ class TestDiscovery:
 
     def __init__(self) -> None:
         """Initialize the test discovery."""
-        self._cache: dict[str, TestDiscoveryResult] = {}
+        # Results are shared by all instances through the module-level cache
+        self._cache = _cache
 
     def discover(self, project_dir: Path) -> TestDiscoveryResult:
         """
@@ -214,11 +265,20 @@ class TestDiscovery:
             TestDiscoveryResult with detected frameworks and commands
         """
         project_dir = Path(project_dir)
-        cache_key = str(project_dir.resolve())
-
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        resolved_dir = project_dir.resolve()
+        watched = self._watched_paths(resolved_dir)
+
+        hit, cached = self._cache.get(resolved_dir, watched, presence=LOCK_FILES)
+        if hit:
+            if not cached.has_tests:
+                # Test files can appear anywhere in the tree, which the
+                # fingerprint doesn't cover; re-check the negative answer
+                cached.has_tests = self._has_test_files(
+                    project_dir, cached.test_directories
+                )
+            return cached
 
+        fingerprint = self._cache.fingerprint(resolved_dir, watched, LOCK_FILES)
         result = TestDiscoveryResult()
 
         # Detect package manager
@@ -264,9 +324,15 @@ class TestDiscovery:
                     result.coverage_command = framework.coverage_command
                     break
 
-        self._cache[cache_key] = result
+        self._cache.put(resolved_dir, fingerprint, result)
         return result
 
+    def _watched_paths(self, project_dir: Path) -> list[str]:
+        """Config files plus test directories (tracked by their listing)."""
+        watched = list(WATCHED_FILES)
+        watched.extend(self._find_test_directories(project_dir))
+        return watched
+
     def _detect_package_manager(self, project_dir: Path) -> str:
         """Detect the package manager used by the project."""
         if (project_dir / "pnpm-lock.yaml").exists():
@@ -519,14 +585,7 @@ class TestDiscovery:
 
     def _find_test_directories(self, project_dir: Path) -> list[str]:
         """Find test directories in the project."""
-        test_dir_patterns = [
-            "tests",
-            "test",
-            "spec",
-            "__tests__",
-            "specs",
-            "test_*",
-        ]
+        test_dir_patterns = [*TEST_DIR_NAMES, "test_*"]
 
         found_dirs = []
         for pattern in test_dir_patterns:
@@ -597,10 +656,18 @@ class TestDiscovery:
         }
 
     def clear_cache(self) -> None:
-        """Clear the internal cache."""
+        """Clear the in-memory cache (persisted entries are still validated)."""
         self._cache.clear()
 
 
+_cache: DiscoveryCache[TestDiscoveryResult] = DiscoveryCache(
+    "test_discovery",
+    version="1",
+    encode=lambda result: TestDiscovery().to_dict(result),
+    decode=TestDiscoveryResult.from_dict,
+)
+
+
 # =============================================================================
 # CONVENIENCE FUNCTIONS
 # =============================================================================
@@ -0,0 +1,260 @@
+"""
+Test Impact Analysis
+====================
+
+Selects the tests a change can affect, so validation runs a few test files
+instead of a whole (monorepo) suite.
+
+A changed source file impacts:
+- every test file that reaches it through the project's import graph
+  (directly or through other modules), and
+- test files named after it by convention (test_x.py / x_test.py,
+  x.test.ts / x.spec.ts, __tests__/x.ts) in the same directory or in a test
+  directory of one of its ancestors.
+
+Changed test files are selected themselves. The selection falls back to the
+full suite whenever the mapping is uncertain: test configuration changed
+(conftest.py, package.json, jest.config.js, ...), a changed file is in a
+language the import graph doesn't cover, a source file was deleted, a test
+fixture (a non-source file in a test directory) changed, nothing could be
+mapped, or too many tests were reached for a selection to be worth it.
+
+Usage:
+    from analysis.test_impact import select_impacted_tests, selected_test_command
+
+    selection = select_impacted_tests(project_dir, ["src/billing.py"])
+    if not selection.full_suite:
+        command = selected_test_command(test_info, selection.test_files)
+"""
+
+from __future__ import annotations
+
+import posixpath
+import shlex
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .import_graph import JS_SUFFIXES, SOURCE_SUFFIXES, ImportGraph, get_import_graph
+from .test_discovery import (
+    LOCK_FILES,
+    TEST_DIR_NAMES,
+    WATCHED_FILES,
+    TestDiscoveryResult,
+)
+
+# Beyond this many test files the change is too central to bother selecting
+MAX_SELECTED_TESTS = 200
+
+# Languages the import graph can't trace: any change means the full suite
+UNTRACED_SUFFIXES = (".go", ".rs", ".rb", ".java", ".kt", ".swift", ".cs", ".php")
+
+# Files that change how (or which) tests run, by name
+TEST_CONFIG_NAMES = frozenset(
+    {posixpath.basename(path) for path in (*WATCHED_FILES, *LOCK_FILES)}
+    | {"conftest.py", "tox.ini", "noxfile.py", "tsconfig.json", ".babelrc"}
+)
+
+# Frameworks that accept test files as arguments, and the files they run
+_FILE_ARGUMENT_FRAMEWORKS = {
+    "pytest": (".py",),
+    "unittest": (".py",),
+    "jest": JS_SUFFIXES,
+    "vitest": JS_SUFFIXES,
+    "mocha": JS_SUFFIXES,
+    "playwright": JS_SUFFIXES,
+}
+
+
+@dataclass
+class TestSelection:
+    """
+    Tests impacted by a change.
+
+    Attributes:
+        test_files: Project-relative test files to run (empty for full_suite)
+        full_suite: Whether the whole suite has to run instead
+        reason: Why the full suite is needed, or how the tests were selected
+        unmapped_files: Changed source files no test reaches
+    """
+
+    __test__ = False  # Prevent pytest from collecting this as a test class
+
+    test_files: list[str] = field(default_factory=list)
+    full_suite: bool = False
+    reason: str = ""
+    unmapped_files: list[str] = field(default_factory=list)
+
+
+def is_test_file(rel_path: str) -> bool:
+    """Whether a project-relative path is a test file by naming convention."""
+    name = posixpath.basename(rel_path)
+    stem, suffix = posixpath.splitext(name)
+    if suffix == ".py":
+        return stem.startswith("test_") or stem.endswith("_test")
+    if suffix in JS_SUFFIXES:
+        return (
+            stem.endswith((".test", ".spec")) or "__tests__" in rel_path.split("/")[:-1]
+        )
+    return False
+
+
+def select_impacted_tests(
+    project_dir: Path,
+    changed_files: list[str],
+    graph: ImportGraph | None = None,
+) -> TestSelection:
+    """
+    Select the test files that can be affected by a set of changed files.
+
+    Args:
+        project_dir: Project root
+        changed_files: Project-relative paths of the changed files
+        graph: The project's import graph (refreshed one is fetched if None)
+
+    Returns:
+        TestSelection with the tests to run, or full_suite set
+    """
+    if graph is None:
+        graph = get_import_graph(project_dir)
+    files = graph.files()
+    tests_by_name: dict[str, list[str]] = {}
+    for path in files:
+        if is_test_file(path):
+            tests_by_name.setdefault(posixpath.basename(path), []).append(path)
+
+    selected: set[str] = set()
+    unmapped: list[str] = []
+    for changed in dict.fromkeys(p.replace("\\", "/") for p in changed_files):
+        name = posixpath.basename(changed)
+        if name in TEST_CONFIG_NAMES:
+            return _full_suite(f"test configuration changed: {changed}")
+        if changed.endswith(UNTRACED_SUFFIXES):
+            return _full_suite(f"imports of {changed} can't be traced")
+        if is_test_file(changed):
+            if changed in files:
+                selected.add(changed)
+            continue
+        if not changed.endswith(SOURCE_SUFFIXES):
+            if _in_test_directory(changed):
+                return _full_suite(f"test fixture changed: {changed}")
+            continue  # Docs, assets and data can't break tests by import
+        if changed not in files:
+            return _full_suite(f"{changed} was removed or is not indexed")
+
+        impacted = _importing_tests(graph, changed) | _tests_named_after(
+            changed, tests_by_name
+        )
+        if not impacted:
+            unmapped.append(changed)
+        selected |= impacted
+
+    if not selected:
+        if unmapped:
+            return _full_suite("no tests could be mapped to the changed files")
+        return TestSelection(reason="no code or test files changed")
+    if len(selected) > MAX_SELECTED_TESTS:
+        return _full_suite(f"change reaches {len(selected)} test files")
+    return TestSelection(
+        test_files=sorted(selected),
+        reason=f"{len(selected)} test file(s) reach the changed files",
+        unmapped_files=unmapped,
+    )
+
+
+def selected_test_command(
+    test_info: TestDiscoveryResult, test_files: list[str]
+) -> str | None:
+    """
+    Build the command that runs only the given test files.
+
+    Args:
+        test_info: Discovered test frameworks of the project
+        test_files: Project-relative test files
+
+    Returns:
+        Command for the project's primary framework, or None if that
+        framework can't run individual files (or none of them are its tests)
+    """
+    if not test_info.frameworks or not test_info.test_command:
+        return None
+    framework = test_info.frameworks[0]
+    suffixes = _FILE_ARGUMENT_FRAMEWORKS.get(framework.name)
+    if suffixes is None:
+        return None
+    runnable = [path for path in test_files if path.endswith(suffixes)]
+    if not runnable:
+        return None
+
+    arguments = " ".join(shlex.quote(path) for path in runnable)
+    command = test_info.test_command
+    if framework.name == "unittest":
+        # "discover" takes no file arguments; unittest accepts paths directly
+        return f"python -m unittest {arguments}"
+    if command.endswith(" test") and not command.startswith("npx"):
+        # "npm test" / "pnpm test": pass the files through to the script
+        return f"{command} -- {arguments}"
+    return f"{command} {arguments}"
+
+
+def _full_suite(reason: str) -> TestSelection:
+    return TestSelection(full_suite=True, reason=reason)
+
+
+def _in_test_directory(rel_path: str) -> bool:
+    return any(part in TEST_DIR_NAMES for part in rel_path.split("/")[:-1])
+
+
+def _importing_tests(graph: ImportGraph, rel_path: str) -> set[str]:
+    """Test files that import rel_path, directly or through other modules."""
+    tests: set[str] = set()
+    seen = {rel_path}
+    queue = deque([rel_path])
+    while queue:
+        for importer in graph.dependents(queue.popleft()):
+            if importer in seen:
+                continue
+            seen.add(importer)
+            if is_test_file(importer):
+                tests.add(importer)
+            queue.append(importer)
+    return tests
+
+
+def _tests_named_after(rel_path: str, tests_by_name: dict[str, list[str]]) -> set[str]:
+    """Test files named after rel_path next to it or in an ancestor's tests."""
+    directory = posixpath.dirname(rel_path)
+    stem, suffix = posixpath.splitext(posixpath.basename(rel_path))
+    if suffix == ".py":
+        names = [f"test_{stem}.py", f"{stem}_test.py"]
+    else:
+        names = [
+            f"{stem}{kind}{ext}" for kind in (".test", ".spec") for ext in JS_SUFFIXES
+        ]
+        names += [f"{stem}{ext}" for ext in JS_SUFFIXES]  # Inside __tests__/
+
+    tests = set()
+    for name in names:
+        for test in tests_by_name.get(name, ()):
+            if not is_test_file(test) or test == rel_path:
+                continue
+            if _test_root(test) in _ancestors(directory):
+                tests.add(test)
+    return tests
+
+
+def _test_root(test_path: str) -> str:
+    """Directory a test file belongs to: above its test directory, if any."""
+    parts = test_path.split("/")[:-1]
+    for index, part in enumerate(parts):
+        if part in TEST_DIR_NAMES:
+            return "/".join(parts[:index])
+    return "/".join(parts)
+
+
+def _ancestors(directory: str) -> set[str]:
+    ancestors = {""}
+    while directory:
+        ancestors.add(directory)
+        directory = posixpath.dirname(directory)
+    return ancestors
@@ -107,22 +107,64 @@ def _get_cached_project_data(
     return project_index, project_capabilities
 
 
-def invalidate_project_cache(project_dir: Path | None = None) -> None:
+def invalidate_project_cache(
+    project_dir: Path | None = None, services: list[str] | None = None
+) -> None:
     """
     Invalidate the project index cache.
 
     Args:
         project_dir: Specific project to invalidate, or None to clear all
+        services: Only these services changed (see refresh_project_index).
+            The cached entry is kept; the changed services and the project-wide
+            sections are reloaded from project_index.json and the capabilities
+            recomputed. An empty list reloads the project-wide sections only.
     """
     with _CACHE_LOCK:
         if project_dir is None:
             _PROJECT_INDEX_CACHE.clear()
             logger.debug("Cleared all project index cache entries")
-        else:
-            key = str(project_dir.resolve())
+            return
+        key = str(project_dir.resolve())
+        if services is None:
             if key in _PROJECT_INDEX_CACHE:
                 del _PROJECT_INDEX_CACHE[key]
                 logger.debug(f"Invalidated project index cache for {project_dir}")
+            return
+        cached = _PROJECT_INDEX_CACHE.get(key)
+
+    if cached is None:
+        return
+
+    # Load outside the lock, then patch only the changed services so cached
+    # entries of unchanged services are kept as they are
+    fresh_index = load_project_index(project_dir)
+    cached_index, _, cached_time = cached
+    cached_services = cached_index.get("services") or {}
+    changed = set(services)
+    project_index = {k: v for k, v in fresh_index.items() if k != "services"}
+    project_index["services"] = {
+        name: (
+            cached_services[name]
+            if name not in changed and name in cached_services
+            else service
+        )
+        for name, service in (fresh_index.get("services") or {}).items()
+    }
+    project_capabilities = detect_project_capabilities(project_index)
+
+    with _CACHE_LOCK:
+        # Skip if the entry was replaced or dropped meanwhile
+        if _PROJECT_INDEX_CACHE.get(key) is cached:
+            _PROJECT_INDEX_CACHE[key] = (
+                project_index,
+                project_capabilities,
+                cached_time,
+            )
+            logger.debug(
+                f"Invalidated services {sorted(changed)} in project index cache "
+                f"for {project_dir}"
+            )
 
 
 from agents.tools_pkg import (
@@ -143,6 +185,7 @@ from core.auth import (
     require_auth_token,
     validate_token_not_encrypted,
 )
+from core.mcp_pool import pool_command_servers
 from linear_updater import is_linear_enabled
 from prompts_pkg.project_context import detect_project_capabilities, load_project_index
 from security import bash_security_hook
@@ -771,6 +814,9 @@ def create_client(
                 server_config["headers"] = custom["headers"]
             mcp_servers[server_id] = server_config
 
+    # Command servers run as shared warm instances instead of one per session
+    mcp_servers = pool_command_servers(mcp_servers, cwd=project_dir)
+
     # Build system prompt
     base_prompt = (
         f"You are an expert full-stack developer building production-quality software. "
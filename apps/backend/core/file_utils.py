@@ -23,6 +23,14 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import IO, Any, Literal
 
+# The recovery database (services.recovery_store) and its WAL/SHM sidecars
+# belong to one copy of a spec and are never copied between a worktree and the
+# main project; its JSON exports are synced instead. Defined here, outside the
+# services package, so the sync code doesn't import it (the GitHub and GitLab
+# runners have their own top-level "services" package).
+RECOVERY_DB_FILE = "recovery.db"
+RECOVERY_DB_GLOB = f"{RECOVERY_DB_FILE}*"
+
 
 @contextmanager
 def atomic_write(
@@ -0,0 +1,631 @@
+"""
+MCP Server Pool
+===============
+
+Shared, long-lived command (stdio) MCP servers for agent sessions.
+
+create_client() declares command MCP servers such as context7
+(npx -y @upstash/context7-mcp), electron, puppeteer and the project's custom
+command servers, and the CLI used to start fresh instances of them for every
+session: every planner, coder, QA and fixer session cold-started Node and
+re-resolved the packages before its first tool call. The pool keeps one warm
+instance of each stateless command server (POOLED_MCP_SERVERS) per process,
+and sessions reach it over a local Streamable HTTP endpoint instead:
+
+- the bridge listens on 127.0.0.1 (the paths carry a random token) and
+  relays JSON-RPC between any number of sessions and the single stdio
+  process, renumbering request IDs so every response finds its session;
+- the instance is started by the first session that uses it and initialized
+  once; each session's initialize is answered with the cached result;
+- a supervisor thread pings the instances, restarts the ones that died or
+  stopped answering, and stops the ones idle for longer than
+  MCP_SERVER_IDLE_SECONDS (the next session starts them again).
+
+Stateful servers keep one instance per session: puppeteer and electron drive
+a browser or app whose pages and state belong to the session, and the
+project's custom command servers may hold state too.
+
+Set MCP_SERVER_POOL_ENABLED=false to give every session its own instances
+again.
+
+Usage:
+    from core.mcp_pool import pool_command_servers
+
+    mcp_servers = pool_command_servers(mcp_servers, cwd=project_dir)
+"""
+
+import atexit
+import itertools
+import json
+import logging
+import os
+import re
+import secrets
+import shutil
+import subprocess
+import threading
+import time
+from collections.abc import Collection
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Command servers that are safe to share: they keep no per-session state
+POOLED_MCP_SERVERS = frozenset({"context7"})
+
+# Protocol version and client info of the pool's own initialize handshake
+PROTOCOL_VERSION = "2025-06-18"
+CLIENT_INFO = {"name": "auto-claude-mcp-pool", "version": "1.0.0"}
+
+# npx may download the package the first time a server starts
+START_TIMEOUT_SECONDS = 120.0
+
+# Longest a tool call may take before its session gets an error
+REQUEST_TIMEOUT_SECONDS = 600.0
+
+# Supervisor pass interval, and how long a ping may take
+HEALTH_CHECK_INTERVAL_SECONDS = 30.0
+PING_TIMEOUT_SECONDS = 10.0
+
+# Instances unused this long are stopped (override: MCP_SERVER_IDLE_SECONDS)
+DEFAULT_IDLE_SECONDS = 900.0
+
+# JSON-RPC error codes
+_PARSE_ERROR = -32700
+_METHOD_NOT_FOUND = -32601
+_INTERNAL_ERROR = -32603
+
+
+def is_pool_enabled() -> bool:
+    """Check if command MCP servers should be shared between sessions."""
+    return os.environ.get("MCP_SERVER_POOL_ENABLED", "true").lower() == "true"
+
+
+def get_idle_seconds() -> float:
+    """Idle lifetime of a pooled instance."""
+    try:
+        return float(os.environ.get("MCP_SERVER_IDLE_SECONDS", DEFAULT_IDLE_SECONDS))
+    except ValueError:
+        return DEFAULT_IDLE_SECONDS
+
+
+class MCPServerError(Exception):
+    """A pooled MCP server could not be started or did not answer."""
+
+
+class _Pending:
+    """A request waiting for the server's response."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.response: dict | None = None
+
+
+class PooledServer:
+    """
+    One warm stdio MCP server shared by every session.
+
+    Args:
+        name: Server name (for logs)
+        command: Executable to run
+        args: Its arguments
+        cwd: Working directory of the process
+        env: Extra environment variables of the process
+    """
+
+    def __init__(
+        self,
+        name: str,
+        command: str,
+        args: list[str],
+        cwd: Path,
+        env: dict[str, str] | None = None,
+    ):
+        self.name = name
+        self.command = command
+        self.args = list(args)
+        self.cwd = Path(cwd)
+        self.env = dict(env or {})
+        self.init_result: dict | None = None
+        self.starts = 0
+        self.last_used = time.monotonic()
+        self._wanted = False  # Should be running (started and not idle-stopped)
+        self._in_flight = 0
+        self._in_flight_lock = threading.Lock()
+        self._process: subprocess.Popen | None = None
+        self._start_lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending: dict[int, _Pending] = {}
+        self._ids = itertools.count(1)
+
+    @property
+    def running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    @property
+    def pid(self) -> int | None:
+        return self._process.pid if self.running else None
+
+    @property
+    def wanted(self) -> bool:
+        return self._wanted
+
+    @property
+    def busy(self) -> bool:
+        return self._in_flight > 0
+
+    def ensure_started(self) -> None:
+        """Start and initialize the instance unless it is running."""
+        with self._start_lock:
+            self._wanted = True
+            if self.running and self.init_result is not None:
+                return
+            self._stop_process()
+            started_at = time.monotonic()
+            self._spawn()
+            try:
+                response = self._call(
+                    "initialize",
+                    {
+                        "protocolVersion": PROTOCOL_VERSION,
+                        "capabilities": {},
+                        "clientInfo": CLIENT_INFO,
+                    },
+                    START_TIMEOUT_SECONDS,
+                )
+                if "result" not in response:
+                    raise MCPServerError(f"initialize failed: {response.get('error')}")
+                self._write({"jsonrpc": "2.0", "method": "notifications/initialized"})
+            except MCPServerError:
+                self._stop_process()
+                raise
+            self.init_result = response["result"]
+            self.starts += 1
+            logger.info(
+                f"[MCPPool] Started {self.name} (pid {self._process.pid}) in "
+                f"{time.monotonic() - started_at:.1f}s"
+            )
+
+    def restart(self) -> None:
+        """Replace the instance with a fresh one."""
+        with self._start_lock:
+            self._stop_process()
+            self.ensure_started()
+
+    def stop(self) -> None:
+        """Stop the instance (a later session starts it again)."""
+        with self._start_lock:
+            self._wanted = False
+            self._stop_process()
+
+    def ping(self) -> bool:
+        """Whether the instance answers a ping in time."""
+        if not self.running:
+            return False
+        try:
+            return "result" in self._call("ping", None, PING_TIMEOUT_SECONDS)
+        except MCPServerError:
+            return False
+
+    def handle(self, message: dict) -> dict | None:
+        """
+        Relay one JSON-RPC message of a session.
+
+        Returns:
+            The response for the session (None for notifications and for
+            responses, which are not relayed)
+        """
+        method = message.get("method")
+        if not isinstance(method, str):
+            # The pool answers the server's requests itself
+            return None
+        self.last_used = time.monotonic()
+        request_id = message.get("id")
+        is_request = "id" in message
+
+        if not is_request:
+            # The instance was initialized once; cancellations refer to IDs
+            # the server never saw
+            if method not in ("notifications/initialized", "notifications/cancelled"):
+                try:
+                    self.ensure_started()
+                    self._write(message)
+                except MCPServerError as e:
+                    logger.warning(f"[MCPPool] {self.name}: dropped {method}: {e}")
+            return None
+
+        if method == "ping":
+            return {"jsonrpc": "2.0", "id": request_id, "result": {}}
+
+        with self._in_flight_lock:
+            self._in_flight += 1
+        try:
+            self.ensure_started()
+            if method == "initialize":
+                result = self.init_result
+                return {"jsonrpc": "2.0", "id": request_id, "result": result}
+            response = self._call(
+                method, message.get("params"), REQUEST_TIMEOUT_SECONDS
+            )
+        except MCPServerError as e:
+            return {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {"code": _INTERNAL_ERROR, "message": str(e)},
+            }
+        finally:
+            with self._in_flight_lock:
+                self._in_flight -= 1
+            self.last_used = time.monotonic()
+        return {**response, "id": request_id}
+
+    def _spawn(self) -> None:
+        executable = shutil.which(self.command)
+        if executable is None:
+            raise MCPServerError(f"command not found: {self.command}")
+        try:
+            self._process = subprocess.Popen(
+                [executable, *self.args],
+                cwd=self.cwd,
+                env={**os.environ, **self.env},
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            raise MCPServerError(f"failed to start {self.command}: {e}") from e
+        threading.Thread(
+            target=self._read_loop,
+            args=(self._process,),
+            name=f"mcp-pool-{self.name}",
+            daemon=True,
+        ).start()
+
+    def _stop_process(self) -> None:
+        process, self._process = self._process, None
+        self.init_result = None
+        if process is None:
+            return
+        if process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        self._fail_pending()
+
+    def _read_loop(self, process: subprocess.Popen) -> None:
+        for line in process.stdout:
+            try:
+                payload = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Not a JSON-RPC message (stray output)
+            for message in payload if isinstance(payload, list) else [payload]:
+                if isinstance(message, dict):
+                    self._on_message(message)
+        # The process exited: nothing will answer the pending requests
+        if process is self._process or self._process is None:
+            self._fail_pending()
+
+    def _on_message(self, message: dict) -> None:
+        if "method" in message:
+            if "id" in message:
+                # Server-to-client request (sampling, roots...): the pool
+                # declared no client capabilities, so only ping is answered
+                if message["method"] == "ping":
+                    reply = {"jsonrpc": "2.0", "id": message["id"], "result": {}}
+                else:
+                    reply = {
+                        "jsonrpc": "2.0",
+                        "id": message["id"],
+                        "error": {
+                            "code": _METHOD_NOT_FOUND,
+                            "message": "Not supported by the MCP server pool",
+                        },
+                    }
+                try:
+                    self._write(reply)
+                except MCPServerError:
+                    pass
+            return  # Server notifications are not relayed
+        with self._pending_lock:
+            pending = self._pending.pop(message.get("id"), None)
+        if pending is not None:
+            pending.response = message
+            pending.event.set()
+
+    def _fail_pending(self) -> None:
+        with self._pending_lock:
+            pending, self._pending = list(self._pending.values()), {}
+        for entry in pending:
+            entry.event.set()
+
+    def _write(self, message: dict) -> None:
+        process = self._process
+        if process is None or process.poll() is not None:
+            raise MCPServerError(f"{self.name} is not running")
+        data = (json.dumps(message) + "\n").encode("utf-8")
+        try:
+            with self._write_lock:
+                process.stdin.write(data)
+                process.stdin.flush()
+        except (OSError, ValueError) as e:
+            raise MCPServerError(f"{self.name} closed its input: {e}") from e
+
+    def _call(self, method: str, params: Any, timeout: float) -> dict:
+        internal_id = next(self._ids)
+        pending = _Pending()
+        with self._pending_lock:
+            self._pending[internal_id] = pending
+        message: dict[str, Any] = {
+            "jsonrpc": "2.0",
+            "id": internal_id,
+            "method": method,
+        }
+        if params is not None:
+            message["params"] = params
+        try:
+            self._write(message)
+        except MCPServerError:
+            with self._pending_lock:
+                self._pending.pop(internal_id, None)
+            raise
+        if not pending.event.wait(timeout):
+            with self._pending_lock:
+                self._pending.pop(internal_id, None)
+            raise MCPServerError(f"{self.name} did not answer {method} in {timeout}s")
+        if pending.response is None:
+            raise MCPServerError(f"{self.name} exited during {method}")
+        return pending.response
+
+
+class _BridgeHandler(BaseHTTPRequestHandler):
+    """Streamable HTTP endpoint of the pooled servers (JSON responses only)."""
+
+    protocol_version = "HTTP/1.1"
+    server: "_BridgeServer"
+
+    def do_POST(self):
+        target = self.server.pool.server_for_path(self.path)
+        if target is None:
+            self._send(404, None)
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            error = {"code": _PARSE_ERROR, "message": "Parse error"}
+            self._send(400, {"jsonrpc": "2.0", "id": None, "error": error})
+            return
+        messages = payload if isinstance(payload, list) else [payload]
+        responses = [
+            response
+            for response in (
+                target.handle(m) if isinstance(m, dict) else None for m in messages
+            )
+            if response is not None
+        ]
+        if not responses:
+            self._send(202, None)
+        else:
+            self._send(200, responses if isinstance(payload, list) else responses[0])
+
+    def do_GET(self):
+        # No server-initiated stream: server notifications are not relayed
+        self._send(405, None)
+
+    def do_DELETE(self):
+        # Sessions share the instance: ending one keeps it running
+        self._send(200, None)
+
+    def _send(self, status: int, body: Any) -> None:
+        data = b"" if body is None else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        if body is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class _BridgeServer(ThreadingHTTPServer):
+    daemon_threads = True
+    pool: "MCPServerPool"
+
+
+class MCPServerPool:
+    """
+    Warm instances of command MCP servers, bridged to local HTTP endpoints.
+
+    Args:
+        idle_seconds: Instances unused this long are stopped
+        check_interval: Seconds between supervisor passes (None: no
+            supervisor thread, call check_health() yourself)
+    """
+
+    def __init__(
+        self,
+        idle_seconds: float | None = None,
+        check_interval: float | None = HEALTH_CHECK_INTERVAL_SECONDS,
+    ):
+        self.idle_seconds = get_idle_seconds() if idle_seconds is None else idle_seconds
+        self.check_interval = check_interval
+        self._token = secrets.token_urlsafe(16)
+        self._lock = threading.Lock()
+        self._servers: dict[str, PooledServer] = {}
+        self._routes: dict[tuple, str] = {}
+        self._httpd: _BridgeServer | None = None
+        self._closed = threading.Event()
+
+    def url_for(
+        self,
+        name: str,
+        command: str,
+        args: list[str],
+        cwd: Path,
+        env: dict[str, str] | None = None,
+    ) -> str:
+        """
+        Local endpoint of the pooled instance of a command server.
+
+        Nothing is started until a session uses the endpoint.
+        """
+        key = (
+            command,
+            tuple(args),
+            str(Path(cwd).resolve()),
+            tuple(sorted((env or {}).items())),
+        )
+        with self._lock:
+            self._start_bridge()
+            route = self._routes.get(key)
+            if route is None:
+                slug = re.sub(r"[^A-Za-z0-9_-]", "-", name)
+                route = f"{len(self._routes)}-{slug}"
+                self._servers[route] = PooledServer(name, command, args, cwd, env)
+                self._routes[key] = route
+            port = self._httpd.server_address[1]
+        return f"http://127.0.0.1:{port}/mcp/{self._token}/{route}"
+
+    def server_for_path(self, path: str) -> PooledServer | None:
+        """The pooled server an endpoint path refers to."""
+        parts = path.split("?", 1)[0].strip("/").split("/")
+        if len(parts) != 3 or parts[0] != "mcp":
+            return None
+        if not secrets.compare_digest(parts[1], self._token):
+            return None
+        return self._servers.get(parts[2])
+
+    def servers(self) -> list[PooledServer]:
+        with self._lock:
+            return list(self._servers.values())
+
+    def check_health(self) -> None:
+        """One supervisor pass: stop idle instances, restart broken ones."""
+        now = time.monotonic()
+        for server in self.servers():
+            if not server.wanted or server.busy:
+                continue
+            if now - server.last_used > self.idle_seconds:
+                logger.info(f"[MCPPool] Stopping idle {server.name}")
+                server.stop()
+            elif not server.ping():
+                logger.warning(f"[MCPPool] {server.name} is unhealthy, restarting")
+                try:
+                    server.restart()
+                except MCPServerError as e:
+                    logger.warning(f"[MCPPool] Failed to restart {server.name}: {e}")
+
+    def close(self) -> None:
+        """Stop every instance and the bridge."""
+        self._closed.set()
+        with self._lock:
+            servers, self._servers, self._routes = list(self._servers.values()), {}, {}
+            httpd, self._httpd = self._httpd, None
+        for server in servers:
+            server.stop()
+        if httpd is not None:
+            httpd.shutdown()
+            httpd.server_close()
+
+    def _start_bridge(self) -> None:
+        if self._httpd is not None:
+            return
+        httpd = _BridgeServer(("127.0.0.1", 0), _BridgeHandler)
+        httpd.pool = self
+        threading.Thread(
+            target=httpd.serve_forever, name="mcp-pool-bridge", daemon=True
+        ).start()
+        if self.check_interval is not None:
+            threading.Thread(
+                target=self._supervise, name="mcp-pool-supervisor", daemon=True
+            ).start()
+        self._httpd = httpd
+
+    def _supervise(self) -> None:
+        while not self._closed.wait(self.check_interval):
+            try:
+                self.check_health()
+            except Exception as e:
+                logger.warning(f"[MCPPool] Health check failed: {e}")
+
+
+# =============================================================================
+# Process-wide pool
+# =============================================================================
+
+_POOL: MCPServerPool | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_pool() -> MCPServerPool:
+    """The pool shared by every session of this process."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = MCPServerPool()
+        return _POOL
+
+
+def shutdown_pool() -> None:
+    """Stop the shared pool's instances (a later session starts a new pool)."""
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.close()
+
+
+atexit.register(shutdown_pool)
+
+
+def pool_command_servers(
+    mcp_servers: dict[str, Any],
+    cwd: Path,
+    pooled_servers: Collection[str] = POOLED_MCP_SERVERS,
+) -> dict[str, Any]:
+    """
+    Point a session's stateless command MCP servers at pooled instances.
+
+    HTTP and SDK servers are kept as they are, and so are command servers
+    not in pooled_servers and those whose executable isn't on PATH (the CLI
+    reports those as before).
+
+    Args:
+        mcp_servers: MCP server configs of the session, keyed by name
+        cwd: Working directory of the session
+        pooled_servers: Names of the command servers that may be shared
+
+    Returns:
+        The configs, with the pooled servers replaced by local HTTP endpoints
+    """
+    if not is_pool_enabled():
+        return mcp_servers
+    pooled: dict[str, Any] = {}
+    for name, config in mcp_servers.items():
+        poolable = (
+            name in pooled_servers
+            and isinstance(config, dict)
+            and "command" in config
+            and config.get("type", "stdio") == "stdio"
+        )
+        if not poolable or shutil.which(config["command"]) is None:
+            pooled[name] = config
+            continue
+        try:
+            url = get_pool().url_for(
+                name, config["command"], config.get("args", []), cwd, config.get("env")
+            )
+        except OSError as e:
+            logger.warning(f"[MCPPool] Not pooling {name}: {e}")
+            pooled[name] = config
+            continue
+        pooled[name] = {"type": "http", "url": url}
+    return pooled
@@ -0,0 +1,171 @@
+"""
+Implementation Plan Cache
+=========================
+
+Shared, read-only view of implementation_plan.json.
+
+The status UI and the coder loop call several core.progress functions per
+tick (counts, next subtask, phase summary), and each of them used to parse
+the plan again. load_plan() parses a plan once per version of the file,
+identified by its stat signature, and hands every caller the same frozen
+snapshot. Derived counts are computed lazily, once per snapshot.
+
+A file rewritten within the filesystem's timestamp granularity can keep its
+stat signature, so a snapshot of a recently modified file is confirmed
+against the file's bytes before it is reused. Snapshots of the most
+recently used MAX_CACHED_PLANS plans are kept.
+
+Usage:
+    from core.plan_cache import load_plan
+
+    snapshot = load_plan(spec_dir / "implementation_plan.json")
+    completed, total = snapshot.counts["completed"], snapshot.counts["total"]
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+# Files modified less than this long before they were read are re-checked
+# byte-for-byte on the next load (covers 1-2s mtime filesystems)
+RACY_WINDOW_NS = 2_000_000_000
+
+# Plans (spec directories) whose snapshots are kept
+MAX_CACHED_PLANS = 32
+
+# Statuses counted separately by PlanSnapshot.counts; anything else is pending
+COUNTED_STATUSES = ("completed", "in_progress", "pending", "failed")
+
+
+def freeze(value: Any) -> Any:
+    """Return a read-only copy of parsed JSON (dicts become mapping proxies,
+    lists become tuples)."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Return a plain, mutable copy of a frozen value."""
+    if isinstance(value, MappingProxyType):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+class PlanSnapshot:
+    """
+    One parsed version of an implementation plan.
+
+    Attributes:
+        plan: The plan as read-only mappings and tuples
+        raw: The file's bytes, used to confirm the snapshot
+    """
+
+    def __init__(self, raw: bytes):
+        self.raw = raw
+        self.plan = freeze(json.loads(raw.decode("utf-8")))
+
+    @property
+    def phases(self) -> tuple:
+        return self.plan.get("phases", ())
+
+    @cached_property
+    def counts(self) -> MappingProxyType:
+        """Subtask counts by status, plus "total"."""
+        counts = dict.fromkeys(COUNTED_STATUSES, 0)
+        counts["total"] = 0
+        for phase in self.phases:
+            for subtask in phase.get("subtasks", ()):
+                counts["total"] += 1
+                status = subtask.get("status", "pending")
+                counts[status if status in COUNTED_STATUSES else "pending"] += 1
+        return MappingProxyType(counts)
+
+    @cached_property
+    def phase_counts(self) -> tuple[tuple[int, int], ...]:
+        """(completed, total) subtasks of each phase, in plan order."""
+        return tuple(
+            (
+                sum(
+                    1
+                    for s in phase.get("subtasks", ())
+                    if s.get("status") == "completed"
+                ),
+                len(phase.get("subtasks", ())),
+            )
+            for phase in self.phases
+        )
+
+    def to_dict(self) -> dict:
+        """Return a fresh, mutable copy of the plan."""
+        return thaw(self.plan)
+
+
+@dataclass
+class _Entry:
+    signature: tuple[int, int, int]
+    racy: bool
+    snapshot: PlanSnapshot
+
+
+_entries: OrderedDict[str, _Entry] = OrderedDict()
+_lock = threading.Lock()
+
+
+def load_plan(plan_file: Path) -> PlanSnapshot:
+    """
+    Load an implementation plan, reusing the parsed plan while the file is
+    unchanged.
+
+    Args:
+        plan_file: Path to implementation_plan.json
+
+    Returns:
+        The plan's current snapshot (shared; do not mutate)
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError, UnicodeDecodeError: If the file is not valid JSON
+    """
+    key = os.fspath(plan_file)
+    read_at_ns = time.time_ns()
+    st = os.stat(plan_file)
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None:
+            _entries.move_to_end(key)
+    if entry is not None and entry.signature == signature and not entry.racy:
+        return entry.snapshot
+
+    raw = Path(plan_file).read_bytes()
+    if entry is not None and entry.snapshot.raw == raw:
+        snapshot = entry.snapshot
+    else:
+        snapshot = PlanSnapshot(raw)
+
+    racy = read_at_ns - st.st_mtime_ns < RACY_WINDOW_NS
+    with _lock:
+        _entries[key] = _Entry(signature, racy, snapshot)
+        _entries.move_to_end(key)
+        while len(_entries) > MAX_CACHED_PLANS:
+            _entries.popitem(last=False)
+    return snapshot
+
+
+def clear_plan_cache() -> None:
+    """Forget all cached plans (useful for testing)."""
+    with _lock:
+        _entries.clear()
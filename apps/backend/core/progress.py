@@ -11,6 +11,7 @@ Enhanced with colored output, icons, and better visual formatting.
 import json
 from pathlib import Path
 
+from core.plan_cache import load_plan, thaw
 from core.plan_normalization import normalize_subtask_aliases
 from ui import (
     Icons,
@@ -43,19 +44,8 @@ def count_subtasks(spec_dir: Path) -> tuple[int, int]:
         return 0, 0
 
     try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
-
-        total = 0
-        completed = 0
-
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                total += 1
-                if subtask.get("status") == "completed":
-                    completed += 1
-
-        return completed, total
+        counts = load_plan(plan_file).counts
+        return counts["completed"], counts["total"]
     except (OSError, json.JSONDecodeError, UnicodeDecodeError):
         return 0, 0
 
@@ -81,18 +71,7 @@ def count_subtasks_detailed(spec_dir: Path) -> dict:
         return result
 
     try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
-
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                result["total"] += 1
-                status = subtask.get("status", "pending")
-                if status in result:
-                    result[status] += 1
-                else:
-                    result["pending"] += 1
-
+        result.update(load_plan(plan_file).counts)
         return result
     except (OSError, json.JSONDecodeError, UnicodeDecodeError):
         return result
@@ -182,16 +161,14 @@ def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
 
         # Phase summary
         try:
-            with open(spec_dir / "implementation_plan.json", encoding="utf-8") as f:
-                plan = json.load(f)
+            snapshot = load_plan(spec_dir / "implementation_plan.json")
+            plan = snapshot.plan
 
             print("\nPhases:")
-            for phase in plan.get("phases", []):
+            for phase, (phase_completed, phase_total) in zip(
+                snapshot.phases, snapshot.phase_counts
+            ):
                 phase_subtasks = phase.get("subtasks", [])
-                phase_completed = sum(
-                    1 for s in phase_subtasks if s.get("status") == "completed"
-                )
-                phase_total = len(phase_subtasks)
                 phase_name = phase.get("name", phase.get("id", "Unknown"))
 
                 if phase_completed == phase_total:
@@ -302,8 +279,7 @@ def get_plan_summary(spec_dir: Path) -> dict:
         }
 
     try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
+        plan = load_plan(plan_file).plan
 
         summary = {
             "workflow_type": plan.get("workflow_type"),
@@ -321,7 +297,7 @@ def get_plan_summary(spec_dir: Path) -> dict:
                 "id": phase.get("id"),
                 "phase": phase.get("phase"),
                 "name": phase.get("name"),
-                "depends_on": phase.get("depends_on", []),
+                "depends_on": thaw(phase.get("depends_on", [])),
                 "subtasks": [],
                 "completed": 0,
                 "total": 0,
@@ -376,8 +352,7 @@ def get_current_phase(spec_dir: Path) -> dict | None:
         return None
 
     try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
+        plan = load_plan(plan_file).plan
 
         for phase in plan.get("phases", []):
             subtasks = phase.get("subtasks", phase.get("chunks", []))
@@ -416,8 +391,7 @@ def get_next_subtask(spec_dir: Path) -> dict | None:
         return None
 
     try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
+        plan = load_plan(plan_file).plan
 
         phases = plan.get("phases", [])
 
@@ -443,7 +417,7 @@ def get_next_subtask(spec_dir: Path) -> dict | None:
                 phase_id_value if phase_id_value is not None else phase.get("phase")
             )
             depends_on_raw = phase.get("depends_on", [])
-            if isinstance(depends_on_raw, list):
+            if isinstance(depends_on_raw, (list, tuple)):
                 depends_on = [str(d) for d in depends_on_raw if d is not None]
             elif depends_on_raw is None:
                 depends_on = []
@@ -459,7 +433,7 @@ def get_next_subtask(spec_dir: Path) -> dict | None:
             for subtask in phase.get("subtasks", phase.get("chunks", [])):
                 status = subtask.get("status", "pending")
                 if status in {"pending", "not_started", "not started"}:
-                    subtask_out, _changed = normalize_subtask_aliases(subtask)
+                    subtask_out, _changed = normalize_subtask_aliases(thaw(subtask))
                     subtask_out["status"] = "pending"
                     return {
                         **subtask_out,
@@ -474,6 +448,62 @@ def get_next_subtask(spec_dir: Path) -> dict | None:
         return None
 
 
+def get_parallel_subtasks(spec_dir: Path, limit: int) -> list[dict]:
+    """
+    Find pending subtasks that can be worked on at the same time.
+
+    Looks at the phase get_next_subtask() would pick from. If that phase is
+    marked parallel_safe, returns up to ``limit`` of its pending subtasks in
+    plan order; otherwise returns just the next subtask.
+
+    Args:
+        spec_dir: Directory containing implementation_plan.json
+        limit: Maximum number of subtasks to return
+
+    Returns:
+        List of subtask dicts (same shape as get_next_subtask()), empty if
+        all complete
+    """
+    next_subtask = get_next_subtask(spec_dir)
+    if not next_subtask:
+        return []
+    if limit <= 1:
+        return [next_subtask]
+
+    try:
+        plan = load_plan(spec_dir / "implementation_plan.json").plan
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+        return [next_subtask]
+
+    for phase in plan.get("phases", []):
+        phase_id_value = phase.get("id")
+        phase_id = phase_id_value if phase_id_value is not None else phase.get("phase")
+        if phase_id != next_subtask["phase_id"]:
+            continue
+        if not phase.get("parallel_safe"):
+            break
+
+        batch = []
+        for subtask in phase.get("subtasks", phase.get("chunks", [])):
+            status = subtask.get("status", "pending")
+            if status in {"pending", "not_started", "not started"}:
+                subtask_out, _changed = normalize_subtask_aliases(thaw(subtask))
+                subtask_out["status"] = "pending"
+                batch.append(
+                    {
+                        **subtask_out,
+                        "phase_id": phase_id,
+                        "phase_name": phase.get("name"),
+                        "phase_num": phase.get("phase"),
+                    }
+                )
+                if len(batch) >= limit:
+                    break
+        return batch
+
+    return [next_subtask]
+
+
 def format_duration(seconds: float) -> str:
     """Format a duration in human-readable form."""
     if seconds < 60:
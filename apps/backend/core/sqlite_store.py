@@ -0,0 +1,98 @@
+"""
+SQLite Store Base
+=================
+
+Connection and transaction handling shared by the SQLite-backed stores
+(recovery state, review finding caches, rate limit state, embedding cache).
+
+Each thread gets its own connection to the database, in WAL mode so readers
+never block the writer and several processes can share one file. Connections
+run in autocommit mode; multi-statement updates go through ``_transaction()``,
+which takes the write lock up front (``BEGIN IMMEDIATE``) so read-modify-write
+sequences are atomic across processes.
+
+Usage:
+    from core.sqlite_store import SQLiteStore
+
+    class MyCache(SQLiteStore):
+        def __init__(self, db_path: Path):
+            super().__init__(db_path, _SCHEMA)
+
+        def put(self, key: str, value: str) -> None:
+            with self._transaction() as conn:
+                conn.execute("INSERT OR REPLACE INTO items VALUES (?, ?)", ...)
+                self._trim(conn, "items", MAX_ITEMS)
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+# Wait this long for another process's write transaction before failing
+BUSY_TIMEOUT_SECONDS = 30.0
+
+
+class SQLiteStore:
+    """
+    Base for stores kept in one SQLite database.
+
+    Args:
+        db_path: Database file (parent directory created if needed)
+        schema: Script creating the store's tables, run on open
+    """
+
+    # Row factory of the store's connections (None: plain tuples)
+    row_factory: Any = None
+
+    def __init__(self, db_path: Path, schema: str):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._connect().executescript(schema)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=BUSY_TIMEOUT_SECONDS,
+                isolation_level=None,  # Transactions are explicit
+            )
+            conn.row_factory = self.row_factory
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    @contextmanager
+    def _transaction(self, write: bool = True) -> Iterator[sqlite3.Connection]:
+        """Run a block in one transaction, rolled back if it raises."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @staticmethod
+    def _trim(conn: sqlite3.Connection, table: str, max_entries: int) -> None:
+        """Drop a table's oldest rows beyond max_entries."""
+        # Rows are reinserted on replace, so rowid order is insertion order
+        conn.execute(
+            f"DELETE FROM {table} WHERE rowid <= (SELECT MAX(rowid) FROM {table}) - ?",
+            (max_entries,),
+        )
@@ -13,6 +13,7 @@ import subprocess
 import sys
 from pathlib import Path
 
+from core.file_utils import RECOVERY_DB_GLOB
 from core.git_executable import run_git
 from merge import FileTimelineTracker
 from security.constants import ALLOWLIST_FILENAME, PROFILE_FILENAME
@@ -314,7 +315,13 @@ def copy_spec_to_worktree(
     if target_spec_dir.exists():
         shutil.rmtree(target_spec_dir)
 
-    shutil.copytree(source_spec_dir, target_spec_dir)
+    # The recovery database is per-copy; the worktree rebuilds it from the
+    # JSON exports (see services.recovery_store)
+    shutil.copytree(
+        source_spec_dir,
+        target_spec_dir,
+        ignore=shutil.ignore_patterns(RECOVERY_DB_GLOB),
+    )
 
     return target_spec_dir
 
@@ -9,12 +9,12 @@ tracking, status management, and follow-up capabilities.
 
 import asyncio
 import functools
-import json
 from dataclasses import dataclass, field, fields
 from datetime import datetime
 from pathlib import Path
 
 from core.file_utils import write_json_atomic
+from core.plan_cache import load_plan
 
 from .enums import PhaseType, SubtaskStatus, WorkflowType
 from .phase import Phase
@@ -215,8 +215,7 @@ class ImplementationPlan:
     @classmethod
     def load(cls, path: Path) -> "ImplementationPlan":
         """Load plan from JSON file."""
-        with open(path, encoding="utf-8") as f:
-            return cls.from_dict(json.load(f))
+        return cls.from_dict(load_plan(path).to_dict())
 
     def get_available_phases(self) -> list[Phase]:
         """Get phases whose dependencies are satisfied."""
@@ -20,6 +20,7 @@ Environment Variables:
     # Database
     GRAPHITI_DATABASE: Graph database name (default: auto_claude_memory)
     GRAPHITI_DB_PATH: Database storage path (default: ~/.auto-claude/memories)
+    GRAPHITI_EMBEDDING_CACHE: Set to "false" to disable the on-disk embedding cache
 
     # OpenAI
     OPENAI_API_KEY: Required for OpenAI provider
@@ -66,6 +67,7 @@ from typing import Optional
 # Default configuration values
 DEFAULT_DATABASE = "auto_claude_memory"
 DEFAULT_DB_PATH = "~/.auto-claude/memories"
+EMBEDDING_CACHE_FILE = "embedding_cache.db"
 DEFAULT_OLLAMA_BASE_URL = "http://localhost:11434"
 
 # Graphiti state marker file (stores connection info and status)
@@ -118,6 +120,7 @@ class GraphitiConfig:
     # Database settings (LadybugDB - embedded, no Docker required)
     database: str = DEFAULT_DATABASE
     db_path: str = DEFAULT_DB_PATH
+    embedding_cache: bool = True
 
     # OpenAI settings
     openai_api_key: str = ""
@@ -171,6 +174,9 @@ class GraphitiConfig:
         # Database settings (LadybugDB - embedded)
         database = os.environ.get("GRAPHITI_DATABASE", DEFAULT_DATABASE)
         db_path = os.environ.get("GRAPHITI_DB_PATH", DEFAULT_DB_PATH)
+        embedding_cache = os.environ.get(
+            "GRAPHITI_EMBEDDING_CACHE", "true"
+        ).lower() not in ("false", "0", "no")
 
         # OpenAI settings
         openai_api_key = os.environ.get("OPENAI_API_KEY", "")
@@ -233,6 +239,7 @@ class GraphitiConfig:
             embedder_provider=embedder_provider,
             database=database,
             db_path=db_path,
+            embedding_cache=embedding_cache,
             openai_api_key=openai_api_key,
             openai_model=openai_model,
             openai_embedding_model=openai_embedding_model,
@@ -358,6 +365,17 @@ class GraphitiConfig:
         full_path.parent.mkdir(parents=True, exist_ok=True)
         return full_path
 
+    def get_embedding_cache_path(self) -> Path:
+        """
+        Get the path of the embedding cache database.
+
+        The cache sits next to the graph databases and is shared by all of
+        them; entries are keyed by provider, model and dimension.
+        """
+        base_path = Path(self.db_path).expanduser()
+        base_path.mkdir(parents=True, exist_ok=True)
+        return base_path / EMBEDDING_CACHE_FILE
+
     def get_provider_summary(self) -> str:
         """Get a summary of configured providers."""
         return f"LLM: {self.llm_provider}, Embedder: {self.embedder_provider}"
@@ -412,6 +430,22 @@ class GraphitiConfig:
             return 1536  # Default for unknown OpenRouter models
         return 768  # Safe default
 
+    def get_embedding_model(self) -> str:
+        """
+        Get the embedding model (or deployment) of the current embedder provider.
+
+        Returns:
+            Model name, or "" for an unknown provider
+        """
+        return {
+            "openai": self.openai_embedding_model,
+            "voyage": self.voyage_embedding_model,
+            "azure_openai": self.azure_openai_embedding_deployment,
+            "ollama": self.ollama_embedding_model,
+            "google": self.google_embedding_model,
+            "openrouter": self.openrouter_embedding_model,
+        }.get(self.embedder_provider, "")
+
     def get_provider_signature(self) -> str:
         """
         Get a unique signature for the current embedding provider configuration.
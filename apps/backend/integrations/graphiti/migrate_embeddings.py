@@ -221,6 +221,11 @@ class EmbeddingMigrator:
             else:
                 stats["failed"] += 1
 
+        # Episodes share entity names and facts; repeats come from the cache
+        cache_stats = self.target_client and self.target_client.embedding_cache_stats
+        if cache_stats:
+            stats["embedding_cache_hit_rate"] = cache_stats.hit_rate
+
         return stats
 
     async def close(self):
@@ -320,6 +325,8 @@ async def interactive_migration():
     print(f"  Total Episodes: {stats['total']}")
     print(f"  Succeeded: {stats['succeeded']}")
     print(f"  Failed: {stats['failed']}")
+    if "embedding_cache_hit_rate" in stats:
+        print(f"  Embedding Cache Hit Rate: {stats['embedding_cache_hit_rate']:.1%}")
     print("=" * 70 + "\n")
 
 
@@ -10,6 +10,7 @@ This package provides:
 - Factory functions that create the correct client based on provider selection
 - Provider-specific configuration validation
 - Graceful error handling with helpful messages
+- A persistent on-disk cache in front of every embedder
 - Health checks and validation utilities
 - Convenience functions for graph-based memory queries
 
@@ -25,6 +26,9 @@ Usage:
 # Core exceptions
 # Cross-encoder / reranker
 from .cross_encoder import create_cross_encoder
+
+# Embedding cache
+from .embedding_cache import CachedEmbedder, EmbeddingCache, EmbeddingCacheStats
 from .exceptions import ProviderError, ProviderNotInstalled
 
 # Factory functions
@@ -52,6 +56,10 @@ __all__ = [
     "create_llm_client",
     "create_embedder",
     "create_cross_encoder",
+    # Embedding cache
+    "CachedEmbedder",
+    "EmbeddingCache",
+    "EmbeddingCacheStats",
     # Models
     "EMBEDDING_DIMENSIONS",
     "get_expected_embedding_dim",
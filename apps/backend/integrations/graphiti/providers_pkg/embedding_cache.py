@@ -0,0 +1,262 @@
+"""
+Persistent Embedding Cache
+==========================
+
+On-disk cache in front of every Graphiti embedder.
+
+Memory episodes repeat the same strings across sessions (file paths, pattern
+names, recurring gotchas, session-insight boilerplate), and graphiti-core
+embeds each of them again on every add_episode and search; migrating a
+database re-embeds everything. The cache stores each vector once, keyed by
+(provider, model, dimension, sha256 of the text), in an SQLite database next
+to the graph databases (WAL mode, so concurrent agent sessions can share it).
+
+CachedEmbedder wraps the provider's embedder: batches are looked up in one
+query and only the misses are sent to the provider, as a single batch.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from core.sqlite_store import SQLiteStore
+
+if TYPE_CHECKING:
+    from graphiti_config import GraphitiConfig
+
+try:
+    from graphiti_core.embedder.client import EmbedderClient
+except ImportError:
+    # graphiti-core validates the embedder type; without it any base will do
+    EmbedderClient = object
+
+logger = logging.getLogger(__name__)
+
+# Oldest entries are dropped beyond this (~6 KB each at 1536 dimensions)
+MAX_CACHED_EMBEDDINGS = 100_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    dimension INTEGER NOT NULL,
+    text_hash TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    PRIMARY KEY (provider, model, dimension, text_hash)
+);
+"""
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Lookups served by a CachedEmbedder."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __str__(self) -> str:
+        return f"{self.hits} hits, {self.misses} misses ({self.hit_rate:.1%} hit rate)"
+
+
+class EmbeddingCache(SQLiteStore):
+    """
+    SQLite store of embedding vectors.
+
+    Vectors are stored as float32, the precision the providers return.
+
+    Args:
+        db_path: Database file (parent directory created if needed)
+        max_entries: Entries kept before the oldest are dropped
+    """
+
+    def __init__(self, db_path: Path, max_entries: int = MAX_CACHED_EMBEDDINGS):
+        super().__init__(db_path, _SCHEMA)
+        self.max_entries = max_entries
+
+    def get_many(
+        self, provider: str, model: str, dimension: int, texts: list[str]
+    ) -> dict[str, list[float]]:
+        """
+        Look up several texts at once.
+
+        Returns:
+            Vectors keyed by text, for the texts that are cached
+        """
+        hashes = {_text_hash(text): text for text in texts}
+        found: dict[str, list[float]] = {}
+        conn = self._connect()
+        keys = list(hashes)
+        # Stay well below SQLite's bound-parameter limit
+        for i in range(0, len(keys), 500):
+            chunk = keys[i : i + 500]
+            rows = conn.execute(
+                "SELECT text_hash, vector FROM embeddings "
+                "WHERE provider = ? AND model = ? AND dimension = ? "
+                f"AND text_hash IN ({', '.join('?' * len(chunk))})",
+                (provider, model, dimension, *chunk),
+            )
+            for text_hash, blob in rows:
+                found[hashes[text_hash]] = array("f", blob).tolist()
+        return found
+
+    def put_many(
+        self,
+        provider: str,
+        model: str,
+        dimension: int,
+        vectors: dict[str, list[float]],
+    ) -> None:
+        """Store vectors keyed by their text."""
+        if not vectors:
+            return
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings "
+                "(provider, model, dimension, text_hash, vector) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (provider, model, dimension, _text_hash(text), array("f", vector))
+                    for text, vector in vectors.items()
+                ],
+            )
+            self._trim(conn, "embeddings", self.max_entries)
+
+
+class CachedEmbedder(EmbedderClient):
+    """
+    Graphiti embedder that serves repeated texts from an EmbeddingCache.
+
+    Implements the EmbedderClient interface (create / create_batch) and
+    delegates misses to the wrapped provider embedder. Cache failures are
+    logged and fall through to the provider.
+
+    Args:
+        embedder: Provider embedder to wrap
+        cache: Shared vector store
+        provider: Embedder provider name
+        model: Embedding model name
+        dimension: Embedding dimension
+    """
+
+    def __init__(
+        self,
+        embedder: Any,
+        cache: EmbeddingCache,
+        provider: str,
+        model: str,
+        dimension: int,
+    ):
+        self.embedder = embedder
+        self.cache = cache
+        self.provider = provider
+        self.model = model
+        self.dimension = dimension
+        self.cache_stats = EmbeddingCacheStats()
+
+    def __getattr__(self, name: str) -> Any:
+        # Provider-specific attributes (config, client, ...) pass through
+        if name == "embedder":
+            raise AttributeError(name)
+        return getattr(self.embedder, name)
+
+    async def create(self, input_data: Any) -> list[float]:
+        """
+        Create the embedding of one text.
+
+        graphiti-core passes either a string or a one-element list of
+        strings; anything else (token IDs, several strings) is not cached.
+        """
+        if isinstance(input_data, str):
+            text = input_data
+        elif (
+            isinstance(input_data, list)
+            and len(input_data) == 1
+            and isinstance(input_data[0], str)
+        ):
+            text = input_data[0]
+        else:
+            return await self.embedder.create(input_data)
+
+        cached = self._lookup([text])
+        if text in cached:
+            self.cache_stats.hits += 1
+            return cached[text]
+
+        self.cache_stats.misses += 1
+        vector = await self.embedder.create(input_data)
+        self._store({text: vector})
+        return vector
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        """
+        Create the embeddings of several texts.
+
+        Cached texts are served from disk; the rest (each distinct text
+        once) go to the provider in a single batch.
+        """
+        vectors = self._lookup(input_data_list)
+        missing = list(dict.fromkeys(t for t in input_data_list if t not in vectors))
+        self.cache_stats.hits += len(input_data_list) - len(missing)
+        self.cache_stats.misses += len(missing)
+
+        if missing:
+            fresh = dict(zip(missing, await self.embedder.create_batch(missing)))
+            self._store(fresh)
+            vectors.update(fresh)
+        return [vectors[text] for text in input_data_list]
+
+    def _lookup(self, texts: list[str]) -> dict[str, list[float]]:
+        try:
+            return self.cache.get_many(self.provider, self.model, self.dimension, texts)
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache lookup failed: {e}")
+            return {}
+
+    def _store(self, vectors: dict[str, list[float]]) -> None:
+        try:
+            self.cache.put_many(self.provider, self.model, self.dimension, vectors)
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+
+
+def wrap_with_cache(embedder: Any, config: GraphitiConfig) -> Any:
+    """
+    Put the persistent embedding cache in front of an embedder.
+
+    Args:
+        embedder: Provider embedder from create_embedder
+        config: GraphitiConfig with provider and database settings
+
+    Returns:
+        CachedEmbedder, or the embedder itself if the cache is disabled or
+        its database cannot be opened
+    """
+    if not config.embedding_cache:
+        return embedder
+    try:
+        cache = EmbeddingCache(config.get_embedding_cache_path())
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Embedding cache unavailable, embedding uncached: {e}")
+        return embedder
+    return CachedEmbedder(
+        embedder,
+        cache,
+        provider=config.embedder_provider,
+        model=config.get_embedding_model(),
+        dimension=config.get_embedding_dimension(),
+    )
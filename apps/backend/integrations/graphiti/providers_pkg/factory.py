@@ -19,6 +19,7 @@ from .embedder_providers import (
     create_openrouter_embedder,
     create_voyage_embedder,
 )
+from .embedding_cache import wrap_with_cache
 from .exceptions import ProviderError
 from .llm_providers import (
     create_anthropic_llm_client,
@@ -70,6 +71,9 @@ def create_embedder(config: "GraphitiConfig") -> Any:
     """
     Create an embedder based on the configured provider.
 
+    The provider's embedder is wrapped in the persistent embedding cache
+    unless GRAPHITI_EMBEDDING_CACHE is disabled.
+
     Args:
         config: GraphitiConfig with provider settings
 
@@ -85,16 +89,18 @@ def create_embedder(config: "GraphitiConfig") -> Any:
     logger.info(f"Creating embedder for provider: {provider}")
 
     if provider == "openai":
-        return create_openai_embedder(config)
+        embedder = create_openai_embedder(config)
     elif provider == "voyage":
-        return create_voyage_embedder(config)
+        embedder = create_voyage_embedder(config)
     elif provider == "azure_openai":
-        return create_azure_openai_embedder(config)
+        embedder = create_azure_openai_embedder(config)
     elif provider == "ollama":
-        return create_ollama_embedder(config)
+        embedder = create_ollama_embedder(config)
     elif provider == "google":
-        return create_google_embedder(config)
+        embedder = create_google_embedder(config)
     elif provider == "openrouter":
-        return create_openrouter_embedder(config)
+        embedder = create_openrouter_embedder(config)
     else:
         raise ProviderError(f"Unknown embedder provider: {provider}")
+
+    return wrap_with_cache(embedder, config)
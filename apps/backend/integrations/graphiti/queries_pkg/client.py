@@ -100,6 +100,11 @@ class GraphitiClient:
         """Check if client is initialized."""
         return self._initialized
 
+    @property
+    def embedding_cache_stats(self):
+        """Embedding cache hits and misses, or None if the cache is off."""
+        return getattr(self._embedder, "cache_stats", None)
+
     async def initialize(self, state: GraphitiState | None = None) -> bool:
         """
         Initialize the Graphiti client with configured providers.
@@ -226,6 +231,10 @@ class GraphitiClient:
         """
         Close the Graphiti client and clean up connections.
         """
+        stats = self.embedding_cache_stats
+        if stats is not None:
+            logger.info(f"Embedding cache: {stats}")
+
         if self._graphiti:
             try:
                 await self._graphiti.close()
@@ -6,6 +6,7 @@ Integration with Linear issue tracking.
 """
 
 from .config import LinearConfig
+from .graphql_client import LinearAPIError, LinearGraphQLClient
 from .integration import LinearManager
 from .updater import (
     STATUS_CANCELED,
@@ -15,6 +16,7 @@ from .updater import (
     STATUS_TODO,
     LinearTaskState,
     create_linear_task,
+    flush_linear_updates,
     get_linear_api_key,
     is_linear_enabled,
     update_linear_status,
@@ -25,7 +27,9 @@ LinearIntegration = LinearManager
 LinearUpdater = LinearTaskState  # Alias - old code may expect this name
 
 __all__ = [
+    "LinearAPIError",
     "LinearConfig",
+    "LinearGraphQLClient",
     "LinearManager",
     "LinearIntegration",
     "LinearTaskState",
@@ -33,6 +37,7 @@ __all__ = [
     "is_linear_enabled",
     "get_linear_api_key",
     "create_linear_task",
+    "flush_linear_updates",
     "update_linear_status",
     "STATUS_TODO",
     "STATUS_IN_PROGRESS",
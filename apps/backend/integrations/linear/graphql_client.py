@@ -0,0 +1,422 @@
+"""
+Linear GraphQL Client
+=====================
+
+Lightweight direct client for the Linear GraphQL API.
+
+Replaces the per-update Claude mini-agent (which needed an LLM round-trip
+plus an MCP handshake for every status change or comment) with plain
+HTTP requests:
+
+- Keep-alive connections are pooled and reused across calls
+- Team and workflow-state IDs are looked up once and cached
+- Several mutations can be sent as one aliased GraphQL document
+
+The endpoint defaults to Linear's public API but can be pointed at a local
+stub server via ``LINEAR_API_URL`` (used by the tests).
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import os
+import queue
+import threading
+import urllib.parse
+from dataclasses import dataclass, field
+from typing import Any
+
+DEFAULT_LINEAR_API_URL = "https://api.linear.app/graphql"
+
+# Maximum idle keep-alive connections kept per client
+DEFAULT_POOL_SIZE = 4
+
+
+class LinearAPIError(Exception):
+    """Raised when a Linear GraphQL request fails."""
+
+    def __init__(self, message: str, data: dict | None = None):
+        super().__init__(message)
+        # Fields the response still carried next to its GraphQL errors
+        self.data = data
+
+
+class LinearBatchError(LinearAPIError):
+    """Raised when some mutations of a batch did not succeed (the rest did)."""
+
+    def __init__(self, message: str, failed: list[int]):
+        super().__init__(message)
+        # Positions of the mutations that did not report success
+        self.failed = failed
+
+
+@dataclass
+class LinearMutation:
+    """A single mutation to be sent as part of a batched request."""
+
+    field_name: str
+    # Argument name -> (GraphQL type, value), e.g. {"input": ("CommentCreateInput!", {...})}
+    arguments: dict[str, tuple[str, Any]]
+    selection: str = "success"
+
+
+@dataclass
+class _ConnectionPool:
+    """Thread-safe pool of keep-alive HTTP(S) connections to one host."""
+
+    scheme: str
+    host: str
+    port: int | None
+    timeout: float
+    max_size: int = DEFAULT_POOL_SIZE
+    _idle: queue.LifoQueue = field(default_factory=queue.LifoQueue)
+    connections_opened: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        """Return a connection and whether it was reused from the pool."""
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            pass
+        with self._lock:
+            self.connections_opened += 1
+        conn_cls = (
+            http.client.HTTPSConnection
+            if self.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        return conn_cls(self.host, self.port, timeout=self.timeout), False
+
+    def release(self, conn: http.client.HTTPConnection) -> None:
+        if self._idle.qsize() >= self.max_size:
+            conn.close()
+            return
+        self._idle.put(conn)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class LinearGraphQLClient:
+    """Direct Linear GraphQL API client with pooled connections and ID caches."""
+
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str | None = None,
+        timeout: float = 30.0,
+        pool_size: int = DEFAULT_POOL_SIZE,
+    ):
+        self.api_key = api_key
+        self.api_url = api_url or os.environ.get(
+            "LINEAR_API_URL", DEFAULT_LINEAR_API_URL
+        )
+        parsed = urllib.parse.urlsplit(self.api_url)
+        if parsed.scheme not in ("http", "https") or not parsed.hostname:
+            raise ValueError(f"Invalid Linear API URL: {self.api_url}")
+        self._path = parsed.path or "/"
+        if parsed.query:
+            self._path += f"?{parsed.query}"
+        self._pool = _ConnectionPool(
+            scheme=parsed.scheme,
+            host=parsed.hostname,
+            port=parsed.port,
+            timeout=timeout,
+            max_size=pool_size,
+        )
+
+        # ID caches - these never change during a run
+        self._team_id: str | None = None
+        self._state_ids: dict[str, dict[str, str]] = {}
+        self._issues: dict[str, tuple[str, str | None]] = {}
+        self._cache_lock = threading.Lock()
+
+        # Request counter (useful for diagnostics and tests)
+        self.request_count = 0
+
+    @property
+    def connections_opened(self) -> int:
+        """Number of TCP connections opened so far."""
+        return self._pool.connections_opened
+
+    def close(self) -> None:
+        """Close all idle pooled connections."""
+        self._pool.close()
+
+    def _auth_header(self) -> str:
+        # Personal API keys are sent as-is; OAuth access tokens need "Bearer"
+        if self.api_key.startswith("lin_api_") or self.api_key.startswith("Bearer "):
+            return self.api_key
+        if self.api_key.startswith("lin_oauth_"):
+            return f"Bearer {self.api_key}"
+        return self.api_key
+
+    # ------------------------------------------------------------------
+    # Transport
+    # ------------------------------------------------------------------
+
+    def execute(self, query: str, variables: dict | None = None) -> dict:
+        """
+        Execute a GraphQL document synchronously.
+
+        Args:
+            query: GraphQL query or mutation document
+            variables: Optional variables for the document
+
+        Returns:
+            The ``data`` object of the response
+
+        Raises:
+            LinearAPIError: On transport, HTTP or GraphQL errors
+        """
+        body = json.dumps({"query": query, "variables": variables or {}}).encode(
+            "utf-8"
+        )
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": self._auth_header(),
+        }
+
+        while True:
+            conn, reused = self._pool.acquire()
+            try:
+                conn.request("POST", self._path, body=body, headers=headers)
+                response = conn.getresponse()
+                payload = response.read()
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                # An idle keep-alive connection may have been closed by the
+                # server; retry those on a fresh connection, fail otherwise
+                if reused:
+                    continue
+                raise LinearAPIError(f"Linear API request failed: {e}") from e
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._pool.release(conn)
+
+            self.request_count += 1
+            if response.status >= 400:
+                raise LinearAPIError(
+                    f"Linear API HTTP {response.status}: "
+                    f"{payload.decode('utf-8', errors='replace')[:200]}"
+                )
+            try:
+                result = json.loads(payload)
+            except json.JSONDecodeError as e:
+                raise LinearAPIError(f"Invalid JSON from Linear API: {e}") from e
+
+            if result.get("errors"):
+                messages = "; ".join(
+                    str(err.get("message", err)) for err in result["errors"]
+                )
+                raise LinearAPIError(
+                    f"Linear GraphQL error: {messages}", data=result.get("data")
+                )
+            return result.get("data") or {}
+
+    # ------------------------------------------------------------------
+    # Cached lookups
+    # ------------------------------------------------------------------
+
+    def get_team_id(self) -> str:
+        """
+        Get the team ID to create issues in.
+
+        Uses LINEAR_TEAM_ID if set, otherwise the first team visible to the
+        API key. The result is cached for the lifetime of the client.
+        """
+        if self._team_id:
+            return self._team_id
+
+        team_id = os.environ.get("LINEAR_TEAM_ID")
+        if not team_id:
+            data = self.execute("query Teams { teams(first: 1) { nodes { id } } }")
+            nodes = (data.get("teams") or {}).get("nodes") or []
+            if not nodes:
+                raise LinearAPIError("No Linear teams available for this API key")
+            team_id = nodes[0]["id"]
+
+        with self._cache_lock:
+            self._team_id = team_id
+        return team_id
+
+    def get_state_id(self, team_id: str, state_name: str) -> str:
+        """
+        Get the workflow state ID for a status name within a team.
+
+        All of the team's states are fetched in one request and cached.
+        """
+        states = self._state_ids.get(team_id)
+        if states is None:
+            data = self.execute(
+                "query TeamStates($teamId: String!) {"
+                " team(id: $teamId) { states { nodes { id name } } } }",
+                {"teamId": team_id},
+            )
+            nodes = ((data.get("team") or {}).get("states") or {}).get("nodes") or []
+            states = {node["name"].lower(): node["id"] for node in nodes}
+            with self._cache_lock:
+                self._state_ids[team_id] = states
+
+        state_id = states.get(state_name.lower())
+        if not state_id:
+            raise LinearAPIError(
+                f"Workflow state '{state_name}' not found for team {team_id}"
+            )
+        return state_id
+
+    def resolve_issue(self, issue_ref: str) -> tuple[str, str | None]:
+        """
+        Resolve an issue identifier (e.g. "VAL-123") to its UUID and team ID.
+
+        Returns:
+            Tuple of (issue UUID, team ID or None)
+        """
+        cached = self._issues.get(issue_ref)
+        if cached:
+            return cached
+
+        data = self.execute(
+            "query Issue($id: String!) { issue(id: $id) { id team { id } } }",
+            {"id": issue_ref},
+        )
+        issue = data.get("issue")
+        if not issue or not issue.get("id"):
+            raise LinearAPIError(f"Linear issue not found: {issue_ref}")
+
+        resolved = (issue["id"], (issue.get("team") or {}).get("id"))
+        with self._cache_lock:
+            self._issues[issue_ref] = resolved
+        return resolved
+
+    # ------------------------------------------------------------------
+    # Mutations
+    # ------------------------------------------------------------------
+
+    def create_issue(
+        self, team_id: str, title: str, description: str | None = None
+    ) -> dict:
+        """
+        Create an issue.
+
+        Returns:
+            Dict with the issue's ``id`` (UUID) and ``identifier`` (e.g. "VAL-123")
+        """
+        issue_input: dict[str, Any] = {"teamId": team_id, "title": title}
+        if description:
+            issue_input["description"] = description
+
+        data = self.execute(
+            "mutation CreateIssue($input: IssueCreateInput!) {"
+            " issueCreate(input: $input) { success issue { id identifier } } }",
+            {"input": issue_input},
+        )
+        result = data.get("issueCreate") or {}
+        issue = result.get("issue")
+        if not result.get("success") or not issue:
+            raise LinearAPIError("Linear issueCreate did not succeed")
+
+        with self._cache_lock:
+            self._issues[issue["identifier"]] = (issue["id"], team_id)
+        return issue
+
+    def run_mutations(self, mutations: list[LinearMutation]) -> dict:
+        """
+        Send several mutations as one aliased GraphQL document.
+
+        Linear executes the fields of a mutation document in order, so a
+        status change followed by comments arrives in a single round-trip.
+
+        Raises:
+            LinearBatchError: If some mutations did not report success
+            LinearAPIError: If the request fails
+        """
+        if not mutations:
+            return {}
+
+        var_defs = []
+        fields = []
+        variables: dict[str, Any] = {}
+        for i, mutation in enumerate(mutations):
+            args = []
+            for name, (gql_type, value) in mutation.arguments.items():
+                var_name = f"m{i}_{name}"
+                var_defs.append(f"${var_name}: {gql_type}")
+                args.append(f"{name}: ${var_name}")
+                variables[var_name] = value
+            fields.append(
+                f"m{i}: {mutation.field_name}({', '.join(args)}) {{ {mutation.selection} }}"
+            )
+
+        document = f"mutation Batch({', '.join(var_defs)}) {{ {' '.join(fields)} }}"
+        try:
+            data = self.execute(document, variables)
+        except LinearAPIError as e:
+            if not e.data:
+                raise
+            # Fields are executed independently: some may have gone through
+            data = e.data
+
+        failed = [
+            i
+            for i in range(len(mutations))
+            if not (data.get(f"m{i}") or {}).get("success")
+        ]
+        if failed:
+            names = ", ".join(mutations[i].field_name for i in failed)
+            raise LinearBatchError(f"Linear {names} did not succeed", failed)
+        return data
+
+    @staticmethod
+    def update_issue_state(issue_id: str, state_id: str) -> LinearMutation:
+        """Build an issueUpdate mutation that moves an issue to a state."""
+        return LinearMutation(
+            field_name="issueUpdate",
+            arguments={
+                "id": ("String!", issue_id),
+                "input": ("IssueUpdateInput!", {"stateId": state_id}),
+            },
+        )
+
+    @staticmethod
+    def comment(issue_id: str, body: str) -> LinearMutation:
+        """Build a commentCreate mutation."""
+        return LinearMutation(
+            field_name="commentCreate",
+            arguments={
+                "input": ("CommentCreateInput!", {"issueId": issue_id, "body": body})
+            },
+        )
+
+
+# Shared client per (api key, endpoint) so the pool and caches survive across calls
+_clients: dict[tuple[str, str], LinearGraphQLClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_graphql_client(api_key: str) -> LinearGraphQLClient:
+    """Get the shared GraphQL client for an API key and the configured endpoint."""
+    api_url = os.environ.get("LINEAR_API_URL", DEFAULT_LINEAR_API_URL)
+    key = (api_key, api_url)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = LinearGraphQLClient(api_key, api_url=api_url)
+            _clients[key] = client
+        return client
+
+
+def reset_graphql_clients() -> None:
+    """Close and forget all shared clients (used by tests)."""
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
@@ -2,14 +2,20 @@
 Linear Updater - Python-Orchestrated Linear Updates
 ====================================================
 
-Provides reliable Linear updates via focused mini-agent calls.
+Provides reliable Linear updates at key build transitions.
 Instead of relying on agents to remember Linear updates in long prompts,
-the Python orchestrator triggers small, focused agents at key transitions.
+the Python orchestrator triggers updates directly.
+
+Updates go through the Linear GraphQL API (see graphql_client.py). Status
+changes and comments are queued per spec and flushed as one batched request,
+either when the orchestrator calls flush_linear_updates() at the end of a
+session or after a short debounce delay. A focused mini-agent talking to the
+Linear MCP server is kept only as a fallback when the direct API fails.
 
 Design Principles:
 - ONE task per spec (not one issue per subtask)
 - Python orchestrator controls when updates happen
-- Small prompts that can't lose context
+- No LLM round-trip for routine updates
 - Graceful degradation if Linear unavailable
 
 Status Flow:
@@ -20,15 +26,23 @@ Status Flow:
     +-- Task created from spec
 """
 
+import asyncio
 import json
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
 
+from .graphql_client import (
+    LinearAPIError,
+    LinearBatchError,
+    LinearGraphQLClient,
+    get_graphql_client,
+)
+
 # Linear status constants (matching Valma AI team setup)
 STATUS_TODO = "Todo"
 STATUS_IN_PROGRESS = "In Progress"
@@ -39,7 +53,10 @@ STATUS_CANCELED = "Canceled"
 # State file name
 LINEAR_TASK_FILE = ".linear_task.json"
 
-# Linear MCP tools needed for updates
+# Seconds to wait for more updates before flushing a queued batch
+UPDATE_DEBOUNCE_SECONDS = 5.0
+
+# Linear MCP tools needed for the agent fallback
 LINEAR_TOOLS = [
     "mcp__linear-server__list_teams",
     "mcp__linear-server__create_issue",
@@ -108,10 +125,31 @@ def get_linear_api_key() -> str:
     return os.environ.get("LINEAR_API_KEY", "")
 
 
+@dataclass
+class _PendingUpdates:
+    """Status change and comments queued for one spec, not yet sent."""
+
+    status: str | None = None
+    comments: list[str] = field(default_factory=list)
+    flush_task: asyncio.Task | None = None
+
+
+# Queued updates keyed by resolved spec directory
+_pending_updates: dict[Path, _PendingUpdates] = {}
+
+
+def _get_graphql_client() -> LinearGraphQLClient:
+    """Get the shared direct API client for the configured key."""
+    api_key = get_linear_api_key()
+    if not api_key:
+        raise ValueError("LINEAR_API_KEY not set")
+    return get_graphql_client(api_key)
+
+
 def _create_linear_client() -> ClaudeSDKClient:
     """
     Create a minimal Claude client with only Linear MCP tools.
-    Used for focused mini-agent calls.
+    Used for focused mini-agent calls when the direct API is unavailable.
     """
     from core.auth import (
         ensure_claude_code_oauth_token,
@@ -179,33 +217,18 @@ async def _run_linear_agent(prompt: str) -> str | None:
         return None
 
 
-async def create_linear_task(
-    spec_dir: Path,
-    title: str,
-    description: str | None = None,
-) -> LinearTaskState | None:
-    """
-    Create a new Linear task for a spec.
-
-    Called by spec_runner.py after requirements gathering.
-
-    Args:
-        spec_dir: Spec directory to save state
-        title: Task title (the task name from user)
-        description: Optional task description
-
-    Returns:
-        LinearTaskState if successful, None if failed
-    """
-    if not is_linear_enabled():
-        return None
+def _graphql_create_task(title: str, description: str | None) -> tuple[str, str]:
+    """Create the issue through the direct API. Returns (task_id, team_id)."""
+    client = _get_graphql_client()
+    team_id = client.get_team_id()
+    issue = client.create_issue(team_id, title, description)
+    return issue["identifier"], team_id
 
-    # Check if task already exists
-    existing = LinearTaskState.load(spec_dir)
-    if existing and existing.task_id:
-        print(f"Linear task already exists: {existing.task_id}")
-        return existing
 
+async def _agent_create_task(
+    title: str, description: str | None
+) -> tuple[str | None, str | None]:
+    """Create the issue through a mini-agent. Returns (task_id, team_id)."""
     desc_part = f'\n   - description: "{description}"' if description else ""
 
     prompt = f"""Create a Linear task with these details:
@@ -226,7 +249,7 @@ TEAM_ID: [the team ID]
 
     response = await _run_linear_agent(prompt)
     if not response:
-        return None
+        return None, None
 
     # Parse response for task_id and team_id
     task_id = None
@@ -241,6 +264,47 @@ TEAM_ID: [the team ID]
 
     if not task_id:
         print(f"Failed to parse task ID from response: {response[:200]}")
+        return None, None
+
+    return task_id, team_id
+
+
+async def create_linear_task(
+    spec_dir: Path,
+    title: str,
+    description: str | None = None,
+) -> LinearTaskState | None:
+    """
+    Create a new Linear task for a spec.
+
+    Called by spec_runner.py after requirements gathering.
+
+    Args:
+        spec_dir: Spec directory to save state
+        title: Task title (the task name from user)
+        description: Optional task description
+
+    Returns:
+        LinearTaskState if successful, None if failed
+    """
+    if not is_linear_enabled():
+        return None
+
+    # Check if task already exists
+    existing = LinearTaskState.load(spec_dir)
+    if existing and existing.task_id:
+        print(f"Linear task already exists: {existing.task_id}")
+        return existing
+
+    try:
+        task_id, team_id = await asyncio.to_thread(
+            _graphql_create_task, title, description
+        )
+    except (LinearAPIError, ValueError) as e:
+        print(f"Linear API unavailable ({e}), falling back to agent")
+        task_id, team_id = await _agent_create_task(title, description)
+
+    if not task_id:
         return None
 
     # Create and save state
@@ -257,19 +321,181 @@ TEAM_ID: [the team ID]
     return state
 
 
+def _pending_for(spec_dir: Path) -> _PendingUpdates:
+    key = Path(spec_dir).resolve()
+    pending = _pending_updates.get(key)
+    if pending is None:
+        pending = _PendingUpdates()
+        _pending_updates[key] = pending
+    return pending
+
+
+async def _delayed_flush(spec_dir: Path, delay: float) -> None:
+    await asyncio.sleep(delay)
+    pending = _pending_updates.get(Path(spec_dir).resolve())
+    if pending is not None:
+        # Detach ourselves so flush_linear_updates doesn't cancel this task
+        pending.flush_task = None
+    await flush_linear_updates(spec_dir)
+
+
+async def _schedule_flush(spec_dir: Path) -> bool:
+    """Debounce: (re)start the flush timer, or flush now if debouncing is off."""
+    if UPDATE_DEBOUNCE_SECONDS <= 0:
+        return await flush_linear_updates(spec_dir)
+
+    pending = _pending_for(spec_dir)
+    if pending.flush_task is not None:
+        pending.flush_task.cancel()
+    pending.flush_task = asyncio.create_task(
+        _delayed_flush(spec_dir, UPDATE_DEBOUNCE_SECONDS)
+    )
+    return True
+
+
+def _graphql_send_updates(
+    state: LinearTaskState, status: str | None, comments: list[str]
+) -> tuple[str | None, list[str]]:
+    """
+    Send a status change and comments through the direct API in one request.
+
+    Returns:
+        The status change and comments that did not go through
+    """
+    client = _get_graphql_client()
+    issue_id, issue_team_id = client.resolve_issue(state.task_id)
+
+    mutations = []
+    if status:
+        team_id = state.team_id or issue_team_id
+        if not team_id:
+            raise LinearAPIError(f"No team known for Linear issue {state.task_id}")
+        state_id = client.get_state_id(team_id, status)
+        mutations.append(client.update_issue_state(issue_id, state_id))
+    for comment in comments:
+        mutations.append(client.comment(issue_id, comment))
+
+    try:
+        client.run_mutations(mutations)
+    except LinearBatchError as e:
+        failed = set(e.failed)
+        offset = 1 if status else 0
+        return (
+            status if status and 0 in failed else None,
+            [c for i, c in enumerate(comments, offset) if i in failed],
+        )
+    return None, []
+
+
+async def _agent_update_status(state: LinearTaskState, new_status: str) -> bool:
+    prompt = f"""Update Linear issue status:
+
+1. First, use mcp__linear-server__list_issue_statuses with teamId: "{state.team_id}" to find the state ID for "{new_status}"
+2. Then, use mcp__linear-server__update_issue with:
+   - issueId: "{state.task_id}"
+   - stateId: [the state ID for "{new_status}" from step 1]
+
+Confirm when done.
+"""
+
+    response = await _run_linear_agent(prompt)
+    return bool(response)
+
+
+async def _agent_add_comment(state: LinearTaskState, comment: str) -> bool:
+    # Escape any quotes in the comment
+    safe_comment = comment.replace('"', '\\"').replace("\n", "\\n")
+
+    prompt = f"""Add a comment to Linear issue:
+
+Use mcp__linear-server__create_comment with:
+- issueId: "{state.task_id}"
+- body: "{safe_comment}"
+
+Confirm when done.
+"""
+
+    response = await _run_linear_agent(prompt)
+    return bool(response)
+
+
+async def flush_linear_updates(spec_dir: Path) -> bool:
+    """
+    Send all queued status changes and comments for a spec.
+
+    Called by the orchestrator at the end of each session; also runs
+    automatically after UPDATE_DEBOUNCE_SECONDS without new updates.
+    Uses one batched GraphQL request, falling back to the mini-agent
+    for whatever the direct API did not apply.
+
+    Args:
+        spec_dir: Spec directory with .linear_task.json
+
+    Returns:
+        True if everything queued was delivered (or nothing was queued)
+    """
+    pending = _pending_updates.pop(Path(spec_dir).resolve(), None)
+    if pending is None:
+        return True
+    if pending.flush_task is not None:
+        pending.flush_task.cancel()
+
+    status = pending.status
+    comments = pending.comments
+    if not status and not comments:
+        return True
+
+    state = LinearTaskState.load(spec_dir)
+    if not state or not state.task_id:
+        print("No Linear task found for this spec")
+        return False
+    if status == state.status:
+        status = None
+
+    try:
+        unsent_status, unsent_comments = await asyncio.to_thread(
+            _graphql_send_updates, state, status, comments
+        )
+        if unsent_status or unsent_comments:
+            print("Linear API applied part of the batch, falling back to agent")
+    except (LinearAPIError, ValueError) as e:
+        print(f"Linear API unavailable ({e}), falling back to agent")
+        unsent_status, unsent_comments = status, comments
+
+    # Only what the API did not apply goes to the agent, so nothing is posted twice
+    success = True
+    if unsent_status:
+        success = await _agent_update_status(state, unsent_status)
+        if not success:
+            status = None
+    for comment in unsent_comments:
+        success = await _agent_add_comment(state, comment) and success
+
+    if status:
+        state.status = status
+        state.save(spec_dir)
+        print(f"Updated Linear task {state.task_id} to: {status}")
+    if comments and success:
+        print(f"Added {len(comments)} comment(s) to Linear task {state.task_id}")
+
+    return success
+
+
 async def update_linear_status(
     spec_dir: Path,
     new_status: str,
 ) -> bool:
     """
-    Update the Linear task status.
+    Queue a Linear task status update.
+
+    The update is sent with the next flush (see flush_linear_updates).
 
     Args:
         spec_dir: Spec directory with .linear_task.json
         new_status: New status (STATUS_TODO, STATUS_IN_PROGRESS, STATUS_IN_REVIEW, STATUS_DONE)
 
     Returns:
-        True if successful, False otherwise
+        True if the update was queued (or sent), False otherwise
     """
     if not is_linear_enabled():
         return False
@@ -279,28 +505,15 @@ async def update_linear_status(
         print("No Linear task found for this spec")
         return False
 
-    # Don't update if already at this status
-    if state.status == new_status:
-        return True
-
-    prompt = f"""Update Linear issue status:
+    pending = _pending_for(spec_dir)
 
-1. First, use mcp__linear-server__list_issue_statuses with teamId: "{state.team_id}" to find the state ID for "{new_status}"
-2. Then, use mcp__linear-server__update_issue with:
-   - issueId: "{state.task_id}"
-   - stateId: [the state ID for "{new_status}" from step 1]
-
-Confirm when done.
-"""
-
-    response = await _run_linear_agent(prompt)
-    if response:
-        state.status = new_status
-        state.save(spec_dir)
-        print(f"Updated Linear task {state.task_id} to: {new_status}")
+    # Don't update if already at this status
+    if state.status == new_status and pending.status is None:
         return True
 
-    return False
+    # Only the latest status matters
+    pending.status = new_status
+    return await _schedule_flush(spec_dir)
 
 
 async def add_linear_comment(
@@ -308,14 +521,16 @@ async def add_linear_comment(
     comment: str,
 ) -> bool:
     """
-    Add a comment to the Linear task.
+    Queue a comment on the Linear task.
+
+    The comment is sent with the next flush (see flush_linear_updates).
 
     Args:
         spec_dir: Spec directory with .linear_task.json
         comment: Comment text to add
 
     Returns:
-        True if successful, False otherwise
+        True if the comment was queued (or sent), False otherwise
     """
     if not is_linear_enabled():
         return False
@@ -325,24 +540,8 @@ async def add_linear_comment(
         print("No Linear task found for this spec")
         return False
 
-    # Escape any quotes in the comment
-    safe_comment = comment.replace('"', '\\"').replace("\n", "\\n")
-
-    prompt = f"""Add a comment to Linear issue:
-
-Use mcp__linear-server__create_comment with:
-- issueId: "{state.task_id}"
-- body: "{safe_comment}"
-
-Confirm when done.
-"""
-
-    response = await _run_linear_agent(prompt)
-    if response:
-        print(f"Added comment to Linear task {state.task_id}")
-        return True
-
-    return False
+    _pending_for(spec_dir).comments.append(comment)
+    return await _schedule_flush(spec_dir)
 
 
 # === Convenience functions for specific transitions ===
@@ -96,6 +96,9 @@ def apply_single_task_changes(
             elif change.change_type == ChangeType.ADD_FUNCTION:
                 # Add function at end (before exports)
                 content += f"{line_ending}{line_ending}{change.content_after}"
+            else:
+                # Other additions (classes, variables, types) go at the end
+                content += f"{line_ending}{change.content_after}"
 
     # Restore original line ending style if it was CRLF
     if original_line_ending == "\r\n":
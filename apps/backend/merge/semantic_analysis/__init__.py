@@ -4,7 +4,10 @@ Semantic analyzer package for code analysis.
 This package provides modular semantic analysis capabilities:
 - models.py: Data structures for extracted elements
 - comparison.py: Element comparison and change classification
-- regex_analyzer.py: Regex-based analysis for code changes
+- python_analyzer.py: AST-based element extraction for Python
+- js_analyzer.py: Tolerant element extraction for JavaScript/TypeScript
+- structural_analyzer.py: Element-level analysis with content-hash memoization
+- regex_analyzer.py: Regex-based analysis for code changes (fallback)
 """
 
 from .models import ExtractedElement
@@ -28,7 +28,8 @@ def compare_elements(
     """
     changes: list[SemanticChange] = []
 
-    all_keys = set(before.keys()) | set(after.keys())
+    # After-version order first, then removed elements, so results are stable
+    all_keys = list(after) + [key for key in before if key not in after]
 
     for key in all_keys:
         elem_before = before.get(key)
@@ -135,8 +136,11 @@ def get_location(element: ExtractedElement) -> str:
         element: The element to generate location for
 
     Returns:
-        Location string in format "element_type:name" or "element_type:parent.name"
+        Location string in format "element_type:name" or "element_type:parent.name",
+        or "file_top" for imports
     """
+    if element.element_type in {"import", "import_from"}:
+        return "file_top"
     if element.parent:
         return f"{element.element_type}:{element.parent}.{element.name.split('.')[-1]}"
     return f"{element.element_type}:{element.name}"
@@ -165,7 +169,10 @@ def classify_modification(
 
     if element_type in {"function", "method"}:
         # Analyze the function content for specific changes
-        return classify_function_modification(before.content, after.content, ext)
+        change_type = classify_function_modification(before.content, after.content, ext)
+        if element_type == "method" and change_type == ChangeType.MODIFY_FUNCTION:
+            return ChangeType.MODIFY_METHOD
+        return change_type
 
     if element_type == "class":
         return ChangeType.MODIFY_CLASS
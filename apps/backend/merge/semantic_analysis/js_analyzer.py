@@ -0,0 +1,195 @@
+"""
+Tolerant structural extraction for JavaScript and TypeScript.
+
+This is not a parser. It splits a module into top-level statements by
+tracking bracket depth (skipping strings, template literals, regex literals
+and comments) and classifies each statement by its first line. Source that
+does not balance only blurs the statements around it: a column-0
+declaration keyword always starts a new statement.
+"""
+
+from __future__ import annotations
+
+import re
+
+from .models import ExtractedElement
+
+# First line of a top-level declaration
+_DECLARATION = re.compile(
+    r"(?:export\s+(?:default\s+)?)?(?:declare\s+)?"
+    r"(?:"
+    r"(?P<import>import)\b(?!\s*\()"
+    r"|(?:async\s+)?function\b\s*\*?\s*(?P<function>[\w$]+)"
+    r"|(?:abstract\s+)?class\s+(?P<class>[\w$]+)"
+    r"|interface\s+(?P<interface>[\w$]+)"
+    r"|type\s+(?P<type>[\w$]+)\s*(?:<|=)"
+    r"|(?:const\s+)?enum\s+(?P<enum>[\w$]+)"
+    r"|(?:const|let|var)\s+(?P<variable>[\w$]+)"
+    r")"
+)
+
+# A variable whose initializer is a function or a wrapped component
+_FUNCTION_VALUE = re.compile(
+    r"[^=]*=\s*(?:async\s+)?"
+    r"(?:function\b"
+    r"|(?:\([^)]*\)|[\w$]+)\s*(?::[^=]*)?=>"
+    r"|(?:React\.)?(?:memo|forwardRef)\s*\()"
+)
+
+# Code tokens that matter for depth tracking. A slash after an operator or
+# opening bracket starts a regex literal, whose brackets and quotes don't count.
+_TOKEN = re.compile(
+    r"(?<=[=(,:!&|?;{}\[])\s*/(?![/*])(?:\\.|\[(?:\\.|[^\]\\\n])*\]|[^/\\\n\[])+/"
+    r"|//|/\*|`|\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*'|[{}()\[\]]"
+)
+
+# Lines including their LF (str.splitlines also splits on form feeds etc.)
+_LINE = re.compile(r"[^\n]*\n|[^\n]+")
+
+_BRACKETS = {"{": 1, "(": 1, "[": 1, "}": -1, ")": -1, "]": -1}
+
+# Column-0 lines that continue the previous statement
+_CONTINUATION = tuple("})].,;?:|&+-*=<>")
+
+# Column-0 lines that belong to the statement after them
+_LEADING = ("//", "/*", "*", "@")
+
+
+def extract_js_elements(source: str) -> dict[str, ExtractedElement]:
+    """
+    Extract the top-level declarations of a JavaScript/TypeScript module.
+
+    Imports are keyed by their normalized text. Variables initialized with
+    a function (arrow functions, function expressions, memo/forwardRef
+    components) are reported as functions. Every other top-level statement
+    (app.listen(3000), module.exports = ..., side-effect calls) is a
+    "statement" keyed by its position among them, so no part of the module
+    goes untracked.
+
+    Args:
+        source: Module source with LF line endings
+
+    Returns:
+        Elements keyed by "element_type:name", in source order
+    """
+    lines = _LINE.findall(source)
+    elements: dict[str, ExtractedElement] = {}
+    statements = 0
+
+    for start, first, end in _statements(lines):
+        match = _DECLARATION.match(lines[first])
+        content = "".join(lines[start:end])
+        if match:
+            element_type = match.lastgroup
+            name = match.group(element_type) if element_type != "import" else None
+        else:
+            statements += 1
+            element_type, name = "statement", str(statements)
+
+        if element_type == "import":
+            name = " ".join(content.split())
+        elif element_type == "enum":
+            element_type = "type"
+        elif element_type == "variable" and _FUNCTION_VALUE.match(
+            "".join(lines[first:end])
+        ):
+            element_type = "function"
+
+        elements[_unique_key(elements, f"{element_type}:{name}")] = ExtractedElement(
+            element_type=element_type,
+            name=name,
+            start_line=start + 1,
+            end_line=end,
+            content=content,
+        )
+
+    return elements
+
+
+def _unique_key(elements: dict[str, ExtractedElement], key: str) -> str:
+    # Overloads and redeclarations are matched up by position
+    unique, count = key, 1
+    while unique in elements:
+        count += 1
+        unique = f"{key}#{count}"
+    return unique
+
+
+def _statements(lines: list[str]):
+    """
+    Yield (start, first, end) line indexes of each top-level statement.
+
+    start includes leading comments and decorators, first is the statement's
+    own first line and end is exclusive, with trailing blank lines dropped.
+    """
+    boundaries: list[tuple[int, int]] = []
+    leading: int | None = None
+    depth = 0
+    state = None  # None, "comment" or "template"
+
+    for index, line in enumerate(lines):
+        if state is None and line[:1] not in ("", " ", "\t", "\n", "\r"):
+            declaration = _DECLARATION.match(line)
+            if declaration or (depth == 0 and not line.startswith(_CONTINUATION)):
+                depth = 0
+                if line.startswith(_LEADING) and not declaration:
+                    if leading is None:
+                        leading = index
+                else:
+                    boundaries.append((index if leading is None else leading, index))
+                    leading = None
+        depth, state = _scan(line, depth, state)
+        if depth < 0:
+            depth = 0
+
+    ends = [start for start, _ in boundaries[1:]] + [len(lines)]
+    if leading is not None:
+        ends[-1] = leading
+    for (start, first), end in zip(boundaries, ends):
+        while end > first + 1 and not lines[end - 1].strip():
+            end -= 1
+        yield start, first, end
+
+
+def _scan(line: str, depth: int, state: str | None) -> tuple[int, str | None]:
+    """Track bracket depth through one line."""
+    pos = 0
+    while pos < len(line):
+        if state == "comment":
+            close = line.find("*/", pos)
+            if close < 0:
+                return depth, state
+            pos, state = close + 2, None
+            continue
+        if state == "template":
+            close = _template_end(line, pos)
+            if close < 0:
+                return depth, state
+            pos, state = close + 1, None
+            continue
+
+        token = _TOKEN.search(line, pos)
+        if token is None:
+            break
+        text = token.group()
+        pos = token.end()
+        if text == "//":
+            break
+        if text == "/*":
+            state = "comment"
+        elif text == "`":
+            state = "template"
+        elif text in _BRACKETS:
+            depth += _BRACKETS[text]
+    return depth, state
+
+
+def _template_end(line: str, pos: int) -> int:
+    while True:
+        close = line.find("`", pos)
+        if close < 0:
+            return -1
+        backslashes = len(line[:close]) - len(line[:close].rstrip("\\"))
+        if backslashes % 2 == 0:
+            return close
+        pos = close + 1
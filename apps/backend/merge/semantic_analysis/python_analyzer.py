@@ -0,0 +1,241 @@
+"""
+AST-based structural extraction for Python.
+
+Modules are parsed one top-level block at a time, and the symbols of each
+block are cached by its text. Two versions of a file share most of their
+blocks, so analyzing a task's version after the baseline only parses the
+blocks the task touched. If a block boundary was guessed wrong (a column-0
+line inside a multi-line string), the block fails to parse and the whole
+module is parsed instead.
+"""
+
+from __future__ import annotations
+
+import ast
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+
+from .models import ExtractedElement
+
+MAX_CACHED_BLOCKS = 4096
+
+# Column-0 clauses that continue the previous statement
+_CLAUSE = re.compile(r"(?:else|elif|except|finally)\b")
+
+# Lines including their LF; ast only counts LF, str.splitlines() also splits
+# on form feeds and other separators
+_LINE = re.compile(r"[^\n]*\n|[^\n]+")
+
+# (element_type, name, start_line, end_line, methods), lines relative to the
+# parsed text; methods are (name, start_line, end_line)
+_Symbol = tuple[str, str, int, int, tuple[tuple[str, int, int], ...]]
+
+_block_lock = threading.Lock()
+_block_cache: OrderedDict[str, tuple[_Symbol, ...]] = OrderedDict()
+
+
+def extract_python_elements(source: str) -> dict[str, ExtractedElement]:
+    """
+    Extract the top-level symbols of a Python module.
+
+    Imports, functions, classes and module-level variables are keyed by
+    "element_type:name"; import blocks (imports under try/except or if) count
+    as imports. Every other top-level statement (if __name__ == "__main__",
+    calls, augmented assignments...) is a "statement" keyed by its position
+    among them, so no part of the module goes untracked. Classes carry their methods in metadata["members"]
+    and their source without those methods in metadata["shell"], so a
+    modified class can be diffed method by method.
+
+    Args:
+        source: Module source with LF line endings
+
+    Returns:
+        Elements keyed by "element_type:name", in source order
+
+    Raises:
+        SyntaxError: If the source cannot be parsed
+    """
+    lines = _LINE.findall(source)
+    try:
+        symbols = [
+            (start, symbol)
+            for start, end in _blocks(lines)
+            for symbol in _block_symbols("".join(lines[start:end]))
+        ]
+    except SyntaxError:
+        symbols = [(0, symbol) for symbol in _symbols(ast.parse(source))]
+
+    elements: dict[str, ExtractedElement] = {}
+    statements = 0
+    for offset, (element_type, name, start, end, methods) in symbols:
+        if element_type == "statement":
+            statements += 1
+            name = str(statements)
+        element = _element(lines, element_type, name, offset + start, offset + end)
+        if element_type == "import":
+            element.name = " ".join(element.content.split())
+        elif element_type == "class":
+            _add_members(lines, element, offset, methods)
+        key = f"{element_type}:{element.name}"
+        elements[_unique_key(elements, key)] = element
+    return elements
+
+
+def clear_block_cache() -> None:
+    """Drop all cached block symbols."""
+    with _block_lock:
+        _block_cache.clear()
+
+
+def _blocks(lines: list[str]) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) line indexes of the module's top-level blocks."""
+    start = 0
+    decorators_only = False
+    for index, line in enumerate(lines):
+        first = line[:1]
+        if not (first.isalpha() or first in ("_", "@")):
+            continue  # Indented, blank, comment or a closing bracket
+        if index == start:
+            decorators_only = first == "@"
+            continue
+        if decorators_only:
+            # Decorators belong to the definition after them
+            decorators_only = first == "@"
+            continue
+        if _CLAUSE.match(line):
+            continue
+        yield start, index
+        start = index
+        decorators_only = first == "@"
+    if start < len(lines):
+        yield start, len(lines)
+
+
+def _block_symbols(text: str) -> tuple[_Symbol, ...]:
+    with _block_lock:
+        cached = _block_cache.get(text)
+        if cached is not None:
+            _block_cache.move_to_end(text)
+            return cached
+
+    symbols = _symbols(ast.parse(text))
+
+    with _block_lock:
+        _block_cache[text] = symbols
+        while len(_block_cache) > MAX_CACHED_BLOCKS:
+            _block_cache.popitem(last=False)
+    return symbols
+
+
+def _symbols(tree: ast.Module) -> tuple[_Symbol, ...]:
+    symbols: list[_Symbol] = []
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            # Named from its source text once the text is sliced out
+            symbols.append(("import", "", node.lineno, node.end_lineno, ()))
+
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            symbols.append(
+                ("function", node.name, _start_line(node), node.end_lineno, ())
+            )
+
+        elif isinstance(node, ast.ClassDef):
+            methods = tuple(
+                (child.name, _start_line(child), child.end_lineno)
+                for child in node.body
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef))
+            )
+            symbols.append(
+                ("class", node.name, _start_line(node), node.end_lineno, methods)
+            )
+
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)) and (
+            name := _variable_name(node)
+        ):
+            symbols.append(("variable", name, node.lineno, node.end_lineno, ()))
+
+        elif isinstance(node, (ast.Try, ast.If)) and _is_import_block(node):
+            symbols.append(("import", "", node.lineno, node.end_lineno, ()))
+
+        else:
+            # Named by its position once the module's statements are counted
+            symbols.append(("statement", "", node.lineno, node.end_lineno, ()))
+    return tuple(symbols)
+
+
+def _variable_name(node: ast.Assign | ast.AnnAssign) -> str | None:
+    targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+    names = [t.id for t in targets if isinstance(t, ast.Name)]
+    return names[0] if names else None
+
+
+def _is_import_block(node: ast.AST) -> bool:
+    """Whether a try/if only imports (with fallbacks such as "yaml = None")."""
+    has_import = False
+    for child in ast.walk(node):
+        if isinstance(child, (ast.Import, ast.ImportFrom)):
+            has_import = True
+        elif isinstance(child, ast.stmt) and not isinstance(
+            child, (ast.Try, ast.If, ast.Pass, ast.Assign, ast.Raise)
+        ):
+            return False
+    return has_import
+
+
+def _unique_key(elements: dict[str, ExtractedElement], key: str) -> str:
+    # Redefinitions (e.g. under "if TYPE_CHECKING") are matched up by position
+    unique, count = key, 1
+    while unique in elements:
+        count += 1
+        unique = f"{key}#{count}"
+    return unique
+
+
+def _start_line(node: ast.AST) -> int:
+    decorators = getattr(node, "decorator_list", None)
+    if decorators:
+        return min(d.lineno for d in decorators)
+    return node.lineno
+
+
+def _element(
+    lines: list[str],
+    element_type: str,
+    name: str,
+    start_line: int,
+    end_line: int,
+    parent: str | None = None,
+) -> ExtractedElement:
+    return ExtractedElement(
+        element_type=element_type,
+        name=name,
+        start_line=start_line,
+        end_line=end_line,
+        content="".join(lines[start_line - 1 : end_line]),
+        parent=parent,
+    )
+
+
+def _add_members(
+    lines: list[str],
+    element: ExtractedElement,
+    offset: int,
+    methods: tuple[tuple[str, int, int], ...],
+) -> None:
+    members: dict[str, ExtractedElement] = {}
+    shell = element.content
+    for name, start, end in methods:
+        method = _element(
+            lines,
+            "method",
+            f"{element.name}.{name}",
+            offset + start,
+            offset + end,
+            parent=element.name,
+        )
+        members[f"method:{method.name}"] = method
+        shell = shell.replace(method.content, "", 1)
+    element.metadata["members"] = members
+    element.metadata["shell"] = shell
@@ -0,0 +1,279 @@
+"""
+Structural semantic analysis for code changes.
+
+Both versions of a file are split into top-level elements (stdlib ast for
+Python, a tolerant scanner for JavaScript/TypeScript) and compared element by
+element, so changes carry the exact source segments they replace. Files that
+cannot be parsed, and other languages, fall back to the regex analyzer. So
+do changes that don't account for every line of the second version, which
+file_merger would otherwise silently drop.
+
+Results are memoized by content hash: the extracted elements of each version
+(so a baseline shared by several tasks is parsed once), and the analysis of
+each (before, after) pair.
+"""
+
+from __future__ import annotations
+
+import difflib
+import hashlib
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import replace
+from datetime import datetime
+
+from ..file_merger import apply_single_task_changes
+from ..types import ChangeType, FileAnalysis, SemanticChange, TaskSnapshot
+from .comparison import compare_elements
+from .js_analyzer import extract_js_elements
+from .models import ExtractedElement
+from .python_analyzer import clear_block_cache, extract_python_elements
+from .regex_analyzer import analyze_with_regex
+
+EXTRACTORS = {
+    ".py": extract_python_elements,
+    ".js": extract_js_elements,
+    ".jsx": extract_js_elements,
+    ".ts": extract_js_elements,
+    ".tsx": extract_js_elements,
+}
+
+MAX_CACHED_ELEMENTS = 256
+MAX_CACHED_ANALYSES = 512
+
+_cache_lock = threading.Lock()
+# (ext, content hash) -> elements, or None if the content does not parse
+_element_cache: OrderedDict[tuple[str, str], dict[str, ExtractedElement] | None] = (
+    OrderedDict()
+)
+# (ext, before hash, after hash) -> analysis
+_analysis_cache: OrderedDict[tuple[str, str, str], FileAnalysis] = OrderedDict()
+
+
+def analyze_structure(
+    file_path: str,
+    before: str,
+    after: str,
+    ext: str,
+) -> FileAnalysis:
+    """
+    Analyze code changes by comparing top-level elements.
+
+    Args:
+        file_path: Path to the file being analyzed
+        before: Content before changes
+        after: Content after changes
+        ext: File extension
+
+    Returns:
+        FileAnalysis with element-level changes
+    """
+    # Normalize line endings to LF; change segments must match what
+    # file_merger searches for
+    before = before.replace("\r\n", "\n").replace("\r", "\n")
+    after = after.replace("\r\n", "\n").replace("\r", "\n")
+    before_hash = _hash(before)
+    after_hash = _hash(after)
+
+    key = (ext, before_hash, after_hash)
+    with _cache_lock:
+        cached = _analysis_cache.get(key)
+        if cached is not None:
+            _analysis_cache.move_to_end(key)
+    if cached is None:
+        cached = _analyze(file_path, before, after, ext, before_hash, after_hash)
+        with _cache_lock:
+            _analysis_cache[key] = cached
+            while len(_analysis_cache) > MAX_CACHED_ANALYSES:
+                _analysis_cache.popitem(last=False)
+
+    return _copy_analysis(cached, file_path)
+
+
+def clear_analysis_cache() -> None:
+    """Drop all memoized elements and analyses."""
+    with _cache_lock:
+        _element_cache.clear()
+        _analysis_cache.clear()
+    clear_block_cache()
+
+
+def _hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def _elements(
+    content: str, content_hash: str, ext: str
+) -> dict[str, ExtractedElement] | None:
+    key = (ext, content_hash)
+    with _cache_lock:
+        if key in _element_cache:
+            _element_cache.move_to_end(key)
+            return _element_cache[key]
+
+    try:
+        elements = EXTRACTORS[ext](content)
+    except (SyntaxError, ValueError, RecursionError):
+        elements = None
+
+    with _cache_lock:
+        _element_cache[key] = elements
+        while len(_element_cache) > MAX_CACHED_ELEMENTS:
+            _element_cache.popitem(last=False)
+    return elements
+
+
+def _analyze(
+    file_path: str,
+    before: str,
+    after: str,
+    ext: str,
+    before_hash: str,
+    after_hash: str,
+) -> FileAnalysis:
+    if ext not in EXTRACTORS:
+        return analyze_with_regex(file_path, before, after, ext)
+
+    elements_before = _elements(before, before_hash, ext)
+    elements_after = _elements(after, after_hash, ext)
+    if elements_before is None or elements_after is None:
+        return analyze_with_regex(file_path, before, after, ext)
+
+    elements_before, elements_after = _expand_classes(
+        elements_before, elements_after, before
+    )
+    changes = compare_elements(elements_before, elements_after, ext)
+    if any(
+        change.content_before
+        and change.content_after
+        and before.count(change.content_before) != 1
+        for change in changes
+    ):
+        # file_merger applies modifications with replace(): a segment that
+        # also appears elsewhere in the file would be rewritten there too
+        return analyze_with_regex(file_path, before, after, ext)
+    if not _reproduces(file_path, before, after, changes):
+        return analyze_with_regex(file_path, before, after, ext)
+
+    analysis = FileAnalysis(file_path=file_path, changes=changes)
+    for change in changes:
+        if change.change_type == ChangeType.ADD_IMPORT:
+            analysis.imports_added.add(change.target)
+        elif change.change_type == ChangeType.REMOVE_IMPORT:
+            analysis.imports_removed.add(change.target)
+        elif change.change_type in {ChangeType.ADD_FUNCTION, ChangeType.ADD_METHOD}:
+            analysis.functions_added.add(change.target)
+        elif change.change_type == ChangeType.MODIFY_CLASS:
+            analysis.classes_modified.add(change.target)
+        elif change.content_before and change.content_after:
+            if change.location.startswith(("function:", "method:")):
+                analysis.functions_modified.add(change.target)
+            if change.location.startswith("method:"):
+                analysis.classes_modified.add(change.target.split(".")[0])
+        analysis.total_lines_changed += _lines_changed(
+            change.content_before, change.content_after
+        )
+    return analysis
+
+
+def _reproduces(
+    file_path: str, before: str, after: str, changes: list[SemanticChange]
+) -> bool:
+    """
+    Whether applying the changes to before gives every line of after.
+
+    Additions are placed where file_merger puts them, so only the lines are
+    compared, not their order.
+    """
+    # file_merger leaves removals to the caller
+    for change in changes:
+        if change.content_before and not change.content_after:
+            before = before.replace(change.content_before, "", 1)
+    snapshot = TaskSnapshot(
+        task_id="",
+        task_intent="",
+        started_at=datetime.now(),
+        semantic_changes=changes,
+    )
+    merged = apply_single_task_changes(before, snapshot, file_path)
+    return _line_counts(merged) == _line_counts(after)
+
+
+def _line_counts(content: str) -> Counter[str]:
+    return Counter(line.rstrip() for line in content.splitlines() if line.strip())
+
+
+def _expand_classes(
+    before: dict[str, ExtractedElement],
+    after: dict[str, ExtractedElement],
+    before_text: str,
+) -> tuple[dict[str, ExtractedElement], dict[str, ExtractedElement]]:
+    """
+    Compare classes method by method when only their method bodies changed.
+
+    A class whose methods were added or removed, or whose other statements
+    changed, stays a single element. So does a class with a changed method
+    whose text also appears elsewhere in the file (e.g. the same close() in
+    two classes), since the method alone would not locate the change.
+    """
+    expanded: set[str] = set()
+    for key, element in after.items():
+        previous = before.get(key)
+        if (
+            element.element_type == "class"
+            and previous is not None
+            and previous.content != element.content
+            and "shell" in element.metadata
+            and previous.metadata.get("shell") == element.metadata["shell"]
+            and previous.metadata["members"].keys()
+            == element.metadata["members"].keys()
+            and all(
+                before_text.count(member.content) == 1
+                for name, member in previous.metadata["members"].items()
+                if member.content != element.metadata["members"][name].content
+            )
+        ):
+            expanded.add(key)
+    if not expanded:
+        return before, after
+
+    def expand(elements: dict[str, ExtractedElement]) -> dict[str, ExtractedElement]:
+        result: dict[str, ExtractedElement] = {}
+        for key, element in elements.items():
+            if key in expanded:
+                result.update(element.metadata["members"])
+            else:
+                result[key] = element
+        return result
+
+    return expand(before), expand(after)
+
+
+def _lines_changed(before: str | None, after: str | None) -> int:
+    before_lines = before.splitlines() if before else []
+    after_lines = after.splitlines() if after else []
+    if not before_lines or not after_lines:
+        return len(before_lines) + len(after_lines)
+    matcher = difflib.SequenceMatcher(None, before_lines, after_lines, autojunk=False)
+    return sum(
+        (i2 - i1) + (j2 - j1)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    )
+
+
+def _copy_analysis(analysis: FileAnalysis, file_path: str) -> FileAnalysis:
+    """Return a copy callers can modify without touching the cache."""
+    return replace(
+        analysis,
+        file_path=file_path,
+        changes=[
+            replace(change, metadata=dict(change.metadata))
+            for change in analysis.changes
+        ],
+        functions_modified=set(analysis.functions_modified),
+        functions_added=set(analysis.functions_added),
+        imports_added=set(analysis.imports_added),
+        imports_removed=set(analysis.imports_removed),
+        classes_modified=set(analysis.classes_modified),
+    )
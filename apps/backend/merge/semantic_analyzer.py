@@ -2,11 +2,15 @@
 Semantic Analyzer
 =================
 
-Analyzes code changes at a semantic level using regex-based heuristics.
+Analyzes code changes at a semantic level by comparing top-level elements.
 
 This module provides analysis of code changes, extracting meaningful
 semantic changes like "added import", "modified function", "wrapped JSX element"
-rather than line-level diffs.
+rather than line-level diffs. Python is parsed with the stdlib ast module and
+JavaScript/TypeScript with a tolerant structural scanner; anything else, or
+source that does not parse, falls back to regex-based heuristics. Results are
+memoized by content hash, so a baseline shared by several tasks is only
+analyzed once.
 """
 
 from __future__ import annotations
@@ -42,14 +46,14 @@ except ImportError:
 logger = logging.getLogger(__name__)
 MODULE = "merge.semantic_analyzer"
 
-# Import regex-based analyzer
+# Import structural analyzer
 from .semantic_analysis.models import ExtractedElement
-from .semantic_analysis.regex_analyzer import analyze_with_regex
+from .semantic_analysis.structural_analyzer import analyze_structure
 
 
 class SemanticAnalyzer:
     """
-    Analyzes code changes at a semantic level using regex-based heuristics.
+    Analyzes code changes at a semantic level by comparing top-level elements.
 
     Example:
         analyzer = SemanticAnalyzer()
@@ -60,7 +64,7 @@ class SemanticAnalyzer:
 
     def __init__(self):
         """Initialize the analyzer."""
-        debug(MODULE, "Initializing SemanticAnalyzer (regex-based)")
+        debug(MODULE, "Initializing SemanticAnalyzer (structural)")
 
     def analyze_diff(
         self,
@@ -93,8 +97,8 @@ class SemanticAnalyzer:
             task_id=task_id,
         )
 
-        # Use regex-based analysis
-        analysis = analyze_with_regex(file_path, before, after, ext)
+        # Element-level analysis, memoized by content hash
+        analysis = analyze_structure(file_path, before, after, ext)
 
         debug_success(
             MODULE,
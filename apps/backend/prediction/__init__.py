@@ -26,11 +26,13 @@ Usage:
 from pathlib import Path
 
 # Public API exports
+from .failure_index import FailureIndex
 from .models import PredictedIssue, PreImplementationChecklist
 from .predictor import BugPredictor
 
 __all__ = [
     "BugPredictor",
+    "FailureIndex",
     "PredictedIssue",
     "PreImplementationChecklist",
     "generate_subtask_checklist",
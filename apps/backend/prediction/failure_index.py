@@ -0,0 +1,278 @@
+"""
+TF-IDF index of failed attempts for similar-failure lookups.
+
+Each failed attempt is tokenized once, when it is added. Lookups only score
+attempts that share a term or a file with the subtask (via inverted indexes),
+ranking them by TF-IDF cosine similarity of the descriptions plus file overlap.
+The index is persisted next to attempt_history.json and brought up to date
+incrementally: only attempts that aren't indexed yet are tokenized.
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+
+INDEX_VERSION = 1
+
+# Score added per file shared with the subtask (files are a stronger signal
+# than description wording; cosine similarity is at most 1.0)
+FILE_MATCH_WEIGHT = 0.5
+
+# Minimum score for an attempt to count as similar
+MIN_SIMILARITY = 0.3
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _attempt_keys(attempts: list[dict]) -> list[str]:
+    """Stable content-based keys for attempts (duplicates get a counter)."""
+    seen: Counter = Counter()
+    keys = []
+    for attempt in attempts:
+        digest = hashlib.sha1(
+            json.dumps(attempt, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        keys.append(f"{digest}:{seen[digest]}")
+        seen[digest] += 1
+    return keys
+
+
+class FailureIndex:
+    """Inverted TF-IDF index over failed subtask attempts."""
+
+    def __init__(self, index_file: Path | None = None):
+        """
+        Initialize an empty index.
+
+        Args:
+            index_file: Where to persist the index, or None to keep it in memory
+        """
+        self.index_file = Path(index_file) if index_file else None
+        # Signature of the attempt history the index was last synced with
+        self.source_signature: list | None = None
+        self._docs: dict[str, dict] = {}
+        self._term_index: dict[str, set[str]] = {}
+        self._file_index: dict[str, set[str]] = {}
+        self._norms: dict[str, float] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def add_attempt(self, attempt: dict, key: str | None = None) -> bool:
+        """
+        Index an attempt (non-failures are ignored).
+
+        Args:
+            attempt: Attempt dict with subtask_id, subtask_description,
+                status, error_message and files_modified
+            key: Unique key for the attempt (defaults to a content hash)
+
+        Returns:
+            True if the attempt was added
+        """
+        if attempt.get("status") != "failed":
+            return False
+        key = key or _attempt_keys([attempt])[0]
+        with self._lock:
+            if key in self._docs:
+                return False
+            description = attempt.get("subtask_description") or ""
+            self._insert(
+                key,
+                {
+                    "subtask_id": attempt.get("subtask_id"),
+                    "description": description,
+                    "failure_reason": attempt.get("error_message") or "Unknown error",
+                    "files": sorted(set(attempt.get("files_modified") or [])),
+                    "terms": dict(Counter(tokenize(description))),
+                },
+            )
+        return True
+
+    def sync(self, attempts: list[dict], source_signature: list | None = None) -> int:
+        """
+        Bring the index in line with an attempt history.
+
+        Attempts already indexed are kept as they are; new ones are added and
+        ones no longer in the history are dropped.
+
+        Args:
+            attempts: The full attempt history
+            source_signature: Signature of the history file, saved with the index
+
+        Returns:
+            Number of attempts added or removed
+        """
+        keys = _attempt_keys(attempts)
+        changes = 0
+        with self._lock:
+            wanted = set(keys)
+            for key in [k for k in self._docs if k not in wanted]:
+                self._remove(key)
+                changes += 1
+            for key, attempt in zip(keys, attempts):
+                if key not in self._docs and self.add_attempt(attempt, key):
+                    changes += 1
+            self.source_signature = source_signature
+        return changes
+
+    def _insert(self, key: str, doc: dict) -> None:
+        self._docs[key] = doc
+        for term in doc["terms"]:
+            self._term_index.setdefault(term, set()).add(key)
+        for file_path in doc["files"]:
+            self._file_index.setdefault(file_path, set()).add(key)
+        # Document frequencies changed, so cached vector norms are stale
+        self._norms.clear()
+
+    def _remove(self, key: str) -> None:
+        doc = self._docs.pop(key)
+        for term in doc["terms"]:
+            self._discard(self._term_index, term, key)
+        for file_path in doc["files"]:
+            self._discard(self._file_index, file_path, key)
+        self._norms.clear()
+
+    @staticmethod
+    def _discard(index: dict[str, set[str]], name: str, key: str) -> None:
+        keys = index.get(name)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[name]
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def _idf(self, term: str) -> float:
+        # Smoothed so terms found in every attempt still carry some weight
+        df = len(self._term_index.get(term, ()))
+        return math.log((1 + len(self._docs)) / (1 + df)) + 1.0
+
+    def _norm(self, key: str) -> float:
+        norm = self._norms.get(key)
+        if norm is None:
+            terms = self._docs[key]["terms"]
+            norm = math.sqrt(
+                sum((tf * self._idf(term)) ** 2 for term, tf in terms.items())
+            )
+            self._norms[key] = norm
+        return norm
+
+    def search(
+        self,
+        description: str,
+        files: list[str] | set[str] | None = None,
+        limit: int = 3,
+    ) -> list[dict]:
+        """
+        Find failed attempts similar to a subtask.
+
+        Args:
+            description: The subtask's description
+            files: Files the subtask will modify or create
+            limit: Maximum number of results
+
+        Returns:
+            Similar failures (subtask_id, description, failure_reason,
+            similarity_score), most similar first
+        """
+        query_tf = Counter(tokenize(description))
+        files = set(files or [])
+
+        with self._lock:
+            query = {term: tf * self._idf(term) for term, tf in query_tf.items()}
+            query_norm = math.sqrt(sum(w * w for w in query.values()))
+
+            candidates: set[str] = set()
+            for term in query:
+                candidates |= self._term_index.get(term, set())
+            for file_path in files:
+                candidates |= self._file_index.get(file_path, set())
+
+            similar = []
+            for key in candidates:
+                doc = self._docs[key]
+                score = 0.0
+                doc_norm = self._norm(key)
+                if query_norm and doc_norm:
+                    dot = sum(
+                        weight * doc["terms"][term] * self._idf(term)
+                        for term, weight in query.items()
+                        if term in doc["terms"]
+                    )
+                    score += dot / (query_norm * doc_norm)
+                score += FILE_MATCH_WEIGHT * len(files.intersection(doc["files"]))
+
+                if score >= MIN_SIMILARITY:
+                    similar.append(
+                        {
+                            "subtask_id": doc["subtask_id"],
+                            "description": doc["description"],
+                            "failure_reason": doc["failure_reason"],
+                            "similarity_score": round(score, 3),
+                        }
+                    )
+
+        # Most similar first; ties keep a stable order
+        similar.sort(key=lambda s: (-s["similarity_score"], str(s["subtask_id"])))
+        return similar[:limit]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def load(cls, index_file: Path) -> "FailureIndex":
+        """Load a persisted index (an empty one if missing or unreadable)."""
+        index = cls(index_file)
+        try:
+            with open(index_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            return index
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return index
+
+        for key, doc in (data.get("docs") or {}).items():
+            index._insert(key, doc)
+        index.source_signature = data.get("source_signature")
+        return index
+
+    def save(self) -> None:
+        """Persist the index atomically (no-op for in-memory indexes)."""
+        if self.index_file is None:
+            return
+        with self._lock:
+            data = {
+                "version": INDEX_VERSION,
+                "source_signature": self.source_signature,
+                "docs": self._docs,
+            }
+            tmp_file = self.index_file.with_name(
+                f".{self.index_file.name}.{os.getpid()}.tmp"
+            )
+            try:
+                self.index_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_file, self.index_file)
+            except OSError:
+                # The index can always be rebuilt from the history
+                tmp_file.unlink(missing_ok=True)
@@ -4,8 +4,15 @@ Loads historical data from gotchas, patterns, and attempt history.
 """
 
 import json
+import threading
 from pathlib import Path
 
+from .failure_index import FailureIndex
+
+# Failure indexes already loaded in this process, by index file path
+_failure_indexes: dict[str, FailureIndex] = {}
+_failure_indexes_lock = threading.Lock()
+
 
 class MemoryLoader:
     """Loads historical data from memory files."""
@@ -21,6 +28,7 @@ class MemoryLoader:
         self.gotchas_file = self.memory_dir / "gotchas.md"
         self.patterns_file = self.memory_dir / "patterns.md"
         self.history_file = self.memory_dir / "attempt_history.json"
+        self.failure_index_file = self.memory_dir / "failure_index.json"
 
     def load_gotchas(self) -> list[str]:
         """
@@ -91,6 +99,55 @@ class MemoryLoader:
         try:
             with open(self.history_file, encoding="utf-8") as f:
                 history = json.load(f)
-                return history.get("attempts", [])
         except (OSError, json.JSONDecodeError, UnicodeDecodeError):
             return []
+
+        if "attempts" in history:
+            return history.get("attempts", [])
+
+        # Recovery manager format: attempts grouped per subtask
+        attempts = []
+        for subtask_id, subtask in (history.get("subtasks") or {}).items():
+            for attempt in subtask.get("attempts", []):
+                attempts.append(
+                    {
+                        "subtask_id": subtask_id,
+                        "subtask_description": attempt.get("approach", ""),
+                        "status": "completed" if attempt.get("success") else "failed",
+                        "error_message": attempt.get("error") or "Unknown error",
+                        "files_modified": attempt.get("files_modified", []),
+                    }
+                )
+        return attempts
+
+    def _history_signature(self) -> list[int] | None:
+        try:
+            st = self.history_file.stat()
+        except OSError:
+            return None
+        return [st.st_mtime_ns, st.st_size]
+
+    def load_failure_index(self) -> FailureIndex:
+        """
+        Load the similar-failure index, updated for the current attempt history.
+
+        The index is kept in memory and persisted to failure_index.json. It is
+        only re-synced when attempt_history.json changed, and then only new
+        attempts are tokenized.
+
+        Returns:
+            FailureIndex over the failed attempts
+        """
+        key = str(self.failure_index_file.resolve())
+        with _failure_indexes_lock:
+            index = _failure_indexes.get(key)
+            if index is None:
+                index = FailureIndex.load(self.failure_index_file)
+                _failure_indexes[key] = index
+
+        signature = self._history_signature()
+        if signature is None or signature != index.source_signature:
+            index.sync(self.load_attempt_history(), signature)
+            if signature is not None:
+                index.save()
+        return index
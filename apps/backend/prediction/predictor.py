@@ -49,13 +49,13 @@ class BugPredictor:
             PreImplementationChecklist ready for formatting
         """
         # Load historical data
-        attempt_history = self.memory_loader.load_attempt_history()
+        failure_index = self.memory_loader.load_failure_index()
         known_patterns = self.memory_loader.load_patterns()
         known_gotchas = self.memory_loader.load_gotchas()
 
         # Analyze risks
         predicted_issues = self.risk_analyzer.analyze_subtask_risks(
-            subtask, attempt_history
+            subtask, failure_index
         )
 
         # Generate checklist
@@ -104,8 +104,8 @@ class BugPredictor:
         Returns:
             List of predicted issues
         """
-        attempt_history = self.memory_loader.load_attempt_history()
-        return self.risk_analyzer.analyze_subtask_risks(subtask, attempt_history)
+        failure_index = self.memory_loader.load_failure_index()
+        return self.risk_analyzer.analyze_subtask_risks(subtask, failure_index)
 
     def get_similar_past_failures(self, subtask: dict) -> list[dict]:
         """
@@ -117,5 +117,5 @@ class BugPredictor:
         Returns:
             List of similar failed attempts
         """
-        attempt_history = self.memory_loader.load_attempt_history()
-        return self.risk_analyzer.find_similar_failures(subtask, attempt_history)
+        failure_index = self.memory_loader.load_failure_index()
+        return self.risk_analyzer.find_similar_failures(subtask, failure_index)
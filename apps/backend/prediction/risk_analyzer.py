@@ -3,8 +3,7 @@ Risk analysis and similarity detection for subtasks.
 Analyzes subtasks to predict issues based on work type and historical failures.
 """
 
-import re
-
+from .failure_index import FailureIndex
 from .models import PredictedIssue
 from .patterns import detect_work_type, get_common_issues
 
@@ -24,14 +23,14 @@ class RiskAnalyzer:
     def analyze_subtask_risks(
         self,
         subtask: dict,
-        attempt_history: list[dict] | None = None,
+        attempt_history: list[dict] | FailureIndex | None = None,
     ) -> list[PredictedIssue]:
         """
         Predict likely issues for a subtask based on work type and history.
 
         Args:
             subtask: Subtask dictionary with keys like description, files_to_modify, etc.
-            attempt_history: Optional list of historical attempts
+            attempt_history: Optional list of historical attempts, or an index over them
 
         Returns:
             List of predicted issues, sorted by likelihood (high first)
@@ -79,14 +78,18 @@ class RiskAnalyzer:
     def find_similar_failures(
         self,
         subtask: dict,
-        attempt_history: list[dict],
+        attempt_history: list[dict] | FailureIndex,
     ) -> list[dict]:
         """
         Find subtasks similar to this one that failed before.
 
+        Failed attempts are ranked by TF-IDF similarity of their description
+        plus the number of files they share with the subtask.
+
         Args:
             subtask: Current subtask to analyze
-            attempt_history: List of historical attempts
+            attempt_history: List of historical attempts, or an index over them
+                (see MemoryLoader.load_failure_index)
 
         Returns:
             List of similar failed attempts with similarity scores
@@ -94,46 +97,13 @@ class RiskAnalyzer:
         if not attempt_history:
             return []
 
-        subtask_desc = subtask.get("description", "").lower()
+        if isinstance(attempt_history, FailureIndex):
+            index = attempt_history
+        else:
+            index = FailureIndex()
+            index.sync(attempt_history)
+
         subtask_files = set(
             subtask.get("files_to_modify", []) + subtask.get("files_to_create", [])
         )
-
-        similar = []
-        for attempt in attempt_history:
-            # Only look at failures
-            if attempt.get("status") != "failed":
-                continue
-
-            # Check similarity
-            attempt_desc = attempt.get("subtask_description", "").lower()
-            attempt_files = set(attempt.get("files_modified", []))
-
-            # Calculate similarity score
-            score = 0
-
-            # Description keyword overlap
-            subtask_keywords = set(re.findall(r"\w+", subtask_desc))
-            attempt_keywords = set(re.findall(r"\w+", attempt_desc))
-            common_keywords = subtask_keywords & attempt_keywords
-            if common_keywords:
-                score += len(common_keywords)
-
-            # File overlap
-            common_files = subtask_files & attempt_files
-            if common_files:
-                score += len(common_files) * 3  # Files are stronger signal
-
-            if score > 2:  # Threshold for similarity
-                similar.append(
-                    {
-                        "subtask_id": attempt.get("subtask_id"),
-                        "description": attempt.get("subtask_description"),
-                        "failure_reason": attempt.get("error_message", "Unknown error"),
-                        "similarity_score": score,
-                    }
-                )
-
-        # Sort by similarity
-        similar.sort(key=lambda x: x["similarity_score"], reverse=True)
-        return similar[:3]  # Top 3 similar failures
+        return index.search(subtask.get("description", ""), subtask_files, limit=3)
@@ -11,6 +11,7 @@ from core.progress import (
     format_duration,
     get_current_phase,
     get_next_subtask,
+    get_parallel_subtasks,
     get_plan_summary,
     get_progress_percentage,
     is_build_complete,
@@ -26,6 +27,7 @@ __all__ = [
     "format_duration",
     "get_current_phase",
     "get_next_subtask",
+    "get_parallel_subtasks",
     "get_plan_summary",
     "get_progress_percentage",
     "is_build_complete",
@@ -13,6 +13,8 @@ saving context window and keeping agents focused.
 import json
 from pathlib import Path
 
+from analysis.analyzers import ProjectAnalyzer
+
 
 def load_project_index(project_dir: Path) -> dict:
     """
@@ -168,8 +170,12 @@ def should_refresh_project_index(project_dir: Path) -> bool:
     """
     Check if project_index.json needs refresh based on dependency file changes.
 
-    Uses smart caching: only refresh if dependency files (package.json,
-    pyproject.toml, etc.) have been modified since the last index generation.
+    The index records a fingerprint of the project layout and of each
+    service's manifests (package.json, pyproject.toml, etc.) and entry points.
+    Files whose mtime changed are re-hashed, so touching a file without
+    changing it doesn't trigger a refresh. Use
+    analysis.analyzers.refresh_project_index() to re-analyze only the
+    services that changed.
 
     Args:
         project_dir: Root directory of the project
@@ -177,69 +183,14 @@ def should_refresh_project_index(project_dir: Path) -> bool:
     Returns:
         True if index should be regenerated, False if cache is still valid
     """
-    index_file = project_dir / ".auto-claude" / "project_index.json"
-
-    if not index_file.exists():
+    project_index = load_project_index(project_dir)
+    if not project_index:
         return True  # No index, must generate
 
     try:
-        index_mtime = index_file.stat().st_mtime
+        return not ProjectAnalyzer(project_dir).is_index_current(project_index)
     except OSError:
-        return True  # Can't stat file, regenerate
-
-    # Check all dependency files that could change frameworks
-    dep_files = [
-        project_dir / "package.json",
-        project_dir / "pyproject.toml",
-        project_dir / "requirements.txt",
-        project_dir / "Gemfile",
-        project_dir / "go.mod",
-        project_dir / "Cargo.toml",
-        project_dir / "composer.json",
-    ]
-
-    for dep_file in dep_files:
-        try:
-            dep_mtime = dep_file.stat().st_mtime
-            if dep_mtime > index_mtime:
-                return True  # Dependency file changed, refresh needed
-        except (OSError, FileNotFoundError):
-            continue  # Skip files we can't stat or don't exist
-
-    # Also check subdirectories for monorepos (first level only)
-    try:
-        for subdir in project_dir.iterdir():
-            if not subdir.is_dir():
-                continue
-            # Skip hidden dirs and common non-service dirs
-            if subdir.name.startswith(".") or subdir.name in (
-                "node_modules",
-                "__pycache__",
-                "dist",
-                "build",
-                ".git",
-            ):
-                continue
-
-            subdir_pkg = subdir / "package.json"
-            try:
-                pkg_mtime = subdir_pkg.stat().st_mtime
-                if pkg_mtime > index_mtime:
-                    return True
-            except (OSError, FileNotFoundError):
-                continue
-
-            subdir_pyproject = subdir / "pyproject.toml"
-            try:
-                pyproject_mtime = subdir_pyproject.stat().st_mtime
-                if pyproject_mtime > index_mtime:
-                    return True
-            except (OSError, FileNotFoundError):
-                continue
-    except OSError:
-        pass  # Can't iterate dir, use cached index
-
-    return False  # Cache is fresh
+        return True  # Can't inspect the project, regenerate
 
 
 def get_mcp_tools_for_project(capabilities: dict) -> list[str]:
@@ -14,6 +14,7 @@ from core.client import create_client
 from debug import debug, debug_error, debug_section, debug_success, debug_warning
 from linear_updater import (
     LinearTaskState,
+    flush_linear_updates,
     is_linear_enabled,
     linear_qa_approved,
     linear_qa_max_iterations,
@@ -290,6 +291,7 @@ async def run_qa_validation_loop(
             # Update Linear: QA approved, awaiting human review
             if linear_task and linear_task.task_id:
                 await linear_qa_approved(spec_dir)
+                await flush_linear_updates(spec_dir)
                 print("\nLinear: Task marked as QA approved, awaiting human review")
 
             return True
@@ -357,6 +359,7 @@ async def run_qa_validation_loop(
                 # Update Linear
                 if linear_task and linear_task.task_id:
                     await linear_qa_max_iterations(spec_dir, qa_iteration)
+                    await flush_linear_updates(spec_dir)
                     print(
                         "\nLinear: Task marked as needing human intervention (recurring issues)"
                     )
@@ -367,6 +370,7 @@ async def run_qa_validation_loop(
             if linear_task and linear_task.task_id:
                 issues_count = len(current_issues)
                 await linear_qa_rejected(spec_dir, issues_count, qa_iteration)
+                await flush_linear_updates(spec_dir)
 
             if qa_iteration >= MAX_QA_ITERATIONS:
                 print("\n⚠️  Maximum QA iterations reached.")
@@ -525,6 +529,7 @@ async def run_qa_validation_loop(
     # Update Linear: max iterations reached, needs human intervention
     if linear_task and linear_task.task_id:
         await linear_qa_max_iterations(spec_dir, qa_iteration)
+        await flush_linear_updates(spec_dir)
         print("\nLinear: Task marked as needing human intervention")
 
     print("\nManual intervention required.")
@@ -7,7 +7,9 @@ and report generation.
 """
 
 import json
-from collections import Counter
+import math
+from collections import Counter, defaultdict
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from difflib import SequenceMatcher
 from pathlib import Path
@@ -133,6 +135,74 @@ def _issue_similarity(issue1: dict[str, Any], issue2: dict[str, Any]) -> float:
     return SequenceMatcher(None, key1, key2).ratio()
 
 
+class _IssueKeyIndex:
+    """
+    Normalized issue keys, indexed for similarity lookups.
+
+    SequenceMatcher.ratio() is 2 * matches / (len(a) + len(b)), and the
+    matching characters can outnumber neither the shorter key nor the
+    characters both keys have in common. Keys are bucketed by length and keep
+    their character counts, so a lookup only scores the keys whose length and
+    shared characters can still reach the threshold: the results are the
+    same as scoring every key, without the quadratic cost on long histories.
+    """
+
+    def __init__(self, threshold: float = ISSUE_SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self.keys: list[str] = []
+        self._positions: dict[str, int] = {}
+        self._char_counts: list[Counter] = []
+        self._by_length: dict[int, list[int]] = defaultdict(list)
+
+    def add(self, key: str) -> int:
+        """Index a key (once) and return its position."""
+        position = self._positions.get(key)
+        if position is None:
+            position = len(self.keys)
+            self._positions[key] = position
+            self.keys.append(key)
+            self._char_counts.append(Counter(key))
+            self._by_length[len(key)].append(position)
+        return position
+
+    def similar(self, key: str) -> Iterator[int]:
+        """
+        Positions of the indexed keys similar to key, in insertion order.
+
+        Similar means SequenceMatcher(None, key, indexed_key).ratio() is at
+        least the threshold.
+        """
+        threshold = self.threshold
+        length = len(key)
+        # Lengths whose length bound 2 * min / total reaches the threshold
+        shortest = math.floor(length * threshold / (2 - threshold))
+        longest = math.ceil(length * (2 - threshold) / threshold)
+        candidates = sorted(
+            position
+            for other_length in range(shortest, longest + 1)
+            for position in self._by_length.get(other_length, ())
+        )
+        if not candidates:
+            return
+
+        char_counts = Counter(key)
+        chars = list(char_counts)
+        counts = list(char_counts.values())
+        zeros = [0] * len(chars)
+        matcher = SequenceMatcher(None, key)
+        for position in candidates:
+            other = self.keys[position]
+            total = length + len(other)
+            # Characters both keys have (the bound SequenceMatcher.quick_ratio uses)
+            other_counts = map(self._char_counts[position].get, chars, zeros)
+            shared = sum(map(min, counts, other_counts))
+            if 2.0 * shared / total < threshold:
+                continue
+            matcher.set_seq2(other)
+            if matcher.ratio() >= threshold:
+                yield position
+
+
 def has_recurring_issues(
     current_issues: list[dict[str, Any]],
     history: list[dict[str, Any]],
@@ -149,23 +219,22 @@ def has_recurring_issues(
     Returns:
         (has_recurring, recurring_issues) tuple
     """
-    # Flatten all historical issues
-    historical_issues = []
+    # Index the distinct keys of all historical issues, with their counts
+    index = _IssueKeyIndex()
+    key_counts: Counter[int] = Counter()
     for record in history:
-        historical_issues.extend(record.get("issues", []))
+        for issue in record.get("issues", []):
+            key_counts[index.add(_normalize_issue_key(issue))] += 1
 
-    if not historical_issues:
+    if not key_counts:
         return False, []
 
     recurring = []
 
     for current in current_issues:
-        occurrence_count = 1  # Count current occurrence
-
-        for historical in historical_issues:
-            similarity = _issue_similarity(current, historical)
-            if similarity >= ISSUE_SIMILARITY_THRESHOLD:
-                occurrence_count += 1
+        key = _normalize_issue_key(current)
+        # Count current occurrence, plus every similar historical one
+        occurrence_count = 1 + sum(key_counts[p] for p in index.similar(key))
 
         if occurrence_count >= threshold:
             recurring.append(
@@ -194,24 +263,25 @@ def get_recurring_issue_summary(
     if not all_issues:
         return {"total_issues": 0, "unique_issues": 0, "most_common": []}
 
-    # Group similar issues
+    # Group similar issues: each joins the first earlier group it is similar
+    # to. Groups only grow, so a key repeated later lands in the same group.
+    index = _IssueKeyIndex()
     issue_groups: dict[str, list[dict[str, Any]]] = {}
+    group_of_key: dict[str, str] = {}
 
     for issue in all_issues:
         key = _normalize_issue_key(issue)
-        matched = False
-
-        for existing_key in issue_groups:
-            if (
-                SequenceMatcher(None, key, existing_key).ratio()
-                >= ISSUE_SIMILARITY_THRESHOLD
-            ):
-                issue_groups[existing_key].append(issue)
-                matched = True
-                break
-
-        if not matched:
-            issue_groups[key] = [issue]
+        group = group_of_key.get(key)
+        if group is None:
+            position = next(index.similar(key), None)
+            if position is None:
+                index.add(key)
+                issue_groups[key] = []
+                group = key
+            else:
+                group = index.keys[position]
+            group_of_key[key] = group
+        issue_groups[group].append(issue)
 
     # Find most common issues
     sorted_groups = sorted(issue_groups.items(), key=lambda x: len(x[1]), reverse=True)
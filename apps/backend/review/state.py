@@ -8,6 +8,9 @@ Tracks approval status, feedback, and detects changes to specs after approval.
 
 import hashlib
 import json
+import os
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -15,16 +18,68 @@ from pathlib import Path
 # State file name
 REVIEW_STATE_FILE = "review_state.json"
 
+# Characters hashed per read, so large plans are never held in memory at once
+HASH_CHUNK_CHARS = 1 << 20
 
-def _compute_file_hash(file_path: Path) -> str:
-    """Compute MD5 hash of a file's contents for change detection."""
-    if not file_path.exists():
-        return ""
+# Files modified this recently are rehashed on every check: an in-place edit
+# within the filesystem's timestamp granularity can keep size and mtime
+RACY_WINDOW_NS = 2_000_000_000
+
+# Resolved path -> (stat signature, hashed_at_ns, hash)
+_file_hash_cache: dict[str, tuple[tuple[int, int, int, int], int, str]] = {}
+_file_hash_cache_lock = threading.Lock()
+
+
+def clear_file_hash_cache() -> None:
+    """Forget all cached file hashes."""
+    with _file_hash_cache_lock:
+        _file_hash_cache.clear()
+
+
+def _hash_file_contents(file_path: Path) -> str:
+    """MD5 of the file's text (newlines normalized), read in chunks."""
+    digest = hashlib.md5(usedforsecurity=False)
     try:
-        content = file_path.read_text(encoding="utf-8")
-        return hashlib.md5(content.encode("utf-8"), usedforsecurity=False).hexdigest()
+        with open(file_path, encoding="utf-8") as f:
+            while chunk := f.read(HASH_CHUNK_CHARS):
+                digest.update(chunk.encode("utf-8"))
     except (OSError, UnicodeDecodeError):
         return ""
+    return digest.hexdigest()
+
+
+def _compute_file_hash(file_path: Path) -> str:
+    """
+    Compute MD5 hash of a file's contents for change detection.
+
+    Hashes are cached against the file's stat signature (mtime, ctime, size,
+    inode), so checking an unchanged file costs one stat call. Any write
+    changes mtime and ctime; a file modified within RACY_WINDOW_NS of being
+    hashed is not trusted from the cache until it is older than that.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return ""
+    signature = (stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size, stat.st_ino)
+    key = os.path.abspath(file_path)
+
+    with _file_hash_cache_lock:
+        cached = _file_hash_cache.get(key)
+    if cached is not None:
+        cached_signature, hashed_at_ns, file_hash = cached
+        if (
+            cached_signature == signature
+            and max(stat.st_mtime_ns, stat.st_ctime_ns) < hashed_at_ns - RACY_WINDOW_NS
+        ):
+            return file_hash
+
+    hashed_at_ns = time.time_ns()
+    file_hash = _hash_file_contents(file_path)
+    if file_hash:
+        with _file_hash_cache_lock:
+            _file_hash_cache[key] = (signature, hashed_at_ns, file_hash)
+    return file_hash
 
 
 def _compute_spec_hash(spec_dir: Path) -> str:
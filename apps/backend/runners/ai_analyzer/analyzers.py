@@ -4,10 +4,63 @@ Individual analyzer implementations for different aspects of code analysis.
 
 from typing import Any
 
+# Source files every analyzer reads
+SOURCE_PATTERNS = [
+    "*.py",
+    "*.js",
+    "*.jsx",
+    "*.ts",
+    "*.tsx",
+    "*.vue",
+    "*.svelte",
+    "*.go",
+    "*.rs",
+    "*.rb",
+    "*.php",
+    "*.java",
+    "*.kt",
+    "*.cs",
+    "*.swift",
+    "*.sql",
+]
+
+# Dependency manifests and deployment/runtime configuration
+CONFIG_PATTERNS = [
+    "requirements*.txt",
+    "pyproject.toml",
+    "Pipfile*",
+    "poetry.lock",
+    "package.json",
+    "package-lock.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+    "go.mod",
+    "go.sum",
+    "Cargo.toml",
+    "Cargo.lock",
+    "Gemfile*",
+    "composer.json",
+    "composer.lock",
+    "Dockerfile*",
+    "docker-compose*.yml",
+    "docker-compose*.yaml",
+    "*.env.example",
+    "settings*.toml",
+    "*.ini",
+    "*.cfg",
+]
+
+# Documentation
+DOC_PATTERNS = ["*.md", "*.rst"]
+
 
 class BaseAnalyzer:
     """Base class for all analyzers."""
 
+    # Project files the analyzer reads (glob patterns matched against file
+    # names); a change to any of them invalidates its cached result
+    INPUT_PATTERNS: list[str] = SOURCE_PATTERNS
+
     def __init__(self, project_index: dict[str, Any]):
         """
         Initialize analyzer.
@@ -167,6 +220,8 @@ Analyze the actual code structure using Read, Grep, and Glob."""
 class SecurityAnalyzer(BaseAnalyzer):
     """Analyzes security vulnerabilities."""
 
+    INPUT_PATTERNS = SOURCE_PATTERNS + CONFIG_PATTERNS
+
     def get_prompt(self) -> str:
         """Generate analysis prompt."""
         return """Perform a security analysis of this codebase.
@@ -243,6 +298,8 @@ Use Grep to find database queries and loops."""
 class CodeQualityAnalyzer(BaseAnalyzer):
     """Analyzes code quality and maintainability."""
 
+    INPUT_PATTERNS = SOURCE_PATTERNS + DOC_PATTERNS
+
     def get_prompt(self) -> str:
         """Generate analysis prompt."""
         return """Analyze code quality and maintainability.
@@ -1,61 +1,176 @@
 """
 Cache management for AI analysis results.
+
+Each analyzer's result is cached under a fingerprint of its inputs: its
+prompt plus the content of every project file it reads (see
+``BaseAnalyzer.INPUT_PATTERNS``). An analyzer is re-run as soon as one of
+its inputs changes, and never while they stay the same.
+
+File contents are hashed once and remembered with their stat signature
+(mtime, size), so later runs only re-hash files that were touched.
 """
 
+import fnmatch
+import hashlib
 import json
-import time
+import os
 from pathlib import Path
 from typing import Any
 
+from analysis.analyzers.base import SKIP_DIRS
+from analysis.discovery_cache import hash_path, stat_signature
+
+# Bump when the fingerprint or the cached result format changes
+CACHE_VERSION = 1
+
 
 class CacheManager:
     """Manages caching of AI analysis results."""
 
-    CACHE_VALIDITY_HOURS = 24
-
-    def __init__(self, cache_dir: Path):
+    def __init__(self, cache_dir: Path, project_dir: Path | None = None):
         """
         Initialize cache manager.
 
         Args:
             cache_dir: Directory to store cache files
+            project_dir: Project whose files are fingerprinted (default: the
+                project containing ``.auto-claude/ai_cache``)
         """
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_file = self.cache_dir / "ai_insights.json"
+        self.analyzer_cache_file = self.cache_dir / "analyzer_results.json"
+        self.project_dir = project_dir or cache_dir.parent.parent
+        self._cache = self._load()
+        self._project_files: list[str] | None = None
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            data = json.loads(self.analyzer_cache_file.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            data = None
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            data = {"version": CACHE_VERSION, "files": {}, "analyzers": {}}
+        return data
+
+    # ------------------------------------------------------------------
+    # Fingerprints
+    # ------------------------------------------------------------------
 
-    def get_cached_result(self, skip_cache: bool = False) -> dict[str, Any] | None:
+    def _list_project_files(self) -> list[str]:
+        """Relative paths of the project's files (skipping vendored/build dirs)."""
+        if self._project_files is None:
+            files = []
+            for root, dirs, names in os.walk(self.project_dir):
+                dirs[:] = sorted(
+                    d
+                    for d in dirs
+                    if d not in SKIP_DIRS and not d.endswith(".egg-info")
+                )
+                rel_root = Path(root).relative_to(self.project_dir)
+                files.extend((rel_root / name).as_posix() for name in names)
+            self._project_files = sorted(files)
+        return self._project_files
+
+    def _file_digest(self, rel_path: str) -> str | None:
+        """Content hash of a file, re-hashed only if its stat changed."""
+        files: dict[str, list] = self._cache["files"]
+        stat = stat_signature(self.project_dir / rel_path)
+        if stat is None:
+            files.pop(rel_path, None)
+            return None
+        recorded = files.get(rel_path)
+        if recorded and recorded[:2] == stat:
+            return recorded[2]
+        digest = hash_path(self.project_dir / rel_path)
+        files[rel_path] = [*stat, digest]
+        return digest
+
+    def fingerprint(self, name: str, prompt: str, input_patterns: list[str]) -> str:
         """
-        Retrieve cached analysis result if valid.
+        Fingerprint an analyzer's inputs.
+
+        Take the fingerprint *before* running the analyzer, so an edit made
+        while it runs invalidates the stored result instead of hiding behind it.
 
         Args:
+            name: Analyzer name
+            prompt: The analyzer's prompt
+            input_patterns: Glob patterns of the project files it reads
+
+        Returns:
+            Hex digest identifying the analyzer's inputs
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{CACHE_VERSION}\0{name}\0{prompt}\0".encode())
+        for rel_path in self._list_project_files():
+            file_name = rel_path.rsplit("/", 1)[-1]
+            if any(fnmatch.fnmatch(file_name, p) for p in input_patterns):
+                file_digest = self._file_digest(rel_path)
+                if file_digest is not None:
+                    digest.update(f"{rel_path}\0{file_digest}\0".encode())
+        return digest.hexdigest()
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def get_analyzer_result(
+        self, name: str, fingerprint: str, skip_cache: bool = False
+    ) -> dict[str, Any] | None:
+        """
+        Retrieve an analyzer's cached result if its inputs are unchanged.
+
+        Args:
+            name: Analyzer name
+            fingerprint: Fingerprint of the analyzer's current inputs
             skip_cache: If True, always return None (force re-analysis)
 
         Returns:
-            Cached analysis result or None if cache invalid/expired
+            Cached analysis result or None
         """
         if skip_cache:
             return None
-
-        if not self.cache_file.exists():
+        entry = self._cache["analyzers"].get(name)
+        if not entry or entry.get("fingerprint") != fingerprint:
             return None
+        return entry.get("result")
 
-        cache_age = time.time() - self.cache_file.stat().st_mtime
-        hours_old = cache_age / 3600
-
-        if hours_old >= self.CACHE_VALIDITY_HOURS:
-            print(f"⚠️  Cache expired ({hours_old:.1f} hours old), re-analyzing...")
-            return None
+    def save_analyzer_result(
+        self, name: str, fingerprint: str, result: dict[str, Any]
+    ) -> None:
+        """
+        Remember an analyzer's result (failed runs and unparsed responses
+        are not cached).
 
-        print(f"✓ Using cached AI insights ({hours_old:.1f} hours old)")
-        return json.loads(self.cache_file.read_text(encoding="utf-8"))
+        Args:
+            name: Analyzer name
+            fingerprint: Fingerprint taken before the analyzer ran
+            result: Analysis result
+        """
+        if "error" in result or "_raw_response" in result:
+            return
+        self._cache["analyzers"][name] = {"fingerprint": fingerprint, "result": result}
 
     def save_result(self, result: dict[str, Any]) -> None:
         """
-        Save analysis result to cache.
+        Save the combined analysis result and the per-analyzer cache.
 
         Args:
             result: Analysis result to cache
         """
         self.cache_file.write_text(json.dumps(result, indent=2), encoding="utf-8")
+        if self._project_files is not None:
+            # Forget hashes of files that no longer exist
+            listed = set(self._project_files)
+            self._cache["files"] = {
+                path: entry
+                for path, entry in self._cache["files"].items()
+                if path in listed
+            }
+        tmp_file = self.analyzer_cache_file.with_name(
+            f".{self.analyzer_cache_file.name}.{os.getpid()}.tmp"
+        )
+        tmp_file.write_text(json.dumps(self._cache), encoding="utf-8")
+        os.replace(tmp_file, self.analyzer_cache_file)
         print(f"\n✓ AI insights cached to: {self.cache_file}")
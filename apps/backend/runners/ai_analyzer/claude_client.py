@@ -3,6 +3,7 @@ Claude SDK client wrapper for AI analysis.
 """
 
 import json
+import uuid
 from pathlib import Path
 from typing import Any
 
@@ -86,7 +87,10 @@ class ClaudeAnalysisClient:
             },
         }
 
-        settings_file = self.project_dir / ".claude_ai_analyzer_settings.json"
+        # Unique per query, since analyzers run concurrently
+        settings_file = (
+            self.project_dir / f".claude_ai_analyzer_settings.{uuid.uuid4().hex}.json"
+        )
         with open(settings_file, "w", encoding="utf-8") as f:
             json.dump(settings, f, indent=2)
 
@@ -2,6 +2,7 @@
 Main orchestrator for AI-powered project analysis.
 """
 
+import asyncio
 import time
 from datetime import datetime
 from pathlib import Path
@@ -19,6 +20,9 @@ from .summary_printer import SummaryPrinter
 class AIAnalyzerRunner:
     """Orchestrates AI-powered project analysis."""
 
+    # Maximum number of analyzers querying Claude at the same time
+    MAX_CONCURRENT_ANALYZERS = 3
+
     def __init__(self, project_dir: Path, project_index: dict[str, Any]):
         """
         Initialize AI analyzer.
@@ -29,7 +33,9 @@ class AIAnalyzerRunner:
         """
         self.project_dir = project_dir
         self.project_index = project_index
-        self.cache_manager = CacheManager(project_dir / ".auto-claude" / "ai_cache")
+        self.cache_manager = CacheManager(
+            project_dir / ".auto-claude" / "ai_cache", project_dir
+        )
         self.cost_estimator = CostEstimator(project_dir, project_index)
         self.result_parser = ResultParser()
         self.summary_printer = SummaryPrinter()
@@ -49,31 +55,49 @@ class AIAnalyzerRunner:
         """
         self._print_header()
 
-        # Check for cached analysis
-        cached_result = self.cache_manager.get_cached_result(skip_cache)
-        if cached_result:
-            return cached_result
+        # Determine which analyzers to run
+        analyzers_to_run = self._get_analyzers_to_run(selected_analyzers)
 
-        if not CLAUDE_SDK_AVAILABLE:
+        # Reuse results of analyzers whose inputs are unchanged
+        insights: dict[str, Any] = {}
+        fingerprints = self._fingerprint_analyzers(analyzers_to_run)
+        pending = []
+        for analyzer_name in analyzers_to_run:
+            cached = self.cache_manager.get_analyzer_result(
+                analyzer_name, fingerprints.get(analyzer_name), skip_cache
+            )
+            if cached is not None:
+                print(f"✓ Using cached {analyzer_name} insights (inputs unchanged)")
+                insights[analyzer_name] = cached
+            else:
+                pending.append(analyzer_name)
+
+        if pending and not CLAUDE_SDK_AVAILABLE:
             print("✗ Claude Agent SDK not available. Cannot run AI analysis.")
             return {"error": "Claude SDK not installed"}
 
         # Estimate cost before running
         cost_estimate = self.cost_estimator.estimate_cost()
-        self.summary_printer.print_cost_estimate(cost_estimate.__dict__)
+        if pending:
+            self.summary_printer.print_cost_estimate(cost_estimate.__dict__)
 
         # Initialize results
         insights = {
             "analysis_timestamp": datetime.now().isoformat(),
             "project_dir": str(self.project_dir),
             "cost_estimate": cost_estimate.__dict__,
+            **insights,
         }
 
-        # Determine which analyzers to run
-        analyzers_to_run = self._get_analyzers_to_run(selected_analyzers)
-
-        # Run each analyzer
-        await self._run_analyzers(analyzers_to_run, insights)
+        # Run the analyzers whose inputs changed
+        await self._run_analyzers(pending, insights)
+        for analyzer_name in pending:
+            if analyzer_name in fingerprints:
+                self.cache_manager.save_analyzer_result(
+                    analyzer_name,
+                    fingerprints[analyzer_name],
+                    insights[analyzer_name],
+                )
 
         # Calculate overall score
         insights["overall_score"] = self._calculate_overall_score(
@@ -114,31 +138,63 @@ class AIAnalyzerRunner:
 
         return AnalyzerType.all_analyzers()
 
+    def _fingerprint_analyzers(self, analyzers_to_run: list[str]) -> dict[str, str]:
+        """
+        Fingerprint the inputs of each analyzer (before any of them runs).
+
+        Args:
+            analyzers_to_run: List of analyzer names
+
+        Returns:
+            Fingerprint per analyzer; analyzers that can't build a prompt are
+            left out (they are never cached)
+        """
+        fingerprints = {}
+        for analyzer_name in analyzers_to_run:
+            analyzer = AnalyzerFactory.create(analyzer_name, self.project_index)
+            try:
+                prompt = analyzer.get_prompt()
+            except ValueError:
+                continue
+            fingerprints[analyzer_name] = self.cache_manager.fingerprint(
+                analyzer_name, prompt, analyzer.INPUT_PATTERNS
+            )
+        return fingerprints
+
     async def _run_analyzers(
         self, analyzers_to_run: list[str], insights: dict[str, Any]
     ) -> None:
         """
-        Run all specified analyzers.
+        Run all specified analyzers concurrently.
 
         Args:
             analyzers_to_run: List of analyzer names to run
             insights: Dictionary to store results
         """
-        for analyzer_name in analyzers_to_run:
-            print(f"\n🤖 Running {analyzer_name.replace('_', ' ').title()} Analyzer...")
-            start_time = time.time()
-
-            try:
-                result = await self._run_single_analyzer(analyzer_name)
-                insights[analyzer_name] = result
-
-                duration = time.time() - start_time
-                score = result.get("score", 0)
-                print(f"   ✓ Completed in {duration:.1f}s (score: {score}/100)")
-
-            except Exception as e:
-                print(f"   ✗ Error: {e}")
-                insights[analyzer_name] = {"error": str(e)}
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ANALYZERS)
+
+        async def run(analyzer_name: str) -> None:
+            title = analyzer_name.replace("_", " ").title()
+            async with semaphore:
+                print(f"\n🤖 Running {title} Analyzer...")
+                start_time = time.time()
+
+                try:
+                    result = await self._run_single_analyzer(analyzer_name)
+                    insights[analyzer_name] = result
+
+                    duration = time.time() - start_time
+                    score = result.get("score", 0)
+                    print(
+                        f"   ✓ {title} completed in {duration:.1f}s "
+                        f"(score: {score}/100)"
+                    )
+
+                except Exception as e:
+                    print(f"   ✗ {title} error: {e}")
+                    insights[analyzer_name] = {"error": str(e)}
+
+        await asyncio.gather(*(run(name) for name in analyzers_to_run))
 
     async def _run_single_analyzer(self, analyzer_name: str) -> dict[str, Any]:
         """
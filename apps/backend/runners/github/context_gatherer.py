@@ -16,15 +16,21 @@ Responsibilities:
 
 from __future__ import annotations
 
-import ast
 import asyncio
 import json
-import os
 import re
+from collections.abc import Collection
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from analysis.import_graph import (
+    SOURCE_SUFFIXES,
+    ImportGraph,
+    get_import_graph,
+    iter_import_specifiers,
+)
+
 try:
     from .gh_client import GHClient, PRTooLargeError
     from .services.io_utils import safe_print
@@ -244,6 +250,7 @@ class PRContextGatherer:
             max_retries=3,
             repo=repo,
         )
+        self._import_graph: ImportGraph | None = None
 
     async def gather(self) -> PRContext:
         """
@@ -883,167 +890,51 @@ class PRContextGatherer:
 
         return found
 
+    def _get_import_graph(self) -> ImportGraph:
+        """Get the project's import graph, refreshed once per gatherer."""
+        if self._import_graph is None:
+            self._import_graph = get_import_graph(
+                self.project_dir, self._load_tsconfig_paths()
+            )
+        return self._import_graph
+
     def _find_imports(self, content: str, source_path: Path) -> set[str]:
         """
         Find imported files from source code.
 
         Supports:
-        - JavaScript/TypeScript: ES6 imports, path aliases, CommonJS, re-exports
+        - JavaScript/TypeScript: ES6 imports, path aliases, CommonJS, re-exports,
+          side-effect and dynamic imports
         - Python: import statements via AST
-        """
-        imports = set()
 
-        if source_path.suffix in [".ts", ".tsx", ".js", ".jsx"]:
-            # Load tsconfig paths once for this file (for alias resolution)
-            ts_paths = self._load_tsconfig_paths()
-
-            # Pattern 1: ES6 relative imports (existing)
-            # Matches: from './file', from '../file'
-            relative_pattern = r"from\s+['\"](\.[^'\"]+)['\"]"
-            for match in re.finditer(relative_pattern, content):
-                import_path = match.group(1)
-                resolved = self._resolve_import_path(import_path, source_path)
-                if resolved:
-                    imports.add(resolved)
-
-            # Pattern 2: Path alias imports (NEW)
-            # Matches: from '@/utils', from '~/config', from '@shared/types'
-            alias_pattern = r"from\s+['\"](@[^'\"]+|~[^'\"]+)['\"]"
-            if ts_paths:
-                for match in re.finditer(alias_pattern, content):
-                    import_path = match.group(1)
-                    resolved = self._resolve_alias_import(import_path, ts_paths)
-                    if resolved:
-                        imports.add(resolved)
-
-            # Pattern 3: CommonJS require (NEW)
-            # Matches: require('./utils'), require('@/config')
-            require_pattern = r"require\s*\(\s*['\"]([^'\"]+)['\"]\s*\)"
-            for match in re.finditer(require_pattern, content):
-                import_path = match.group(1)
-                resolved = self._resolve_any_import(import_path, source_path, ts_paths)
-                if resolved:
-                    imports.add(resolved)
-
-            # Pattern 4: Re-exports (NEW)
-            # Matches: export * from './module', export { x } from './module'
-            reexport_pattern = r"export\s+(?:\*|\{[^}]*\})\s+from\s+['\"]([^'\"]+)['\"]"
-            for match in re.finditer(reexport_pattern, content):
-                import_path = match.group(1)
-                resolved = self._resolve_any_import(import_path, source_path, ts_paths)
-                if resolved:
-                    imports.add(resolved)
-
-        elif source_path.suffix == ".py":
-            # Python imports via AST
-            imports.update(self._find_python_imports(content, source_path))
-
-        return imports
-
-    def _resolve_alias_import(
-        self, import_path: str, ts_paths: dict[str, list[str]]
-    ) -> str | None:
+        Imports are resolved against the project's import graph index, so no
+        candidate paths are stat'ed.
         """
-        Resolve a path alias import to an actual file path.
-
-        Path aliases (e.g., @/utils, ~/config) are project-root relative,
-        not relative to the importing file.
-
-        Args:
-            import_path: Path alias import like '@/utils' or '~/config'
-            ts_paths: tsconfig paths mapping
-
-        Returns:
-            Resolved path relative to project root, or None if not found
-        """
-        resolved_alias = self._resolve_path_alias(import_path, ts_paths)
-        if not resolved_alias:
-            return None
-
-        # Path aliases are project-root relative, so resolve from root
-        # by using an empty base path (Path(".").parent = Path("."))
-        return self._resolve_import_path("./" + resolved_alias, Path("."))
-
-    def _resolve_any_import(
-        self, import_path: str, source_path: Path, ts_paths: dict[str, list[str]] | None
-    ) -> str | None:
-        """
-        Resolve any import path (relative, alias, or node_modules).
-
-        Handles all import types:
-        - Relative: './utils', '../config'
-        - Path aliases: '@/utils', '~/config'
-        - Node modules: 'lodash' (returns None - not project files)
+        if source_path.suffix not in SOURCE_SUFFIXES:
+            return set()
 
-        Args:
-            import_path: The import path from the source code
-            source_path: Path of the file doing the importing
-            ts_paths: tsconfig paths mapping, or None
-
-        Returns:
-            Resolved path relative to project root, or None if not found/external
-        """
-        if import_path.startswith("."):
-            # Relative import
-            return self._resolve_import_path(import_path, source_path)
-        elif import_path.startswith("@") or import_path.startswith("~"):
-            # Path alias import
-            if ts_paths:
-                return self._resolve_alias_import(import_path, ts_paths)
-            return None
-        else:
-            # Node modules package - skip
-            return None
+        graph = self._get_import_graph()
+        source = source_path.as_posix()
+        imports = set()
+        for specifier in iter_import_specifiers(content, source_path.suffix):
+            resolved = graph.resolve(specifier, source)
+            if resolved:
+                imports.add(str(Path(resolved)))
+        return imports
 
     def _resolve_import_path(self, import_path: str, source_path: Path) -> str | None:
         """
-        Resolve a relative import path to an absolute file path.
+        Resolve a relative JS/TS import path to a project file.
 
         Args:
             import_path: Relative import like './utils' or '../config'
             source_path: Path of the file doing the importing
 
         Returns:
-            Absolute path relative to project root, or None if not found
+            Path relative to project root, or None if not found
         """
-        # Start from the directory containing the source file
-        base_dir = source_path.parent
-
-        # Resolve relative path - MUST prepend project_dir to resolve correctly
-        # when CWD is different from project root (e.g., running from apps/backend/)
-        resolved = (self.project_dir / base_dir / import_path).resolve()
-
-        # Try common extensions if no extension provided
-        if not resolved.suffix:
-            for ext in [".ts", ".tsx", ".js", ".jsx"]:
-                candidate = resolved.with_suffix(ext)
-                if candidate.exists() and candidate.is_file():
-                    try:
-                        rel_path = candidate.relative_to(self.project_dir)
-                        return str(rel_path)
-                    except ValueError:
-                        # File is outside project directory
-                        return None
-
-            # Also check for index files
-            for ext in [".ts", ".tsx", ".js", ".jsx"]:
-                index_file = resolved / f"index{ext}"
-                if index_file.exists() and index_file.is_file():
-                    try:
-                        rel_path = index_file.relative_to(self.project_dir)
-                        return str(rel_path)
-                    except ValueError:
-                        return None
-
-        # File with extension
-        if resolved.exists() and resolved.is_file():
-            try:
-                rel_path = resolved.relative_to(self.project_dir)
-                return str(rel_path)
-            except ValueError:
-                return None
-
-        return None
+        resolved = self._get_import_graph().resolve(import_path, source_path.as_posix())
+        return str(Path(resolved)) if resolved else None
 
     def _find_config_files(self, directory: Path) -> set[str]:
         """Find configuration files in a directory."""
@@ -1071,9 +962,9 @@ class PRContextGatherer:
         """
         Find files that import the given file (reverse dependencies).
 
-        Uses pure Python to search for import statements referencing this file.
-        Cross-platform compatible (Windows, macOS, Linux).
-        Limited to prevent performance issues on large codebases.
+        Looks the file up in the project's reverse import graph, which is
+        built once and then updated incrementally from git changes, instead
+        of scanning the tree for each changed file.
 
         Args:
             file_path: Path of the file to find dependents for
@@ -1082,100 +973,29 @@ class PRContextGatherer:
         Returns:
             Set of file paths that import this file.
         """
-        dependents: set[str] = set()
         path_obj = Path(file_path)
-        stem = path_obj.stem  # e.g., 'helpers' from 'utils/helpers.ts'
-
-        # Skip if stem is too generic (would match too many files)
-        if stem in ["index", "main", "app", "utils", "helpers", "types", "constants"]:
-            return dependents
-
-        # Build regex patterns and file extensions based on file type
-        pattern = None
-        file_extensions = []
-
-        if path_obj.suffix in [".ts", ".tsx", ".js", ".jsx"]:
-            # Match various import styles for JS/TS
-            # from './helpers', from '../utils/helpers', from '@/utils/helpers'
-            # Escape stem for regex safety
-            escaped_stem = re.escape(stem)
-            pattern = re.compile(rf"['\"].*{escaped_stem}['\"]")
-            file_extensions = [".ts", ".tsx", ".js", ".jsx"]
-        elif path_obj.suffix == ".py":
-            # Match Python imports: from .helpers import, import helpers
-            escaped_stem = re.escape(stem)
-            pattern = re.compile(rf"(from.*{escaped_stem}|import.*{escaped_stem})")
-            file_extensions = [".py"]
-        else:
-            return dependents
-
-        # Directories to exclude
-        exclude_dirs = {
-            "node_modules",
-            ".git",
-            "dist",
-            "build",
-            "__pycache__",
-            ".venv",
-            "venv",
-        }
-
-        # Walk the project directory
-        project_path = Path(self.project_dir)
-        files_checked = 0
-        max_files_to_check = 2000  # Prevent infinite scanning on large codebases
 
-        try:
-            for root, dirs, files in os.walk(project_path):
-                # Modify dirs in-place to exclude certain directories
-                dirs[:] = [d for d in dirs if d not in exclude_dirs]
-
-                for filename in files:
-                    # Check if we've hit the file limit
-                    if files_checked >= max_files_to_check:
-                        safe_print(
-                            f"[Context] File limit reached finding dependents for {file_path}"
-                        )
-                        return dependents
-
-                    # Check if file has the right extension
-                    if not any(filename.endswith(ext) for ext in file_extensions):
-                        continue
-
-                    file_full_path = Path(root) / filename
-                    files_checked += 1
-
-                    # Get relative path from project root
-                    try:
-                        relative_path = file_full_path.relative_to(project_path)
-                        relative_path_str = str(relative_path).replace("\\", "/")
-
-                        # Don't include the file itself
-                        if relative_path_str == file_path:
-                            continue
-
-                        # Search for the pattern in the file
-                        try:
-                            with open(
-                                file_full_path, encoding="utf-8", errors="ignore"
-                            ) as f:
-                                content = f.read()
-                                if pattern.search(content):
-                                    dependents.add(relative_path_str)
-                                    if len(dependents) >= max_results:
-                                        return dependents
-                        except (OSError, UnicodeDecodeError):
-                            # Skip files that can't be read
-                            continue
-
-                    except ValueError:
-                        # File is not relative to project_path, skip it
-                        continue
+        # Skip generic names (imported from everywhere, so their dependents
+        # would crowd out more relevant context)
+        if path_obj.stem in [
+            "index",
+            "main",
+            "app",
+            "utils",
+            "helpers",
+            "types",
+            "constants",
+        ]:
+            return set()
+        if path_obj.suffix not in SOURCE_SUFFIXES:
+            return set()
 
+        try:
+            dependents = self._get_import_graph().dependents(path_obj.as_posix())
         except Exception as e:
             safe_print(f"[Context] Error finding dependents: {e}")
-
-        return dependents
+            return set()
+        return set(sorted(dependents)[:max_results])
 
     def _prioritize_related_files(self, files: set[str], limit: int = 50) -> list[str]:
         """
@@ -1334,128 +1154,11 @@ class PRContextGatherer:
 
         return paths if paths else None
 
-    def _resolve_path_alias(
-        self, import_path: str, paths: dict[str, list[str]]
-    ) -> str | None:
-        """
-        Resolve a path alias import to an actual file path.
-
-        Args:
-            import_path: Import path like '@/utils/helpers' or '~/config'
-            paths: tsconfig paths mapping from _load_tsconfig_paths()
-
-        Returns:
-            Resolved path like 'src/utils/helpers', or None if no match
-        """
-        for alias_pattern, target_paths in paths.items():
-            # Skip empty target_paths (malformed tsconfig entry)
-            if not target_paths:
-                continue
-            # Convert '@/*' to regex pattern '^@/(.*)$'
-            regex_pattern = "^" + alias_pattern.replace("*", "(.*)") + "$"
-            match = re.match(regex_pattern, import_path)
-            if match:
-                suffix = match.group(1) if match.lastindex else ""
-                # Use first target path, replace * with suffix
-                target = target_paths[0].replace("*", suffix)
-                return target
-        return None
-
-    def _resolve_python_import(
-        self, module_name: str, level: int, source_path: Path
-    ) -> str | None:
-        """
-        Resolve a Python import to an actual file path.
-
-        Args:
-            module_name: Module name like 'utils' or 'utils.helpers'
-            level: Import level (0=absolute, 1=from ., 2=from .., etc.)
-            source_path: Path of file doing the importing
-
-        Returns:
-            Resolved path relative to project root, or None if not found.
-        """
-        if level > 0:
-            # Relative import: from . or from ..
-            base_dir = source_path.parent
-            # level=1 means same package (.), level=2 means parent (..), etc.
-            for _ in range(level - 1):
-                base_dir = base_dir.parent
-
-            if module_name:
-                # from .module import x -> look for module.py or module/__init__.py
-                parts = module_name.split(".")
-                candidate = base_dir / Path(*parts)
-            else:
-                # from . import x -> can't resolve without knowing what x is
-                return None
-        else:
-            # Absolute import - check if it's project-internal
-            parts = module_name.split(".")
-            candidate = Path(*parts)
-
-        # Try as module file (e.g., utils.py)
-        file_path = self.project_dir / candidate.with_suffix(".py")
-        if file_path.exists() and file_path.is_file():
-            try:
-                return str(file_path.relative_to(self.project_dir))
-            except ValueError:
-                return None
-
-        # Try as package directory (e.g., utils/__init__.py)
-        init_path = self.project_dir / candidate / "__init__.py"
-        if init_path.exists() and init_path.is_file():
-            try:
-                return str(init_path.relative_to(self.project_dir))
-            except ValueError:
-                return None
-
-        return None
-
-    def _find_python_imports(self, content: str, source_path: Path) -> set[str]:
-        """
-        Find imported files from Python source code using AST.
-
-        Uses ast.parse to extract Import and ImportFrom nodes, then resolves
-        them to actual file paths within the project.
-
-        Args:
-            content: Python source code
-            source_path: Path of the file being analyzed
-
-        Returns:
-            Set of resolved file paths relative to project root.
-        """
-        imports: set[str] = set()
-
-        try:
-            tree = ast.parse(content)
-        except SyntaxError:
-            # Invalid Python syntax - skip gracefully
-            return imports
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                # import module, import module.submodule
-                for alias in node.names:
-                    resolved = self._resolve_python_import(alias.name, 0, source_path)
-                    if resolved:
-                        imports.add(resolved)
-
-            elif isinstance(node, ast.ImportFrom):
-                # from module import x, from . import x, from ..module import x
-                module = node.module or ""
-                level = node.level  # 0=absolute, 1=from ., 2=from .., etc.
-                resolved = self._resolve_python_import(module, level, source_path)
-                if resolved:
-                    imports.add(resolved)
-
-        return imports
-
     @staticmethod
     def find_related_files_for_root(
         changed_files: list[ChangedFile],
         project_root: Path,
+        tracked_files: Collection[str] | None = None,
     ) -> list[str]:
         """
         Find files related to the changes using a specific project root.
@@ -1466,12 +1169,20 @@ class PRContextGatherer:
         Args:
             changed_files: List of changed files from the PR
             project_root: Path to search for related files (e.g., worktree path)
+            tracked_files: Files of the checked-out commit (relative, forward
+                slashes); candidates are looked up here instead of stat'ed
 
         Returns:
             List of related file paths (relative to project root)
         """
         related: set[str] = set()
 
+        def exists(rel_path: Path) -> bool:
+            if tracked_files is not None:
+                return rel_path.as_posix() in tracked_files
+            full_path = project_root / rel_path
+            return full_path.exists() and full_path.is_file()
+
         for changed_file in changed_files:
             path = Path(changed_file.path)
 
@@ -1489,22 +1200,19 @@ class PRContextGatherer:
             ]
 
             for test_path in test_patterns:
-                full_path = project_root / test_path
-                if full_path.exists() and full_path.is_file():
+                if exists(test_path):
                     related.add(str(test_path))
 
             # Find config files in same directory
             for name in CONFIG_FILE_NAMES:
                 config_path = path.parent / name
-                full_path = project_root / config_path
-                if full_path.exists() and full_path.is_file():
+                if exists(config_path):
                     related.add(str(config_path))
 
             # Find type definition files
             if path.suffix in [".ts", ".tsx"]:
                 type_def = path.parent / f"{path.stem}.d.ts"
-                full_path = project_root / type_def
-                if full_path.exists() and full_path.is_file():
+                if exists(type_def):
                     related.add(str(type_def))
 
         # Remove files that are already in changed_files
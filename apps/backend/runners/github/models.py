@@ -419,6 +419,12 @@ class PRReviewResult:
     new_findings_since_last_review: list[str] = field(
         default_factory=list
     )  # New issues in recent commits
+    finding_reuse: dict = field(
+        default_factory=dict
+    )  # Files whose cached findings were reused, and the tokens/time saved
+    context_pack: dict = field(
+        default_factory=dict
+    )  # Patch content summarized or dropped to fit the review token budget
 
     # Posted findings tracking (for frontend state sync)
     has_posted_findings: bool = False  # True if any findings have been posted to GitHub
@@ -454,6 +460,8 @@ class PRReviewResult:
             "resolved_findings": self.resolved_findings,
             "unresolved_findings": self.unresolved_findings,
             "new_findings_since_last_review": self.new_findings_since_last_review,
+            "finding_reuse": self.finding_reuse,
+            "context_pack": self.context_pack,
             # Posted findings tracking
             "has_posted_findings": self.has_posted_findings,
             "posted_finding_ids": self.posted_finding_ids,
@@ -501,6 +509,8 @@ class PRReviewResult:
             new_findings_since_last_review=data.get(
                 "new_findings_since_last_review", []
             ),
+            finding_reuse=data.get("finding_reuse", {}),
+            context_pack=data.get("context_pack", {}),
             # Posted findings tracking
             has_posted_findings=data.get("has_posted_findings", False),
             posted_finding_ids=data.get("posted_finding_ids", []),
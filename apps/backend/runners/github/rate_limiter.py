@@ -9,6 +9,8 @@ Comprehensive rate limiting system that protects against:
 
 Components:
 - TokenBucket: Classic token bucket algorithm for rate limiting
+- SharedTokenBucket / SharedCostTracker: The same limits shared by every
+  runner process on the machine (see shared_limits.py)
 - RateLimiter: Singleton managing GitHub and AI cost limits
 - @rate_limited decorator: Automatic pre-flight checks with retry logic
 - Cost tracking: Per-model AI API cost calculation and budgeting
@@ -37,18 +39,28 @@ Usage:
     # Manual rate check
     if not await limiter.acquire_github():
         raise RateLimitExceeded("GitHub API rate limit reached")
+
+    # Share limits with the other runner processes on this machine
+    limiter = RateLimiter.get_instance(state_dir=DEFAULT_SHARED_STATE_DIR)
 """
 
 from __future__ import annotations
 
 import asyncio
 import functools
+import sqlite3
 import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any, TypeVar
 
+try:
+    from .shared_limits import SharedLimitStore
+except (ImportError, ValueError, SystemError):
+    from shared_limits import SharedLimitStore
+
 # Type for decorated functions
 F = TypeVar("F", bound=Callable[..., Any])
 
@@ -158,6 +170,110 @@ class TokenBucket:
         return tokens_needed / self.refill_rate
 
 
+class SharedTokenBucket:
+    """
+    Token bucket shared by every process using the same store.
+
+    Same interface as TokenBucket. Waiting callers queue up in the store
+    and are served in arrival order, across processes.
+
+    Args:
+        store: Shared limit store
+        name: Bucket name (e.g., "github")
+        capacity: Maximum number of tokens
+        refill_rate: Tokens added per second
+    """
+
+    # How often a caller that is not at the head of the queue checks again
+    POLL_INTERVAL = 0.05
+
+    def __init__(
+        self,
+        store: SharedLimitStore,
+        name: str,
+        capacity: int,
+        refill_rate: float,
+    ):
+        self.store = store
+        self.name = name
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+
+    def try_acquire(self, tokens: int = 1) -> bool:
+        """
+        Try to acquire tokens without waiting.
+
+        Fails while other callers are queued, so it cannot jump the queue.
+
+        Returns:
+            True if tokens acquired, False otherwise
+        """
+        acquired, _ = self.store.take(
+            self.name, self.capacity, self.refill_rate, tokens
+        )
+        return acquired
+
+    async def acquire(self, tokens: int = 1, timeout: float | None = None) -> bool:
+        """
+        Acquire tokens, waiting in line if necessary.
+
+        Args:
+            tokens: Number of tokens to acquire
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if tokens acquired, False if timeout reached
+        """
+        # Store calls can wait on another process's write lock: they run in
+        # a worker thread so the event loop keeps going meanwhile
+        if await asyncio.to_thread(self.try_acquire, tokens):
+            return True
+
+        start_time = time.monotonic()
+        waiter_id = await asyncio.to_thread(self.store.enqueue, self.name)
+        acquired = False
+        try:
+            while True:
+                acquired, wait_time = await asyncio.to_thread(
+                    self.store.take,
+                    self.name,
+                    self.capacity,
+                    self.refill_rate,
+                    tokens,
+                    waiter_id,
+                )
+                if acquired:
+                    return True
+
+                if timeout is not None:
+                    remaining = timeout - (time.monotonic() - start_time)
+                    if remaining <= 0:
+                        return False
+                    wait_time = min(wait_time, remaining)
+
+                # Poll at least every second to keep our place in the queue
+                await asyncio.sleep(min(max(wait_time, self.POLL_INTERVAL), 1.0))
+        finally:
+            if not acquired:
+                await asyncio.to_thread(self.store.dequeue, waiter_id)
+
+    def available(self) -> int:
+        """Get number of available tokens."""
+        return int(self.store.available(self.name, self.capacity, self.refill_rate))
+
+    def time_until_available(self, tokens: int = 1) -> float:
+        """
+        Calculate seconds until requested tokens available.
+
+        Returns:
+            0 if tokens immediately available, otherwise seconds to wait
+        """
+        level = self.store.available(self.name, self.capacity, self.refill_rate)
+        if level >= tokens:
+            return 0.0
+        return (tokens - level) / self.refill_rate
+
+
 # AI model pricing (per 1M tokens)
 AI_PRICING = {
     # Claude 4.5 models (current)
@@ -275,6 +391,83 @@ class CostTracker:
         return "\n".join(lines)
 
 
+class SharedCostTracker(CostTracker):
+    """
+    Track AI API costs against a budget shared by every runner process.
+
+    The budget covers all operations recorded in the shared ledger over the
+    last budget_window seconds, whichever process made them. total_cost and
+    operations still describe this process's own spend.
+
+    Args:
+        store: Shared limit store
+        cost_limit: Budget in dollars, shared across processes
+        budget_window: Seconds an operation counts against the budget
+    """
+
+    def __init__(
+        self,
+        store: SharedLimitStore,
+        cost_limit: float = 10.0,
+        budget_window: float = 3600.0,
+    ):
+        super().__init__(cost_limit=cost_limit)
+        self.store = store
+        self.budget_window = budget_window
+
+    def add_operation(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        model: str,
+        operation_name: str = "unknown",
+    ) -> float:
+        """
+        Track cost of an AI operation in the shared ledger.
+
+        Raises:
+            CostLimitExceeded: If operation would exceed the shared budget
+        """
+        cost = self.calculate_cost(input_tokens, output_tokens, model)
+
+        recorded, shared_total = self.store.record_cost(
+            cost,
+            cost_limit=self.cost_limit,
+            window=self.budget_window,
+            operation=operation_name,
+            model=model,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+        )
+        if not recorded:
+            raise CostLimitExceeded(
+                f"Operation would exceed shared cost limit: "
+                f"${shared_total:.2f} > ${self.cost_limit:.2f}"
+            )
+
+        self.total_cost += cost
+        self.operations.append(
+            {
+                "timestamp": datetime.now().isoformat(),
+                "operation": operation_name,
+                "model": model,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cost": cost,
+            }
+        )
+
+        return cost
+
+    def shared_cost(self) -> float:
+        """Total spent by all processes within the budget window."""
+        return self.store.spent(self.budget_window)
+
+    def remaining_budget(self) -> float:
+        """Get remaining shared budget in dollars."""
+        return max(0.0, self.cost_limit - self.shared_cost())
+
+
 class RateLimiter:
     """
     Singleton rate limiter for GitHub automation.
@@ -294,6 +487,7 @@ class RateLimiter:
         github_refill_rate: float = 1.4,  # ~5000/hour
         cost_limit: float = 10.0,
         max_retry_delay: float = 300.0,  # 5 minutes
+        state_dir: Path | None = None,
     ):
         """
         Initialize rate limiter.
@@ -301,17 +495,31 @@ class RateLimiter:
         Args:
             github_limit: Maximum GitHub API calls (default: 5000/hour)
             github_refill_rate: Tokens per second refill rate
-            cost_limit: Maximum AI cost in dollars per run
+            cost_limit: Maximum AI cost in dollars per run (per hour across
+                processes when shared)
             max_retry_delay: Maximum exponential backoff delay
+            state_dir: Share the limits with every process using the same
+                directory (default: limits are private to this process)
         """
         if RateLimiter._initialized:
             return
 
-        self.github_bucket = TokenBucket(
-            capacity=github_limit,
-            refill_rate=github_refill_rate,
-        )
-        self.cost_tracker = CostTracker(cost_limit=cost_limit)
+        store = self._open_store(state_dir) if state_dir is not None else None
+        if store is not None:
+            self.github_bucket = SharedTokenBucket(
+                store,
+                "github",
+                capacity=github_limit,
+                refill_rate=github_refill_rate,
+            )
+            self.cost_tracker = SharedCostTracker(store, cost_limit=cost_limit)
+        else:
+            self.github_bucket = TokenBucket(
+                capacity=github_limit,
+                refill_rate=github_refill_rate,
+            )
+            self.cost_tracker = CostTracker(cost_limit=cost_limit)
+        self.shared = store is not None
         self.max_retry_delay = max_retry_delay
 
         # Request statistics
@@ -322,6 +530,18 @@ class RateLimiter:
 
         RateLimiter._initialized = True
 
+    @staticmethod
+    def _open_store(state_dir: Path) -> SharedLimitStore | None:
+        try:
+            return SharedLimitStore(state_dir)
+        except (OSError, sqlite3.Error) as e:
+            print(
+                f"[RateLimit] Shared limits unavailable ({e}); "
+                f"limiting this process only",
+                flush=True,
+            )
+            return None
+
     @classmethod
     def get_instance(
         cls,
@@ -329,6 +549,7 @@ class RateLimiter:
         github_refill_rate: float = 1.4,
         cost_limit: float = 10.0,
         max_retry_delay: float = 300.0,
+        state_dir: Path | None = None,
     ) -> RateLimiter:
         """
         Get or create singleton instance.
@@ -338,6 +559,7 @@ class RateLimiter:
             github_refill_rate: Tokens per second refill rate
             cost_limit: Maximum AI cost in dollars
             max_retry_delay: Maximum retry delay
+            state_dir: Directory of the limits shared across processes
 
         Returns:
             RateLimiter singleton instance
@@ -348,6 +570,7 @@ class RateLimiter:
                 github_refill_rate=github_refill_rate,
                 cost_limit=cost_limit,
                 max_retry_delay=max_retry_delay,
+                state_dir=state_dir,
             )
         return cls._instance
 
@@ -36,14 +36,22 @@ Usage:
 
     # Show batch status
     python runner.py batch-status
+
+    # Keep a warm process running and take jobs as JSON lines on stdin
+    # (see serve.py for the protocol)
+    python runner.py serve --max-workers 4
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import dataclasses
+import hashlib
 import json
 import os
 import sys
+from collections.abc import Callable
 from pathlib import Path
 
 # Fix Windows console encoding for Unicode output (emojis, special chars)
@@ -84,7 +92,37 @@ sys.path.insert(0, str(Path(__file__).parent))
 # Now import models and orchestrator directly (they use relative imports internally)
 from models import GitHubRunnerConfig
 from orchestrator import GitHubOrchestrator, ProgressCallback
+from rate_limiter import RateLimiter
 from services.io_utils import safe_print
+from shared_limits import DEFAULT_SHARED_STATE_DIR
+
+# Successful `gh auth token` / `gh repo view` results, reused by later jobs
+# in serve mode (one-shot runs only look them up once anyway)
+_gh_lookups: dict[tuple[str, ...], str] = {}
+
+# Orchestrators (GH client, engines) no job is using, kept for later jobs in
+# serve mode, oldest first; None outside serve mode. A job checks an
+# orchestrator out, so concurrent jobs never share one.
+_idle_orchestrators: list[tuple[tuple, GitHubOrchestrator]] | None = None
+MAX_IDLE_ORCHESTRATORS = 8
+
+# Orchestrators checked out by the running serve-mode job
+_job_orchestrators: contextvars.ContextVar[
+    list[tuple[tuple, GitHubOrchestrator]] | None
+] = contextvars.ContextVar("job_orchestrators", default=None)
+
+# Config fields kept out of the orchestrator key (only their digest goes in)
+_SECRET_CONFIG_FIELDS = ("token", "bot_token")
+
+
+def reset_warm_state() -> None:
+    """Forget cached gh lookups and orchestrators (serve mode "reload")."""
+    from core.gh_executable import invalidate_gh_cache
+
+    _gh_lookups.clear()
+    if _idle_orchestrators is not None:
+        _idle_orchestrators.clear()
+    invalidate_gh_cache()
 
 
 def print_progress(callback: ProgressCallback) -> None:
@@ -118,6 +156,13 @@ def get_config(args) -> GitHubRunnerConfig:
             flush=True,
         )
 
+    token_key = ("token", gh_path or "")
+    repo_key = ("repo", gh_path or "", str(Path(args.project).resolve()))
+    if not token:
+        token = _gh_lookups.get(token_key, "")
+    if not repo:
+        repo = _gh_lookups.get(repo_key, "")
+
     if not token and gh_path:
         # Try to get from gh CLI
         try:
@@ -128,6 +173,7 @@ def get_config(args) -> GitHubRunnerConfig:
             )
             if result.returncode == 0:
                 token = result.stdout.strip()
+                _gh_lookups[token_key] = token
         except FileNotFoundError:
             pass  # gh not installed or not in PATH
 
@@ -150,6 +196,7 @@ def get_config(args) -> GitHubRunnerConfig:
             )
             if result.returncode == 0:
                 repo = result.stdout.strip()
+                _gh_lookups[repo_key] = repo
             elif os.environ.get("DEBUG"):
                 safe_print(f"[DEBUG] gh repo view failed: {result.stderr}")
         except FileNotFoundError:
@@ -179,6 +226,67 @@ def get_config(args) -> GitHubRunnerConfig:
     )
 
 
+def create_orchestrator(
+    args,
+    config: GitHubRunnerConfig,
+    progress_callback: Callable[[ProgressCallback], None] | None = None,
+) -> GitHubOrchestrator:
+    """Create the orchestrator for a command (reused across jobs in serve mode)."""
+    checked_out = _job_orchestrators.get()
+    if _idle_orchestrators is None or checked_out is None:
+        return GitHubOrchestrator(
+            project_dir=args.project,
+            config=config,
+            progress_callback=progress_callback,
+        )
+
+    key = _orchestrator_key(args.project, config, progress_callback)
+    for i in range(len(_idle_orchestrators) - 1, -1, -1):
+        if _idle_orchestrators[i][0] == key:
+            orchestrator = _idle_orchestrators.pop(i)[1]
+            break
+    else:
+        orchestrator = GitHubOrchestrator(
+            project_dir=args.project,
+            config=config,
+            progress_callback=progress_callback,
+        )
+    checked_out.append((key, orchestrator))
+    return orchestrator
+
+
+def _orchestrator_key(
+    project: str,
+    config: GitHubRunnerConfig,
+    progress_callback: Callable[[ProgressCallback], None] | None,
+) -> tuple:
+    """
+    Identity of an orchestrator: the project and the config's values.
+
+    The config is rebuilt per job (commands tweak it), so it is compared by
+    value. Tokens only contribute a digest, so they never sit in the key.
+    """
+    credentials = hashlib.sha256(
+        "\0".join(
+            str(getattr(config, name) or "") for name in _SECRET_CONFIG_FIELDS
+        ).encode("utf-8")
+    ).hexdigest()
+    settings = tuple(
+        (field.name, repr(getattr(config, field.name)))
+        for field in dataclasses.fields(config)
+        if field.name not in _SECRET_CONFIG_FIELDS
+    )
+    return (str(Path(project).resolve()), settings, credentials, progress_callback)
+
+
+def _release_orchestrators(checked_out: list[tuple[tuple, GitHubOrchestrator]]):
+    """Return a finished job's orchestrators to the idle pool (bounded)."""
+    if _idle_orchestrators is None:
+        return
+    _idle_orchestrators.extend(checked_out)
+    del _idle_orchestrators[:-MAX_IDLE_ORCHESTRATORS]
+
+
 async def cmd_review_pr(args) -> int:
     """Review a pull request."""
     import sys
@@ -204,11 +312,7 @@ async def cmd_review_pr(args) -> int:
         )
         safe_print("[DEBUG] Creating orchestrator...")
 
-    orchestrator = GitHubOrchestrator(
-        project_dir=args.project,
-        config=config,
-        progress_callback=print_progress,
-    )
+    orchestrator = create_orchestrator(args, config, print_progress)
 
     if debug:
         safe_print("[DEBUG] Orchestrator created")
@@ -270,11 +374,7 @@ async def cmd_followup_review_pr(args) -> int:
         )
         safe_print("[DEBUG] Creating orchestrator...")
 
-    orchestrator = GitHubOrchestrator(
-        project_dir=args.project,
-        config=config,
-        progress_callback=print_progress,
-    )
+    orchestrator = create_orchestrator(args, config, print_progress)
 
     if debug:
         safe_print("[DEBUG] Orchestrator created")
@@ -329,11 +429,7 @@ async def cmd_followup_review_pr(args) -> int:
 async def cmd_triage(args) -> int:
     """Triage issues."""
     config = get_config(args)
-    orchestrator = GitHubOrchestrator(
-        project_dir=args.project,
-        config=config,
-        progress_callback=print_progress,
-    )
+    orchestrator = create_orchestrator(args, config, print_progress)
 
     issue_numbers = args.issues if args.issues else None
     results = await orchestrator.triage_issues(
@@ -369,11 +465,7 @@ async def cmd_auto_fix(args) -> int:
     """Start auto-fix for an issue."""
     config = get_config(args)
     config.auto_fix_enabled = True
-    orchestrator = GitHubOrchestrator(
-        project_dir=args.project,
-        config=config,
-        progress_callback=print_progress,
-    )
+    orchestrator = create_orchestrator(args, config, print_progress)
 
     state = await orchestrator.auto_fix_issue(args.issue_number)
 
@@ -395,11 +487,7 @@ async def cmd_check_labels(args) -> int:
     """Check for issues with auto-fix labels."""
     config = get_config(args)
     config.auto_fix_enabled = True
-    orchestrator = GitHubOrchestrator(
-        project_dir=args.project,
-        config=config,
-        progress_callback=print_progress,
-    )
+    orchestrator = create_orchestrator(args, config, print_progress)
 
     issues = await orchestrator.check_auto_fix_labels()
 
@@ -417,11 +505,7 @@ async def cmd_check_new(args) -> int:
     """Check for new issues not yet in the auto-fix queue."""
     config = get_config(args)
     config.auto_fix_enabled = True
-    orchestrator = GitHubOrchestrator(
-        project_dir=args.project,
-        config=config,
-        progress_callback=print_progress,
-    )
+    orchestrator = create_orchestrator(args, config, print_progress)
 
     issues = await orchestrator.check_new_issues()
 
@@ -434,10 +518,7 @@ async def cmd_check_new(args) -> int:
 async def cmd_queue(args) -> int:
     """Show auto-fix queue."""
     config = get_config(args)
-    orchestrator = GitHubOrchestrator(
-        project_dir=args.project,
-        config=config,
-    )
+    orchestrator = create_orchestrator(args, config)
 
     queue = await orchestrator.get_auto_fix_queue()
 
@@ -474,11 +555,7 @@ async def cmd_batch_issues(args) -> int:
     """Batch similar issues and create combined specs."""
     config = get_config(args)
     config.auto_fix_enabled = True
-    orchestrator = GitHubOrchestrator(
-        project_dir=args.project,
-        config=config,
-        progress_callback=print_progress,
-    )
+    orchestrator = create_orchestrator(args, config, print_progress)
 
     issue_numbers = args.issues if args.issues else None
     batches = await orchestrator.batch_and_fix_issues(issue_numbers)
@@ -508,10 +585,7 @@ async def cmd_batch_issues(args) -> int:
 async def cmd_batch_status(args) -> int:
     """Show batch status."""
     config = get_config(args)
-    orchestrator = GitHubOrchestrator(
-        project_dir=args.project,
-        config=config,
-    )
+    orchestrator = create_orchestrator(args, config)
 
     status = await orchestrator.get_batch_status()
 
@@ -536,11 +610,7 @@ async def cmd_analyze_preview(args) -> int:
     import json
 
     config = get_config(args)
-    orchestrator = GitHubOrchestrator(
-        project_dir=args.project,
-        config=config,
-        progress_callback=print_progress,
-    )
+    orchestrator = create_orchestrator(args, config, print_progress)
 
     issue_numbers = args.issues if args.issues else None
     max_issues = getattr(args, "max_issues", 200)
@@ -605,11 +675,7 @@ async def cmd_approve_batches(args) -> int:
     import json
 
     config = get_config(args)
-    orchestrator = GitHubOrchestrator(
-        project_dir=args.project,
-        config=config,
-        progress_callback=print_progress,
-    )
+    orchestrator = create_orchestrator(args, config, print_progress)
 
     # Load approved batches from file
     try:
@@ -638,8 +704,49 @@ async def cmd_approve_batches(args) -> int:
     return 0
 
 
-def main():
-    """CLI entry point."""
+async def cmd_serve(args) -> int:
+    """Serve jobs from a warm, long-running process."""
+    global _idle_orchestrators
+
+    from serve import JobServer
+
+    _idle_orchestrators = []
+    server = JobServer(
+        run_job=run_job,
+        max_workers=args.max_workers,
+        on_reload=reset_warm_state,
+    )
+    if args.socket or args.port is not None:
+        await server.serve_socket(socket_path=args.socket, port=args.port)
+    else:
+        await server.serve_stdio()
+    return 0
+
+
+async def run_job(argv: list[str]) -> int:
+    """Run one serve-mode job, given the argv of an equivalent one-shot run."""
+    args = build_parser().parse_args(argv)
+    handler = COMMANDS.get(args.command)
+    if not handler or handler is cmd_serve:
+        safe_print(f"Unknown command: {args.command}")
+        return 1
+
+    checked_out: list[tuple[tuple, GitHubOrchestrator]] = []
+    reset_token = _job_orchestrators.set(checked_out)
+    try:
+        return await handler(args)
+    except Exception as e:
+        capture_exception(e, command=args.command)
+        debug_error("github_runner", "Command failed", error=str(e))
+        safe_print(f"Error: {e}")
+        raise
+    finally:
+        _job_orchestrators.reset(reset_token)
+        _release_orchestrators(checked_out)
+
+
+def build_parser():
+    """Build the CLI argument parser."""
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -785,28 +892,58 @@ def main():
         help="JSON file containing approved batches",
     )
 
+    # serve command (long-running job server)
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run jobs sent as JSON lines from a warm, long-running process",
+    )
+    serve_parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=4,
+        help="Maximum number of jobs run concurrently (default: 4)",
+    )
+    serve_parser.add_argument(
+        "--socket",
+        type=Path,
+        help="Listen on this Unix socket instead of stdin",
+    )
+    serve_parser.add_argument(
+        "--port",
+        type=int,
+        help="Listen on this localhost TCP port instead of stdin (0 picks one)",
+    )
+
+    return parser
+
+
+# Route to command handler
+COMMANDS = {
+    "review-pr": cmd_review_pr,
+    "followup-review-pr": cmd_followup_review_pr,
+    "triage": cmd_triage,
+    "auto-fix": cmd_auto_fix,
+    "check-auto-fix-labels": cmd_check_labels,
+    "check-new": cmd_check_new,
+    "queue": cmd_queue,
+    "batch-issues": cmd_batch_issues,
+    "batch-status": cmd_batch_status,
+    "analyze-preview": cmd_analyze_preview,
+    "approve-batches": cmd_approve_batches,
+    "serve": cmd_serve,
+}
+
+
+def main():
+    """CLI entry point."""
+    parser = build_parser()
     args = parser.parse_args()
 
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
-    # Route to command handler
-    commands = {
-        "review-pr": cmd_review_pr,
-        "followup-review-pr": cmd_followup_review_pr,
-        "triage": cmd_triage,
-        "auto-fix": cmd_auto_fix,
-        "check-auto-fix-labels": cmd_check_labels,
-        "check-new": cmd_check_new,
-        "queue": cmd_queue,
-        "batch-issues": cmd_batch_issues,
-        "batch-status": cmd_batch_status,
-        "analyze-preview": cmd_analyze_preview,
-        "approve-batches": cmd_approve_batches,
-    }
-
-    handler = commands.get(args.command)
+    handler = COMMANDS.get(args.command)
     if not handler:
         safe_print(f"Unknown command: {args.command}")
         sys.exit(1)
@@ -822,6 +959,10 @@ def main():
             },
         )
 
+        # Share the GitHub and AI budgets with the other runner processes
+        # (review, triage, autofix) on this machine
+        RateLimiter.get_instance(state_dir=DEFAULT_SHARED_STATE_DIR)
+
         exit_code = asyncio.run(handler(args))
         sys.exit(exit_code)
     except KeyboardInterrupt:
@@ -0,0 +1,340 @@
+"""
+Runner Serve Mode
+=================
+
+Long-running job server for the GitHub runner.
+
+Running ``runner.py`` once per PR review, triage or auto-fix pays for a cold
+Python start every time: imports, dependency validation, ``gh`` discovery,
+token and repo lookups, and a fresh rate limiter. ``runner.py serve`` keeps
+one process alive instead and accepts jobs as JSON lines, either on stdin or
+on a local socket. Jobs run concurrently under a bounded worker pool and
+share the process's warm state.
+
+Protocol (one JSON object per line):
+
+    -> {"id": "job-1", "argv": ["review-pr", "123", "--force"]}
+    <- {"id": "job-1", "event": "output", "stream": "stdout", "line": "..."}
+    <- {"id": "job-1", "event": "done", "exit_code": 0, "duration_ms": 812}
+
+``argv`` is exactly what would be passed to ``runner.py`` for a one-shot run
+(global options such as ``--project`` included). The output lines are what a
+one-shot run would have printed. Lines from concurrent jobs interleave, and
+the ``id`` says which job each line belongs to. Control messages:
+
+    -> {"id": "c1", "command": "ping"}      <- {"id": "c1", "event": "pong"}
+    -> {"id": "c2", "command": "reload"}    drop warm state (tokens, clients)
+    -> {"id": "c3", "command": "shutdown"}  finish running jobs, then exit
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import io
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from collections.abc import Awaitable, Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+# Default number of jobs run at the same time
+DEFAULT_MAX_WORKERS = 4
+
+# Longest accepted request line (a job is a short argv list)
+MAX_REQUEST_BYTES = 1024 * 1024
+
+# Runs one job: argv -> exit code
+JobRunner = Callable[[list[str]], Awaitable[int]]
+
+# Sends one event to the client that submitted a job (thread-safe)
+EventSink = Callable[[dict[str, Any]], None]
+
+_current_job: contextvars.ContextVar[JobOutput | None] = contextvars.ContextVar(
+    "github_runner_job", default=None
+)
+
+
+class JobOutput:
+    """Turns a job's writes to stdout/stderr into output events."""
+
+    def __init__(self, job_id: str, emit: EventSink):
+        self.job_id = job_id
+        self._emit = emit
+        self._partial: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def write(self, stream: str, text: str) -> None:
+        with self._lock:
+            buffered = self._partial.get(stream, "") + text
+            *lines, self._partial[stream] = buffered.split("\n")
+        for line in lines:
+            self._send(stream, line)
+
+    def close(self) -> None:
+        with self._lock:
+            partial, self._partial = self._partial, {}
+        for stream, line in partial.items():
+            if line:
+                self._send(stream, line)
+
+    def _send(self, stream: str, line: str) -> None:
+        self._emit(
+            {"id": self.job_id, "event": "output", "stream": stream, "line": line}
+        )
+
+
+class JobAwareStream(io.TextIOBase):
+    """
+    Stand-in for sys.stdout/sys.stderr in serve mode.
+
+    Writes made while a job runs become that job's output events, including
+    writes from the tasks it creates and from asyncio.to_thread() calls, which
+    copy the job's context. A plain threading.Thread starts with an empty
+    context, so its writes go to the real stream. All other writes go to the
+    real stream too.
+    """
+
+    def __init__(self, name: str, stream: Any):
+        self.name = name
+        self._stream = stream
+
+    @property
+    def encoding(self) -> str:
+        return getattr(self._stream, "encoding", None) or "utf-8"
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    def reconfigure(self, **kwargs: Any) -> None:
+        # Commands ask for line buffering; job output is already per line
+        pass
+
+    def write(self, text: str) -> int:
+        job = _current_job.get()
+        if job is None:
+            return self._stream.write(text)
+        job.write(self.name, text)
+        return len(text)
+
+    def flush(self) -> None:
+        if _current_job.get() is None:
+            self._stream.flush()
+
+
+class JobServer:
+    """
+    Runs runner jobs concurrently in one warm process.
+
+    Args:
+        run_job: Runs one job's argv and returns its exit code
+        max_workers: Maximum number of jobs running at the same time
+        on_reload: Called for a "reload" control message to drop warm state
+    """
+
+    def __init__(
+        self,
+        run_job: JobRunner,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_reload: Callable[[], None] | None = None,
+    ):
+        self.run_job = run_job
+        self.max_workers = max(1, max_workers)
+        self.on_reload = on_reload
+        self._slots = asyncio.Semaphore(self.max_workers)
+        self._tasks: set[asyncio.Task] = set()
+        self._shutdown = asyncio.Event()
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def handle_line(self, line: str | bytes, emit: EventSink) -> None:
+        """Handle one request line: start a job or answer a control message."""
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", errors="replace")
+        if not line.strip():
+            return
+
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as e:
+            emit({"id": None, "event": "error", "error": f"Invalid request: {e}"})
+            return
+
+        job_id = request.get("id")
+        command = request.get("command")
+        if command == "ping":
+            emit({"id": job_id, "event": "pong"})
+        elif command == "reload":
+            if self.on_reload:
+                self.on_reload()
+            emit({"id": job_id, "event": "reloaded"})
+        elif command == "shutdown":
+            self._shutdown.set()
+            emit({"id": job_id, "event": "shutting_down"})
+        elif command is not None:
+            emit(
+                {"id": job_id, "event": "error", "error": f"Unknown command: {command}"}
+            )
+        elif not isinstance(request.get("argv"), list) or not all(
+            isinstance(arg, str) for arg in request["argv"]
+        ):
+            emit(
+                {
+                    "id": job_id,
+                    "event": "error",
+                    "error": "argv must be a list of strings",
+                }
+            )
+        elif self._shutdown.is_set():
+            emit({"id": job_id, "event": "error", "error": "Server is shutting down"})
+        else:
+            task = asyncio.create_task(self._run(str(job_id), request["argv"], emit))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, job_id: str, argv: list[str], emit: EventSink) -> None:
+        async with self._slots:
+            output = JobOutput(job_id, emit)
+            # Set in this task's own context, so only this job's writes match
+            _current_job.set(output)
+            started = time.monotonic()
+            try:
+                exit_code = await self.run_job(argv)
+            except SystemExit as e:
+                # argparse errors and get_config() exit instead of raising
+                exit_code = e.code if isinstance(e.code, int) else 1
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+            finally:
+                _current_job.set(None)
+                output.close()
+            emit(
+                {
+                    "id": job_id,
+                    "event": "done",
+                    "exit_code": exit_code,
+                    "duration_ms": round((time.monotonic() - started) * 1000),
+                }
+            )
+
+    async def drain(self) -> None:
+        """Wait for all running jobs to finish."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    # ------------------------------------------------------------------
+    # Transports
+    # ------------------------------------------------------------------
+
+    async def serve_stdio(self) -> None:
+        """Serve jobs read from stdin, with events written to stdout."""
+        real_stdout = sys.__stdout__
+        write_lock = threading.Lock()
+
+        def emit(event: dict[str, Any]) -> None:
+            data = json.dumps(event) + "\n"
+            with write_lock:
+                try:
+                    real_stdout.write(data)
+                    real_stdout.flush()
+                except (BrokenPipeError, ValueError, OSError):
+                    # Client went away; keep running jobs to completion
+                    pass
+
+        # stdout carries the protocol; stray writes outside jobs go to stderr
+        with redirect_job_output(stdout_fallback=sys.stderr):
+            while not self._shutdown.is_set():
+                line = await asyncio.to_thread(sys.stdin.readline)
+                if not line:
+                    break
+                self.handle_line(line, emit)
+            await self.drain()
+
+    async def serve_socket(
+        self, socket_path: Path | None = None, port: int | None = None
+    ) -> None:
+        """
+        Serve jobs over a local socket.
+
+        Args:
+            socket_path: Unix domain socket to listen on
+            port: Localhost TCP port to listen on (where Unix sockets aren't
+                available); 0 picks a free port
+        """
+        loop = asyncio.get_running_loop()
+
+        async def handle_connection(
+            reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+        ) -> None:
+            def emit(event: dict[str, Any]) -> None:
+                data = (json.dumps(event) + "\n").encode("utf-8")
+                loop.call_soon_threadsafe(_write_if_open, writer, data)
+
+            try:
+                while not self._shutdown.is_set():
+                    line = await reader.readline()
+                    if not line:
+                        break
+                    self.handle_line(line, emit)
+            except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+                pass
+
+        if socket_path is not None:
+            socket_path = Path(socket_path)
+            socket_path.unlink(missing_ok=True)
+            server = await asyncio.start_unix_server(
+                handle_connection, path=str(socket_path), limit=MAX_REQUEST_BYTES
+            )
+            os.chmod(socket_path, 0o600)
+            address = str(socket_path)
+        else:
+            server = await asyncio.start_server(
+                handle_connection, "127.0.0.1", port or 0, limit=MAX_REQUEST_BYTES
+            )
+            address = f"127.0.0.1:{server.sockets[0].getsockname()[1]}"
+
+        with redirect_job_output():
+            # Announce where we listen (clients started us and wait for this)
+            print(json.dumps({"id": None, "event": "listening", "address": address}))
+            sys.stdout.flush()
+            async with server:
+                await self._shutdown.wait()
+            await self.drain()
+        if socket_path is not None:
+            socket_path.unlink(missing_ok=True)
+
+
+def _write_if_open(writer: asyncio.StreamWriter, data: bytes) -> None:
+    if not writer.is_closing():
+        writer.write(data)
+
+
+@contextlib.contextmanager
+def redirect_job_output(stdout_fallback: Any = None) -> Iterator[None]:
+    """
+    Route stdout/stderr writes to the job that made them.
+
+    Args:
+        stdout_fallback: Where stdout writes made outside any job go
+            (default: the current stdout)
+    """
+    saved = sys.stdout, sys.stderr
+    sys.stdout = JobAwareStream("stdout", stdout_fallback or sys.stdout)
+    sys.stderr = JobAwareStream("stderr", sys.stderr)
+    try:
+        yield
+    finally:
+        sys.stdout, sys.stderr = saved
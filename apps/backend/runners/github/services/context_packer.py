@@ -0,0 +1,371 @@
+"""
+Context Packer
+==============
+
+Token-budgeted packing of PR diffs into review prompts.
+
+Review prompts used to hard-truncate the diff at a fixed number of
+characters, so on a big PR whatever came last was silently lost. The packer
+decides what goes in instead, and reports everything it leaves out:
+
+- files are ranked by risk (security-sensitive paths first, lockfiles and
+  generated files last) and then by change size;
+- low-value files (lockfiles, generated, minified or vendored files) are
+  summarized: only their hunk headers and line counts are sent;
+- a file larger than the shard budget keeps the hunks that fit, and the
+  rest of its hunks are summarized;
+- files are split into shards of at most the shard budget, to be reviewed in
+  parallel, until the total budget is spent; the files past it are
+  summarized, or dropped when even the summary no longer fits.
+
+Every summarized or dropped piece of content is recorded in a PackReport,
+which the prompts include so the agents know what they did not see.
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+
+try:
+    from .finding_cache import estimate_tokens
+except (ImportError, ValueError, SystemError):
+    from services.finding_cache import estimate_tokens
+
+# Risk ranks (higher is reviewed first and cut last)
+RISK_HIGH = 3
+RISK_NORMAL = 2
+RISK_LOW = 1
+RISK_LOW_VALUE = 0
+
+# Lockfiles, generated and vendored content: summarized, never reviewed line by line
+_LOW_VALUE_NAMES = {
+    "package-lock.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+    "poetry.lock",
+    "uv.lock",
+    "Pipfile.lock",
+    "Cargo.lock",
+    "Gemfile.lock",
+    "composer.lock",
+    "go.sum",
+}
+_LOW_VALUE_PATTERN = re.compile(
+    r"(\.min\.(js|css)$|\.map$|\.snap$|\.svg$|_pb2\.py$|\.pb\.go$|\.generated\.\w+$"
+    r"|(^|/)(dist|build|vendor|node_modules|__snapshots__|generated)/)"
+)
+
+# Paths where a bug is most likely to be a security or data-loss issue
+_HIGH_RISK_PATTERN = re.compile(
+    r"(auth|login|password|secret|token|crypt|security|permission|session|oauth"
+    r"|sql|migration|payment|billing|sanitiz|\.env|docker|workflows/)",
+    re.IGNORECASE,
+)
+
+# Tests and docs: reviewed after the code they cover
+_LOW_RISK_PATTERN = re.compile(
+    r"((^|/)(tests?|docs?|__tests__|spec)/|(^|/)test_[^/]*$|_test\.\w+$"
+    r"|\.(test|spec)\.\w+$|\.(md|rst|txt)$)",
+    re.IGNORECASE,
+)
+
+
+def file_risk(path: str) -> int:
+    """Risk rank of a changed file, from its path."""
+    if PurePosixPath(path).name in _LOW_VALUE_NAMES or _LOW_VALUE_PATTERN.search(path):
+        return RISK_LOW_VALUE
+    if _HIGH_RISK_PATTERN.search(path):
+        return RISK_HIGH
+    if _LOW_RISK_PATTERN.search(path):
+        return RISK_LOW
+    return RISK_NORMAL
+
+
+def split_hunks(patch: str) -> list[str]:
+    """Split a patch into its hunks (text before the first hunk joins it)."""
+    hunks: list[str] = []
+    current: list[str] = []
+    for line in patch.splitlines(keepends=True):
+        if line.startswith("@@") and any(
+            not part.startswith(("---", "+++", "diff ", "index ")) for part in current
+        ):
+            hunks.append("".join(current))
+            current = []
+        current.append(line)
+    if current:
+        hunks.append("".join(current))
+    return hunks
+
+
+def summarize_hunks(hunks: list[str]) -> str:
+    """One line per hunk: its header, plus the lines it adds and removes."""
+    lines = []
+    for hunk in hunks:
+        header = next((h for h in hunk.splitlines() if h.startswith("@@")), "")
+        added = sum(
+            1
+            for h in hunk.splitlines()
+            if h.startswith("+") and not h.startswith("+++")
+        )
+        removed = sum(
+            1
+            for h in hunk.splitlines()
+            if h.startswith("-") and not h.startswith("---")
+        )
+        lines.append(f"{header or '(no hunk header)'} [+{added}/-{removed} lines]")
+    return "\n".join(lines)
+
+
+def split_unified_diff(diff: str) -> list[tuple[str, str]]:
+    """
+    Split a multi-file unified diff into (path, patch) pairs.
+
+    A file starts at a "diff --git" line, or at a "--- " line directly
+    followed by "+++ " once the current file has hunks; the file headers
+    stay with the patch.
+    """
+    files: list[tuple[str, list[str]]] = []
+    in_hunks = False
+    lines = diff.splitlines(keepends=True)
+    for i, line in enumerate(lines):
+        next_line = lines[i + 1] if i + 1 < len(lines) else ""
+        header = line.startswith("--- ") and next_line.startswith("+++ ")
+        if not files or line.startswith("diff --git ") or (header and in_hunks):
+            files.append(("", []))
+            in_hunks = False
+        path, file_lines = files[-1]
+        file_lines.append(line)
+        if line.startswith("@@"):
+            in_hunks = True
+        elif not in_hunks and line.startswith(("--- ", "+++ ")):
+            name = line[4:].strip()
+            if name != "/dev/null" and (not path or line.startswith("+++ ")):
+                files[-1] = (name.removeprefix("a/").removeprefix("b/"), file_lines)
+    return [
+        (path, "".join(file_lines).strip("\n"))
+        for path, file_lines in files
+        if "".join(file_lines).strip()
+    ]
+
+
+@dataclass
+class PackedFile:
+    """A changed file as it goes into a review prompt."""
+
+    path: str
+    patch: str  # The full patch, or what was kept of it
+    tokens: int
+    risk: int
+    summarized: bool = False  # Some or all of the hunks are summarized
+
+
+@dataclass
+class Omission:
+    """Patch content left out of the prompts."""
+
+    path: str
+    reason: str
+    hunks: int  # Hunks not sent in full
+    tokens: int  # Prompt tokens of the content not sent
+    dropped: bool = False  # Not even a summary was sent
+
+    def to_dict(self) -> dict:
+        return {
+            "path": self.path,
+            "reason": self.reason,
+            "hunks": self.hunks,
+            "tokens": self.tokens,
+            "dropped": self.dropped,
+        }
+
+
+@dataclass
+class PackReport:
+    """Everything the packer summarized or dropped."""
+
+    omissions: list[Omission] = field(default_factory=list)
+    tokens_sent: int = 0
+
+    @property
+    def tokens_omitted(self) -> int:
+        return sum(o.tokens for o in self.omissions)
+
+    @property
+    def incomplete_paths(self) -> set[str]:
+        """Files not sent in full."""
+        return {o.path for o in self.omissions}
+
+    def to_dict(self) -> dict:
+        return {
+            "tokens_sent": self.tokens_sent,
+            "tokens_omitted": self.tokens_omitted,
+            "omissions": [o.to_dict() for o in self.omissions],
+        }
+
+    def prompt_section(self, paths: set[str] | None = None) -> str:
+        """
+        Markdown listing of the omitted content ("" if nothing was).
+
+        Args:
+            paths: Only list these files' summarized content (dropped files
+                are always listed); all files if None
+        """
+        omissions = [
+            o for o in self.omissions if paths is None or o.dropped or o.path in paths
+        ]
+        if not omissions:
+            return ""
+        lines = [
+            f"- `{o.path}`: {'dropped' if o.dropped else 'summarized'} "
+            f"{o.hunks} hunk(s), ~{o.tokens:,} tokens ({o.reason})"
+            for o in omissions
+        ]
+        return (
+            "\n### Content Not Shown In Full\n"
+            "The diff below is packed to a token budget. These patches were "
+            "summarized (hunk headers and line counts only) or dropped; read the "
+            "files if you need their content.\n\n" + "\n".join(lines) + "\n"
+        )
+
+    def __str__(self) -> str:
+        if not self.omissions:
+            return f"all patches sent in full (~{self.tokens_sent:,} tokens)"
+        dropped = sum(1 for o in self.omissions if o.dropped)
+        return (
+            f"~{self.tokens_sent:,} tokens sent; "
+            f"{len(self.omissions) - dropped} file(s) summarized and "
+            f"{dropped} dropped (~{self.tokens_omitted:,} tokens omitted)"
+        )
+
+
+@dataclass
+class ContextPack:
+    """Changed files packed into shards, and what was left out."""
+
+    shards: list[list[PackedFile]]
+    report: PackReport
+
+    @property
+    def files(self) -> list[PackedFile]:
+        return [file for shard in self.shards for file in shard]
+
+
+def _fit_hunks(hunks: list[str], max_tokens: int) -> tuple[str, int]:
+    """Keep the leading hunks that fit max_tokens; returns (text, hunks kept)."""
+    kept: list[str] = []
+    used = 0
+    for hunk in hunks:
+        tokens = estimate_tokens(hunk)
+        if used + tokens > max_tokens:
+            break
+        kept.append(hunk)
+        used += tokens
+    if not kept and hunks:
+        # A single hunk over budget: keep the most leading lines whose text
+        # fits (per-line estimates round down and would overshoot)
+        lines = hunks[0].splitlines(keepends=True)
+        count = bisect.bisect_right(
+            range(1, len(lines) + 1),
+            max_tokens,
+            key=lambda n: estimate_tokens("".join(lines[:n])),
+        )
+        return "".join(lines[:count]), 0
+    return "".join(kept), len(kept)
+
+
+def pack_files(
+    files: list[tuple[str, str]],
+    shard_tokens: int,
+    total_tokens: int,
+) -> ContextPack:
+    """
+    Pack changed files into shards of at most shard_tokens patch tokens.
+
+    Args:
+        files: (path, patch) of each changed file
+        shard_tokens: Patch tokens per shard (one review session)
+        total_tokens: Patch tokens across all shards
+
+    Returns:
+        The shards (files ranked by risk, then change size; one empty shard
+        when there are no files) and the report of the omitted content
+    """
+    report = PackReport()
+    ranked = sorted(
+        ((path, patch or "", file_risk(path)) for path, patch in files),
+        key=lambda f: (-f[2], -len(f[1])),
+    )
+
+    packed: list[PackedFile] = []
+    budget_left = total_tokens
+    for path, patch, risk in ranked:
+        hunks = split_hunks(patch)
+        tokens = estimate_tokens(patch)
+        text, summarized, reason = patch, False, ""
+
+        if risk == RISK_LOW_VALUE and hunks:
+            text, summarized, reason = summarize_hunks(hunks), True, "low-value file"
+            report.omissions.append(Omission(path, reason, len(hunks), tokens))
+        elif tokens > shard_tokens:
+            summary_budget = shard_tokens // 10
+            kept_text, kept = _fit_hunks(hunks, shard_tokens - summary_budget)
+            rest = summarize_hunks(hunks[kept:])
+            text = f"{kept_text}\n... (remaining hunks summarized)\n{rest}"
+            summarized, reason = True, "over the per-file budget"
+            report.omissions.append(
+                Omission(
+                    path,
+                    reason,
+                    len(hunks) - kept,
+                    tokens - estimate_tokens(kept_text),
+                )
+            )
+
+        text_tokens = estimate_tokens(text)
+        if text_tokens > budget_left:
+            summary = summarize_hunks(hunks)
+            full_omission = Omission(path, "over the review budget", len(hunks), tokens)
+            report.omissions = [o for o in report.omissions if o.path != path]
+            if hunks and estimate_tokens(summary) <= budget_left:
+                text, summarized = summary, True
+                report.omissions.append(full_omission)
+            else:
+                full_omission.dropped = True
+                report.omissions.append(full_omission)
+                continue
+            text_tokens = estimate_tokens(text)
+
+        budget_left -= text_tokens
+        report.tokens_sent += text_tokens
+        packed.append(PackedFile(path, text, text_tokens, risk, summarized))
+
+    shards: list[list[PackedFile]] = [[]]
+    shard_used = 0
+    for file in packed:
+        if shards[-1] and shard_used + file.tokens > shard_tokens:
+            shards.append([])
+            shard_used = 0
+        shards[-1].append(file)
+        shard_used += file.tokens
+    return ContextPack(shards=shards, report=report)
+
+
+def pack_diff(diff: str, max_tokens: int) -> tuple[str, PackReport]:
+    """
+    Pack a multi-file unified diff into a single prompt budget.
+
+    Returns:
+        Tuple of (the packed diff, report of the omitted content)
+    """
+    pack = pack_files(split_unified_diff(diff), max_tokens, max_tokens)
+    patches = []
+    for file in pack.files:
+        patch = file.patch
+        if not patch.startswith(("diff ", "--- ")):
+            # Summaries lose the file headers
+            patch = f"--- a/{file.path}\n+++ b/{file.path}\n{patch}"
+        patches.append(patch)
+    return "\n\n".join(patches), pack.report
@@ -0,0 +1,112 @@
+"""
+Diff Scanning
+=============
+
+Single-pass helpers over unified diffs for the follow-up reviewer:
+
+- DiffHunkIndex parses a diff once into per-file changed line ranges, so
+  checking whether a finding's line was touched is a bisection instead of a
+  rescan of the diff.
+- AddedCodeScanner runs a set of regex patterns over a diff in one combined
+  pass and reports, per pattern, the first match in added code.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+
+_HUNK_HEADER = re.compile(r"@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+class DiffHunkIndex:
+    """
+    Changed line ranges of a unified diff, per file.
+
+    Ranges are the new-side lines of each hunk (start through start + count,
+    as the reviewer has always counted them), merged and sorted per file.
+    """
+
+    def __init__(self, diff: str):
+        ranges: dict[str, list[tuple[int, int]]] = {}
+        current: list[tuple[int, int]] | None = None
+        for line in diff.splitlines():
+            if line.startswith("--- a/"):
+                current = ranges.setdefault(line[6:], [])
+            elif line.startswith("diff --git"):
+                current = None
+            elif current is not None and line.startswith("@@"):
+                # Content lines start with " ", "+" or "-": this is a header
+                match = _HUNK_HEADER.match(line)
+                if match:
+                    start = int(match.group(1))
+                    count = int(match.group(2)) if match.group(2) else 1
+                    current.append((start, start + count))
+
+        self._starts: dict[str, list[int]] = {}
+        self._ends: dict[str, list[int]] = {}
+        for file, hunks in ranges.items():
+            starts: list[int] = []
+            ends: list[int] = []
+            for start, end in sorted(hunks):
+                if ends and start <= ends[-1]:
+                    ends[-1] = max(ends[-1], end)
+                else:
+                    starts.append(start)
+                    ends.append(end)
+            self._starts[file] = starts
+            self._ends[file] = ends
+
+    def has_file(self, file: str) -> bool:
+        """Whether the diff modifies this (previously existing) file."""
+        return file in self._starts
+
+    def line_changed(self, file: str, line: int) -> bool:
+        """Whether a new-side line of the file falls in one of its hunks."""
+        starts = self._starts.get(file)
+        if not starts:
+            return False
+        index = bisect_right(starts, line) - 1
+        return index >= 0 and line <= self._ends[file][index]
+
+
+class AddedCodeScanner:
+    """
+    Finds the first match of each pattern that lies in added code.
+
+    A match counts as added code when the 50 characters around it contain the
+    start of a "+" line. All patterns are compiled into one alternation of
+    lookaheads, so the diff is scanned once and every pattern is still tried
+    at every position (a match of one pattern can't hide another inside it).
+
+    Args:
+        patterns: Regular expressions, matched case-insensitively
+    """
+
+    def __init__(self, patterns: list[str]):
+        self.patterns = list(patterns)
+        self._scan = re.compile(
+            "|".join(f"(?=(?P<p{i}>{p}))" for i, p in enumerate(self.patterns)),
+            re.IGNORECASE,
+        )
+
+    def first_added(self, diff: str) -> dict[int, int]:
+        """
+        Scan a diff.
+
+        Returns:
+            Offset of the first added-code match, keyed by pattern index, in
+            pattern order
+        """
+        found: dict[int, int] = {}
+        for match in self._scan.finditer(diff):
+            index = int(match.lastgroup[1:])
+            if index in found:
+                continue
+            start, end = match.span(match.lastgroup)
+            context = diff[max(0, start - 50) : end + 50]
+            if "\n+" in context or context.startswith("+"):
+                found[index] = start
+                if len(found) == len(self.patterns):
+                    break
+        return dict(sorted(found.items()))
@@ -0,0 +1,274 @@
+"""
+Finding Cache
+=============
+
+Per-file reuse of review findings across PR re-reviews.
+
+A re-review after a rebase or a one-line fix used to send every changed file
+through the specialist agents again. Findings are now stored per file, keyed
+by:
+
+- the file's blob SHA at the PR head (same content = same blob, across
+  rebases),
+- a hash of the review context the agents see for the file (its path and
+  patch, and the patches of the other changed files it refers to or that
+  refer to it, so a change to a caller or callee invalidates it), and
+- the prompt version (a hash of the review prompts, model and thinking
+  level), so changing any of them invalidates everything.
+
+Files whose key is cached reuse the stored findings; only the rest go back to
+the model. Each entry also remembers its share of the review time and the
+prompt tokens of its patch, so every run can report what the reuse saved.
+
+The store is an SQLite database in the GitHub state directory (WAL mode, so
+concurrent runners can share it).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+
+from core.sqlite_store import SQLiteStore
+
+try:
+    from ..models import PRReviewFinding
+except (ImportError, ValueError, SystemError):
+    from models import PRReviewFinding
+
+logger = logging.getLogger(__name__)
+
+FINDING_CACHE_DB_FILE = "finding_cache.db"
+
+# Oldest entries are dropped beyond this
+MAX_CACHED_FILES = 20_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS file_findings (
+    blob_sha TEXT NOT NULL,
+    context_hash TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    findings TEXT NOT NULL,
+    review_seconds REAL NOT NULL,
+    prompt_tokens INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (blob_sha, context_hash, prompt_version)
+);
+"""
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of prompt text (~4 characters per token)."""
+    return len(text) // 4
+
+
+# Modules other files refer to by their directory's name
+_INDEX_MODULES = {"__init__", "index", "mod", "main"}
+
+_WORD = re.compile(r"[\w-]+")
+
+
+def file_context_hash(
+    path: str, patch: str, related: list[tuple[str, str]] | None = None
+) -> str:
+    """Hash of the review context of one file: its path, its patch and the
+    (path, patch) of the changed files related to it."""
+    digest = hashlib.sha256(f"{path}\0{patch}".encode())
+    for related_path, related_patch in sorted(related or []):
+        digest.update(f"\0{related_path}\0{related_patch}".encode())
+    return digest.hexdigest()
+
+
+def _module_name(path: str) -> str:
+    """Name other files refer to a file by."""
+    file = PurePosixPath(path)
+    name = file.name.split(".")[0]
+    if name in _INDEX_MODULES and file.parent.name:
+        return file.parent.name
+    return name
+
+
+def file_context_hashes(files: list[tuple[str, str, str]]) -> dict[str, str]:
+    """
+    Context hash of every changed file of a PR.
+
+    Two changed files are related when either one mentions the other's module
+    name (an import, a call through the module); a file's findings can depend
+    on a related file's changes, so its hash covers their patches too.
+
+    Args:
+        files: (path, content, patch) of each changed file (the content may
+            be empty, the patch is searched as well)
+
+    Returns:
+        Context hash by path
+    """
+    words = {
+        path: set(_WORD.findall(content)) | set(_WORD.findall(patch))
+        for path, content, patch in files
+    }
+    names = {path: _module_name(path) for path, _, _ in files}
+    return {
+        path: file_context_hash(
+            path,
+            patch,
+            [
+                (other, other_patch)
+                for other, _, other_patch in files
+                if other != path
+                and (names[other] in words[path] or names[path] in words[other])
+            ],
+        )
+        for path, _, patch in files
+    }
+
+
+def prompt_version(*parts: str) -> str:
+    """Hash of everything that shapes the findings besides the files."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+@dataclass
+class FileReviewKey:
+    """Cache key of one changed file."""
+
+    path: str
+    blob_sha: str
+    context_hash: str
+    prompt_tokens: int = 0
+
+
+@dataclass
+class FindingReuseStats:
+    """What reusing cached findings saved in one review run."""
+
+    files_reused: int = 0
+    files_reviewed: int = 0
+    tokens_saved: int = 0
+    seconds_saved: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "files_reused": self.files_reused,
+            "files_reviewed": self.files_reviewed,
+            "tokens_saved": self.tokens_saved,
+            "seconds_saved": round(self.seconds_saved, 1),
+        }
+
+    def __str__(self) -> str:
+        return (
+            f"{self.files_reused} file(s) reused, {self.files_reviewed} reviewed "
+            f"(~{self.tokens_saved:,} prompt tokens and "
+            f"~{self.seconds_saved:.0f}s saved)"
+        )
+
+
+class FindingCache(SQLiteStore):
+    """
+    SQLite store of review findings per file.
+
+    Args:
+        db_path: Database file (parent directory created if needed)
+        max_entries: Entries kept before the oldest are dropped
+    """
+
+    def __init__(self, db_path: Path, max_entries: int = MAX_CACHED_FILES):
+        super().__init__(db_path, _SCHEMA)
+        self.max_entries = max_entries
+
+    def lookup(
+        self, keys: list[FileReviewKey], version: str
+    ) -> tuple[dict[str, list[PRReviewFinding]], FindingReuseStats]:
+        """
+        Find the files whose findings can be reused.
+
+        Args:
+            keys: Cache keys of the changed files
+            version: Prompt version of this review
+
+        Returns:
+            Tuple of (cached findings keyed by file path, reuse stats with
+            files_reused and the savings filled in)
+        """
+        reused: dict[str, list[PRReviewFinding]] = {}
+        stats = FindingReuseStats()
+        conn = self._connect()
+        for key in keys:
+            row = conn.execute(
+                "SELECT findings, review_seconds, prompt_tokens FROM file_findings "
+                "WHERE blob_sha = ? AND context_hash = ? AND prompt_version = ?",
+                (key.blob_sha, key.context_hash, version),
+            ).fetchone()
+            if row is None:
+                continue
+            findings_json, review_seconds, prompt_tokens = row
+            try:
+                reused[key.path] = [
+                    PRReviewFinding.from_dict(data)
+                    for data in json.loads(findings_json)
+                ]
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable cached findings: {e}")
+                continue
+            stats.files_reused += 1
+            stats.tokens_saved += prompt_tokens
+            stats.seconds_saved += review_seconds
+        return reused, stats
+
+    def store(
+        self,
+        keys: list[FileReviewKey],
+        version: str,
+        findings: list[PRReviewFinding],
+        review_seconds: float,
+    ) -> None:
+        """
+        Store the findings of freshly reviewed files.
+
+        Every key gets an entry (an empty one for files without findings).
+        The review time is split between the files by prompt tokens.
+
+        Args:
+            keys: Cache keys of the files that were reviewed
+            version: Prompt version of this review
+            findings: Findings of the review (other files' are ignored)
+            review_seconds: Duration of the review
+        """
+        if not keys:
+            return
+        by_file: dict[str, list[dict]] = {key.path: [] for key in keys}
+        for finding in findings:
+            if finding.file in by_file:
+                by_file[finding.file].append(finding.to_dict())
+        weights = [key.prompt_tokens or 1 for key in keys]
+        total_weight = sum(weights)
+        now = time.time()
+
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO file_findings (blob_sha, context_hash, "
+                "prompt_version, findings, review_seconds, prompt_tokens, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        key.blob_sha,
+                        key.context_hash,
+                        version,
+                        json.dumps(by_file[key.path]),
+                        review_seconds * weight / total_weight,
+                        key.prompt_tokens,
+                        now,
+                    )
+                    for key, weight in zip(keys, weights)
+                ],
+            )
+            self._trim(conn, "file_findings", self.max_entries)
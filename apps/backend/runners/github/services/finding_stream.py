@@ -0,0 +1,163 @@
+"""
+Finding Stream
+==============
+
+Incremental deduplication and cross-validation of review findings.
+
+The specialist reviewers run as independent concurrent sessions, and each
+session's findings are fed to a FindingStream as soon as it finishes:
+
+- duplicates (same file, line and title) are dropped on arrival, so the
+  stream always knows how many distinct findings were reported so far;
+- findings are grouped by location (file, line, category) on arrival, so
+  the agreement between specialists is known while the others still run.
+
+Merging each agreeing group into one finding (boosted confidence, combined
+agents, evidence and descriptions) is the only work left once the last
+session is in, and the result is the same as deduplicating and
+cross-validating all findings at once.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+try:
+    from ..models import PRReviewFinding, ReviewSeverity
+except (ImportError, ValueError, SystemError):
+    from models import PRReviewFinding, ReviewSeverity
+
+# Confidence boost for multi-agent agreement
+CONFIDENCE_BOOST = 0.15
+MAX_CONFIDENCE = 0.95
+
+_SEVERITY_ORDER = {
+    ReviewSeverity.CRITICAL: 0,
+    ReviewSeverity.HIGH: 1,
+    ReviewSeverity.MEDIUM: 2,
+    ReviewSeverity.LOW: 3,
+}
+
+
+def duplicate_key(finding: PRReviewFinding) -> tuple:
+    """Findings with the same key are duplicates (only the first is kept)."""
+    return (finding.file, finding.line, finding.title.lower().strip())
+
+
+def location_key(finding: PRReviewFinding) -> tuple:
+    """Findings with the same key are cross-validated against each other."""
+    return (finding.file, finding.line, finding.category.value)
+
+
+def merge_agreeing_findings(group: list[PRReviewFinding]) -> PRReviewFinding:
+    """
+    Merge findings of several agents on the same location into one.
+
+    The most severe finding is kept and updated in place: its confidence is
+    boosted by CONFIDENCE_BOOST (capped at MAX_CONFIDENCE), and it collects
+    the source agents, evidence and descriptions of the group.
+
+    Args:
+        group: Two or more findings with the same location key
+
+    Returns:
+        The merged (primary) finding
+    """
+    # Sort by severity to keep highest severity finding
+    group.sort(key=lambda f: _SEVERITY_ORDER.get(f.severity, 99))
+    primary = group[0]
+
+    # Collect all source agents from group
+    all_agents: list[str] = []
+    for f in group:
+        if f.source_agents:
+            for agent in f.source_agents:
+                if agent not in all_agents:
+                    all_agents.append(agent)
+
+    # Combine evidence from all findings
+    all_evidence: list[str] = []
+    for f in group:
+        if f.evidence and f.evidence.strip():
+            all_evidence.append(f.evidence.strip())
+    combined_evidence = "\n---\n".join(all_evidence) if all_evidence else None
+
+    # Combine descriptions
+    all_descriptions: list[str] = [primary.description]
+    for f in group[1:]:
+        if f.description and f.description not in all_descriptions:
+            all_descriptions.append(f.description)
+
+    base_confidence = primary.confidence or 0.5
+    primary.confidence = min(base_confidence + CONFIDENCE_BOOST, MAX_CONFIDENCE)
+    primary.cross_validated = True
+    primary.source_agents = all_agents
+    primary.evidence = combined_evidence
+    primary.description = " | ".join(all_descriptions)
+    return primary
+
+
+class FindingStream:
+    """
+    Deduplicates and groups findings as they arrive.
+
+    Feed batches with add(); call merge() once, after the last batch.
+    """
+
+    def __init__(self):
+        self._seen: set[tuple] = set()
+        self._groups: dict[tuple, list[PRReviewFinding]] = {}
+        self._agreed_groups = 0
+
+    @property
+    def unique_count(self) -> int:
+        """Distinct findings received so far."""
+        return len(self._seen)
+
+    @property
+    def agreed_count(self) -> int:
+        """Locations reported by more than one finding so far."""
+        return self._agreed_groups
+
+    def add(self, findings: Iterable[PRReviewFinding]) -> list[PRReviewFinding]:
+        """
+        Add a batch of findings.
+
+        Returns:
+            The findings of the batch that weren't duplicates
+        """
+        added = []
+        for finding in findings:
+            key = duplicate_key(finding)
+            if key in self._seen:
+                continue
+            self._seen.add(key)
+            group = self._groups.setdefault(location_key(finding), [])
+            group.append(finding)
+            if len(group) == 2:
+                self._agreed_groups += 1
+            added.append(finding)
+        return added
+
+    def merge(self) -> tuple[list[PRReviewFinding], list[str]]:
+        """
+        Merge the agreeing findings.
+
+        Returns:
+            Tuple of (cross-validated findings in arrival order of their
+            location, IDs of the findings several agents agreed on)
+        """
+        findings: list[PRReviewFinding] = []
+        agreed_ids: list[str] = []
+        for group in self._groups.values():
+            if len(group) >= 2:
+                primary = merge_agreeing_findings(group)
+                findings.append(primary)
+                agreed_ids.append(primary.id)
+            else:
+                finding = group[0]
+                # Ensure source_agents is populated (use empty list if not set)
+                if not finding.source_agents:
+                    finding.source_agents = []
+                findings.append(finding)
+        return findings, agreed_ids
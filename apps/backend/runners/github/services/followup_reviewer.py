@@ -17,7 +17,6 @@ from __future__ import annotations
 
 import hashlib
 import logging
-import re
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -35,6 +34,8 @@ try:
         ReviewSeverity,
     )
     from .category_utils import map_category
+    from .context_packer import pack_diff
+    from .diff_scan import AddedCodeScanner, DiffHunkIndex
     from .io_utils import safe_print
     from .prompt_manager import PromptManager
     from .pydantic_models import FollowupReviewResponse
@@ -48,6 +49,8 @@ except (ImportError, ValueError, SystemError):
         ReviewSeverity,
     )
     from services.category_utils import map_category
+    from services.context_packer import pack_diff
+    from services.diff_scan import AddedCodeScanner, DiffHunkIndex
     from services.io_utils import safe_print
     from services.prompt_manager import PromptManager
     from services.pydantic_models import FollowupReviewResponse
@@ -62,6 +65,23 @@ _SEVERITY_MAPPING = {
     "low": ReviewSeverity.LOW,
 }
 
+# Common security issues in new code, checked by the heuristic review
+_SECURITY_PATTERNS = [
+    (r"password\s*=\s*['\"][^'\"]+['\"]", "Hardcoded password detected"),
+    (r"api[_-]?key\s*=\s*['\"][^'\"]+['\"]", "Hardcoded API key detected"),
+    (r"secret\s*=\s*['\"][^'\"]+['\"]", "Hardcoded secret detected"),
+    (r"eval\s*\(", "Use of eval() detected"),
+    (r"dangerouslySetInnerHTML", "dangerouslySetInnerHTML usage detected"),
+]
+
+_SECURITY_SCANNER = AddedCodeScanner([pattern for pattern, _ in _SECURITY_PATTERNS])
+
+# Diff tokens in the AI review prompt (the rest is summarized or dropped)
+FOLLOWUP_DIFF_TOKENS = 20_000
+
+# New commits listed in the AI review prompt (the newest are kept)
+MAX_PROMPT_COMMITS = 50
+
 
 class FollowupReviewer:
     """
@@ -291,15 +311,17 @@ class FollowupReviewer:
         """
         resolved = []
         unresolved = []
+        changed = set(changed_files)
+        hunks = DiffHunkIndex(diff) if diff else None
 
         for finding in previous_findings:
             # If the file wasn't changed, finding is still open
-            if finding.file not in changed_files:
+            if finding.file not in changed:
                 unresolved.append(finding)
                 continue
 
             # Check if the line was modified
-            if self._line_appears_changed(finding.file, finding.line, diff):
+            if self._line_appears_changed(finding.file, finding.line, hunks):
                 resolved.append(finding)
             else:
                 # File was modified but the specific line wasn't clearly changed
@@ -309,34 +331,18 @@ class FollowupReviewer:
 
         return resolved, unresolved
 
-    def _line_appears_changed(self, file: str, line: int | None, diff: str) -> bool:
+    def _line_appears_changed(
+        self, file: str, line: int | None, hunks: DiffHunkIndex | None
+    ) -> bool:
         """Check if a specific line appears to have been changed in the diff."""
-        if not diff:
+        if hunks is None:
             return False
 
         # Handle None or invalid line numbers (legacy data)
         if line is None or line <= 0:
             return True  # Assume changed if line unknown
 
-        # Look for the file in the diff
-        file_marker = f"--- a/{file}"
-        if file_marker not in diff:
-            return False
-
-        # Find the file section in the diff
-        file_start = diff.find(file_marker)
-        next_file = diff.find("\n--- a/", file_start + 1)
-        file_diff = diff[file_start:next_file] if next_file > 0 else diff[file_start:]
-
-        # Parse hunk headers (@@...@@) to find if line was in a changed region
-        hunk_pattern = r"@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@"
-        for match in re.finditer(hunk_pattern, file_diff):
-            start_line = int(match.group(1))
-            count = int(match.group(2)) if match.group(2) else 1
-            if start_line <= line <= start_line + count:
-                return True
-
-        return False
+        return hunks.line_changed(file, line)
 
     def _check_new_changes_heuristic(
         self,
@@ -347,43 +353,31 @@ class FollowupReviewer:
         Do a quick heuristic check on new changes.
 
         This is a simplified check - full AI review would be more thorough.
-        Looks for common issues in the diff.
+        Looks for common issues in the diff, all patterns in a single pass.
         """
         findings = []
 
         if not diff:
             return findings
 
-        # Check for common security issues in new code
-        security_patterns = [
-            (r"password\s*=\s*['\"][^'\"]+['\"]", "Hardcoded password detected"),
-            (r"api[_-]?key\s*=\s*['\"][^'\"]+['\"]", "Hardcoded API key detected"),
-            (r"secret\s*=\s*['\"][^'\"]+['\"]", "Hardcoded secret detected"),
-            (r"eval\s*\(", "Use of eval() detected"),
-            (r"dangerouslySetInnerHTML", "dangerouslySetInnerHTML usage detected"),
-        ]
-
-        for pattern, title in security_patterns:
-            matches = re.finditer(pattern, diff, re.IGNORECASE)
-            for match in matches:
-                # Only flag if it's in a + line (added code)
-                context = diff[max(0, match.start() - 50) : match.end() + 50]
-                if "\n+" in context or context.startswith("+"):
-                    findings.append(
-                        PRReviewFinding(
-                            id=hashlib.md5(
-                                f"new-{pattern}-{match.start()}".encode(),
-                                usedforsecurity=False,
-                            ).hexdigest()[:12],
-                            severity=ReviewSeverity.HIGH,
-                            category=ReviewCategory.SECURITY,
-                            title=title,
-                            description=f"Potential security issue in new code: {title.lower()}",
-                            file="(in diff)",
-                            line=0,
-                        )
-                    )
-                    break  # One finding per pattern is enough
+        # First match per pattern that is in added code, in pattern order
+        first_added = _SECURITY_SCANNER.first_added(diff)
+        for index, start in first_added.items():
+            pattern, title = _SECURITY_PATTERNS[index]
+            findings.append(
+                PRReviewFinding(
+                    id=hashlib.md5(
+                        f"new-{pattern}-{start}".encode(),
+                        usedforsecurity=False,
+                    ).hexdigest()[:12],
+                    severity=ReviewSeverity.HIGH,
+                    category=ReviewCategory.SECURITY,
+                    title=title,
+                    description=f"Potential security issue in new code: {title.lower()}",
+                    file="(in diff)",
+                    line=0,
+                )
+            )
 
         return findings
 
@@ -601,12 +595,26 @@ class FollowupReviewer:
         )
 
         # Format commits with timestamps (for timeline correlation with AI comments)
+        commits = context.commits_since_review
         commits_text = "\n".join(
             [
                 f"- {c.get('sha', '')[:8]} ({c.get('commit', {}).get('author', {}).get('date', 'unknown')}): {c.get('commit', {}).get('message', '').split(chr(10))[0]}"
-                for c in context.commits_since_review
+                for c in commits[-MAX_PROMPT_COMMITS:]
             ]
         )
+        if len(commits) > MAX_PROMPT_COMMITS:
+            commits_text = (
+                f"- ... {len(commits) - MAX_PROMPT_COMMITS} earlier commit(s) "
+                f"not shown\n{commits_text}"
+            )
+
+        # Pack the diff to the prompt budget, riskiest files first; the
+        # prompt lists whatever was summarized or dropped
+        diff_text, pack_report = pack_diff(
+            context.diff_since_review, FOLLOWUP_DIFF_TOKENS
+        )
+        if pack_report.omissions:
+            logger.info(f"[Followup] Diff packing: {pack_report}")
 
         # Format contributor comments with timestamps
         contributor_comments_text = "\n".join(
@@ -652,10 +660,10 @@ class FollowupReviewer:
 {commits_text if commits_text else "No new commits."}
 
 ### DIFF SINCE LAST REVIEW:
+{pack_report.prompt_section()}
 ```diff
-{context.diff_since_review[:15000]}
+{diff_text}
 ```
-{f"... (truncated, {len(context.diff_since_review)} total chars)" if len(context.diff_since_review) > 15000 else ""}
 
 ### FILES CHANGED SINCE LAST REVIEW:
 {chr(10).join(f"- {f}" for f in context.files_changed_since_review) if context.files_changed_since_review else "No files changed."}
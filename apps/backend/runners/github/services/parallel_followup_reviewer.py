@@ -44,6 +44,7 @@ try:
         ReviewSeverity,
     )
     from .category_utils import map_category
+    from .context_packer import pack_diff
     from .io_utils import safe_print
     from .pr_worktree_manager import PRWorktreeManager
     from .pydantic_models import ParallelFollowupResponse
@@ -63,6 +64,7 @@ except (ImportError, ValueError, SystemError):
     )
     from phase_config import get_thinking_budget, resolve_model_id
     from services.category_utils import map_category
+    from services.context_packer import pack_diff
     from services.io_utils import safe_print
     from services.pr_worktree_manager import PRWorktreeManager
     from services.pydantic_models import ParallelFollowupResponse
@@ -77,6 +79,9 @@ DEBUG_MODE = os.environ.get("DEBUG", "").lower() in ("true", "1", "yes")
 # Directory for PR review worktrees (shared with initial reviewer)
 PR_WORKTREE_DIR = ".auto-claude/github/pr/worktrees"
 
+# Diff tokens in the orchestrator prompt (the rest is summarized or dropped)
+FOLLOWUP_DIFF_TOKENS = 25_000
+
 # Severity mapping for AI responses
 _SEVERITY_MAPPING = {
     "critical": ReviewSeverity.CRITICAL,
@@ -364,11 +369,12 @@ class ParallelFollowupReviewer:
         ai_reviews = self._format_ai_reviews(context)
         ci_status = self._format_ci_status(context)
 
-        # Truncate diff if too long
-        MAX_DIFF_CHARS = 100_000
-        diff_content = context.diff_since_review
-        if len(diff_content) > MAX_DIFF_CHARS:
-            diff_content = diff_content[:MAX_DIFF_CHARS] + "\n\n... (diff truncated)"
+        # Pack the diff to the prompt budget, riskiest files first
+        diff_content, pack_report = pack_diff(
+            context.diff_since_review, FOLLOWUP_DIFF_TOKENS
+        )
+        if pack_report.omissions:
+            logger.info(f"[ParallelFollowup] Diff packing: {pack_report}")
 
         followup_context = f"""
 ---
@@ -403,6 +409,7 @@ class ParallelFollowupReviewer:
 {ai_reviews}
 
 ### Diff Since Last Review
+{pack_report.prompt_section()}
 ```diff
 {diff_content}
 ```
@@ -2,25 +2,33 @@
 Parallel Orchestrator PR Reviewer
 ==================================
 
-PR reviewer using Claude Agent SDK subagents for parallel specialist analysis.
+PR reviewer running specialist agents as concurrent sessions.
 
-The orchestrator analyzes the PR and delegates to specialized agents (security,
-quality, logic, codebase-fit, ai-triage) which run in parallel. Results are
-synthesized into a final verdict.
+The changed files are packed into token-budgeted shards (see context_packer),
+and every specialist (security, quality, logic, codebase-fit, plus ai-triage
+when the PR has AI comments) reviews every shard in its own session, several
+at a time. Findings stream into an incremental dedup and cross-validation
+stage as each session finishes; the merged findings are then re-investigated
+by the finding-validator, which dismisses false positives, and synthesized
+into a final verdict.
 
 Key Design:
-- AI decides which agents to invoke (NOT programmatic rules)
-- Subagents defined via SDK `agents={}` parameter
-- SDK handles parallel execution automatically
+- Independent sessions: a slow specialist or shard doesn't hold up the others
+- Findings are deduplicated and grouped as they arrive (see finding_stream)
 - User-configured model from frontend settings (no hardcoding)
 """
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import hashlib
 import logging
 import os
+import sqlite3
+import time
 from collections import defaultdict
+from dataclasses import replace
 from enum import Enum
 from pathlib import Path
 from typing import Any
@@ -30,7 +38,11 @@ from claude_agent_sdk import AgentDefinition
 try:
     from ...core.client import create_client
     from ...phase_config import get_thinking_budget, resolve_model_id
-    from ..context_gatherer import PRContext, PRContextGatherer, _validate_git_ref
+    from ..context_gatherer import (
+        PRContext,
+        PRContextGatherer,
+        _validate_git_ref,
+    )
     from ..gh_client import GHClient
     from ..models import (
         BRANCH_BEHIND_BLOCKER_MSG,
@@ -42,12 +54,37 @@ try:
         ReviewSeverity,
     )
     from .category_utils import map_category
+    from .context_packer import ContextPack, PackedFile, PackReport, pack_files
+    from .finding_cache import (
+        FINDING_CACHE_DB_FILE,
+        FileReviewKey,
+        FindingCache,
+        FindingReuseStats,
+        estimate_tokens,
+        file_context_hashes,
+        prompt_version,
+    )
+    from .finding_stream import (
+        FindingStream,
+        duplicate_key,
+        location_key,
+        merge_agreeing_findings,
+    )
     from .io_utils import safe_print
     from .pr_worktree_manager import PRWorktreeManager
-    from .pydantic_models import AgentAgreement, ParallelOrchestratorResponse
+    from .pydantic_models import (
+        AgentAgreement,
+        FindingValidationResponse,
+        FindingValidationResult,
+        SpecialistReviewResponse,
+    )
     from .sdk_utils import process_sdk_stream
 except (ImportError, ValueError, SystemError):
-    from context_gatherer import PRContext, PRContextGatherer, _validate_git_ref
+    from context_gatherer import (
+        PRContext,
+        PRContextGatherer,
+        _validate_git_ref,
+    )
     from core.client import create_client
     from gh_client import GHClient
     from models import (
@@ -61,9 +98,35 @@ except (ImportError, ValueError, SystemError):
     )
     from phase_config import get_thinking_budget, resolve_model_id
     from services.category_utils import map_category
+    from services.context_packer import (
+        ContextPack,
+        PackedFile,
+        PackReport,
+        pack_files,
+    )
+    from services.finding_cache import (
+        FINDING_CACHE_DB_FILE,
+        FileReviewKey,
+        FindingCache,
+        FindingReuseStats,
+        estimate_tokens,
+        file_context_hashes,
+        prompt_version,
+    )
+    from services.finding_stream import (
+        FindingStream,
+        duplicate_key,
+        location_key,
+        merge_agreeing_findings,
+    )
     from services.io_utils import safe_print
     from services.pr_worktree_manager import PRWorktreeManager
-    from services.pydantic_models import AgentAgreement, ParallelOrchestratorResponse
+    from services.pydantic_models import (
+        AgentAgreement,
+        FindingValidationResponse,
+        FindingValidationResult,
+        SpecialistReviewResponse,
+    )
     from services.sdk_utils import process_sdk_stream
 
 
@@ -75,6 +138,46 @@ DEBUG_MODE = os.environ.get("DEBUG", "").lower() in ("true", "1", "yes")
 # Directory for PR review worktrees (inside github/pr for consistency)
 PR_WORKTREE_DIR = ".auto-claude/github/pr/worktrees"
 
+# Prompts that shape the findings: changing any of them invalidates reuse
+REVIEW_PROMPT_FILES = (
+    "pr_security_agent.md",
+    "pr_quality_agent.md",
+    "pr_logic_agent.md",
+    "pr_codebase_fit_agent.md",
+    "pr_ai_triage.md",
+    "pr_finding_validator.md",
+)
+
+# Specialists that review every shard of the changed files
+FILE_REVIEWERS = (
+    "security-reviewer",
+    "quality-reviewer",
+    "logic-reviewer",
+    "codebase-fit-reviewer",
+)
+
+# Reviews the PR's AI comments once (not per shard), when there are any
+AI_TRIAGE_REVIEWER = "ai-triage-reviewer"
+
+# Re-investigates the merged findings, dismissing false positives
+FINDING_VALIDATOR = "finding-validator"
+
+# Findings per finding-validator session
+VALIDATOR_BATCH_SIZE = 25
+
+# Patch tokens per specialist session: larger PRs are split into shards
+SPECIALIST_SHARD_TOKENS = 30_000
+
+# Specialist sessions running at the same time
+MAX_CONCURRENT_SPECIALIST_SESSIONS = 6
+
+# Patch tokens across all shards (the rest is summarized or dropped)
+MAX_REVIEW_TOKENS = 240_000
+
+# Commits and AI comments listed in a prompt (the rest are counted)
+MAX_PROMPT_COMMITS = 50
+MAX_PROMPT_AI_COMMENTS = 20
+
 
 class ConfidenceTier(str, Enum):
     """Confidence tiers for finding routing.
@@ -195,18 +298,66 @@ def _is_finding_in_scope(
     return True, "In scope"
 
 
+def _apply_verdicts(
+    findings: list[PRReviewFinding],
+    verdicts: dict[tuple, FindingValidationResult],
+) -> list[PRReviewFinding]:
+    """
+    Apply the finding-validator's verdicts, by finding location.
+
+    Findings dismissed as false positives are dropped; the others record the
+    verdict, its code evidence and explanation.
+
+    Args:
+        findings: Findings to apply the verdicts to (updated in place)
+        verdicts: Verdicts by location key (see finding_stream.location_key)
+
+    Returns:
+        The findings that weren't dismissed
+    """
+    kept = []
+    for finding in findings:
+        verdict = verdicts.get(location_key(finding))
+        if verdict is not None:
+            if verdict.validation_status == "dismissed_false_positive":
+                continue
+            finding.validation_status = verdict.validation_status
+            finding.validation_evidence = verdict.code_evidence
+            finding.validation_explanation = verdict.explanation
+        kept.append(finding)
+    return kept
+
+
+def _triage_files(
+    pack: ContextPack, commented_paths: set[str], max_tokens: int
+) -> list[PackedFile]:
+    """
+    Files for the AI triage session: the commented ones, up to max_tokens.
+
+    Falls back to the first (highest-risk) shard when no comment is on a file.
+    """
+    files: list[PackedFile] = []
+    used = 0
+    for file in pack.files:
+        if file.path in commented_paths and used + file.tokens <= max_tokens:
+            files.append(file)
+            used += file.tokens
+    return files or pack.shards[0]
+
+
 class ParallelOrchestratorReviewer:
     """
-    PR reviewer using SDK subagents for parallel specialist analysis.
+    PR reviewer running specialist agents as concurrent sessions.
 
-    The orchestrator:
-    1. Analyzes the PR (size, complexity, file types, risk areas)
-    2. Delegates to appropriate specialist agents (SDK handles parallel execution)
-    3. Synthesizes findings into a final verdict
+    The reviewer:
+    1. Packs the changed files into shards by risk and patch size
+    2. Runs every specialist over every shard as independent sessions
+    3. Deduplicates and cross-validates findings as the sessions finish
+    4. Re-investigates the merged findings, dismissing false positives
+    5. Synthesizes findings into a final verdict
 
     Model Configuration:
-    - Orchestrator uses user-configured model from frontend settings
-    - Specialist agents use model="inherit" (same as orchestrator)
+    - All sessions use the user-configured model from frontend settings
     """
 
     def __init__(
@@ -221,6 +372,7 @@ class ParallelOrchestratorReviewer:
         self.config = config
         self.progress_callback = progress_callback
         self.worktree_manager = PRWorktreeManager(project_dir, PR_WORKTREE_DIR)
+        self._finding_cache: FindingCache | None = None
 
     def _report_progress(self, phase: str, progress: int, message: str, **kwargs):
         """Report progress if callback is set."""
@@ -293,15 +445,15 @@ class ParallelOrchestratorReviewer:
 
     def _define_specialist_agents(self) -> dict[str, AgentDefinition]:
         """
-        Define specialist agents for the SDK.
+        Define the specialist agents.
 
         Each agent has:
-        - description: When the orchestrator should invoke this agent
-        - prompt: System prompt for the agent
+        - description: What the agent reviews
+        - prompt: Instructions the agent's sessions start with
         - tools: Tools the agent can use (read-only for PR review)
-        - model: "inherit" = use same model as orchestrator (user's choice)
+        - model: "inherit" = use the reviewer's model (user's choice)
 
-        Returns AgentDefinition dataclass instances as required by the SDK.
+        Returns AgentDefinition dataclass instances, as the SDK defines agents.
         """
         # Load agent prompts from files
         security_prompt = self._load_prompt("pr_security_agent.md")
@@ -368,12 +520,12 @@ class ParallelOrchestratorReviewer:
                 tools=["Read", "Grep", "Glob"],
                 model="inherit",
             ),
-            "finding-validator": AgentDefinition(
+            FINDING_VALIDATOR: AgentDefinition(
                 description=(
                     "Finding validation specialist. Re-investigates findings to validate "
                     "they are actually real issues, not false positives. "
                     "Reads the ACTUAL CODE at the finding location with fresh eyes. "
-                    "CRITICAL: Invoke for ALL findings after specialist agents complete. "
+                    "Runs over the merged findings after the specialist sessions. "
                     "Can confirm findings as valid OR dismiss them as false positives."
                 ),
                 prompt=validator_prompt
@@ -383,13 +535,29 @@ class ParallelOrchestratorReviewer:
             ),
         }
 
-    def _build_orchestrator_prompt(self, context: PRContext) -> str:
-        """Build full prompt for orchestrator with PR context."""
-        # Load orchestrator prompt
-        base_prompt = self._load_prompt("pr_parallel_orchestrator.md")
-        if not base_prompt:
-            base_prompt = "You are a PR reviewer. Analyze and delegate to specialists."
+    def _build_specialist_prompt(
+        self,
+        agent_name: str,
+        agent_prompt: str,
+        context: PRContext,
+        shard: list[PackedFile],
+        shard_label: str = "",
+        reused_files: list[str] | None = None,
+        pack_report: PackReport | None = None,
+    ) -> str:
+        """Build the prompt of one specialist session.
 
+        Args:
+            agent_name: Name of the specialist
+            agent_prompt: The specialist's instructions
+            context: PR context holding all files to review
+            shard: Files this session reviews
+            shard_label: "part i of n" when the files are split into shards
+            reused_files: Changed files whose findings were reused from a
+                previous review (listed, but not sent for review)
+            pack_report: Content the packer summarized or dropped (the
+                shard's files and the dropped ones are listed)
+        """
         # Build file list
         files_list = []
         for file in context.changed_files:
@@ -397,28 +565,33 @@ class ParallelOrchestratorReviewer:
                 f"- `{file.path}` (+{file.additions}/-{file.deletions}) - {file.status}"
             )
 
-        # Build composite diff
+        # Build composite diff of the shard
         patches = []
-        MAX_DIFF_CHARS = 200_000
-
-        for file in context.changed_files:
+        for file in shard:
             if file.patch:
                 patches.append(f"\n### File: {file.path}\n{file.patch}")
 
         diff_content = "\n".join(patches)
 
-        if len(diff_content) > MAX_DIFF_CHARS:
-            diff_content = diff_content[:MAX_DIFF_CHARS] + "\n\n... (diff truncated)"
+        # The packer bounds the shard: list what it left out instead of cutting
+        omitted_section = ""
+        if pack_report:
+            omitted_section = pack_report.prompt_section({file.path for file in shard})
 
         # Build AI comments context if present (with timestamps for timeline awareness)
         ai_comments_section = ""
-        if context.ai_bot_comments:
+        if agent_name == AI_TRIAGE_REVIEWER and context.ai_bot_comments:
             ai_comments_list = []
-            for comment in context.ai_bot_comments[:20]:
+            for comment in context.ai_bot_comments[:MAX_PROMPT_AI_COMMENTS]:
                 ai_comments_list.append(
                     f"- **{comment.tool_name}** ({comment.created_at}) on {comment.file or 'general'}: "
                     f"{comment.body[:200]}..."
                 )
+            if len(context.ai_bot_comments) > MAX_PROMPT_AI_COMMENTS:
+                ai_comments_list.append(
+                    f"- ... and {len(context.ai_bot_comments) - MAX_PROMPT_AI_COMMENTS} "
+                    "more (not shown)"
+                )
             ai_comments_section = f"""
 ### AI Review Comments (need triage)
 Found {len(context.ai_bot_comments)} comments from AI tools.
@@ -431,7 +604,11 @@ Found {len(context.ai_bot_comments)} comments from AI tools.
         commits_section = ""
         if context.commits:
             commits_list = []
-            for commit in context.commits:
+            # Newest commits matter most for the timeline
+            earlier = len(context.commits) - MAX_PROMPT_COMMITS
+            if earlier > 0:
+                commits_list.append(f"- ... {earlier} earlier commit(s) not shown")
+            for commit in context.commits[-MAX_PROMPT_COMMITS:]:
                 sha = commit.get("oid", "")[:8]
                 message = commit.get("messageHeadline", "")
                 committed_at = commit.get("committedDate", "")
@@ -439,6 +616,31 @@ Found {len(context.ai_bot_comments)} comments from AI tools.
             commits_section = f"""
 ### Commit Timeline
 {chr(10).join(commits_list)}
+"""
+
+        # List the files whose findings were reused (unchanged since reviewed)
+        reused_section = ""
+        if reused_files:
+            reused_list = "\n".join(f"- `{path}`" for path in reused_files)
+            reused_section = f"""
+### Unchanged Since Last Review
+These files are also part of the PR, but their content and diff are unchanged
+since the last review; their findings were reused. Do not review them again,
+only read them if needed to understand the changes below.
+
+{reused_list}
+"""
+
+        # Sharded sessions only review their own files
+        shard_section = ""
+        if shard_label:
+            shard_list = "\n".join(f"- `{file.path}`" for file in shard)
+            shard_section = f"""
+### Files to Review ({shard_label})
+The other changed files are reviewed in parallel sessions. Report issues in
+these files only, but read any file you need to understand them.
+
+{shard_list}
 """
 
         pr_context = f"""
@@ -458,7 +660,7 @@ Found {len(context.ai_bot_comments)} comments from AI tools.
 
 ### All Changed Files
 {chr(10).join(files_list)}
-{commits_section}{ai_comments_section}
+{reused_section}{shard_section}{commits_section}{ai_comments_section}{omitted_section}
 ### Code Changes
 ```diff
 {diff_content}
@@ -466,79 +668,10 @@ Found {len(context.ai_bot_comments)} comments from AI tools.
 
 ---
 
-Now analyze this PR and delegate to the appropriate specialist agents.
-Remember: YOU decide which agents to invoke based on YOUR analysis.
-The SDK will run invoked agents in parallel automatically.
+Now review these changes as the {agent_name} and report your findings.
 """
 
-        return base_prompt + pr_context
-
-    def _create_sdk_client(
-        self, project_root: Path, model: str, thinking_budget: int | None
-    ):
-        """Create SDK client with subagents and configuration.
-
-        Args:
-            project_root: Root directory of the project
-            model: Model to use for orchestrator
-            thinking_budget: Max thinking tokens budget
-
-        Returns:
-            Configured SDK client instance
-        """
-        return create_client(
-            project_dir=project_root,
-            spec_dir=self.github_dir,
-            model=model,
-            agent_type="pr_orchestrator_parallel",
-            max_thinking_tokens=thinking_budget,
-            agents=self._define_specialist_agents(),
-            output_format={
-                "type": "json_schema",
-                "schema": ParallelOrchestratorResponse.model_json_schema(),
-            },
-        )
-
-    def _extract_structured_output(
-        self, structured_output: dict[str, Any] | None, result_text: str
-    ) -> tuple[list[PRReviewFinding], list[str]]:
-        """Parse and extract findings from structured output or text fallback.
-
-        Args:
-            structured_output: Structured JSON output from agent
-            result_text: Raw text output as fallback
-
-        Returns:
-            Tuple of (findings list, agents_invoked list)
-        """
-        agents_from_structured: list[str] = []
-
-        if structured_output:
-            findings, agents_from_structured = self._parse_structured_output(
-                structured_output
-            )
-            if findings is None and result_text:
-                findings = self._parse_text_output(result_text)
-            elif findings is None:
-                findings = []
-        else:
-            findings = self._parse_text_output(result_text)
-
-        return findings, agents_from_structured
-
-    def _log_agents_invoked(self, agents: list[str]) -> None:
-        """Log invoked agents with clear formatting.
-
-        Args:
-            agents: List of agent names that were invoked
-        """
-        if agents:
-            safe_print(
-                f"[ParallelOrchestrator] Specialist agents invoked: {', '.join(agents)}",
-                flush=True,
-            )
-            for agent in agents:
-                safe_print(f"[Agent:{agent}] Analysis complete")
+        return agent_prompt + pr_context
 
     def _log_findings_summary(self, findings: list[PRReviewFinding]) -> None:
         """Log findings summary for verification.
@@ -548,7 +681,7 @@ The SDK will run invoked agents in parallel automatically.
         """
         if findings:
             safe_print(
-                f"[ParallelOrchestrator] Parsed {len(findings)} findings from structured output",
+                f"[ParallelOrchestrator] {len(findings)} findings from specialist sessions",
                 flush=True,
             )
             safe_print("[ParallelOrchestrator] Findings summary:")
@@ -591,6 +724,94 @@ The SDK will run invoked agents in parallel automatically.
             evidence=finding_data.evidence,
         )
 
+    async def _fetch_file_blobs(self, pr_number: int) -> dict[str, str]:
+        """Get the blob SHA of every file in the PR (filename -> blob SHA)."""
+        file_blobs: dict[str, str] = {}
+        try:
+            gh_client = GHClient(
+                project_dir=self.project_dir,
+                default_timeout=30.0,
+                repo=self.config.repo,
+            )
+            pr_files = await gh_client.get_pr_files(pr_number)
+            for file in pr_files:
+                filename = file.get("filename", "")
+                blob_sha = file.get("sha", "")
+                if filename and blob_sha:
+                    file_blobs[filename] = blob_sha
+            logger.info(
+                f"Captured {len(file_blobs)} file blob SHAs for follow-up tracking"
+            )
+        except Exception as e:
+            logger.warning(f"Could not capture file blobs: {e}")
+        return file_blobs
+
+    def _prompt_version(self, model: str, thinking_level: str) -> str:
+        """Version of the review setup: prompts, model and thinking level."""
+        return prompt_version(
+            model,
+            thinking_level,
+            *(self._load_prompt(filename) for filename in REVIEW_PROMPT_FILES),
+        )
+
+    def _file_review_keys(
+        self, context: PRContext, file_blobs: dict[str, str]
+    ) -> list[FileReviewKey]:
+        """Finding cache keys of the changed files that have a blob SHA."""
+        context_hashes = file_context_hashes(
+            [(file.path, file.content, file.patch) for file in context.changed_files]
+        )
+        return [
+            FileReviewKey(
+                path=file.path,
+                blob_sha=file_blobs[file.path],
+                context_hash=context_hashes[file.path],
+                prompt_tokens=estimate_tokens(file.patch),
+            )
+            for file in context.changed_files
+            if file_blobs.get(file.path)
+        ]
+
+    def _get_finding_cache(self) -> FindingCache | None:
+        """Open the finding cache once (None if its database is unavailable)."""
+        if self._finding_cache is None:
+            try:
+                self._finding_cache = FindingCache(
+                    self.github_dir / "pr" / FINDING_CACHE_DB_FILE
+                )
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Finding cache unavailable, reviewing all files: {e}")
+        return self._finding_cache
+
+    def _lookup_cached_findings(
+        self, keys: list[FileReviewKey], version: str
+    ) -> tuple[dict[str, list[PRReviewFinding]], FindingReuseStats]:
+        """Cached findings of unchanged files, keyed by path."""
+        cache = self._get_finding_cache()
+        if cache is None or not keys:
+            return {}, FindingReuseStats()
+        try:
+            return cache.lookup(keys, version)
+        except sqlite3.Error as e:
+            logger.warning(f"Finding cache lookup failed: {e}")
+            return {}, FindingReuseStats()
+
+    def _store_findings(
+        self,
+        keys: list[FileReviewKey],
+        version: str,
+        findings: list[PRReviewFinding],
+        review_seconds: float,
+    ) -> None:
+        """Cache the findings of freshly reviewed files."""
+        cache = self._get_finding_cache()
+        if cache is None:
+            return
+        try:
+            cache.store(keys, version, findings, review_seconds)
+        except sqlite3.Error as e:
+            logger.warning(f"Finding cache write failed: {e}")
+
     async def review(self, context: PRContext) -> PRReviewResult:
         """
         Main review entry point.
@@ -644,6 +865,7 @@ The SDK will run invoked agents in parallel automatically.
                 )
                 head_sha = None
 
+            tracked_files: frozenset[str] | None = None
             if not head_sha:
                 if DEBUG_MODE:
                     safe_print("[PRReview] DEBUG: No head_sha - using fallback")
@@ -667,21 +889,13 @@ The SDK will run invoked agents in parallel automatically.
                         head_sha, context.pr_number
                     )
                     project_root = worktree_path
-                    # Count files in worktree to give user visibility (with limit to avoid slowdown)
-                    MAX_FILE_COUNT = 10000
-                    try:
-                        file_count = 0
-                        for f in worktree_path.rglob("*"):
-                            if f.is_file() and ".git" not in f.parts:
-                                file_count += 1
-                                if file_count >= MAX_FILE_COUNT:
-                                    break
-                    except (OSError, PermissionError):
-                        file_count = 0
+                    # Count files from the git index of the checked-out commit
+                    # (cached per SHA) instead of walking the worktree
+                    tracked_files = self.worktree_manager.list_files(worktree_path)
                     file_count_str = (
-                        f"{file_count:,}+"
-                        if file_count >= MAX_FILE_COUNT
-                        else f"{file_count:,}"
+                        f"{len(tracked_files):,}"
+                        if tracked_files is not None
+                        else "unknown number of"
                     )
                     # Always log worktree creation with file count (not gated by DEBUG_MODE)
                     safe_print(
@@ -716,6 +930,7 @@ The SDK will run invoked agents in parallel automatically.
                 new_related_files = PRContextGatherer.find_related_files_for_root(
                     context.changed_files,
                     project_root,
+                    tracked_files=tracked_files,
                 )
                 # Always log rescan result (not gated by DEBUG_MODE)
                 if new_related_files:
@@ -729,9 +944,6 @@ The SDK will run invoked agents in parallel automatically.
                         f"(initial scan found {len(context.related_files)})"
                     )
 
-            # Build orchestrator prompt AFTER worktree creation and related files rescan
-            prompt = self._build_orchestrator_prompt(context)
-
             # Use model and thinking level from config (user settings)
             # Resolve model shorthand via environment variable override if configured
             model_shorthand = self.config.model or "sonnet"
@@ -744,77 +956,92 @@ The SDK will run invoked agents in parallel automatically.
                 f"thinking_level={thinking_level}, thinking_budget={thinking_budget}"
             )
 
-            # Create client with subagents defined
-            # SDK handles parallel execution when Claude invokes multiple Task tools
-            client = self._create_sdk_client(project_root, model, thinking_budget)
+            # Get file blob SHAs: they key finding reuse, and make follow-up
+            # reviews rebase-resistant (same content = same blob SHA)
+            file_blobs = await self._fetch_file_blobs(context.pr_number)
 
-            self._report_progress(
-                "orchestrating",
-                40,
-                "Orchestrator delegating to specialist agents...",
-                pr_number=context.pr_number,
+            # Reuse the findings of files unchanged since they were last reviewed,
+            # only the other files go back to the specialist agents
+            version = self._prompt_version(model, thinking_level)
+            review_keys = self._file_review_keys(context, file_blobs)
+            cached_findings, reuse_stats = self._lookup_cached_findings(
+                review_keys, version
             )
+            review_context = context
+            if cached_findings:
+                review_context = replace(
+                    context,
+                    changed_files=[
+                        f
+                        for f in context.changed_files
+                        if f.path not in cached_findings
+                    ],
+                )
+            reuse_stats.files_reviewed = len(review_context.changed_files)
 
-            # Run orchestrator session using shared SDK stream processor
-            async with client:
-                await client.query(prompt)
-
+            # Rank the files to review and pack them into budgeted shards;
+            # whatever doesn't fit is summarized or dropped, and reported
+            pack = self._pack_context(review_context)
+            logger.info(f"[ParallelOrchestrator] Context packing: {pack.report}")
+            if pack.report.omissions:
                 safe_print(
-                    f"[ParallelOrchestrator] Running orchestrator ({model})...",
+                    f"[ParallelOrchestrator] Context packing: {pack.report}",
                     flush=True,
                 )
 
-                # Process SDK stream with shared utility
-                stream_result = await process_sdk_stream(
-                    client=client,
-                    context_name="ParallelOrchestrator",
-                    model=model,
+            # Findings are deduplicated and grouped as the sessions finish
+            stream = FindingStream()
+            final_agents: list[str] = []
+            store_keys: list[FileReviewKey] = []
+            fresh_findings: list[PRReviewFinding] = []
+            review_seconds = 0.0
+            if review_context.changed_files or not context.changed_files:
+                started_at = time.monotonic()
+                findings, final_agents, unreviewed = await self._run_specialists(
+                    review_context,
+                    project_root,
+                    model,
+                    thinking_budget,
+                    stream,
+                    reused_files=sorted(cached_findings),
+                    pack=pack,
+                )
+                review_seconds = time.monotonic() - started_at
+                # Files are only complete if every specialist reviewed all of
+                # their patch and returned validated findings (summarized files,
+                # failed sessions and text fallbacks are reviewed again next time)
+                incomplete = pack.report.incomplete_paths | unreviewed
+                store_keys = [
+                    key
+                    for key in review_keys
+                    if key.path not in cached_findings and key.path not in incomplete
+                ]
+                # Cached as reported: merging updates the agreeing findings in
+                # place, and they're merged again when reused
+                fresh_findings = [copy.copy(f) for f in findings]
+            else:
+                self._report_progress(
+                    "finalizing",
+                    50,
+                    "No files changed since last review, reusing findings...",
+                    pr_number=context.pr_number,
                 )
 
-                # Check for stream processing errors
-                if stream_result.get("error"):
-                    logger.error(
-                        f"[ParallelOrchestrator] SDK stream failed: {stream_result['error']}"
-                    )
-                    raise RuntimeError(
-                        f"SDK stream processing failed: {stream_result['error']}"
-                    )
-
-                result_text = stream_result["result_text"]
-                structured_output = stream_result["structured_output"]
-                agents_invoked = stream_result["agents_invoked"]
-                msg_count = stream_result["msg_count"]
-
-            self._report_progress(
-                "finalizing",
-                50,
-                "Synthesizing findings...",
-                pr_number=context.pr_number,
-            )
-
-            # Parse findings from output (structured output also returns agents)
-            findings, agents_from_structured = self._extract_structured_output(
-                structured_output, result_text
-            )
-
-            # Use agents from structured output (more reliable than streaming detection)
-            final_agents = (
-                agents_from_structured if agents_from_structured else agents_invoked
-            )
-            logger.info(
-                f"[ParallelOrchestrator] Session complete. Agents invoked: {final_agents}"
-            )
-            safe_print(
-                f"[ParallelOrchestrator] Complete. Agents invoked: {final_agents}",
-                flush=True,
-            )
-
-            # Deduplicate findings
-            unique_findings = self._deduplicate_findings(findings)
+            if cached_findings:
+                for file_findings in cached_findings.values():
+                    stream.add(file_findings)
+                logger.info(f"[ParallelOrchestrator] Finding reuse: {reuse_stats}")
+                safe_print(
+                    f"[ParallelOrchestrator] Finding reuse: {reuse_stats}", flush=True
+                )
 
             # Cross-validate findings: boost confidence when multiple agents agree
-            cross_validated_findings, agent_agreement = self._cross_validate_findings(
-                unique_findings
+            # (the stream already dropped duplicates and grouped by location)
+            cross_validated_findings, agreed_finding_ids = stream.merge()
+            agent_agreement = AgentAgreement(
+                agreed_findings=agreed_finding_ids,
+                conflicting_findings=[],  # Not implemented yet - reserved for future
+                resolution_notes=None,
             )
 
             # Log cross-validation results
@@ -828,8 +1055,30 @@ The SDK will run invoked agents in parallel automatically.
                 f"[PRReview] AgentAgreement: {agent_agreement.model_dump_json()}"
             )
 
+            # Re-investigate the merged findings against the code, dropping
+            # false positives; the files' cached findings keep the verdicts
+            verdicts = await self._validate_findings(
+                cross_validated_findings,
+                context,
+                project_root,
+                model,
+                thinking_budget,
+            )
+            cross_validated_findings = _apply_verdicts(
+                cross_validated_findings, verdicts
+            )
+            if verdicts:
+                final_agents = [*final_agents, FINDING_VALIDATOR]
+            if store_keys:
+                self._store_findings(
+                    store_keys,
+                    version,
+                    _apply_verdicts(fresh_findings, verdicts),
+                    review_seconds,
+                )
+
             # Apply programmatic evidence and scope filters
-            # These catch edge cases that slip through the finding-validator
+            # (also covering findings the validator couldn't check)
             changed_file_paths = [f.path for f in context.changed_files]
             validated_findings = []
             filtered_findings = []
@@ -910,27 +1159,6 @@ The SDK will run invoked agents in parallel automatically.
                 latest_commit = context.commits[-1]
                 head_sha = latest_commit.get("oid") or latest_commit.get("sha")
 
-            # Get file blob SHAs for rebase-resistant follow-up reviews
-            # Blob SHAs persist across rebases - same content = same blob SHA
-            file_blobs: dict[str, str] = {}
-            try:
-                gh_client = GHClient(
-                    project_dir=self.project_dir,
-                    default_timeout=30.0,
-                    repo=self.config.repo,
-                )
-                pr_files = await gh_client.get_pr_files(context.pr_number)
-                for file in pr_files:
-                    filename = file.get("filename", "")
-                    blob_sha = file.get("sha", "")
-                    if filename and blob_sha:
-                        file_blobs[filename] = blob_sha
-                logger.info(
-                    f"Captured {len(file_blobs)} file blob SHAs for follow-up tracking"
-                )
-            except Exception as e:
-                logger.warning(f"Could not capture file blobs: {e}")
-
             result = PRReviewResult(
                 pr_number=context.pr_number,
                 repo=self.config.repo,
@@ -943,6 +1171,8 @@ The SDK will run invoked agents in parallel automatically.
                 blockers=blockers,
                 reviewed_commit_sha=head_sha,
                 reviewed_file_blobs=file_blobs,
+                finding_reuse=reuse_stats.to_dict(),
+                context_pack=pack.report.to_dict(),
             )
 
             self._report_progress(
@@ -967,44 +1197,393 @@ The SDK will run invoked agents in parallel automatically.
             if worktree_path:
                 self._cleanup_pr_worktree(worktree_path)
 
-    def _parse_structured_output(
-        self, structured_output: dict[str, Any]
-    ) -> tuple[list[PRReviewFinding] | None, list[str]]:
-        """Parse findings and agents from SDK structured output.
+    def _pack_context(self, context: PRContext) -> ContextPack:
+        """Pack the changed files into token-budgeted shards, by risk."""
+        return pack_files(
+            [(file.path, file.patch) for file in context.changed_files],
+            SPECIALIST_SHARD_TOKENS,
+            MAX_REVIEW_TOKENS,
+        )
+
+    async def _run_specialists(
+        self,
+        context: PRContext,
+        project_root: Path,
+        model: str,
+        thinking_budget: int | None,
+        stream: FindingStream,
+        reused_files: list[str] | None = None,
+        pack: ContextPack | None = None,
+    ) -> tuple[list[PRReviewFinding], list[str], set[str]]:
+        """Run the specialist sessions over the files to review.
+
+        Every file reviewer gets a session per shard of the packed changed
+        files (and the AI triage reviewer one session, over the files with
+        AI comments, when the PR has any).
+        Up to MAX_CONCURRENT_SPECIALIST_SESSIONS run at a time, and each
+        session's findings are fed to the stream as soon as it finishes.
+
+        Args:
+            context: PR context holding the files to review
+            project_root: Root directory the agents read files from
+            model: Model to use for the sessions
+            thinking_budget: Max thinking tokens budget
+            stream: Receives the findings of each finished session
+            reused_files: Changed files whose findings were reused
+            pack: The files packed into shards (packed here if None)
 
         Returns:
-            Tuple of (findings list or None if parsing failed, agents list)
+            Tuple of (findings in arrival order, agents with a finished session,
+            files of the sessions that failed or whose structured output
+            didn't validate)
+
+        Raises:
+            RuntimeError: If no session finished
         """
-        findings = []
-        agents_from_output: list[str] = []
+        agents = self._define_specialist_agents()
+        if pack is None:
+            pack = self._pack_context(context)
+        shards = pack.shards
+        jobs: list[tuple[str, list[PackedFile], str]] = [
+            (name, shard, f"part {i} of {len(shards)}" if len(shards) > 1 else "")
+            for name in FILE_REVIEWERS
+            for i, shard in enumerate(shards, 1)
+        ]
+        if context.ai_bot_comments:
+            commented = {c.file for c in context.ai_bot_comments if c.file}
+            jobs.append(
+                (
+                    AI_TRIAGE_REVIEWER,
+                    _triage_files(pack, commented, SPECIALIST_SHARD_TOKENS),
+                    "",
+                )
+            )
+
+        safe_print(
+            f"[ParallelOrchestrator] Running {len(jobs)} specialist sessions "
+            f"({len(shards)} shard(s), up to {MAX_CONCURRENT_SPECIALIST_SESSIONS} "
+            f"at a time, {model})...",
+            flush=True,
+        )
+        self._report_progress(
+            "orchestrating",
+            40,
+            f"Running {len(jobs)} specialist sessions...",
+            pr_number=context.pr_number,
+        )
 
+        slots = asyncio.Semaphore(MAX_CONCURRENT_SPECIALIST_SESSIONS)
+
+        async def run_job(name: str, shard: list[PackedFile], shard_label: str):
+            async with slots:
+                try:
+                    findings, validated = await self._run_specialist_session(
+                        name,
+                        self._build_specialist_prompt(
+                            name,
+                            agents[name].prompt,
+                            context,
+                            shard,
+                            shard_label,
+                            reused_files,
+                            pack.report,
+                        ),
+                        project_root,
+                        model,
+                        thinking_budget,
+                    )
+                except Exception as e:
+                    return name, shard, shard_label, None, False, e
+                return name, shard, shard_label, findings, validated, None
+
+        started_at = time.monotonic()
+        findings: list[PRReviewFinding] = []
+        finished_agents: set[str] = set()
+        errors: list[str] = []
+        incomplete: set[str] = set()
+        tasks = [asyncio.ensure_future(run_job(*job)) for job in jobs]
         try:
-            result = ParallelOrchestratorResponse.model_validate(structured_output)
-            agents_from_output = result.agents_invoked or []
+            for done, next_session in enumerate(asyncio.as_completed(tasks), 1):
+                name, shard, shard_label, batch, validated, error = await next_session
+                session = f"{name} ({shard_label})" if shard_label else name
+                if not validated:
+                    incomplete.update(file.path for file in shard)
+                if error is not None:
+                    logger.error(f"[ParallelOrchestrator] {session} failed: {error}")
+                    safe_print(f"[Agent:{name}] Session failed: {error}", flush=True)
+                    errors.append(f"{session}: {error}")
+                    continue
 
-            logger.info(
-                f"[ParallelOrchestrator] Structured output: verdict={result.verdict}, "
-                f"{len(result.findings)} findings, agents={agents_from_output}"
-            )
+                had_findings = stream.unique_count > 0
+                new_findings = stream.add(batch)
+                findings.extend(batch)
+                finished_agents.add(name)
+                if new_findings and not had_findings:
+                    safe_print(
+                        f"[ParallelOrchestrator] First finding after "
+                        f"{time.monotonic() - started_at:.1f}s",
+                        flush=True,
+                    )
+                safe_print(
+                    f"[Agent:{name}] Analysis complete"
+                    f"{f' ({shard_label})' if shard_label else ''}: "
+                    f"{len(new_findings)} new finding(s)",
+                    flush=True,
+                )
+                self._report_progress(
+                    "orchestrating",
+                    40 + 10 * done // len(jobs),
+                    f"{done}/{len(jobs)} specialist sessions done: "
+                    f"{stream.unique_count} findings, "
+                    f"{stream.agreed_count} confirmed by several agents",
+                    pr_number=context.pr_number,
+                )
+        finally:
+            for task in tasks:
+                task.cancel()
 
-            # Log agents invoked with clear formatting
-            self._log_agents_invoked(agents_from_output)
+        if errors and len(errors) == len(jobs):
+            raise RuntimeError(f"All specialist sessions failed: {errors[0]}")
 
-            # Convert structured findings to PRReviewFinding objects
-            for f in result.findings:
-                finding = self._create_finding_from_structured(f)
-                findings.append(finding)
+        final_agents = [
+            name
+            for name in (*FILE_REVIEWERS, AI_TRIAGE_REVIEWER)
+            if name in finished_agents
+        ]
+        self._log_findings_summary(findings)
+        logger.info(
+            f"[ParallelOrchestrator] Sessions complete in "
+            f"{time.monotonic() - started_at:.1f}s. Agents: {final_agents}"
+        )
+        safe_print(
+            f"[ParallelOrchestrator] Complete. Agents invoked: {final_agents}",
+            flush=True,
+        )
+        return findings, final_agents, incomplete
 
-            # Log findings summary for verification
-            self._log_findings_summary(findings)
+    async def _run_specialist_session(
+        self,
+        agent_name: str,
+        prompt: str,
+        project_root: Path,
+        model: str,
+        thinking_budget: int | None,
+    ) -> tuple[list[PRReviewFinding], bool]:
+        """Run one specialist session and parse its findings.
 
-        except Exception as e:
-            logger.error(
-                f"[ParallelOrchestrator] Structured output parsing failed: {e}"
+        Returns:
+            Tuple of (findings, whether the structured output validated)
+
+        Raises:
+            RuntimeError: If the SDK stream fails
+        """
+        stream_result = await self._run_session(
+            agent_name,
+            prompt,
+            project_root,
+            model,
+            thinking_budget,
+            SpecialistReviewResponse.model_json_schema(),
+        )
+        return self._parse_specialist_output(
+            agent_name,
+            stream_result["structured_output"],
+            stream_result["result_text"],
+        )
+
+    async def _run_session(
+        self,
+        agent_name: str,
+        prompt: str,
+        project_root: Path,
+        model: str,
+        thinking_budget: int | None,
+        schema: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Run one agent session with a structured output schema.
+
+        Returns:
+            The processed SDK stream (structured_output, result_text, ...)
+
+        Raises:
+            RuntimeError: If the SDK stream fails
+        """
+        client = create_client(
+            project_dir=project_root,
+            spec_dir=self.github_dir,
+            model=model,
+            agent_type="pr_orchestrator_parallel",
+            max_thinking_tokens=thinking_budget,
+            output_format={"type": "json_schema", "schema": schema},
+        )
+
+        async with client:
+            await client.query(prompt)
+
+            # Process SDK stream with shared utility
+            stream_result = await process_sdk_stream(
+                client=client,
+                context_name=f"Agent:{agent_name}",
+                model=model,
+            )
+
+        if stream_result.get("error"):
+            raise RuntimeError(
+                f"SDK stream processing failed: {stream_result['error']}"
             )
-            return None, agents_from_output
+        return stream_result
+
+    def _build_validator_prompt(
+        self,
+        validator_prompt: str,
+        context: PRContext,
+        findings: list[PRReviewFinding],
+    ) -> str:
+        """Build the prompt of one finding-validator session."""
+        files_list = "\n".join(f"- `{file.path}`" for file in context.changed_files)
+        findings_list = "\n\n".join(
+            f"### {finding.id}\n"
+            f"- **File**: `{finding.file}` line {finding.line}\n"
+            f"- **Severity**: {finding.severity.value}, "
+            f"**Category**: {finding.category.value}\n"
+            f"- **Title**: {finding.title}\n"
+            f"- **Description**: {finding.description}\n"
+            f"- **Evidence**: {finding.evidence or 'none given'}"
+            for finding in findings
+        )
+        return f"""{validator_prompt}
+
+---
+
+## Pull Request #{context.pr_number}: {context.title}
+
+### Changed Files ({len(context.changed_files)} files)
+{files_list}
 
-        return findings, agents_from_output
+## Findings to Validate ({len(findings)})
+Return one validation per finding, with its finding_id.
+
+{findings_list}
+"""
+
+    async def _validate_findings(
+        self,
+        findings: list[PRReviewFinding],
+        context: PRContext,
+        project_root: Path,
+        model: str,
+        thinking_budget: int | None,
+    ) -> dict[tuple, FindingValidationResult]:
+        """Re-investigate the merged findings with the finding-validator.
+
+        Findings are validated in batches of VALIDATOR_BATCH_SIZE, several
+        sessions at a time. Findings reused with a verdict aren't validated
+        again. A batch whose session fails or whose output doesn't validate
+        keeps its findings unvalidated.
+
+        Returns:
+            Verdicts by location key (see finding_stream.location_key)
+        """
+        pending = [f for f in findings if f.validation_status is None]
+        if not pending:
+            return {}
+        validator_prompt = self._define_specialist_agents()[FINDING_VALIDATOR].prompt
+        batches = [
+            pending[i : i + VALIDATOR_BATCH_SIZE]
+            for i in range(0, len(pending), VALIDATOR_BATCH_SIZE)
+        ]
+        self._report_progress(
+            "orchestrating",
+            52,
+            f"Validating {len(pending)} findings...",
+            pr_number=context.pr_number,
+        )
+
+        slots = asyncio.Semaphore(MAX_CONCURRENT_SPECIALIST_SESSIONS)
+
+        async def validate(batch: list[PRReviewFinding]):
+            async with slots:
+                try:
+                    stream_result = await self._run_session(
+                        FINDING_VALIDATOR,
+                        self._build_validator_prompt(validator_prompt, context, batch),
+                        project_root,
+                        model,
+                        thinking_budget,
+                        FindingValidationResponse.model_json_schema(),
+                    )
+                    return batch, FindingValidationResponse.model_validate(
+                        stream_result["structured_output"]
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"[ParallelOrchestrator] Finding validation failed, "
+                        f"keeping {len(batch)} findings unvalidated: {e}"
+                    )
+                    return batch, None
+
+        verdicts: dict[tuple, FindingValidationResult] = {}
+        for batch, response in await asyncio.gather(*map(validate, batches)):
+            if response is None:
+                continue
+            by_id = {finding.id: finding for finding in batch}
+            for validation in response.validations:
+                finding = by_id.get(validation.finding_id)
+                if finding is None:
+                    continue
+                verdicts[location_key(finding)] = validation
+                if validation.validation_status == "dismissed_false_positive":
+                    safe_print(
+                        f"[ParallelOrchestrator] Finding {finding.id} DISMISSED as "
+                        f"false positive: {validation.explanation[:100]}",
+                        flush=True,
+                    )
+
+        dismissed = sum(
+            v.validation_status == "dismissed_false_positive" for v in verdicts.values()
+        )
+        logger.info(
+            f"[PRReview] Finding validation: {len(verdicts)} of {len(pending)} "
+            f"validated, {dismissed} dismissed as false positives"
+        )
+        return verdicts
+
+    def _parse_specialist_output(
+        self,
+        agent_name: str,
+        structured_output: dict[str, Any] | None,
+        result_text: str,
+    ) -> tuple[list[PRReviewFinding], bool]:
+        """Parse a specialist's findings from structured output or text fallback.
+
+        Args:
+            agent_name: The specialist, recorded as the findings' source agent
+            structured_output: Structured JSON output from the session
+            result_text: Raw text output as fallback
+
+        Returns:
+            Tuple of (findings of the session, whether the structured output
+            validated; text fallback findings may be missing some)
+        """
+        findings: list[PRReviewFinding] | None = None
+        if structured_output:
+            try:
+                result = SpecialistReviewResponse.model_validate(structured_output)
+                findings = [
+                    self._create_finding_from_structured(f) for f in result.findings
+                ]
+            except Exception as e:
+                logger.error(
+                    f"[ParallelOrchestrator] {agent_name} structured output "
+                    f"parsing failed: {e}"
+                )
+        validated = findings is not None
+        if findings is None:
+            findings = self._parse_text_output(result_text)
+
+        for finding in findings:
+            finding.source_agents = [agent_name]
+        return findings, validated
 
     def _extract_json_from_text(self, output: str) -> dict[str, Any] | None:
         """Extract JSON object from text output.
@@ -1118,7 +1697,7 @@ The SDK will run invoked agents in parallel automatically.
         unique = []
 
         for f in findings:
-            key = (f.file, f.line, f.title.lower().strip())
+            key = duplicate_key(f)
             if key not in seen:
                 seen.add(key)
                 unique.append(f)
@@ -1136,82 +1715,34 @@ The SDK will run invoked agents in parallel automatically.
           sets cross_validated=True, collects all source agents
         - For single-agent findings: keeps as-is, ensures source_agents is populated
 
+        Reviews use FindingStream, which applies the same rules as findings
+        arrive; this is the batch form.
+
         Args:
             findings: List of deduplicated findings to cross-validate
 
         Returns:
             Tuple of (cross-validated findings, AgentAgreement tracking object)
         """
-        # Confidence boost for multi-agent agreement
-        CONFIDENCE_BOOST = 0.15
-        MAX_CONFIDENCE = 0.95
-
         # Group findings by location key: (file, line, category)
         groups: dict[tuple, list[PRReviewFinding]] = defaultdict(list)
         for finding in findings:
-            key = (finding.file, finding.line, finding.category.value)
-            groups[key].append(finding)
+            groups[location_key(finding)].append(finding)
 
         validated_findings: list[PRReviewFinding] = []
         agreed_finding_ids: list[str] = []
 
-        for key, group in groups.items():
+        for group in groups.values():
             if len(group) >= 2:
                 # Multi-agent agreement: merge findings
-                # Sort by severity to keep highest severity finding
-                severity_order = {
-                    ReviewSeverity.CRITICAL: 0,
-                    ReviewSeverity.HIGH: 1,
-                    ReviewSeverity.MEDIUM: 2,
-                    ReviewSeverity.LOW: 3,
-                }
-                group.sort(key=lambda f: severity_order.get(f.severity, 99))
-                primary = group[0]
-
-                # Collect all source agents from group
-                all_agents: list[str] = []
-                for f in group:
-                    if f.source_agents:
-                        for agent in f.source_agents:
-                            if agent not in all_agents:
-                                all_agents.append(agent)
-
-                # Combine evidence from all findings
-                all_evidence: list[str] = []
-                for f in group:
-                    if f.evidence and f.evidence.strip():
-                        all_evidence.append(f.evidence.strip())
-                combined_evidence = (
-                    "\n---\n".join(all_evidence) if all_evidence else None
-                )
-
-                # Combine descriptions
-                all_descriptions: list[str] = [primary.description]
-                for f in group[1:]:
-                    if f.description and f.description not in all_descriptions:
-                        all_descriptions.append(f.description)
-                combined_description = " | ".join(all_descriptions)
-
-                # Boost confidence (capped at MAX_CONFIDENCE)
-                base_confidence = primary.confidence or 0.5
-                boosted_confidence = min(
-                    base_confidence + CONFIDENCE_BOOST, MAX_CONFIDENCE
-                )
-
-                # Update the primary finding with merged data
-                primary.confidence = boosted_confidence
-                primary.cross_validated = True
-                primary.source_agents = all_agents
-                primary.evidence = combined_evidence
-                primary.description = combined_description
-
+                primary = merge_agreeing_findings(group)
                 validated_findings.append(primary)
                 agreed_finding_ids.append(primary.id)
 
                 logger.debug(
                     f"[PRReview] Cross-validated finding {primary.id}: "
-                    f"merged {len(group)} findings, agents={all_agents}, "
-                    f"confidence={boosted_confidence:.2f}"
+                    f"merged {len(group)} findings, agents={primary.source_agents}, "
+                    f"confidence={primary.confidence:.2f}"
                 )
             else:
                 # Single-agent finding: keep as-is
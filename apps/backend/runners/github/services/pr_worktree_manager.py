@@ -17,6 +17,7 @@ import logging
 import os
 import shutil
 import subprocess
+import threading
 import time
 from pathlib import Path
 from typing import NamedTuple
@@ -58,6 +59,17 @@ import re
 
 SAFE_REF_PATTERN = re.compile(r"^[a-zA-Z0-9._/\-]+$")
 
+# Tracked file listings per commit SHA (a commit's tree never changes)
+MAX_CACHED_FILE_LISTINGS = 16
+_tracked_files_cache: dict[str, frozenset[str]] = {}
+_tracked_files_lock = threading.Lock()
+
+
+def clear_tracked_files_cache() -> None:
+    """Forget all cached tracked file listings."""
+    with _tracked_files_lock:
+        _tracked_files_cache.clear()
+
 
 class WorktreeInfo(NamedTuple):
     """Information about a PR worktree."""
@@ -232,6 +244,64 @@ class PRWorktreeManager:
                 f"[WorktreeManager] Failed to remove worktree {worktree_path}: {e}"
             )
 
+    def list_files(self, worktree_path: Path) -> frozenset[str] | None:
+        """
+        List the files of a worktree's checked-out commit from the git index.
+
+        Reviews of the same commit reuse the listing, so repeated reviews
+        never walk the worktree's directory tree.
+
+        Args:
+            worktree_path: Path to the worktree
+
+        Returns:
+            Tracked paths (relative, forward slashes; names that aren't valid
+            UTF-8 are decoded like os.listdir() does), or None if git failed
+        """
+        env = get_isolated_git_env()
+        try:
+            head = subprocess.run(
+                ["git", "rev-parse", "--verify", "-q", "HEAD"],
+                cwd=worktree_path,
+                capture_output=True,
+                text=True,
+                timeout=30,
+                env=env,
+            )
+            head_sha = head.stdout.strip()
+            if head.returncode != 0 or not head_sha:
+                return None
+
+            with _tracked_files_lock:
+                cached = _tracked_files_cache.get(head_sha)
+            if cached is not None:
+                return cached
+
+            # Paths are raw bytes: decoding them as text fails on a single
+            # file name that isn't valid UTF-8
+            listing = subprocess.run(
+                ["git", "ls-files", "-z"],
+                cwd=worktree_path,
+                capture_output=True,
+                timeout=60,
+                env=env,
+            )
+            if listing.returncode != 0:
+                return None
+            files = frozenset(
+                os.fsdecode(path) for path in listing.stdout.split(b"\0") if path
+            )
+        except (OSError, subprocess.TimeoutExpired, UnicodeDecodeError) as e:
+            logger.warning(f"[WorktreeManager] Could not list worktree files: {e}")
+            return None
+
+        with _tracked_files_lock:
+            if len(_tracked_files_cache) >= MAX_CACHED_FILE_LISTINGS:
+                # Drop the oldest listing (dicts keep insertion order)
+                _tracked_files_cache.pop(next(iter(_tracked_files_cache)))
+            _tracked_files_cache[head_sha] = files
+        return files
+
     def get_worktree_info(self) -> list[WorktreeInfo]:
         """
         Get information about all PR worktrees.
@@ -451,6 +451,14 @@ class ParallelOrchestratorResponse(BaseModel):
     verdict_reasoning: str = Field(description="Explanation for the verdict")
 
 
+class SpecialistReviewResponse(BaseModel):
+    """Response schema for one specialist session over a set of PR files."""
+
+    findings: list[ParallelOrchestratorFinding] = Field(
+        default_factory=list, description="Issues found in the reviewed files"
+    )
+
+
 # =============================================================================
 # Parallel Follow-up Review Response (SDK Subagents for Follow-up)
 # =============================================================================
@@ -16,12 +16,14 @@ from pathlib import Path
 
 try:
     from ...analysis.test_discovery import TestDiscovery
+    from ...analysis.test_impact import select_impacted_tests, selected_test_command
     from ...core.client import create_client
     from ..context_gatherer import PRContext
     from ..models import PRReviewFinding, ReviewSeverity
     from .category_utils import map_category
 except (ImportError, ValueError, SystemError):
     from analysis.test_discovery import TestDiscovery
+    from analysis.test_impact import select_impacted_tests, selected_test_command
     from category_utils import map_category
     from context_gatherer import PRContext
     from core.client import create_client
@@ -44,6 +46,12 @@ class TestResult:
     total_count: int = 0
     coverage: float | None = None
     error: str | None = None
+    # Test files that ran; None when the whole suite ran
+    test_files: list[str] | None = None
+    selection_reason: str | None = None
+    # No test was impacted by the changes (e.g. docs only): nothing ran,
+    # and nothing failed
+    skipped: bool = False
 
 
 @dataclass
@@ -342,16 +350,23 @@ Output findings in JSON format:
 async def run_tests(
     project_dir: Path,
     test_paths: list[str] | None = None,
+    changed_files: list[str] | None = None,
 ) -> TestResult:
     """
-    Run project test suite.
+    Run project tests.
+
+    With changed_files, only the tests impacted by those files run (see
+    analysis.test_impact); the full suite runs when the impact can't be
+    mapped with confidence or the framework can't run individual files.
 
     Args:
         project_dir: Project root directory
         test_paths: Specific test paths to run (optional)
+        changed_files: Files changed by the PR, to select impacted tests (optional)
 
     Returns:
-        TestResult with execution status and results
+        TestResult with execution status and results (skipped, and passed,
+        when the changed files impact no test)
     """
     logger.info("[Orchestrator] Running tests...")
 
@@ -371,6 +386,34 @@ async def run_tests(
                 executed=False, passed=False, error="No test command available"
             )
 
+        test_files = None
+        selection_reason = None
+        if test_paths is None and changed_files:
+            selection = select_impacted_tests(project_dir, changed_files)
+            selection_reason = selection.reason
+            logger.info(f"[Orchestrator] Test selection: {selection.reason}")
+            if not selection.full_suite:
+                if not selection.test_files:
+                    return TestResult(
+                        executed=False,
+                        passed=True,
+                        test_files=[],
+                        selection_reason=selection_reason,
+                        skipped=True,
+                    )
+                test_paths = selection.test_files
+
+        if test_paths:
+            selected_cmd = selected_test_command(test_info, test_paths)
+            if selected_cmd:
+                test_cmd = selected_cmd
+                test_files = list(test_paths)
+            else:
+                logger.info(
+                    "[Orchestrator] Framework can't run selected files, "
+                    "running the full suite"
+                )
+
         # Execute tests with timeout
         logger.info(f"[Orchestrator] Executing: {test_cmd}")
         proc = await asyncio.create_subprocess_shell(
@@ -388,7 +431,13 @@ async def run_tests(
         except asyncio.TimeoutError:
             logger.error("[Orchestrator] Tests timed out after 5 minutes")
             proc.kill()
-            return TestResult(executed=True, passed=False, error="Timeout after 5min")
+            return TestResult(
+                executed=True,
+                passed=False,
+                error="Timeout after 5min",
+                test_files=test_files,
+                selection_reason=selection_reason,
+            )
 
         passed = proc.returncode == 0
         logger.info(f"[Orchestrator] Tests {'passed' if passed else 'failed'}")
@@ -397,6 +446,8 @@ async def run_tests(
             executed=True,
             passed=passed,
             error=None if passed else stderr.decode("utf-8")[:500],
+            test_files=test_files,
+            selection_reason=selection_reason,
         )
 
     except Exception as e:
@@ -0,0 +1,231 @@
+"""
+Shared Rate Limit State
+=======================
+
+SQLite-backed state that lets every runner process on the machine share one
+GitHub token bucket and one AI cost ledger.
+
+The frontend routinely runs several runners at once (review, triage,
+autofix). With in-process limiters each of them believes it owns the whole
+budget; here they coordinate through one database instead:
+
+- Buckets store their level and the wall-clock time it was last updated, so
+  any process can refill and take tokens inside a single ``BEGIN IMMEDIATE``
+  transaction.
+- Processes that have to wait join a FIFO queue of waiters, and only the
+  head of the queue may take tokens, so a busy runner cannot starve the
+  others. Waiters refresh a heartbeat while they wait; the entries of a
+  process that died are dropped once their heartbeat goes stale.
+- Every AI operation is appended to a cost ledger, and the budget check and
+  the insert happen in one transaction, so concurrent runners cannot
+  overspend between them.
+
+The database lives in ``~/.auto-claude/github`` by default (WAL mode, so
+readers never block the writer).
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+
+from core.sqlite_store import SQLiteStore
+
+SHARED_LIMITS_DB_FILE = "rate_limits.db"
+
+# Machine-wide default location, next to the other per-user state
+DEFAULT_SHARED_STATE_DIR = Path("~/.auto-claude/github").expanduser()
+
+# A waiter that has not polled for this long is assumed dead
+WAITER_TTL_SECONDS = 10.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS waiters (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    bucket TEXT NOT NULL,
+    heartbeat REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_waiters_bucket ON waiters (bucket, id);
+CREATE TABLE IF NOT EXISTS costs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp REAL NOT NULL,
+    operation TEXT,
+    model TEXT,
+    input_tokens INTEGER,
+    output_tokens INTEGER,
+    cost REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_costs_timestamp ON costs (timestamp);
+"""
+
+
+class SharedLimitStore(SQLiteStore):
+    """
+    Cross-process token buckets and cost ledger in one SQLite database.
+
+    Args:
+        state_dir: Directory holding the database (created if needed)
+    """
+
+    def __init__(self, state_dir: Path):
+        self.state_dir = Path(state_dir)
+        super().__init__(self.state_dir / SHARED_LIMITS_DB_FILE, _SCHEMA)
+
+    # ------------------------------------------------------------------
+    # Token buckets
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _level(
+        conn: sqlite3.Connection,
+        bucket: str,
+        capacity: int,
+        refill_rate: float,
+        now: float,
+    ) -> float:
+        row = conn.execute(
+            "SELECT tokens, updated_at FROM buckets WHERE name = ?", (bucket,)
+        ).fetchone()
+        if row is None:
+            return float(capacity)
+        tokens, updated_at = row
+        # Clamp: another machine clock step must not mint or burn tokens
+        elapsed = max(0.0, now - updated_at)
+        return min(float(capacity), tokens + elapsed * refill_rate)
+
+    def take(
+        self,
+        bucket: str,
+        capacity: int,
+        refill_rate: float,
+        tokens: int = 1,
+        waiter_id: int | None = None,
+    ) -> tuple[bool, float]:
+        """
+        Take tokens if available and it is the caller's turn.
+
+        Without a waiter_id the call only succeeds while nobody is queued.
+        With one, it refreshes the waiter's heartbeat and only succeeds at the
+        head of the queue; the waiter is dequeued on success.
+
+        Args:
+            bucket: Bucket name
+            capacity: Maximum number of tokens
+            refill_rate: Tokens added per second
+            tokens: Number of tokens to take
+            waiter_id: Queue entry from enqueue(), if waiting
+
+        Returns:
+            (acquired, seconds until the tokens could be available)
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM waiters WHERE bucket = ? AND heartbeat < ?",
+                (bucket, now - WAITER_TTL_SECONDS),
+            )
+            if waiter_id is not None:
+                conn.execute(
+                    "UPDATE waiters SET heartbeat = ? WHERE id = ?", (now, waiter_id)
+                )
+            head = conn.execute(
+                "SELECT id FROM waiters WHERE bucket = ? ORDER BY id LIMIT 1",
+                (bucket,),
+            ).fetchone()
+            level = self._level(conn, bucket, capacity, refill_rate, now)
+            wait = max(0.0, (tokens - level) / refill_rate)
+
+            if head is not None and head[0] != waiter_id:
+                return False, wait
+            if level < tokens:
+                return False, wait
+
+            conn.execute(
+                "INSERT INTO buckets (name, tokens, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET "
+                "tokens = excluded.tokens, updated_at = excluded.updated_at",
+                (bucket, level - tokens, now),
+            )
+            if waiter_id is not None:
+                conn.execute("DELETE FROM waiters WHERE id = ?", (waiter_id,))
+            return True, 0.0
+
+    def enqueue(self, bucket: str) -> int:
+        """Join the queue of processes waiting on a bucket."""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "INSERT INTO waiters (bucket, heartbeat) VALUES (?, ?)",
+                (bucket, time.time()),
+            )
+            return cursor.lastrowid
+
+    def dequeue(self, waiter_id: int) -> None:
+        """Leave the queue (timeout or cancellation)."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM waiters WHERE id = ?", (waiter_id,))
+
+    def available(self, bucket: str, capacity: int, refill_rate: float) -> float:
+        """Current number of tokens in a bucket."""
+        with self._transaction(write=False) as conn:
+            return self._level(conn, bucket, capacity, refill_rate, time.time())
+
+    # ------------------------------------------------------------------
+    # Cost ledger
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _spent(conn: sqlite3.Connection, since: float) -> float:
+        row = conn.execute(
+            "SELECT COALESCE(SUM(cost), 0) FROM costs WHERE timestamp >= ?", (since,)
+        ).fetchone()
+        return float(row[0])
+
+    def record_cost(
+        self,
+        cost: float,
+        cost_limit: float,
+        window: float,
+        operation: str,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+    ) -> tuple[bool, float]:
+        """
+        Append an operation to the ledger unless it would exceed the budget.
+
+        Args:
+            cost: Cost of the operation in dollars
+            cost_limit: Budget shared by all processes over the window
+            window: Budget window in seconds
+            operation: Operation name
+            model: Model identifier
+            input_tokens: Number of input tokens
+            output_tokens: Number of output tokens
+
+        Returns:
+            (recorded, total spent in the window including this operation)
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            spent = self._spent(conn, now - window)
+            if spent + cost > cost_limit:
+                return False, spent + cost
+            conn.execute(
+                "INSERT INTO costs (timestamp, operation, model, input_tokens, "
+                "output_tokens, cost) VALUES (?, ?, ?, ?, ?, ?)",
+                (now, operation, model, input_tokens, output_tokens, cost),
+            )
+            # Entries older than the window no longer count against anything
+            conn.execute("DELETE FROM costs WHERE timestamp < ?", (now - window,))
+            return True, spent + cost
+
+    def spent(self, window: float) -> float:
+        """Total cost recorded by all processes over the window."""
+        with self._transaction(write=False) as conn:
+            return self._spent(conn, time.time() - window)
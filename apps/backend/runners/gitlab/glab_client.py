@@ -4,12 +4,17 @@ GitLab API Client
 
 Client for GitLab API operations.
 Uses direct API calls with PRIVATE-TOKEN authentication.
+
+List endpoints are paginated: _fetch_all follows GitLab's X-Next-Page header
+until the last page, so large MRs (hundreds of files or commits) are fetched
+completely instead of stopping at the first page.
 """
 
 from __future__ import annotations
 
 import json
 import time
+import urllib.error
 import urllib.parse
 import urllib.request
 from dataclasses import dataclass
@@ -18,6 +23,16 @@ from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Any
 
+# Import safe_print for BrokenPipeError handling
+try:
+    from core.io_utils import safe_print
+except ImportError:
+    # Fallback for direct script execution
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from core.io_utils import safe_print
+
 
 @dataclass
 class GitLabConfig:
@@ -28,6 +43,13 @@ class GitLabConfig:
     instance_url: str
 
 
+# Items per page for paginated endpoints (GitLab's maximum)
+PER_PAGE = 100
+
+# Stop following pages beyond this (guards against runaway pagination)
+MAX_PAGES = 100
+
+
 def encode_project_path(project: str) -> str:
     """URL-encode a project path for API calls."""
     return urllib.parse.quote(project, safe="")
@@ -84,12 +106,15 @@ class GitLabClient:
         self.config = config
         self.default_timeout = default_timeout
 
-    def _api_url(self, endpoint: str) -> str:
+    def _api_url(self, endpoint: str, params: dict | None = None) -> str:
         """Build full API URL."""
         base = self.config.instance_url.rstrip("/")
         if not endpoint.startswith("/"):
             endpoint = f"/{endpoint}"
-        return f"{base}/api/v4{endpoint}"
+        url = f"{base}/api/v4{endpoint}"
+        if params:
+            url = f"{url}?{urllib.parse.urlencode(params)}"
+        return url
 
     def _fetch(
         self,
@@ -100,8 +125,57 @@ class GitLabClient:
         max_retries: int = 3,
     ) -> Any:
         """Make an API request to GitLab with rate limit handling."""
+        return self._request(endpoint, method, data, timeout, max_retries)[0]
+
+    def _fetch_all(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        per_page: int = PER_PAGE,
+        max_pages: int = MAX_PAGES,
+    ) -> list:
+        """
+        Fetch every page of a list endpoint.
+
+        Follows the X-Next-Page header (empty on the last page). Without the
+        header, a full page is taken to mean there may be another one.
+        """
+        items: list = []
+        page: int | None = 1
+        pages = 0
+        while page and pages < max_pages:
+            body, headers = self._request(
+                endpoint, params={**(params or {}), "page": page, "per_page": per_page}
+            )
+            body = body or []
+            items.extend(body)
+            pages += 1
+
+            next_page = headers.get("X-Next-Page")
+            if next_page is not None:
+                page = int(next_page) if next_page.strip() else None
+            else:
+                page = page + 1 if len(body) >= per_page else None
+
+        if page and pages >= max_pages:
+            safe_print(
+                f"[GitLab] Stopped after {max_pages} pages of {endpoint}",
+                flush=True,
+            )
+        return items
+
+    def _request(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        data: dict | None = None,
+        timeout: float | None = None,
+        max_retries: int = 3,
+        params: dict | None = None,
+    ) -> tuple[Any, Any]:
+        """Make an API request; returns (parsed body, response headers)."""
         validate_endpoint(endpoint)
-        url = self._api_url(endpoint)
+        url = self._api_url(endpoint, params)
         headers = {
             "PRIVATE-TOKEN": self.config.token,
             "Content-Type": "application/json",
@@ -125,10 +199,10 @@ class GitLabClient:
                     req, timeout=timeout or self.default_timeout
                 ) as response:
                     if response.status == 204:
-                        return None
+                        return None, response.headers
                     response_body = response.read().decode("utf-8")
                     try:
-                        return json.loads(response_body)
+                        return json.loads(response_body), response.headers
                     except json.JSONDecodeError as e:
                         raise Exception(
                             f"Invalid JSON response from GitLab: {e}"
@@ -185,20 +259,37 @@ class GitLabClient:
             f"/projects/{encoded_project}/merge_requests/{mr_iid}/changes"
         )
 
+    def get_mr_diffs(self, mr_iid: int) -> list[dict]:
+        """
+        Get the changed files of an MR, all pages.
+
+        Uses the paginated diffs endpoint (GitLab 15.7+); older instances
+        fall back to the single-response changes endpoint.
+        """
+        encoded_project = encode_project_path(self.config.project)
+        try:
+            return self._fetch_all(
+                f"/projects/{encoded_project}/merge_requests/{mr_iid}/diffs"
+            )
+        except Exception as e:
+            cause = e.__cause__
+            if not (isinstance(cause, urllib.error.HTTPError) and cause.code == 404):
+                raise
+        return self.get_mr_changes(mr_iid).get("changes", [])
+
     def get_mr_diff(self, mr_iid: int) -> str:
         """Get the full diff for an MR."""
-        changes = self.get_mr_changes(mr_iid)
         diffs = []
-        for change in changes.get("changes", []):
+        for change in self.get_mr_diffs(mr_iid):
             diff = change.get("diff", "")
             if diff:
                 diffs.append(diff)
         return "\n".join(diffs)
 
     def get_mr_commits(self, mr_iid: int) -> list[dict]:
-        """Get commits for an MR."""
+        """Get commits for an MR, all pages."""
         encoded_project = encode_project_path(self.config.project)
-        return self._fetch(
+        return self._fetch_all(
             f"/projects/{encoded_project}/merge_requests/{mr_iid}/commits"
         )
 
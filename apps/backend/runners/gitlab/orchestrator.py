@@ -9,6 +9,7 @@ Main coordinator for GitLab automation workflows:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import traceback
 import urllib.error
@@ -134,14 +135,13 @@ class GitLabOrchestrator:
         """Gather context for an MR."""
         safe_print(f"[GitLab] Fetching MR !{mr_iid} data...")
 
-        # Get MR details
-        mr_data = self.client.get_mr(mr_iid)
-
-        # Get changes
-        changes_data = self.client.get_mr_changes(mr_iid)
-
-        # Get commits
-        commits = self.client.get_mr_commits(mr_iid)
+        # MR details, changed files and commits are independent requests:
+        # fetch them concurrently (the client is blocking, so use threads)
+        mr_data, changes, commits = await asyncio.gather(
+            asyncio.to_thread(self.client.get_mr, mr_iid),
+            asyncio.to_thread(self.client.get_mr_diffs, mr_iid),
+            asyncio.to_thread(self.client.get_mr_commits, mr_iid),
+        )
 
         # Build diff from changes
         diffs = []
@@ -149,7 +149,7 @@ class GitLabOrchestrator:
         total_deletions = 0
         changed_files = []
 
-        for change in changes_data.get("changes", []):
+        for change in changes:
             diff = change.get("diff", "")
             if diff:
                 diffs.append(diff)
@@ -3,13 +3,23 @@ MR Review Engine
 ================
 
 Core logic for AI-powered MR code review.
+
+Large MRs are split into chunks of whole files (MAX_CHUNK_DIFF_CHARS of diff
+each) that are reviewed as concurrent sessions, instead of one prompt with a
+truncated diff; a file whose diff is larger than a chunk is split into parts
+of whole hunks. Findings are cached per file, keyed on the content SHA of the
+file's change, so a re-review only sends the changed files back to the model.
+A file is only cached once every part of it was reviewed in full, and only
+if every finding of its chunks could be filed under one of the chunk's files.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 import uuid
+from collections import Counter
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
@@ -23,6 +33,12 @@ try:
         ReviewCategory,
         ReviewSeverity,
     )
+    from .review_cache import (
+        REVIEW_CACHE_DB_FILE,
+        MRReviewCache,
+        content_sha,
+        prompt_version,
+    )
 except ImportError:
     # Fallback for direct script execution (not as a module)
     from models import (
@@ -33,6 +49,12 @@ except ImportError:
         ReviewCategory,
         ReviewSeverity,
     )
+    from services.review_cache import (
+        REVIEW_CACHE_DB_FILE,
+        MRReviewCache,
+        content_sha,
+        prompt_version,
+    )
 
 # Import safe_print for BrokenPipeError handling
 try:
@@ -46,6 +68,25 @@ except ImportError:
     from core.io_utils import safe_print
 
 
+# Diff characters per review session; larger MRs are split into chunks
+MAX_CHUNK_DIFF_CHARS = 40_000
+
+# Diff characters of one prompt; beyond this the diff is truncated (only a
+# single line longer than a chunk gets there)
+MAX_PROMPT_DIFF_CHARS = 50_000
+
+# Review sessions running at once
+MAX_CONCURRENT_CHUNKS = 4
+
+# Least to most severe
+_VERDICT_ORDER = [
+    MergeVerdict.READY_TO_MERGE,
+    MergeVerdict.MERGE_WITH_CHANGES,
+    MergeVerdict.NEEDS_REVISION,
+    MergeVerdict.BLOCKED,
+]
+
+
 @dataclass
 class ProgressCallback:
     """Callback for progress updates."""
@@ -83,6 +124,146 @@ def sanitize_user_content(content: str, max_length: int = 100000) -> str:
     return sanitized
 
 
+def file_path(file: dict) -> str:
+    """Path of a changed file (its old path if it was deleted)."""
+    return file.get("new_path") or file.get("old_path") or "unknown"
+
+
+def file_diff(file: dict) -> str:
+    """Diff of a changed file with git headers naming the file."""
+    old_path = file.get("old_path") or file_path(file)
+    new_path = file_path(file)
+    return (
+        f"diff --git a/{old_path} b/{new_path}\n"
+        f"--- a/{old_path}\n+++ b/{new_path}\n{file.get('diff', '')}"
+    )
+
+
+def file_label(file: dict) -> str:
+    """Path of a changed file, and which part of its diff it holds."""
+    if "part" in file:
+        part, parts = file["part"]
+        return f"{file_path(file)} (part {part} of {parts})"
+    return file_path(file)
+
+
+def split_file(file: dict, max_chars: int) -> list[dict]:
+    """
+    Split a changed file whose diff exceeds max_chars into parts.
+
+    Parts are made of whole hunks; a hunk larger than max_chars is cut between
+    lines. Each part is a copy of the file with part of its diff, and a
+    "part" of (part number, number of parts).
+    """
+    if len(file_diff(file)) <= max_chars:
+        return [file]
+    budget = max(max_chars - len(file_diff({**file, "diff": ""})), 1)
+
+    pieces: list[str] = []
+    for hunk in re.split(r"(?m)^(?=@@)", file.get("diff", "")):
+        if len(hunk) <= budget:
+            pieces.append(hunk)
+            continue
+        header, *lines = hunk.splitlines(keepends=True)
+        piece = header  # The hunk header stays with the first line after it
+        for line in lines:
+            if piece != header and len(piece) + len(line) > budget:
+                pieces.append(piece)
+                piece = ""
+            piece += line
+        pieces.append(piece)
+
+    diffs: list[str] = []
+    for piece in pieces:
+        if diffs and len(diffs[-1]) + len(piece) <= budget:
+            diffs[-1] += piece
+        elif piece:
+            diffs.append(piece)
+    return [
+        {**file, "diff": diff, "part": (i, len(diffs))}
+        for i, diff in enumerate(diffs, 1)
+    ]
+
+
+def chunk_diff(chunk: list[dict]) -> str:
+    """Diff of a review chunk."""
+    return "\n".join(file_diff(f) for f in chunk)
+
+
+def chunk_files(files: list[dict], max_chars: int) -> list[list[dict]]:
+    """
+    Split changed files into review chunks of whole files.
+
+    Files keep their order; a chunk is closed before it would exceed
+    max_chars of diff, and a file larger than that is split into parts of
+    whole hunks (see split_file), each reviewed as a file of its own.
+    """
+    chunks: list[list[dict]] = []
+    current: list[dict] = []
+    size = 0
+    for file in (part for f in files for part in split_file(f, max_chars)):
+        file_size = len(file_diff(file))
+        if current and size + file_size > max_chars:
+            chunks.append(current)
+            current, size = [], 0
+        current.append(file)
+        size += file_size
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def assign_finding_paths(findings: list[MRReviewFinding], paths: set[str]) -> bool:
+    """
+    Point each finding's file at the reviewed path it refers to.
+
+    The model may write "./src/a.py", "b/src/a.py" or just "a.py"; a path that
+    ends with exactly one reviewed path's trailing components is rewritten to
+    that path.
+
+    Returns:
+        Whether every finding refers to one of the paths
+    """
+    assigned = True
+    for finding in findings:
+        if finding.file in paths:
+            continue
+        name = re.sub(r"^(?:\./|[ab]/|/)+", "", finding.file or "")
+        if name in paths:
+            finding.file = name
+            continue
+        matches = [p for p in paths if name and p.endswith(f"/{name}")]
+        if len(matches) == 1:
+            finding.file = matches[0]
+        else:
+            assigned = False
+    return assigned
+
+
+def verdict_for_findings(findings: list[MRReviewFinding]) -> MergeVerdict:
+    """Verdict implied by the most severe of the findings."""
+    severities = {f.severity for f in findings}
+    if ReviewSeverity.CRITICAL in severities:
+        return MergeVerdict.BLOCKED
+    if ReviewSeverity.HIGH in severities:
+        return MergeVerdict.NEEDS_REVISION
+    if findings:
+        return MergeVerdict.MERGE_WITH_CHANGES
+    return MergeVerdict.READY_TO_MERGE
+
+
+def _has_review_json(result_text: str) -> bool:
+    """Whether a review response contains parsable structured output."""
+    json_match = re.search(r"```json\s*([\s\S]*?)\s*```", result_text)
+    if not json_match:
+        return False
+    try:
+        json.loads(json_match.group(1))
+    except json.JSONDecodeError:
+        return False
+    return True
+
+
 class MRReviewEngine:
     """Handles MR review workflow using Claude AI."""
 
@@ -164,30 +345,154 @@ Provide your review in the following JSON format:
         """
         Run the MR review.
 
+        Files with cached findings for their current change are reused; the
+        rest are split into chunks reviewed concurrently, and the findings of
+        every file whose chunks all complete are cached (even if another one
+        fails). Files reviewed from a truncated diff aren't cached, nor the
+        files of a chunk with a finding about another file.
+
         Returns:
             Tuple of (findings, verdict, summary, blockers)
         """
-        from core.client import create_client
-
         self._report_progress(
             "analyzing", 30, "Running AI analysis...", mr_iid=context.mr_iid
         )
 
+        cache = MRReviewCache(self.gitlab_dir / "mr" / REVIEW_CACHE_DB_FILE)
+        version = prompt_version(self._get_review_prompt(), self.config.model or "")
+        shas = {
+            file_path(file): content_sha(file_path(file), file.get("diff", ""))
+            for file in context.changed_files
+        }
+        reused = cache.lookup(shas, version)
+        pending = [f for f in context.changed_files if file_path(f) not in reused]
+        if reused:
+            safe_print(
+                f"[AI] Reusing cached findings for {len(reused)} unchanged file(s)"
+            )
+
+        chunks = chunk_files(pending, MAX_CHUNK_DIFF_CHARS)
+        if not chunks and not reused:
+            # Nothing to split (no changed files): still review the MR once
+            chunks = [[]]
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHUNKS)
+        done = 0
+
+        async def review(chunk: list[dict], index: int) -> str:
+            nonlocal done
+            async with semaphore:
+                result_text = await self._review_chunk(
+                    context, chunk, index, len(chunks)
+                )
+            done += 1
+            self._report_progress(
+                "analyzing",
+                30 + 40 * done // len(chunks),
+                f"Reviewed {done}/{len(chunks)} part(s) of the diff",
+                mr_iid=context.mr_iid,
+            )
+            return result_text
+
+        results = await asyncio.gather(
+            *(review(chunk, i) for i, chunk in enumerate(chunks)),
+            return_exceptions=True,
+        )
+
+        findings: list[MRReviewFinding] = []
+        verdicts: list[MergeVerdict] = []
+        summaries: list[str] = []
+        errors: list[BaseException] = []
+        # Parts of each file, and how many of them were reviewed in full
+        parts = Counter(file_path(f) for chunk in chunks for f in chunk)
+        reviewed: Counter[str] = Counter()
+        reviewed_findings: list[MRReviewFinding] = []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, BaseException):
+                errors.append(result)
+                continue
+            chunk_findings, verdict, summary, _ = self._parse_review_result(result)
+            assigned = assign_finding_paths(
+                chunk_findings, {file_path(f) for f in chunk}
+            )
+            findings.extend(chunk_findings)
+            verdicts.append(verdict)
+            if summary:
+                summaries.append(summary)
+            # A finding that can't be filed under one of the chunk's files
+            # would be lost from the cache
+            if (
+                assigned
+                and _has_review_json(result)
+                and len(chunk_diff(chunk)) <= MAX_PROMPT_DIFF_CHARS
+            ):
+                reviewed.update(file_path(f) for f in chunk)
+                reviewed_findings.extend(chunk_findings)
+        cache.store(
+            {
+                path: shas[path]
+                for path, count in parts.items()
+                if reviewed[path] == count
+            },
+            version,
+            reviewed_findings,
+        )
+
+        if errors:
+            safe_print(f"[AI] Review error: {errors[0]}")
+            raise RuntimeError(f"Review failed: {errors[0]}") from errors[0]
+
+        self._report_progress(
+            "analyzing", 70, "Parsing review results...", mr_iid=context.mr_iid
+        )
+
+        reused_findings = [f for file in reused.values() for f in file]
+        if reused:
+            verdicts.append(verdict_for_findings(reused_findings))
+            summaries.append(
+                f"Findings for {len(reused)} unchanged file(s) were reused "
+                "from a previous review."
+            )
+        findings.extend(reused_findings)
+
+        verdict = max(verdicts, key=_VERDICT_ORDER.index)
+        blockers = [
+            f"{f.title} ({f.file}:{f.line})"
+            for f in findings
+            if f.severity in (ReviewSeverity.CRITICAL, ReviewSeverity.HIGH)
+        ]
+        return findings, verdict, "\n\n".join(summaries), blockers
+
+    async def _review_chunk(
+        self, context: MRContext, chunk: list[dict], index: int, total: int
+    ) -> str:
+        """Review one chunk of changed files; returns the response text."""
+        from core.client import create_client
+
         # Build the review context
         files_list = []
         for file in context.changed_files[:30]:
-            path = file.get("new_path", file.get("old_path", "unknown"))
-            files_list.append(f"- `{path}`")
+            files_list.append(f"- `{file_path(file)}`")
         if len(context.changed_files) > 30:
             files_list.append(f"- ... and {len(context.changed_files) - 30} more files")
         files_str = "\n".join(files_list)
 
+        diff_heading = "### Diff"
+        if total > 1 or len(chunk) < len(context.changed_files):
+            reviewed = ", ".join(f"`{file_label(f)}`" for f in chunk)
+            diff_heading = (
+                f"### Diff (part {index + 1} of {total})\n"
+                f"Review only the files in this part: {reviewed}"
+            )
+
         # Sanitize and truncate user-provided content
         sanitized_title = sanitize_user_content(context.title, max_length=500)
         sanitized_description = sanitize_user_content(
             context.description or "No description provided.", max_length=10000
         )
-        diff_content = sanitize_user_content(context.diff, max_length=50000)
+        diff_content = sanitize_user_content(
+            chunk_diff(chunk), max_length=MAX_PROMPT_DIFF_CHARS
+        )
 
         # Wrap user-provided content in clear delimiters to prevent prompt injection
         # The AI should treat content between these markers as untrusted user input
@@ -211,7 +516,7 @@ Provide your review in the following JSON format:
 ### Files Changed
 {files_str}
 
-### Diff
+{diff_heading}
 ---USER CONTENT START---
 ```diff
 {diff_content}
@@ -237,28 +542,18 @@ Provide your review in the following JSON format:
         )
 
         result_text = ""
-        try:
-            async with client:
-                await client.query(prompt)
-
-                async for msg in client.receive_response():
-                    msg_type = type(msg).__name__
-                    if msg_type == "AssistantMessage" and hasattr(msg, "content"):
-                        for block in msg.content:
-                            # Must check block type - only TextBlock has .text attribute
-                            block_type = type(block).__name__
-                            if block_type == "TextBlock" and hasattr(block, "text"):
-                                result_text += block.text
-
-            self._report_progress(
-                "analyzing", 70, "Parsing review results...", mr_iid=context.mr_iid
-            )
-
-            return self._parse_review_result(result_text)
-
-        except Exception as e:
-            safe_print(f"[AI] Review error: {e}")
-            raise RuntimeError(f"Review failed: {e}") from e
+        async with client:
+            await client.query(prompt)
+
+            async for msg in client.receive_response():
+                msg_type = type(msg).__name__
+                if msg_type == "AssistantMessage" and hasattr(msg, "content"):
+                    for block in msg.content:
+                        # Must check block type - only TextBlock has .text attribute
+                        block_type = type(block).__name__
+                        if block_type == "TextBlock" and hasattr(block, "text"):
+                            result_text += block.text
+        return result_text
 
     def _parse_review_result(
         self, result_text: str
@@ -0,0 +1,148 @@
+"""
+MR Review Cache
+===============
+
+Per-file reuse of MR review findings across re-reviews.
+
+Findings are stored per changed file, keyed by:
+
+- the content SHA of the file's change (a hash of its path and diff, so the
+  same change reviewed again after a rebase or a push to another file hits
+  the cache), and
+- the prompt version (a hash of the review prompt and model), so changing
+  either invalidates everything.
+
+Files whose key is cached reuse the stored findings; only the rest go back to
+the model.
+
+The store is an SQLite database in the GitLab state directory (WAL mode, so
+concurrent runners can share it).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from pathlib import Path
+
+from core.sqlite_store import SQLiteStore
+
+try:
+    from ..models import MRReviewFinding
+except ImportError:
+    # Fallback for direct script execution (not as a module)
+    from models import MRReviewFinding
+
+logger = logging.getLogger(__name__)
+
+REVIEW_CACHE_DB_FILE = "review_cache.db"
+
+# Oldest entries are dropped beyond this
+MAX_CACHED_FILES = 20_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS file_findings (
+    content_sha TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    findings TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (content_sha, prompt_version)
+);
+"""
+
+
+def content_sha(path: str, diff: str) -> str:
+    """SHA of one file's change: its path and its diff."""
+    return hashlib.sha256(f"{path}\0{diff}".encode()).hexdigest()
+
+
+def prompt_version(*parts: str) -> str:
+    """Hash of everything that shapes the findings besides the files."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+class MRReviewCache(SQLiteStore):
+    """
+    SQLite store of MR review findings per file.
+
+    Args:
+        db_path: Database file (parent directory created if needed)
+        max_entries: Entries kept before the oldest are dropped
+    """
+
+    def __init__(self, db_path: Path, max_entries: int = MAX_CACHED_FILES):
+        super().__init__(db_path, _SCHEMA)
+        self.max_entries = max_entries
+
+    def lookup(
+        self, shas: dict[str, str], version: str
+    ) -> dict[str, list[MRReviewFinding]]:
+        """
+        Find the files whose findings can be reused.
+
+        Args:
+            shas: Content SHA of each changed file, keyed by file path
+            version: Prompt version of this review
+
+        Returns:
+            Cached findings keyed by file path
+        """
+        reused: dict[str, list[MRReviewFinding]] = {}
+        conn = self._connect()
+        for path, sha in shas.items():
+            row = conn.execute(
+                "SELECT findings FROM file_findings "
+                "WHERE content_sha = ? AND prompt_version = ?",
+                (sha, version),
+            ).fetchone()
+            if row is None:
+                continue
+            try:
+                reused[path] = [
+                    MRReviewFinding.from_dict(data) for data in json.loads(row[0])
+                ]
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable cached findings: {e}")
+        return reused
+
+    def store(
+        self,
+        shas: dict[str, str],
+        version: str,
+        findings: list[MRReviewFinding],
+    ) -> None:
+        """
+        Store the findings of freshly reviewed files.
+
+        Every file gets an entry (an empty one for files without findings).
+
+        Args:
+            shas: Content SHA of each reviewed file, keyed by file path
+            version: Prompt version of this review
+            findings: Findings of the review (other files' are ignored)
+        """
+        if not shas:
+            return
+        by_file: dict[str, list[dict]] = {path: [] for path in shas}
+        for finding in findings:
+            if finding.file in by_file:
+                by_file[finding.file].append(finding.to_dict())
+        now = time.time()
+
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO file_findings "
+                "(content_sha, prompt_version, findings, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (sha, version, json.dumps(by_file[path]), now)
+                    for path, sha in shas.items()
+                ],
+            )
+            self._trim(conn, "file_findings", self.max_entries)
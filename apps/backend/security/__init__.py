@@ -17,6 +17,7 @@ Main functions:
 - validate_command: Standalone validation function for testing
 - get_security_profile: Get or create security profile for a project
 - reset_profile_cache: Reset cached security profile
+- reset_verdict_cache: Reset cached command verdicts
 
 Command parsing:
 - extract_commands: Extract command names from shell strings
@@ -81,12 +82,16 @@ from .validator import (
     validate_zsh_command,
 )
 
+# Verdict caching
+from .verdict_cache import reset_verdict_cache
+
 __all__ = [
     # Main API
     "bash_security_hook",
     "validate_command",
     "get_security_profile",
     "reset_profile_cache",
+    "reset_verdict_cache",
     # Parsing utilities
     "extract_commands",
     "split_command_segments",
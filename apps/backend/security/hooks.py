@@ -14,7 +14,67 @@ from project_analyzer import BASE_COMMANDS, SecurityProfile, is_command_allowed
 
 from .parser import extract_commands, get_command_for_validation, split_command_segments
 from .profile import get_security_profile
+from .shell_validators import SHELL_INTERPRETERS
 from .validator import VALIDATORS
+from .verdict_cache import verdict_cache
+
+
+def _depends_on_state(cmd: str, cmd_segment: str) -> bool:
+    """
+    Whether a validator's verdict depends on more than the command and profile.
+
+    git commit scans the staged files for secrets, and shell -c validation
+    re-loads the profile of the agent's project directory.
+    """
+    if cmd in SHELL_INTERPRETERS:
+        return True
+    return cmd == "git" and "commit" in cmd_segment.split()
+
+
+def _check_command(command: str, profile: SecurityProfile) -> tuple[bool, str, bool]:
+    """
+    Check a command string against a security profile.
+
+    Returns:
+        (is_allowed, reason, cacheable) tuple
+    """
+    # Extract all commands from the command string
+    commands = extract_commands(command)
+
+    if not commands:
+        # Could not parse - fail safe by blocking
+        return (
+            False,
+            f"Could not parse command for security validation: {command}",
+            True,
+        )
+
+    # Split into segments for per-command validation
+    segments = split_command_segments(command)
+    cacheable = True
+
+    # Check each command against the allowlist
+    for cmd in commands:
+        # Check if command is allowed
+        is_allowed, reason = is_command_allowed(cmd, profile)
+        if not is_allowed:
+            return False, reason, cacheable
+
+        # Additional validation for sensitive commands
+        if cmd in VALIDATORS:
+            cmd_segment = get_command_for_validation(cmd, segments)
+            if not cmd_segment:
+                cmd_segment = command
+
+            if _depends_on_state(cmd, cmd_segment):
+                cacheable = False
+
+            validator = VALIDATORS[cmd]
+            allowed, reason = validator(cmd_segment)
+            if not allowed:
+                return False, reason, cacheable
+
+    return True, "", cacheable
 
 
 async def bash_security_hook(
@@ -27,10 +87,12 @@ async def bash_security_hook(
 
     This is the main security enforcement point. It:
     1. Validates tool_input structure (must be dict with 'command' key)
-    2. Extracts command names from the command string
-    3. Checks each command against the project's security profile
-    4. Runs additional validation for sensitive commands
-    5. Blocks disallowed commands with clear error messages
+    2. Reuses the verdict of an identical command against an unchanged
+       profile (see verdict_cache.py)
+    3. Extracts command names from the command string
+    4. Checks each command against the project's security profile
+    5. Runs additional validation for sensitive commands
+    6. Blocks disallowed commands with clear error messages
 
     Args:
         input_data: Dict containing tool_name and tool_input
@@ -91,44 +153,18 @@ async def bash_security_hook(
         profile = SecurityProfile()
         profile.base_commands = BASE_COMMANDS.copy()
 
-    # Extract all commands from the command string
-    commands = extract_commands(command)
-
-    if not commands:
-        # Could not parse - fail safe by blocking
-        return {
-            "decision": "block",
-            "reason": f"Could not parse command for security validation: {command}",
-        }
-
-    # Split into segments for per-command validation
-    segments = split_command_segments(command)
-
-    # Get all allowed commands
-    allowed = profile.get_all_allowed_commands()
-
-    # Check each command against the allowlist
-    for cmd in commands:
-        # Check if command is allowed
-        is_allowed, reason = is_command_allowed(cmd, profile)
-
-        if not is_allowed:
-            return {
-                "decision": "block",
-                "reason": reason,
-            }
-
-        # Additional validation for sensitive commands
-        if cmd in VALIDATORS:
-            cmd_segment = get_command_for_validation(cmd, segments)
-            if not cmd_segment:
-                cmd_segment = command
-
-            validator = VALIDATORS[cmd]
-            allowed, reason = validator(cmd_segment)
-            if not allowed:
-                return {"decision": "block", "reason": reason}
-
+    # Identical commands against an unchanged profile get the same verdict
+    cache_key = verdict_cache.key(command, cwd, profile)
+    verdict = verdict_cache.get(cache_key)
+    if verdict is None:
+        is_allowed, reason, cacheable = _check_command(command, profile)
+        if cacheable:
+            verdict_cache.put(cache_key, (is_allowed, reason))
+    else:
+        is_allowed, reason = verdict
+
+    if not is_allowed:
+        return {"decision": "block", "reason": reason}
     return {}
 
 
@@ -150,26 +186,5 @@ def validate_command(
         project_dir = Path.cwd()
 
     profile = get_security_profile(project_dir)
-    commands = extract_commands(command)
-
-    if not commands:
-        return False, "Could not parse command"
-
-    segments = split_command_segments(command)
-
-    for cmd in commands:
-        is_allowed_result, reason = is_command_allowed(cmd, profile)
-        if not is_allowed_result:
-            return False, reason
-
-        if cmd in VALIDATORS:
-            cmd_segment = get_command_for_validation(cmd, segments)
-            if not cmd_segment:
-                cmd_segment = command
-
-            validator = VALIDATORS[cmd]
-            allowed, reason = validator(cmd_segment)
-            if not allowed:
-                return False, reason
-
-    return True, ""
+    is_allowed, reason, _ = _check_command(command, profile)
+    return is_allowed, reason
@@ -6,6 +6,7 @@ Manages security profiles for projects, including caching and validation.
 Uses project_analyzer to create dynamic security profiles based on detected stacks.
 """
 
+import os
 from pathlib import Path
 
 from project_analyzer import (
@@ -25,6 +26,9 @@ _cached_project_dir: Path | None = None
 _cached_spec_dir: Path | None = None  # Track spec directory for cache key
 _cached_profile_mtime: float | None = None  # Track file modification time
 _cached_allowlist_mtime: float | None = None  # Track allowlist modification time
+# Arguments of the call that filled the cache, so repeated calls with the same
+# absolute paths (every bash hook call) skip re-resolving them
+_cached_request: tuple[str, str | None] | None = None
 
 
 def _get_profile_path(project_dir: Path) -> Path:
@@ -79,9 +83,19 @@ def get_security_profile(
     global _cached_spec_dir
     global _cached_profile_mtime
     global _cached_allowlist_mtime
+    global _cached_request
 
-    project_dir = Path(project_dir).resolve()
-    resolved_spec_dir = Path(spec_dir).resolve() if spec_dir else None
+    request = (str(project_dir), str(spec_dir) if spec_dir else None)
+    if (
+        _cached_profile is not None
+        and request == _cached_request
+        and all(os.path.isabs(path) for path in request if path)
+    ):
+        project_dir = _cached_project_dir
+        resolved_spec_dir = _cached_spec_dir
+    else:
+        project_dir = Path(project_dir).resolve()
+        resolved_spec_dir = Path(spec_dir).resolve() if spec_dir else None
 
     # Check if cache is valid (both project_dir and spec_dir must match)
     if (
@@ -110,6 +124,7 @@ def get_security_profile(
     _cached_spec_dir = resolved_spec_dir
     _cached_profile_mtime = _get_profile_mtime(project_dir)
     _cached_allowlist_mtime = _get_allowlist_mtime(project_dir)
+    _cached_request = request
 
     return _cached_profile
 
@@ -121,8 +136,10 @@ def reset_profile_cache() -> None:
     global _cached_spec_dir
     global _cached_profile_mtime
     global _cached_allowlist_mtime
+    global _cached_request
     _cached_profile = None
     _cached_project_dir = None
     _cached_spec_dir = None
     _cached_profile_mtime = None
     _cached_allowlist_mtime = None
+    _cached_request = None
@@ -0,0 +1,93 @@
+"""
+Verdict Cache
+=============
+
+Bounded cache of bash_security_hook verdicts.
+
+Agents repeat near-identical commands hundreds of times per session, and each
+hook call would otherwise re-parse the command and re-check every
+sub-command against the allowlist. A verdict is cached under the command, the
+project directory and a fingerprint of the security profile's allowlist, so
+any change to the profile (a re-analysis, an edited allowlist file) makes
+earlier verdicts unreachable. Least recently used verdicts are evicted.
+"""
+
+import threading
+from collections import OrderedDict
+
+from project_analyzer import SecurityProfile
+
+# Maximum number of cached verdicts (a session uses a few hundred)
+MAX_CACHED_VERDICTS = 2048
+
+# (allowed, reason)
+Verdict = tuple[bool, str]
+
+
+def profile_fingerprint(profile: SecurityProfile) -> int:
+    """Fingerprint of everything in a profile that affects a verdict."""
+    return hash(
+        (
+            frozenset(profile.base_commands),
+            frozenset(profile.stack_commands),
+            frozenset(profile.script_commands),
+            frozenset(profile.custom_commands),
+            frozenset(profile.custom_scripts.shell_scripts),
+        )
+    )
+
+
+class VerdictCache:
+    """
+    Thread-safe LRU cache of command verdicts.
+
+    Args:
+        max_size: Maximum number of verdicts kept
+    """
+
+    def __init__(self, max_size: int = MAX_CACHED_VERDICTS):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._verdicts: OrderedDict[tuple, Verdict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(command: str, project_dir: str, profile: SecurityProfile) -> tuple:
+        """Cache key of a command checked against a project's profile."""
+        return (command.strip(), project_dir, profile_fingerprint(profile))
+
+    def get(self, key: tuple) -> Verdict | None:
+        with self._lock:
+            verdict = self._verdicts.get(key)
+            if verdict is None:
+                self.misses += 1
+                return None
+            self._verdicts.move_to_end(key)
+            self.hits += 1
+            return verdict
+
+    def put(self, key: tuple, verdict: Verdict) -> None:
+        with self._lock:
+            self._verdicts[key] = verdict
+            self._verdicts.move_to_end(key)
+            while len(self._verdicts) > self.max_size:
+                self._verdicts.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._verdicts.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._verdicts)
+
+
+# Shared by every hook call in the process
+verdict_cache = VerdictCache()
+
+
+def reset_verdict_cache() -> None:
+    """Forget all cached verdicts (useful for testing)."""
+    verdict_cache.clear()
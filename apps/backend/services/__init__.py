@@ -8,9 +8,11 @@ Background services and orchestration for Auto Claude.
 from .context import ServiceContext
 from .orchestrator import ServiceOrchestrator
 from .recovery import RecoveryManager
+from .recovery_store import RecoveryStore
 
 __all__ = [
     "ServiceContext",
     "ServiceOrchestrator",
     "RecoveryManager",
+    "RecoveryStore",
 ]
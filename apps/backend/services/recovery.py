@@ -11,15 +11,19 @@ Key Features:
 - Attempt history tracking across sessions
 - Smart retry with different approaches
 - Escalation to human when stuck
+
+State lives in a per-spec SQLite store (see recovery_store.py); the JSON
+files in memory/ are kept up to date as exports for other readers.
 """
 
-import json
 import subprocess
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 
+from .recovery_store import RecoveryStore
+
 
 class FailureType(Enum):
     """Types of failures that can occur during autonomous builds."""
@@ -63,76 +67,29 @@ class RecoveryManager:
         self.spec_dir = spec_dir
         self.project_dir = project_dir
         self.memory_dir = spec_dir / "memory"
-        self.attempt_history_file = self.memory_dir / "attempt_history.json"
-        self.build_commits_file = self.memory_dir / "build_commits.json"
-
-        # Ensure memory directory exists
-        self.memory_dir.mkdir(parents=True, exist_ok=True)
-
-        # Initialize files if they don't exist
-        if not self.attempt_history_file.exists():
-            self._init_attempt_history()
-
-        if not self.build_commits_file.exists():
-            self._init_build_commits()
-
-    def _init_attempt_history(self) -> None:
-        """Initialize the attempt history file."""
-        initial_data = {
-            "subtasks": {},
-            "stuck_subtasks": [],
-            "metadata": {
-                "created_at": datetime.now().isoformat(),
-                "last_updated": datetime.now().isoformat(),
-            },
-        }
-        with open(self.attempt_history_file, "w", encoding="utf-8") as f:
-            json.dump(initial_data, f, indent=2)
-
-    def _init_build_commits(self) -> None:
-        """Initialize the build commits tracking file."""
-        initial_data = {
-            "commits": [],
-            "last_good_commit": None,
-            "metadata": {
-                "created_at": datetime.now().isoformat(),
-                "last_updated": datetime.now().isoformat(),
-            },
-        }
-        with open(self.build_commits_file, "w", encoding="utf-8") as f:
-            json.dump(initial_data, f, indent=2)
 
-    def _load_attempt_history(self) -> dict:
-        """Load attempt history from JSON file."""
-        try:
-            with open(self.attempt_history_file, encoding="utf-8") as f:
-                return json.load(f)
-        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-            self._init_attempt_history()
-            with open(self.attempt_history_file, encoding="utf-8") as f:
-                return json.load(f)
-
-    def _save_attempt_history(self, data: dict) -> None:
-        """Save attempt history to JSON file."""
-        data["metadata"]["last_updated"] = datetime.now().isoformat()
-        with open(self.attempt_history_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-
-    def _load_build_commits(self) -> dict:
-        """Load build commits from JSON file."""
-        try:
-            with open(self.build_commits_file, encoding="utf-8") as f:
-                return json.load(f)
-        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-            self._init_build_commits()
-            with open(self.build_commits_file, encoding="utf-8") as f:
-                return json.load(f)
-
-    def _save_build_commits(self, data: dict) -> None:
-        """Save build commits to JSON file."""
-        data["metadata"]["last_updated"] = datetime.now().isoformat()
-        with open(self.build_commits_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        # Creates memory/ and the JSON exports if they don't exist yet
+        self.store = RecoveryStore(self.memory_dir)
+        self.attempt_history_file = self.store.attempt_history_file
+        self.build_commits_file = self.store.build_commits_file
+
+    def flush(self) -> None:
+        """
+        Bring attempt_history.json and build_commits.json up to date.
+
+        Writes only mark the JSON exports stale; call this before they are
+        read or synced to another copy of the spec.
+        """
+        self.store.flush_exports()
+
+    def export_attempt_history(self) -> dict:
+        """
+        Get the full attempt history in the attempt_history.json format.
+
+        Returns:
+            Dict with "subtasks" and "stuck_subtasks"
+        """
+        return self.store.export_attempt_history()
 
     def classify_failure(self, error: str, subtask_id: str) -> FailureType:
         """
@@ -193,9 +150,7 @@ class RecoveryManager:
         Returns:
             Number of attempts
         """
-        history = self._load_attempt_history()
-        subtask_data = history["subtasks"].get(subtask_id, {})
-        return len(subtask_data.get("attempts", []))
+        return self.store.get_attempt_count(subtask_id)
 
     def record_attempt(
         self,
@@ -215,13 +170,6 @@ class RecoveryManager:
             approach: Description of the approach taken
             error: Error message if failed
         """
-        history = self._load_attempt_history()
-
-        # Initialize subtask entry if it doesn't exist
-        if subtask_id not in history["subtasks"]:
-            history["subtasks"][subtask_id] = {"attempts": [], "status": "pending"}
-
-        # Add the attempt
         attempt = {
             "session": session,
             "timestamp": datetime.now().isoformat(),
@@ -229,15 +177,8 @@ class RecoveryManager:
             "success": success,
             "error": error,
         }
-        history["subtasks"][subtask_id]["attempts"].append(attempt)
-
-        # Update status
-        if success:
-            history["subtasks"][subtask_id]["status"] = "completed"
-        else:
-            history["subtasks"][subtask_id]["status"] = "failed"
-
-        self._save_attempt_history(history)
+        # Appends the attempt and sets status to completed/failed atomically
+        self.store.record_attempt(subtask_id, attempt)
 
     def is_circular_fix(self, subtask_id: str, current_approach: str) -> bool:
         """
@@ -250,16 +191,12 @@ class RecoveryManager:
         Returns:
             True if this appears to be a circular fix attempt
         """
-        history = self._load_attempt_history()
-        subtask_data = history["subtasks"].get(subtask_id, {})
-        attempts = subtask_data.get("attempts", [])
-
-        if len(attempts) < 2:
-            return False
-
         # Check if last 3 attempts used similar approaches
         # Simple similarity check: look for repeated keywords
-        recent_attempts = attempts[-3:] if len(attempts) >= 3 else attempts
+        recent_attempts = self.store.get_attempts(subtask_id, limit=3)
+
+        if len(recent_attempts) < 2:
+            return False
 
         # Extract key terms from current approach (ignore common words)
         stop_words = {
@@ -389,8 +326,7 @@ class RecoveryManager:
         Returns:
             Commit hash or None
         """
-        commits = self._load_build_commits()
-        return commits.get("last_good_commit")
+        return self.store.get_last_good_commit()
 
     def record_good_commit(self, commit_hash: str, subtask_id: str) -> None:
         """
@@ -400,18 +336,12 @@ class RecoveryManager:
             commit_hash: Git commit hash
             subtask_id: Subtask that was successfully completed
         """
-        commits = self._load_build_commits()
-
         commit_record = {
             "hash": commit_hash,
             "subtask_id": subtask_id,
             "timestamp": datetime.now().isoformat(),
         }
-
-        commits["commits"].append(commit_record)
-        commits["last_good_commit"] = commit_hash
-
-        self._save_build_commits(commits)
+        self.store.record_good_commit(commit_record)
 
     def rollback_to_commit(self, commit_hash: str) -> bool:
         """
@@ -445,27 +375,10 @@ class RecoveryManager:
             subtask_id: ID of the subtask
             reason: Why it's stuck
         """
-        history = self._load_attempt_history()
-
-        stuck_entry = {
-            "subtask_id": subtask_id,
-            "reason": reason,
-            "escalated_at": datetime.now().isoformat(),
-            "attempt_count": self.get_attempt_count(subtask_id),
-        }
-
-        # Check if already in stuck list
-        existing = [
-            s for s in history["stuck_subtasks"] if s["subtask_id"] == subtask_id
-        ]
-        if not existing:
-            history["stuck_subtasks"].append(stuck_entry)
-
-        # Update subtask status
-        if subtask_id in history["subtasks"]:
-            history["subtasks"][subtask_id]["status"] = "stuck"
-
-        self._save_attempt_history(history)
+        # Adds the stuck entry (once) and updates the subtask status atomically
+        self.store.mark_subtask_stuck(
+            subtask_id, reason, escalated_at=datetime.now().isoformat()
+        )
 
     def get_stuck_subtasks(self) -> list[dict]:
         """
@@ -474,8 +387,7 @@ class RecoveryManager:
         Returns:
             List of stuck subtask entries
         """
-        history = self._load_attempt_history()
-        return history.get("stuck_subtasks", [])
+        return self.store.get_stuck_subtasks()
 
     def get_subtask_history(self, subtask_id: str) -> dict:
         """
@@ -487,10 +399,7 @@ class RecoveryManager:
         Returns:
             Subtask history dict with attempts
         """
-        history = self._load_attempt_history()
-        return history["subtasks"].get(
-            subtask_id, {"attempts": [], "status": "pending"}
-        )
+        return self.store.get_subtask_history(subtask_id)
 
     def get_recovery_hints(self, subtask_id: str) -> list[str]:
         """
@@ -502,16 +411,15 @@ class RecoveryManager:
         Returns:
             List of hint strings
         """
-        subtask_history = self.get_subtask_history(subtask_id)
-        attempts = subtask_history.get("attempts", [])
+        attempt_count = self.store.get_attempt_count(subtask_id)
 
-        if not attempts:
+        if not attempt_count:
             return ["This is the first attempt at this subtask"]
 
-        hints = [f"Previous attempts: {len(attempts)}"]
+        hints = [f"Previous attempts: {attempt_count}"]
 
         # Add info about what was tried
-        for i, attempt in enumerate(attempts[-3:], 1):
+        for i, attempt in enumerate(self.store.get_attempts(subtask_id, limit=3), 1):
             hints.append(
                 f"Attempt {i}: {attempt['approach']} - "
                 f"{'SUCCESS' if attempt['success'] else 'FAILED'}"
@@ -520,7 +428,7 @@ class RecoveryManager:
                 hints.append(f"  Error: {attempt['error'][:100]}")
 
         # Add guidance
-        if len(attempts) >= 2:
+        if attempt_count >= 2:
             hints.append(
                 "\n⚠️  IMPORTANT: Try a DIFFERENT approach than previous attempts"
             )
@@ -532,9 +440,7 @@ class RecoveryManager:
 
     def clear_stuck_subtasks(self) -> None:
         """Clear all stuck subtasks (for manual resolution)."""
-        history = self._load_attempt_history()
-        history["stuck_subtasks"] = []
-        self._save_attempt_history(history)
+        self.store.clear_stuck_subtasks()
 
     def reset_subtask(self, subtask_id: str) -> None:
         """
@@ -543,18 +449,8 @@ class RecoveryManager:
         Args:
             subtask_id: ID of the subtask to reset
         """
-        history = self._load_attempt_history()
-
-        # Clear attempt history
-        if subtask_id in history["subtasks"]:
-            history["subtasks"][subtask_id] = {"attempts": [], "status": "pending"}
-
-        # Remove from stuck subtasks
-        history["stuck_subtasks"] = [
-            s for s in history["stuck_subtasks"] if s["subtask_id"] != subtask_id
-        ]
-
-        self._save_attempt_history(history)
+        # Clears attempts, resets status and un-sticks the subtask atomically
+        self.store.reset_subtask(subtask_id)
 
 
 # Utility functions for integration with agent.py
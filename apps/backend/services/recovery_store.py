@@ -0,0 +1,533 @@
+"""
+Recovery State Store
+====================
+
+SQLite-backed storage for RecoveryManager attempt history and build commits.
+
+One database per spec (``memory/recovery.db``) in WAL mode, so readers never
+block the writer and each query only touches the rows it needs (attempts are
+indexed by subtask). Every multi-step update runs inside a single
+``BEGIN IMMEDIATE`` transaction.
+
+The JSON files the rest of the system reads (``attempt_history.json`` and
+``build_commits.json``: prompts, the prediction module and the agents
+themselves) are kept as exports. Writes only mark them stale, so a write costs
+the same however long the history is; ``flush_exports()`` rewrites them
+atomically, and RecoveryManager.flush() is called before they are read (the
+next prompt) or copied (worktree sync). Stale exports are also flushed when
+the process exits.
+
+Worktree safety: the database files are never synced between the worktree
+and the main project (see agents.utils.sync_spec_to_source); the JSON
+exports are. Each store remembers the stat signature of the exports it last
+wrote, and if an export changes underneath it (e.g. synced back from a
+worktree), the store re-imports it before the next operation.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+from core.file_utils import RECOVERY_DB_FILE, RECOVERY_DB_GLOB  # noqa: F401
+from core.sqlite_store import SQLiteStore
+
+ATTEMPT_HISTORY_FILE = "attempt_history.json"
+BUILD_COMMITS_FILE = "build_commits.json"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS subtasks (
+    position INTEGER PRIMARY KEY AUTOINCREMENT,
+    subtask_id TEXT NOT NULL UNIQUE,
+    status TEXT NOT NULL DEFAULT 'pending'
+);
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    subtask_id TEXT NOT NULL,
+    session INTEGER,
+    timestamp TEXT,
+    approach TEXT,
+    success INTEGER NOT NULL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_attempts_subtask ON attempts (subtask_id, id);
+CREATE TABLE IF NOT EXISTS stuck_subtasks (
+    position INTEGER PRIMARY KEY AUTOINCREMENT,
+    subtask_id TEXT NOT NULL UNIQUE,
+    reason TEXT,
+    escalated_at TEXT,
+    attempt_count INTEGER
+);
+CREATE TABLE IF NOT EXISTS commits (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    hash TEXT NOT NULL,
+    subtask_id TEXT,
+    timestamp TEXT
+);
+"""
+
+
+def _stat_signature(path: Path) -> str | None:
+    """Cheap change detector for a file: (mtime_ns, size), or None if missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _write_json_atomic(path: Path, data: dict) -> None:
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: Path) -> dict | None:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+class RecoveryStore(SQLiteStore):
+    """Transactional store for one spec's recovery state."""
+
+    row_factory = sqlite3.Row
+
+    def __init__(self, memory_dir: Path):
+        self.memory_dir = Path(memory_dir)
+        self.attempt_history_file = self.memory_dir / ATTEMPT_HISTORY_FILE
+        self.build_commits_file = self.memory_dir / BUILD_COMMITS_FILE
+
+        # Signatures of the JSON exports as of our last sync with the database
+        self._known_sigs: tuple[str | None, str | None] | None = None
+
+        super().__init__(self.memory_dir / RECOVERY_DB_FILE, _SCHEMA)
+        self._init_schema()
+
+    # ------------------------------------------------------------------
+    # Transaction handling
+    # ------------------------------------------------------------------
+
+    def _transaction(self, write: bool = False, export: bool = False) -> _Transaction:
+        return _Transaction(self, write=write, export=export)
+
+    def _json_sigs(self) -> tuple[str | None, str | None]:
+        return (
+            _stat_signature(self.attempt_history_file),
+            _stat_signature(self.build_commits_file),
+        )
+
+    def _init_schema(self) -> None:
+        # Opening a write transaction adopts any existing JSON state (a fresh
+        # database has no export signatures yet)
+        with self._transaction(write=True) as conn:
+            if self._get_meta(conn, "created_at") is None:
+                self._set_meta(conn, "created_at", datetime.now().isoformat())
+        # Create the exports, and bring them up to date if a previous process
+        # left them stale
+        self.flush_exports()
+
+    def flush_exports(self) -> bool:
+        """
+        Rewrite the JSON exports if a write made them stale.
+
+        Returns:
+            True if the exports were rewritten
+        """
+        with self._transaction() as conn:
+            if self._get_meta(conn, "exports_stale") is None:
+                return False
+        with self._transaction(write=True, export=True) as conn:
+            # Another store may have flushed them meanwhile
+            flushed = self._get_meta(conn, "exports_stale") is not None
+        _stale_stores.discard(self)
+        return flushed
+
+    # ------------------------------------------------------------------
+    # Meta helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _get_meta(conn: sqlite3.Connection, key: str) -> str | None:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, key: str, value: str | None) -> None:
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    # ------------------------------------------------------------------
+    # JSON import / export
+    # ------------------------------------------------------------------
+
+    def _refresh_from_json(self, conn: sqlite3.Connection) -> bool:
+        """
+        Re-import the JSON exports if something other than a store rewrote them.
+
+        Must run inside a write transaction. Returns True if data was imported.
+        """
+        history_sig, commits_sig = self._json_sigs()
+        if history_sig == self._get_meta(
+            conn, "attempt_history_sig"
+        ) and commits_sig == self._get_meta(conn, "build_commits_sig"):
+            return False
+
+        if not self._import_json(conn):
+            # An export is missing or unreadable: export the database instead
+            self._set_meta(conn, "exports_stale", "1")
+        else:
+            # The database now matches the exports
+            self._set_meta(conn, "exports_stale", None)
+            self._set_meta(conn, "attempt_history_sig", history_sig)
+            self._set_meta(conn, "build_commits_sig", commits_sig)
+        return True
+
+    def _import_json(self, conn: sqlite3.Connection) -> bool:
+        """
+        Replace database contents with the JSON exports (when readable).
+
+        Returns True if both exports were readable.
+        """
+        history = _read_json(self.attempt_history_file)
+        if history is not None:
+            conn.execute("DELETE FROM subtasks")
+            conn.execute("DELETE FROM attempts")
+            conn.execute("DELETE FROM stuck_subtasks")
+            for subtask_id, data in (history.get("subtasks") or {}).items():
+                conn.execute(
+                    "INSERT INTO subtasks (subtask_id, status) VALUES (?, ?)",
+                    (subtask_id, data.get("status", "pending")),
+                )
+                for attempt in data.get("attempts", []):
+                    self._insert_attempt(conn, subtask_id, attempt)
+            for entry in history.get("stuck_subtasks") or []:
+                conn.execute(
+                    "INSERT OR IGNORE INTO stuck_subtasks "
+                    "(subtask_id, reason, escalated_at, attempt_count) "
+                    "VALUES (?, ?, ?, ?)",
+                    (
+                        entry.get("subtask_id"),
+                        entry.get("reason"),
+                        entry.get("escalated_at"),
+                        entry.get("attempt_count"),
+                    ),
+                )
+            created = (history.get("metadata") or {}).get("created_at")
+            if created:
+                self._set_meta(conn, "history_created_at", created)
+
+        commits = _read_json(self.build_commits_file)
+        if commits is not None:
+            conn.execute("DELETE FROM commits")
+            for record in commits.get("commits") or []:
+                conn.execute(
+                    "INSERT INTO commits (hash, subtask_id, timestamp) VALUES (?, ?, ?)",
+                    (
+                        record.get("hash"),
+                        record.get("subtask_id"),
+                        record.get("timestamp"),
+                    ),
+                )
+            self._set_meta(conn, "last_good_commit", commits.get("last_good_commit"))
+            created = (commits.get("metadata") or {}).get("created_at")
+            if created:
+                self._set_meta(conn, "commits_created_at", created)
+        return history is not None and commits is not None
+
+    @staticmethod
+    def _insert_attempt(
+        conn: sqlite3.Connection, subtask_id: str, attempt: dict
+    ) -> None:
+        conn.execute(
+            "INSERT INTO attempts "
+            "(subtask_id, session, timestamp, approach, success, error) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                subtask_id,
+                attempt.get("session"),
+                attempt.get("timestamp"),
+                attempt.get("approach", ""),
+                1 if attempt.get("success") else 0,
+                attempt.get("error"),
+            ),
+        )
+
+    def _export_json(self, conn: sqlite3.Connection) -> None:
+        """Write both JSON exports and remember their signatures."""
+        now = datetime.now().isoformat()
+        created = self._get_meta(conn, "created_at") or now
+
+        history = self._build_attempt_history(conn)
+        history["metadata"] = {
+            "created_at": self._get_meta(conn, "history_created_at") or created,
+            "last_updated": now,
+        }
+        _write_json_atomic(self.attempt_history_file, history)
+
+        commits = {
+            "commits": [
+                {
+                    "hash": row["hash"],
+                    "subtask_id": row["subtask_id"],
+                    "timestamp": row["timestamp"],
+                }
+                for row in conn.execute(
+                    "SELECT hash, subtask_id, timestamp FROM commits ORDER BY id"
+                )
+            ],
+            "last_good_commit": self._get_meta(conn, "last_good_commit"),
+            "metadata": {
+                "created_at": self._get_meta(conn, "commits_created_at") or created,
+                "last_updated": now,
+            },
+        }
+        _write_json_atomic(self.build_commits_file, commits)
+
+        history_sig, commits_sig = self._json_sigs()
+        self._set_meta(conn, "attempt_history_sig", history_sig)
+        self._set_meta(conn, "build_commits_sig", commits_sig)
+        self._set_meta(conn, "exports_stale", None)
+
+    def _build_attempt_history(self, conn: sqlite3.Connection) -> dict:
+        subtasks: dict[str, dict] = {}
+        for row in conn.execute(
+            "SELECT subtask_id, status FROM subtasks ORDER BY position"
+        ):
+            subtasks[row["subtask_id"]] = {"attempts": [], "status": row["status"]}
+        for row in conn.execute(
+            "SELECT subtask_id, session, timestamp, approach, success, error "
+            "FROM attempts ORDER BY id"
+        ):
+            entry = subtasks.setdefault(
+                row["subtask_id"], {"attempts": [], "status": "pending"}
+            )
+            entry["attempts"].append(self._attempt_from_row(row))
+
+        return {
+            "subtasks": subtasks,
+            "stuck_subtasks": self._stuck_rows(conn),
+        }
+
+    @staticmethod
+    def _attempt_from_row(row: sqlite3.Row) -> dict:
+        return {
+            "session": row["session"],
+            "timestamp": row["timestamp"],
+            "approach": row["approach"],
+            "success": bool(row["success"]),
+            "error": row["error"],
+        }
+
+    @staticmethod
+    def _stuck_rows(conn: sqlite3.Connection) -> list[dict]:
+        return [
+            {
+                "subtask_id": row["subtask_id"],
+                "reason": row["reason"],
+                "escalated_at": row["escalated_at"],
+                "attempt_count": row["attempt_count"],
+            }
+            for row in conn.execute(
+                "SELECT subtask_id, reason, escalated_at, attempt_count "
+                "FROM stuck_subtasks ORDER BY position"
+            )
+        ]
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get_attempt_count(self, subtask_id: str) -> int:
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) AS n FROM attempts WHERE subtask_id = ?",
+                (subtask_id,),
+            ).fetchone()
+            return row["n"]
+
+    def get_attempts(self, subtask_id: str, limit: int | None = None) -> list[dict]:
+        """Get a subtask's attempts in order; with ``limit``, only the most recent."""
+        with self._transaction() as conn:
+            if limit is None:
+                rows = conn.execute(
+                    "SELECT * FROM attempts WHERE subtask_id = ? ORDER BY id",
+                    (subtask_id,),
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT * FROM (SELECT * FROM attempts WHERE subtask_id = ? "
+                    "ORDER BY id DESC LIMIT ?) ORDER BY id",
+                    (subtask_id, limit),
+                ).fetchall()
+            return [self._attempt_from_row(row) for row in rows]
+
+    def get_subtask_history(self, subtask_id: str) -> dict:
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT status FROM subtasks WHERE subtask_id = ?", (subtask_id,)
+            ).fetchone()
+            if row is None:
+                return {"attempts": [], "status": "pending"}
+            attempts = conn.execute(
+                "SELECT * FROM attempts WHERE subtask_id = ? ORDER BY id",
+                (subtask_id,),
+            ).fetchall()
+            return {
+                "attempts": [self._attempt_from_row(a) for a in attempts],
+                "status": row["status"],
+            }
+
+    def get_stuck_subtasks(self) -> list[dict]:
+        with self._transaction() as conn:
+            return self._stuck_rows(conn)
+
+    def get_last_good_commit(self) -> str | None:
+        with self._transaction() as conn:
+            return self._get_meta(conn, "last_good_commit")
+
+    def export_attempt_history(self) -> dict:
+        """Get the full attempt history in the JSON export format."""
+        with self._transaction() as conn:
+            return self._build_attempt_history(conn)
+
+    # ------------------------------------------------------------------
+    # Writes (each one atomic; the JSON exports are marked stale)
+    # ------------------------------------------------------------------
+
+    def record_attempt(self, subtask_id: str, attempt: dict) -> None:
+        with self._transaction(write=True) as conn:
+            self._insert_attempt(conn, subtask_id, attempt)
+            conn.execute(
+                "INSERT INTO subtasks (subtask_id, status) VALUES (?, ?) "
+                "ON CONFLICT(subtask_id) DO UPDATE SET status = excluded.status",
+                (subtask_id, "completed" if attempt.get("success") else "failed"),
+            )
+
+    def record_good_commit(self, record: dict) -> None:
+        with self._transaction(write=True) as conn:
+            conn.execute(
+                "INSERT INTO commits (hash, subtask_id, timestamp) VALUES (?, ?, ?)",
+                (record["hash"], record.get("subtask_id"), record.get("timestamp")),
+            )
+            self._set_meta(conn, "last_good_commit", record["hash"])
+
+    def mark_subtask_stuck(
+        self, subtask_id: str, reason: str, escalated_at: str
+    ) -> None:
+        with self._transaction(write=True) as conn:
+            # Count and insert in the same transaction so they can't drift
+            attempt_count = conn.execute(
+                "SELECT COUNT(*) AS n FROM attempts WHERE subtask_id = ?",
+                (subtask_id,),
+            ).fetchone()["n"]
+            conn.execute(
+                "INSERT OR IGNORE INTO stuck_subtasks "
+                "(subtask_id, reason, escalated_at, attempt_count) VALUES (?, ?, ?, ?)",
+                (subtask_id, reason, escalated_at, attempt_count),
+            )
+            conn.execute(
+                "UPDATE subtasks SET status = 'stuck' WHERE subtask_id = ?",
+                (subtask_id,),
+            )
+
+    def clear_stuck_subtasks(self) -> None:
+        with self._transaction(write=True) as conn:
+            conn.execute("DELETE FROM stuck_subtasks")
+
+    def reset_subtask(self, subtask_id: str) -> None:
+        with self._transaction(write=True) as conn:
+            conn.execute("DELETE FROM attempts WHERE subtask_id = ?", (subtask_id,))
+            conn.execute(
+                "UPDATE subtasks SET status = 'pending' WHERE subtask_id = ?",
+                (subtask_id,),
+            )
+            conn.execute(
+                "DELETE FROM stuck_subtasks WHERE subtask_id = ?", (subtask_id,)
+            )
+
+
+class _Transaction:
+    """
+    Context manager for one store operation.
+
+    Write transactions take the database write lock up front (BEGIN IMMEDIATE)
+    so read-modify-write sequences are atomic across processes, and mark the
+    JSON exports stale before committing. Before any operation, the JSON
+    exports are re-imported if another copy of the spec replaced them; the
+    check is a stat() against signatures cached in memory, so it costs no
+    database work in the common case.
+    """
+
+    def __init__(self, store: RecoveryStore, write: bool = False, export: bool = False):
+        self.store = store
+        self.write = write or export
+        self.modifies = write and not export
+        self.export = export
+
+    def __enter__(self) -> sqlite3.Connection:
+        store = self.store
+        conn = store._connect()
+
+        if not self.write and store._known_sigs != store._json_sigs():
+            # Exports changed since we last looked: sync under the write lock
+            self.write = True
+
+        conn.execute("BEGIN IMMEDIATE" if self.write else "BEGIN")
+        try:
+            if self.write:
+                store._refresh_from_json(conn)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        self.conn = conn
+        return conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        conn = self.conn
+        if exc_type is not None:
+            conn.execute("ROLLBACK")
+            return
+        try:
+            if self.export:
+                if self.store._get_meta(conn, "exports_stale") is not None:
+                    self.store._export_json(conn)
+            elif self.modifies:
+                # Exporting is left to flush_exports(): a flag, not O(history)
+                self.store._set_meta(conn, "exports_stale", "1")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        if self.write:
+            self.store._known_sigs = self.store._json_sigs()
+        if self.modifies:
+            _stale_stores.add(self.store)
+
+
+# Stores written to since their last flush (flushed when the process exits)
+_stale_stores: set[RecoveryStore] = set()
+
+
+@atexit.register
+def _flush_stale_stores() -> None:
+    for store in list(_stale_stores):
+        try:
+            store.flush_exports()
+        except (sqlite3.Error, OSError):
+            pass  # The spec directory is gone
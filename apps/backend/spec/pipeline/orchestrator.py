@@ -5,11 +5,12 @@ Spec Orchestrator
 Main orchestration logic for spec creation with dynamic complexity adaptation.
 """
 
+import asyncio
 import json
 from collections.abc import Callable
 from pathlib import Path
 
-from analysis.analyzers import analyze_project
+from analysis.analyzers import refresh_project_index
 from core.workspace.models import SpecNumberLock
 from phase_config import get_thinking_budget
 from prompts_pkg.project_context import should_refresh_project_index
@@ -45,6 +46,7 @@ from .models import (
     get_specs_dir,
     rename_spec_dir_from_requirements,
 )
+from .phase_cache import PHASE_IO, PhaseCache, plan_waves
 
 
 class SpecOrchestrator:
@@ -192,7 +194,9 @@ class SpecOrchestrator:
         """Ensure project_index.json is up-to-date before spec creation.
 
         Uses smart caching: only regenerates if dependency files (package.json,
-        pyproject.toml, etc.) have been modified since the last index generation.
+        pyproject.toml, etc.) have been modified since the last index generation,
+        and then only re-analyzes the services whose files changed. Whenever
+        the index changes, the cached project data is refreshed from it.
         This ensures QA agents receive accurate project capability information
         for dynamic MCP tool injection.
         """
@@ -207,8 +211,14 @@ class SpecOrchestrator:
                 print_status("Generating project index...", "progress")
 
             try:
-                # Regenerate project index
-                analyze_project(self.project_dir, index_file)
+                previous = index_file.read_bytes() if index_file.exists() else None
+                # Regenerate project index (unchanged services are reused)
+                changed_services = refresh_project_index(self.project_dir, index_file)
+                if index_file.read_bytes() != previous:
+                    # Lazy import to avoid circular import with core.client
+                    from core.client import invalidate_project_cache
+
+                    invalidate_project_cache(self.project_dir, changed_services)
                 print_status("Project index updated", "success")
             except Exception as e:
                 print_status(f"Project index refresh failed: {e}", "warning")
@@ -259,15 +269,21 @@ class SpecOrchestrator:
             ui_module=ui,
         )
 
+        # Phases whose inputs are unchanged since a previous run are reused
+        phase_cache = PhaseCache(self.project_dir, self.spec_dir)
+
         results = []
         phase_num = 0
 
-        def run_phase(name: str, phase_fn: Callable) -> phases.PhaseResult:
+        async def run_phase(
+            name: str, phase_fn: Callable, summarize: bool = True
+        ) -> phases.PhaseResult:
             """Run a phase with proper numbering and display.
 
             Args:
                 name: The phase name
                 phase_fn: The phase function to execute
+                summarize: Whether to store a summary for subsequent phases
 
             Returns:
                 The phase result
@@ -281,7 +297,32 @@ class SpecOrchestrator:
             task_logger.log(
                 f"Starting phase {phase_num}: {display_name}", LogEntryType.INFO
             )
-            return phase_fn()
+
+            record = phase_cache.lookup(name, self.task_description)
+            if record is not None:
+                print_status("Inputs unchanged, reusing previous output", "success")
+                if record.get("summary"):
+                    self._phase_summaries[name] = record["summary"]
+                return phases.PhaseResult(
+                    name,
+                    True,
+                    [str(self.spec_dir / f) for f in PHASE_IO[name].writes],
+                    [],
+                    0,
+                )
+
+            result = await phase_fn()
+            if result.success and summarize:
+                # Store summary for subsequent phases (compaction)
+                await self._store_phase_summary(name)
+            if result.success and not result.errors:
+                phase_cache.store(
+                    name, self.task_description, self._phase_summaries.get(name, "")
+                )
+            else:
+                # Fallback output (e.g. minimal research) is retried next run
+                phase_cache.forget(name)
+            return result
 
         # === PHASE 1: DISCOVERY ===
         result = await run_phase("discovery", phase_executor.phase_discovery)
@@ -292,8 +333,6 @@ class SpecOrchestrator:
                 LogPhase.PLANNING, success=False, message="Discovery failed"
             )
             return False
-        # Store summary for subsequent phases (compaction)
-        await self._store_phase_summary("discovery")
 
         # === PHASE 2: REQUIREMENTS GATHERING ===
         result = await run_phase(
@@ -308,8 +347,6 @@ class SpecOrchestrator:
                 message="Requirements gathering failed",
             )
             return False
-        # Store summary for subsequent phases (compaction)
-        await self._store_phase_summary("requirements")
 
         # Rename spec folder with better name from requirements
         rename_spec_dir_from_requirements(self.spec_dir)
@@ -328,6 +365,7 @@ class SpecOrchestrator:
         result = await run_phase(
             "complexity_assessment",
             lambda: self._phase_complexity_assessment_with_requirements(),
+            summarize=False,
         )
         results.append(result)
         if not result.success:
@@ -362,21 +400,29 @@ class SpecOrchestrator:
         print(f"  {muted('Remaining phases:')} {', '.join(phases_to_run)}")
         print()
 
-        phases_executed = ["discovery", "requirements", "complexity_assessment"]
         for phase_name in phases_to_run:
             if phase_name not in all_phases:
                 print_status(f"Unknown phase: {phase_name}, skipping", "warning")
-                continue
+        phases_to_run = [p for p in phases_to_run if p in all_phases]
 
-            result = await run_phase(phase_name, all_phases[phase_name])
-            results.append(result)
-            phases_executed.append(phase_name)
+        phases_executed = ["discovery", "requirements", "complexity_assessment"]
+        for wave in plan_waves(phases_to_run):
+            # Phases in a wave neither read nor write each other's artifacts
+            if len(wave) > 1:
+                print_status(f"Running {', '.join(wave)} concurrently", "info")
+            wave_results = await asyncio.gather(
+                *(run_phase(phase_name, all_phases[phase_name]) for phase_name in wave)
+            )
+            results.extend(wave_results)
+            phases_executed.extend(wave)
 
-            # Store summary for subsequent phases (compaction)
-            if result.success:
-                await self._store_phase_summary(phase_name)
+            if "validation" in wave:
+                # The validation fixer's edits don't invalidate earlier phases
+                phase_cache.rebaseline(phases_executed, self.task_description)
 
-            if not result.success:
+            for phase_name, result in zip(wave, wave_results):
+                if result.success:
+                    continue
                 print()
                 print_status(
                     f"Phase '{phase_name}' failed after {result.retries} retries",
@@ -0,0 +1,257 @@
+"""
+Phase Cache
+===========
+
+Input fingerprints for incremental spec creation.
+
+Each cacheable phase declares the spec artifacts it reads and writes
+(PHASE_IO). A phase's fingerprint hashes its name, the task text, the project
+index (for phases that analyze the project) and the current content of every
+artifact it reads. When a phase finishes cleanly, its fingerprint and summary
+are stored in the spec directory. A re-run, or a retry after a failed
+validation, reuses the phase while its fingerprint is unchanged and its outputs
+still exist. Otherwise the stale outputs are removed first, so the phase's own
+"already exists" shortcut cannot pick them up.
+
+Fingerprints are taken after a phase has run, so a phase that rewrites one of
+its inputs (self-critique edits spec.md) is not invalidated by its own edit.
+PHASE_IO also tells the orchestrator which phases can run concurrently.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from core.file_utils import write_json_atomic
+
+# Bump when fingerprints change meaning, so old manifests are ignored
+CACHE_VERSION = 1
+
+MANIFEST_FILE = ".phase_cache.json"
+
+# Project-level indexes, in the order discovery looks at them
+PROJECT_INDEX_FILES = (
+    Path(".auto-claude") / "project_index.json",
+    Path("auto-claude") / "project_index.json",
+)
+
+
+@dataclass(frozen=True)
+class PhaseIO:
+    """Spec artifacts a phase depends on and produces."""
+
+    reads: tuple[str, ...] = ()
+    writes: tuple[str, ...] = ()  # Created by the phase; removed when stale
+    edits: tuple[str, ...] = ()  # Inputs rewritten in place
+    uses_task: bool = False
+    uses_project: bool = False
+
+    @property
+    def touches(self) -> set[str]:
+        return set(self.reads) | set(self.writes) | set(self.edits)
+
+    @property
+    def changes(self) -> set[str]:
+        return set(self.writes) | set(self.edits)
+
+
+# Phases not listed here (requirements, complexity_assessment, validation)
+# are never cached and never run alongside other phases
+PHASE_IO: dict[str, PhaseIO] = {
+    "discovery": PhaseIO(writes=("project_index.json",), uses_project=True),
+    "historical_context": PhaseIO(
+        reads=("requirements.json",), writes=("graph_hints.json",), uses_task=True
+    ),
+    "research": PhaseIO(reads=("requirements.json",), writes=("research.json",)),
+    "context": PhaseIO(
+        reads=("requirements.json",),
+        writes=("context.json",),
+        uses_task=True,
+        uses_project=True,
+    ),
+    "spec_writing": PhaseIO(
+        reads=(
+            "requirements.json",
+            "project_index.json",
+            "context.json",
+            "research.json",
+            "graph_hints.json",
+        ),
+        writes=("spec.md",),
+    ),
+    "self_critique": PhaseIO(
+        reads=("spec.md", "research.json"),
+        writes=("critique_report.json",),
+        edits=("spec.md",),
+    ),
+    "planning": PhaseIO(
+        reads=("spec.md", "requirements.json", "context.json", "project_index.json"),
+        writes=("implementation_plan.json",),
+    ),
+    "quick_spec": PhaseIO(
+        reads=("requirements.json", "project_index.json", "graph_hints.json"),
+        writes=("spec.md", "implementation_plan.json"),
+        uses_task=True,
+    ),
+}
+
+
+def independent(first: str, second: str) -> bool:
+    """Whether two phases can run at the same time."""
+    a, b = PHASE_IO.get(first), PHASE_IO.get(second)
+    if a is None or b is None:
+        return False
+    return not (a.changes & b.touches) and not (b.changes & a.touches)
+
+
+def plan_waves(phase_names: list[str]) -> list[list[str]]:
+    """
+    Group phases into waves that can run concurrently.
+
+    Phases keep their order; a phase joins the current wave when it is
+    independent of every phase already in it.
+
+    Args:
+        phase_names: Phases in the order they would run sequentially
+
+    Returns:
+        Waves of phase names, to be run one wave after another
+    """
+    waves: list[list[str]] = []
+    for name in phase_names:
+        if waves and all(independent(name, other) for other in waves[-1]):
+            waves[-1].append(name)
+        else:
+            waves.append([name])
+    return waves
+
+
+def _hash_file(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class PhaseCache:
+    """
+    Per-spec record of which phases are up to date.
+
+    Args:
+        project_dir: The project root directory
+        spec_dir: The spec directory (holds the manifest)
+    """
+
+    def __init__(self, project_dir: Path, spec_dir: Path):
+        self.project_dir = Path(project_dir)
+        self.spec_dir = Path(spec_dir)
+        self._records: dict[str, dict] = self._load()
+
+    @property
+    def manifest_file(self) -> Path:
+        return self.spec_dir / MANIFEST_FILE
+
+    def _load(self) -> dict[str, dict]:
+        try:
+            with open(self.manifest_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return {}
+        phases = data.get("phases")
+        return phases if isinstance(phases, dict) else {}
+
+    def _save(self) -> None:
+        try:
+            write_json_atomic(
+                self.manifest_file,
+                {"version": CACHE_VERSION, "phases": self._records},
+            )
+        except OSError:
+            pass  # Caching is best-effort
+
+    def fingerprint(self, phase_name: str, task_description: str | None) -> str:
+        """Hash of everything the phase's output depends on."""
+        io = PHASE_IO[phase_name]
+        parts = [phase_name]
+        if io.uses_task:
+            parts.append(f"task:{task_description or ''}")
+        if io.uses_project:
+            for index_file in PROJECT_INDEX_FILES:
+                parts.append(
+                    f"{index_file.as_posix()}:{_hash_file(self.project_dir / index_file)}"
+                )
+        for name in sorted(io.reads):
+            parts.append(f"{name}:{_hash_file(self.spec_dir / name)}")
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def lookup(self, phase_name: str, task_description: str | None) -> dict | None:
+        """
+        Return the stored record of a phase if it can be reused.
+
+        A phase whose inputs changed is forgotten and its outputs removed.
+
+        Args:
+            phase_name: The phase about to run
+            task_description: The current task description
+
+        Returns:
+            The record ({"fingerprint", "summary"}) or None if the phase must run
+        """
+        if phase_name not in PHASE_IO:
+            return None
+        record = self._records.get(phase_name)
+        if record is None:
+            # Never recorded (e.g. a spec from before the cache): leave it to
+            # the phase's own checks
+            return None
+
+        io = PHASE_IO[phase_name]
+        outputs_exist = all((self.spec_dir / name).exists() for name in io.writes)
+        if outputs_exist and record.get("fingerprint") == self.fingerprint(
+            phase_name, task_description
+        ):
+            return record
+
+        for name in io.writes:
+            (self.spec_dir / name).unlink(missing_ok=True)
+        del self._records[phase_name]
+        self._save()
+        return None
+
+    def store(
+        self, phase_name: str, task_description: str | None, summary: str = ""
+    ) -> None:
+        """Record that a phase finished cleanly with its current inputs."""
+        if phase_name not in PHASE_IO:
+            return
+        self._records[phase_name] = {
+            "fingerprint": self.fingerprint(phase_name, task_description),
+            "summary": summary,
+        }
+        self._save()
+
+    def forget(self, phase_name: str) -> None:
+        """Drop a phase's record (its output is not trusted)."""
+        if self._records.pop(phase_name, None) is not None:
+            self._save()
+
+    def rebaseline(self, phase_names: list[str], task_description: str | None) -> None:
+        """
+        Re-take the fingerprints of recorded phases.
+
+        Called after validation, whose fixer may edit any artifact: those edits
+        are the pipeline's own and should not invalidate the phases that ran
+        before it.
+
+        Args:
+            phase_names: Phases of the current run
+            task_description: The current task description
+        """
+        for phase_name in phase_names:
+            record = self._records.get(phase_name)
+            if record is not None and phase_name in PHASE_IO:
+                record["fingerprint"] = self.fingerprint(phase_name, task_description)
+        self._save()
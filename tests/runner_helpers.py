@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Runner Test Helpers
+===================
+
+Commands that run the GitHub/GitLab runners (or code importing them) in a
+fresh interpreter, as the UI starts them.
+
+conftest mocks the Claude SDK in the test process only; the runners import
+it at startup, so these commands stand in for it when it isn't installed.
+The SDK is only used once a job actually runs an agent.
+"""
+
+import sys
+import textwrap
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent / "apps" / "backend"
+GITHUB_RUNNER = BACKEND_DIR / "runners" / "github" / "runner.py"
+GITLAB_RUNNER = BACKEND_DIR / "runners" / "gitlab" / "runner.py"
+
+_SDK_STUB = textwrap.dedent(
+    """
+    import sys
+    from unittest.mock import MagicMock
+
+    try:
+        import claude_agent_sdk  # noqa: F401
+    except ImportError:
+        sys.modules["claude_agent_sdk"] = MagicMock()
+        sys.modules["claude_agent_sdk.types"] = MagicMock()
+    """
+)
+
+_RUN_RUNNER = textwrap.dedent(
+    """
+    import runpy
+
+    runner = sys.argv[1]
+    sys.argv = [runner, *sys.argv[2:]]
+    runpy.run_path(runner, run_name="__main__")
+    """
+)
+
+
+def runner_command(runner: Path, *args: str) -> list[str]:
+    """Command line running a runner CLI with the given arguments."""
+    return [sys.executable, "-c", _SDK_STUB + _RUN_RUNNER, str(runner), *args]
+
+
+def python_command(code: str, *args: str) -> list[str]:
+    """Command line running a Python snippet that may import a runner."""
+    return [sys.executable, "-c", _SDK_STUB + textwrap.dedent(code), *args]
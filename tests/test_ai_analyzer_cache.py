@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Tests for the AI analyzer's per-analyzer result cache.
+
+Covers:
+- Analyzers whose inputs are unchanged are never re-run
+- A change re-runs exactly the analyzers that read the changed file
+- Touched-but-unchanged files are not re-hashed
+- Analyzers run concurrently under the runner's limit
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add apps/backend and its runners directory to path (idempotent guard).
+# ai_analyzer is imported the way ai_analyzer_runner.py does, without the
+# runners package __init__ (which pulls in every other runner).
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+for _path in (_backend_dir, _backend_dir / "runners"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from ai_analyzer import cache_manager as cache_manager_module
+from ai_analyzer import runner as runner_module
+from ai_analyzer.models import AnalyzerType
+from ai_analyzer.runner import AIAnalyzerRunner
+
+ALL_ANALYZERS = AnalyzerType.all_analyzers()
+
+PROJECT_INDEX = {
+    "services": {
+        "api": {
+            "api": {
+                "routes": [{"methods": ["GET"], "path": "/users", "file": "app.py"}]
+            },
+            "database": {"models": {"User": {}}},
+        }
+    }
+}
+
+
+@pytest.fixture
+def project(tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "app.py").write_text("def list_users():\n    return []\n")
+    (project / "package.json").write_text('{"name": "app"}\n')
+    (project / "README.md").write_text("# App\n")
+    (project / "node_modules" / "lib").mkdir(parents=True)
+    (project / "node_modules" / "lib" / "index.js").write_text("module.exports = 1\n")
+    return project
+
+
+class StubAnalyses:
+    """Stands in for the Claude queries; records which analyzers ran."""
+
+    def __init__(self, delay: float = 0.0, fail: set[str] = frozenset()):
+        self.delay = delay
+        self.fail = fail
+        self.ran: list[str] = []
+        self.running = 0
+        self.peak = 0
+
+    async def __call__(self, analyzer_name):
+        self.ran.append(analyzer_name)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+        if analyzer_name in self.fail:
+            raise RuntimeError("query failed")
+        return {"score": 80}
+
+
+async def _analyze(project, stub, **kwargs):
+    runner = AIAnalyzerRunner(project, PROJECT_INDEX)
+    with (
+        patch.object(runner, "_run_single_analyzer", stub),
+        patch.object(runner_module, "CLAUDE_SDK_AVAILABLE", True),
+    ):
+        return await runner.run_full_analysis(**kwargs)
+
+
+def _edit(path: Path, text: str) -> None:
+    path.write_text(text)
+    # Make sure the stat changes even on coarse-mtime filesystems
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestAnalyzerCache:
+    async def test_unchanged_project_reuses_every_result(self, project):
+        first = StubAnalyses()
+        insights = await _analyze(project, first)
+        assert sorted(first.ran) == sorted(ALL_ANALYZERS)
+        assert insights["overall_score"] == 80
+
+        second = StubAnalyses()
+        insights = await _analyze(project, second)
+        assert second.ran == []
+        assert all(insights[name] == {"score": 80} for name in ALL_ANALYZERS)
+        assert insights["overall_score"] == 80
+
+    @pytest.mark.parametrize(
+        ("file_name", "text", "expected"),
+        [
+            ("README.md", "# App\n\nDocs.\n", ["code_quality"]),
+            ("package.json", '{"name": "app", "version": "2"}\n', ["security"]),
+            ("app.py", "def list_users():\n    return [1]\n", ALL_ANALYZERS),
+        ],
+    )
+    async def test_change_reruns_only_analyzers_reading_it(
+        self, project, file_name, text, expected
+    ):
+        await _analyze(project, StubAnalyses())
+        _edit(project / file_name, text)
+
+        stub = StubAnalyses()
+        await _analyze(project, stub)
+
+        assert sorted(stub.ran) == sorted(expected)
+
+    async def test_ignored_dirs_and_touches_are_not_changes(self, project):
+        await _analyze(project, StubAnalyses())
+        _edit(project / "node_modules" / "lib" / "index.js", "module.exports = 2\n")
+        _edit(project / "app.py", (project / "app.py").read_text())
+
+        stub = StubAnalyses()
+        with patch.object(
+            cache_manager_module, "hash_path", wraps=cache_manager_module.hash_path
+        ) as hash_path:
+            await _analyze(project, stub)
+
+        assert stub.ran == []
+        # Only the touched file is re-hashed
+        assert [call.args[0].name for call in hash_path.call_args_list] == ["app.py"]
+
+    async def test_failed_analyzers_are_retried(self, project):
+        await _analyze(project, StubAnalyses(fail={"security"}))
+
+        stub = StubAnalyses()
+        await _analyze(project, stub)
+
+        assert stub.ran == ["security"]
+
+    async def test_skip_cache_reruns_everything(self, project):
+        await _analyze(project, StubAnalyses())
+
+        stub = StubAnalyses()
+        await _analyze(project, stub, skip_cache=True)
+
+        assert sorted(stub.ran) == sorted(ALL_ANALYZERS)
+
+
+class TestConcurrency:
+    async def test_analyzers_run_concurrently_under_limit(self, project):
+        stub = StubAnalyses(delay=0.05)
+
+        await _analyze(project, stub)
+
+        assert stub.peak == AIAnalyzerRunner.MAX_CONCURRENT_ANALYZERS
@@ -11,8 +11,10 @@ Tests cover:
 """
 
 import json
+import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -670,3 +672,76 @@ class TestEdgeCases:
         result2 = discovery.discover(temp_dir)
 
         assert result1 is not result2
+
+
+# =============================================================================
+# FINGERPRINT CACHE
+# =============================================================================
+
+
+WORKFLOW = "name: CI\non: push\njobs:\n  test:\n    runs-on: ubuntu-latest\n    steps:\n      - run: {command}\n"
+
+
+class TestFingerprintCache:
+    """Tests for content-fingerprint cache invalidation."""
+
+    @requires_yaml
+    def test_workflow_edit_invalidates(self, discovery, temp_dir):
+        workflows = temp_dir / ".github" / "workflows"
+        workflows.mkdir(parents=True)
+        (workflows / "ci.yml").write_text(WORKFLOW.format(command="npm test"))
+        assert discovery.discover(temp_dir).test_commands["unit"] == "npm test"
+
+        (workflows / "ci.yml").write_text(WORKFLOW.format(command="pytest -x"))
+        assert discovery.discover(temp_dir).test_commands["unit"] == "pytest -x"
+
+    def test_touch_without_change_is_a_hit(self, discovery, temp_dir):
+        workflows = temp_dir / ".github" / "workflows"
+        workflows.mkdir(parents=True)
+        workflow = workflows / "ci.yml"
+        workflow.write_text(WORKFLOW.format(command="npm test"))
+        result1 = discovery.discover(temp_dir)
+
+        os.utime(workflow, ns=(1, 1))
+
+        assert discovery.discover(temp_dir) is result1
+
+    def test_new_workflow_file_invalidates(self, discovery, temp_dir):
+        workflows = temp_dir / ".github" / "workflows"
+        workflows.mkdir(parents=True)
+        (workflows / "ci.yml").write_text(WORKFLOW.format(command="npm test"))
+        result1 = discovery.discover(temp_dir)
+
+        (workflows / "release.yml").write_text(WORKFLOW.format(command="npm test"))
+        result2 = discovery.discover(temp_dir)
+
+        assert result2 is not result1
+        assert len(result2.workflows) == len(result1.workflows) + 1
+
+    def test_ci_system_change_invalidates(self, discovery, temp_dir):
+        assert discovery.discover(temp_dir) is None
+
+        (temp_dir / ".gitlab-ci.yml").write_text("test:\n  script:\n    - npm test\n")
+        assert discovery.discover(temp_dir).ci_system == "gitlab"
+
+    def test_persisted_cache_reused_across_processes(self, temp_dir):
+        (temp_dir / ".auto-claude").mkdir()
+        (temp_dir / ".gitlab-ci.yml").write_text("test:\n  script:\n    - npm test\n")
+
+        first = CIDiscovery()
+        result1 = first.discover(temp_dir)
+        assert (temp_dir / ".auto-claude" / "cache" / "ci_discovery.json").exists()
+
+        # Simulate a new process: empty in-memory cache, persisted file only
+        first.clear_cache()
+        with patch.object(CIDiscovery, "_parse_gitlab_ci") as parse:
+            result2 = CIDiscovery().discover(temp_dir)
+
+        parse.assert_not_called()
+        assert result2 is not result1
+        assert first.to_dict(result2) == first.to_dict(result1)
+
+    def test_no_persisted_cache_without_auto_claude_dir(self, discovery, temp_dir):
+        (temp_dir / ".gitlab-ci.yml").write_text("test:\n  script:\n    - npm test\n")
+        discovery.discover(temp_dir)
+        assert not (temp_dir / ".auto-claude").exists()
@@ -24,7 +24,12 @@ if str(_github_dir) not in sys.path:
 if str(_backend_dir) not in sys.path:
     sys.path.insert(0, str(_backend_dir))
 
-from context_gatherer import AI_BOT_PATTERNS, FollowupContextGatherer
+from context_gatherer import (
+    AI_BOT_PATTERNS,
+    ChangedFile,
+    FollowupContextGatherer,
+    PRContextGatherer,
+)
 from models import PRReviewResult, FollowupReviewContext
 
 
@@ -235,3 +240,52 @@ class TestAIReviewsInclusion:
 
         # 1 contributor review should be in contributor_comments_since_review
         assert len(context.contributor_comments_since_review) == 1
+
+
+class TestRelatedFilesForRoot:
+    """Tests for the related-file rescan in the review worktree."""
+
+    CHANGED = [
+        ChangedFile("src/app.ts", "modified", 1, 1, "", "", ""),
+        ChangedFile("lib/util.py", "modified", 1, 1, "", "", ""),
+    ]
+
+    def test_tracked_files_match_filesystem_lookup(self, tmp_path):
+        tracked = {
+            "src/app.ts",
+            "src/app.test.ts",
+            "src/app.d.ts",
+            "src/package.json",
+            "lib/util.py",
+            "lib/test_util.py",
+        }
+        for rel_path in tracked:
+            (tmp_path / rel_path).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel_path).write_text("")
+
+        from_disk = PRContextGatherer.find_related_files_for_root(
+            self.CHANGED, tmp_path
+        )
+        from_index = PRContextGatherer.find_related_files_for_root(
+            self.CHANGED, Path("/nonexistent"), tracked_files=tracked
+        )
+
+        assert from_index == from_disk
+        assert sorted(Path(p).as_posix() for p in from_index) == [
+            "lib/test_util.py",
+            "src/app.d.ts",
+            "src/app.test.ts",
+            "src/package.json",
+        ]
+
+    def test_tracked_files_skip_filesystem(self, tmp_path):
+        # Only files of the checked-out commit count, not stray local files
+        (tmp_path / "lib").mkdir()
+        (tmp_path / "lib" / "test_util.py").write_text("")
+
+        assert (
+            PRContextGatherer.find_related_files_for_root(
+                self.CHANGED, tmp_path, tracked_files=frozenset()
+            )
+            == []
+        )
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Tests for token-budgeted packing of PR diffs
+(runners/github/services/context_packer.py).
+
+Covers:
+- Ranking by risk, then change size, into budgeted shards
+- Summaries of low-value files and of hunks over the per-file budget
+- A single hunk over the per-file budget cut to the lines that fit
+- Files past the total budget summarized or dropped, and reported
+- Packing a multi-file unified diff for the follow-up prompt
+"""
+
+import sys
+from pathlib import Path
+
+# Add the backend directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+_services_dir = _github_dir / "services"
+
+if str(_services_dir) not in sys.path:
+    sys.path.insert(0, str(_services_dir))
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+# context_packer falls back to services.finding_cache: point that at the flat
+# module so the backend's own services package isn't shadowed
+import finding_cache
+
+sys.modules.setdefault("services.finding_cache", finding_cache)
+
+from context_packer import (
+    RISK_HIGH,
+    RISK_LOW,
+    RISK_LOW_VALUE,
+    RISK_NORMAL,
+    file_risk,
+    pack_diff,
+    pack_files,
+    split_hunks,
+)
+
+
+def _patch(hunks: int = 1, lines: int = 4, start: int = 1) -> str:
+    """A patch of `hunks` hunks adding `lines` lines each (~6 tokens a line)."""
+    parts = []
+    for i in range(hunks):
+        line = start + i * 100
+        body = "".join(f"+value_{i}_{n} = compute({n})\n" for n in range(lines))
+        parts.append(f"@@ -{line},0 +{line},{lines} @@ def f{i}():\n{body}")
+    return "".join(parts)
+
+
+def test_file_risk():
+    assert file_risk("src/auth/session.py") == RISK_HIGH
+    assert file_risk(".github/workflows/ci.yml") == RISK_HIGH
+    assert file_risk("src/utils/format.py") == RISK_NORMAL
+    assert file_risk("tests/test_format.py") == RISK_LOW
+    assert file_risk("README.md") == RISK_LOW
+    assert file_risk("package-lock.json") == RISK_LOW_VALUE
+    assert file_risk("web/dist/app.min.js") == RISK_LOW_VALUE
+
+
+def test_split_hunks_keeps_file_headers_with_the_first_hunk():
+    patch = "--- a/x.py\n+++ b/x.py\n" + _patch(hunks=3)
+
+    hunks = split_hunks(patch)
+
+    assert len(hunks) == 3
+    assert hunks[0].startswith("--- a/x.py\n+++ b/x.py\n@@ -1,0")
+    assert "".join(hunks) == patch
+
+
+def test_files_ranked_by_risk_then_size_into_shards():
+    files = [
+        ("docs/guide.md", _patch(lines=4)),
+        ("src/small.py", _patch(lines=2)),
+        ("src/big.py", _patch(lines=6)),
+        ("src/auth.py", _patch(lines=2)),
+    ]
+
+    pack = pack_files(files, shard_tokens=80, total_tokens=10_000)
+
+    assert [f.path for f in pack.files] == [
+        "src/auth.py",
+        "src/big.py",
+        "src/small.py",
+        "docs/guide.md",
+    ]
+    assert all(sum(f.tokens for f in shard) <= 80 for shard in pack.shards)
+    assert len(pack.shards) > 1
+    assert pack.report.omissions == []
+    assert pack.report.prompt_section() == ""
+
+
+def test_low_value_files_are_summarized():
+    lockfile = _patch(hunks=2, lines=40)
+
+    pack = pack_files(
+        [("package-lock.json", lockfile), ("src/app.py", _patch())],
+        shard_tokens=10_000,
+        total_tokens=10_000,
+    )
+
+    summarized = pack.files[-1]
+    assert summarized.path == "package-lock.json"
+    assert summarized.summarized
+    assert summarized.patch.splitlines() == [
+        "@@ -1,0 +1,40 @@ def f0(): [+40/-0 lines]",
+        "@@ -101,0 +101,40 @@ def f1(): [+40/-0 lines]",
+    ]
+    (omission,) = pack.report.omissions
+    assert (omission.path, omission.hunks, omission.dropped) == (
+        "package-lock.json",
+        2,
+        False,
+    )
+    assert omission.reason == "low-value file"
+
+
+def test_file_over_shard_budget_keeps_the_hunks_that_fit():
+    patch = _patch(hunks=4, lines=5)  # ~36 tokens a hunk
+
+    pack = pack_files([("src/big.py", patch)], shard_tokens=120, total_tokens=1_000)
+
+    (packed,) = pack.files
+    assert packed.summarized
+    assert packed.patch.count("+value_") == 10  # Two hunks in full
+    assert "... (remaining hunks summarized)" in packed.patch
+    assert "@@ -201,0 +201,5 @@ def f2(): [+5/-0 lines]" in packed.patch
+    (omission,) = pack.report.omissions
+    assert omission.hunks == 2
+    assert omission.reason == "over the per-file budget"
+
+
+def test_single_hunk_over_budget_keeps_the_lines_that_fit():
+    body = "".join("+x = 1\n" for _ in range(200))  # Under a token a line
+    patch = f"@@ -1,0 +1,200 @@\n{body}"
+
+    pack = pack_files([("src/big.py", patch)], shard_tokens=100, total_tokens=1_000)
+
+    (packed,) = pack.files
+    kept_text = packed.patch.split("\n... (remaining hunks summarized)")[0]
+    assert finding_cache.estimate_tokens(kept_text) <= 90
+    assert kept_text.count("+x = 1") > 40
+
+
+def test_files_past_the_total_budget_are_summarized_then_dropped():
+    files = [(f"src/mod_{i}.py", _patch(hunks=2, lines=4)) for i in range(4)]
+
+    pack = pack_files(files, shard_tokens=100, total_tokens=150)
+
+    assert [f.path for f in pack.files if not f.summarized] == [
+        "src/mod_0.py",
+        "src/mod_1.py",
+    ]
+    report = pack.report
+    assert [(o.path, o.dropped) for o in report.omissions] == [
+        ("src/mod_2.py", False),
+        ("src/mod_3.py", True),
+    ]
+    assert report.tokens_sent <= 150
+    assert report.incomplete_paths == {"src/mod_2.py", "src/mod_3.py"}
+    assert "1 file(s) summarized and 1 dropped" in str(report)
+
+    # A shard's prompt lists its own summaries and every dropped file
+    section = report.prompt_section({"src/mod_0.py"})
+    assert "`src/mod_3.py`: dropped 2 hunk(s)" in section
+    assert "src/mod_2.py" not in section
+
+
+def test_pack_diff_for_followup_prompt():
+    diff = "\n\n".join(
+        f"--- a/{path}\n+++ b/{path}\n{_patch(lines=lines)}"
+        for path, lines in [("src/util.py", 4), ("yarn.lock", 30), ("src/auth.py", 4)]
+    )
+
+    packed, report = pack_diff(diff, max_tokens=1_000)
+
+    assert packed.index("+++ b/src/auth.py") < packed.index("+++ b/src/util.py")
+    assert "--- a/yarn.lock\n+++ b/yarn.lock\n@@ -1,0 +1,30 @@" in packed
+    assert "+value_0_29" not in packed
+    assert [o.path for o in report.omissions] == ["yarn.lock"]
+    assert "`yarn.lock`: summarized 1 hunk(s)" in report.prompt_section()
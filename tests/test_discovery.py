@@ -11,8 +11,10 @@ Tests cover:
 """
 
 import json
+import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -576,3 +578,91 @@ class TestEdgeCases:
         result2 = discovery.discover(temp_dir)
 
         assert result1 is not result2
+
+
+# =============================================================================
+# FINGERPRINT CACHE
+# =============================================================================
+
+
+class TestFingerprintCache:
+    """Tests for content-fingerprint cache invalidation."""
+
+    def test_package_json_edit_invalidates(self, discovery, temp_dir):
+        (temp_dir / "package.json").write_text(
+            json.dumps({"devDependencies": {"jest": "^29.0.0"}})
+        )
+        assert discovery.discover(temp_dir).frameworks[0].name == "jest"
+
+        (temp_dir / "package.json").write_text(
+            json.dumps({"devDependencies": {"vitest": "^1.0.0", "x": "1"}})
+        )
+        assert discovery.discover(temp_dir).frameworks[0].name == "vitest"
+
+    def test_touch_without_change_is_a_hit(self, discovery, temp_dir):
+        pkg = temp_dir / "package.json"
+        pkg.write_text(json.dumps({"devDependencies": {"jest": "^29.0.0"}}))
+        result1 = discovery.discover(temp_dir)
+
+        # Rewrite identical content with a new mtime
+        pkg.write_text(pkg.read_text())
+        os.utime(pkg, ns=(1, 1))
+
+        assert discovery.discover(temp_dir) is result1
+
+    def test_new_config_file_invalidates(self, discovery, temp_dir):
+        (temp_dir / "package.json").write_text(
+            json.dumps({"devDependencies": {"jest": "^29.0.0"}})
+        )
+        assert discovery.discover(temp_dir).frameworks[0].config_file is None
+
+        (temp_dir / "jest.config.js").write_text("module.exports = {}")
+        assert discovery.discover(temp_dir).frameworks[0].config_file == "jest.config.js"
+
+    def test_lock_file_content_ignored_but_presence_tracked(self, discovery, temp_dir):
+        (temp_dir / "package.json").write_text(json.dumps({"name": "x"}))
+        lock = temp_dir / "yarn.lock"
+        lock.write_text("# v1")
+        result1 = discovery.discover(temp_dir)
+        assert result1.package_manager == "yarn"
+
+        lock.write_text("# v2 - reinstalled")
+        assert discovery.discover(temp_dir) is result1
+
+        lock.unlink()
+        (temp_dir / "pnpm-lock.yaml").write_text("lockfileVersion: 6")
+        assert discovery.discover(temp_dir).package_manager == "pnpm"
+
+    def test_persisted_cache_reused_across_processes(self, temp_dir):
+        (temp_dir / ".auto-claude").mkdir()
+        (temp_dir / "pytest.ini").write_text("[pytest]\n")
+        (temp_dir / "tests").mkdir()
+        (temp_dir / "tests" / "test_a.py").write_text("def test_a(): pass\n")
+
+        first = TestDiscovery()
+        result1 = first.discover(temp_dir)
+        cache_file = temp_dir / ".auto-claude" / "cache" / "test_discovery.json"
+        assert cache_file.exists()
+
+        # Simulate a new process: empty in-memory cache, persisted file only
+        first.clear_cache()
+        with patch.object(
+            TestDiscovery, "_discover_python_frameworks"
+        ) as python_discovery:
+            result2 = TestDiscovery().discover(temp_dir)
+
+        python_discovery.assert_not_called()
+        assert TestDiscovery().to_dict(result2) == TestDiscovery().to_dict(result1)
+
+    def test_no_persisted_cache_without_auto_claude_dir(self, discovery, temp_dir):
+        (temp_dir / "pytest.ini").write_text("[pytest]\n")
+        discovery.discover(temp_dir)
+        assert not (temp_dir / ".auto-claude").exists()
+
+    def test_negative_has_tests_rechecked(self, discovery, temp_dir):
+        (temp_dir / "pytest.ini").write_text("[pytest]\n")
+        (temp_dir / "src" / "pkg").mkdir(parents=True)
+        assert not discovery.discover(temp_dir).has_tests
+
+        (temp_dir / "src" / "pkg" / "test_mod.py").write_text("def test(): pass\n")
+        assert discovery.discover(temp_dir).has_tests
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Tests for the similar-failure index used by bug prediction.
+
+Covers:
+- TF-IDF ranking of failed attempts, with file overlap
+- Incremental sync with attempt_history.json (only new attempts tokenized)
+- Persistence next to the attempt history
+- The recovery manager's attempt_history.json format
+"""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add apps/backend to path for imports (idempotent guard)
+sys_path = Path(__file__).parent.parent / "apps" / "backend"
+if str(sys_path) not in sys.path:
+    sys.path.insert(0, str(sys_path))
+
+from prediction import BugPredictor, memory_loader
+from prediction import failure_index as failure_index_module
+from prediction.failure_index import FailureIndex
+from prediction.memory_loader import MemoryLoader
+from prediction.risk_analyzer import RiskAnalyzer
+
+
+def _failure(subtask_id, description, files=(), error="boom", status="failed"):
+    return {
+        "subtask_id": subtask_id,
+        "subtask_description": description,
+        "status": status,
+        "error_message": error,
+        "files_modified": list(files),
+    }
+
+
+HISTORY = [
+    _failure("1", "Add avatar upload endpoint to users API", ["app/routes/users.py"]),
+    _failure("2", "Fix the login form validation in the frontend"),
+    _failure("3", "Add pagination to the users list endpoint"),
+    _failure("4", "Add avatar upload endpoint", status="completed"),
+]
+
+
+@pytest.fixture
+def memory_dir(tmp_path):
+    memory = tmp_path / "spec" / "memory"
+    memory.mkdir(parents=True)
+    memory_loader._failure_indexes.clear()
+    yield memory
+    memory_loader._failure_indexes.clear()
+
+
+def _write_history(memory_dir: Path, attempts: list[dict]) -> None:
+    (memory_dir / "attempt_history.json").write_text(
+        json.dumps({"attempts": attempts}), encoding="utf-8"
+    )
+
+
+class TestFailureIndex:
+    def test_ranks_by_description_and_files(self):
+        index = FailureIndex()
+        index.sync(HISTORY)
+
+        results = index.search(
+            "Add avatar upload to the users endpoint", {"app/routes/users.py"}
+        )
+
+        assert [r["subtask_id"] for r in results][:2] == ["1", "3"]
+        assert results[0]["failure_reason"] == "boom"
+        assert results[0]["similarity_score"] > results[1]["similarity_score"]
+
+    def test_ignores_successful_attempts_and_unrelated_text(self):
+        index = FailureIndex()
+        index.sync(HISTORY)
+
+        assert len(index) == 3
+        assert index.search("Configure docker compose networking") == []
+
+    def test_file_overlap_alone_is_similar(self):
+        index = FailureIndex()
+        index.sync(HISTORY)
+
+        results = index.search("Refactor", ["app/routes/users.py"])
+
+        assert [r["subtask_id"] for r in results] == ["1"]
+
+    def test_sync_only_tokenizes_new_attempts(self):
+        index = FailureIndex()
+        index.sync(HISTORY)
+        new = _failure("5", "Add avatar cropping")
+
+        with patch.object(
+            failure_index_module, "tokenize", wraps=failure_index_module.tokenize
+        ) as tokenize:
+            assert index.sync(HISTORY + [new]) == 1
+
+        tokenize.assert_called_once_with("Add avatar cropping")
+
+    def test_sync_drops_removed_attempts(self):
+        index = FailureIndex()
+        index.sync(HISTORY)
+        index.sync(HISTORY[1:])
+
+        assert "1" not in [r["subtask_id"] for r in index.search("avatar upload")]
+
+
+class TestMemoryLoaderIndex:
+    def test_persists_and_reloads_index(self, memory_dir):
+        _write_history(memory_dir, HISTORY)
+        MemoryLoader(memory_dir).load_failure_index()
+        assert (memory_dir / "failure_index.json").exists()
+
+        # A new process loads the persisted index without re-tokenizing
+        memory_loader._failure_indexes.clear()
+        with patch.object(failure_index_module, "tokenize") as tokenize:
+            index = MemoryLoader(memory_dir).load_failure_index()
+        tokenize.assert_not_called()
+        assert len(index) == 3
+
+    def test_picks_up_recorded_attempts(self, memory_dir):
+        _write_history(memory_dir, HISTORY)
+        loader = MemoryLoader(memory_dir)
+        index = loader.load_failure_index()
+
+        _write_history(memory_dir, HISTORY + [_failure("5", "Add avatar cropping")])
+
+        assert loader.load_failure_index() is index
+        assert len(index) == 4
+
+    def test_reads_recovery_manager_format(self, memory_dir):
+        history = {
+            "subtasks": {
+                "1.1": {
+                    "attempts": [
+                        {
+                            "session": 1,
+                            "approach": "Use multer for avatar upload",
+                            "success": False,
+                            "error": "multer not installed",
+                        },
+                        {"session": 2, "approach": "Use busboy", "success": True},
+                    ],
+                    "status": "completed",
+                }
+            },
+            "stuck_subtasks": [],
+            "metadata": {},
+        }
+        (memory_dir / "attempt_history.json").write_text(json.dumps(history))
+
+        results = (
+            MemoryLoader(memory_dir)
+            .load_failure_index()
+            .search("Avatar upload endpoint")
+        )
+
+        assert results == [
+            {
+                "subtask_id": "1.1",
+                "description": "Use multer for avatar upload",
+                "failure_reason": "multer not installed",
+                "similarity_score": results[0]["similarity_score"],
+            }
+        ]
+
+
+class TestRiskAnalyzer:
+    def test_accepts_plain_attempt_list(self):
+        subtask = {
+            "description": "Add avatar upload endpoint",
+            "files_to_modify": ["app/routes/users.py"],
+        }
+
+        results = RiskAnalyzer().find_similar_failures(subtask, HISTORY)
+
+        assert results[0]["subtask_id"] == "1"
+
+    def test_predictor_reports_similar_failure(self, memory_dir):
+        _write_history(memory_dir, HISTORY)
+        predictor = BugPredictor(memory_dir.parent)
+
+        checklist = predictor.generate_checklist(
+            {"id": "x", "description": "Avatar upload endpoint for users"}
+        )
+
+        assert any(
+            issue.description == "Similar subtask failed: boom"
+            for issue in checklist.predicted_issues
+        )
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental dedup and cross-validation of review findings
+(runners/github/services/finding_stream.py).
+
+Covers:
+- Duplicates dropped as batches arrive, with live counts
+- Agreeing findings merged once the last batch is in
+- Same result whether findings arrive in one batch or many
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the backend directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+_services_dir = _github_dir / "services"
+
+if str(_services_dir) not in sys.path:
+    sys.path.insert(0, str(_services_dir))
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from finding_stream import FindingStream
+from models import PRReviewFinding, ReviewCategory, ReviewSeverity
+
+
+def _finding(
+    id: str,
+    agent: str,
+    line: int = 10,
+    title: str = "SQL injection",
+    severity: ReviewSeverity = ReviewSeverity.HIGH,
+    category: ReviewCategory = ReviewCategory.SECURITY,
+) -> PRReviewFinding:
+    return PRReviewFinding(
+        id=id,
+        severity=severity,
+        category=category,
+        title=title,
+        description=f"{agent}: {title}",
+        file="src/db.py",
+        line=line,
+        evidence=f"query = f'SELECT {id}'",
+        confidence=0.7,
+        source_agents=[agent],
+    )
+
+
+def _batches():
+    return [
+        # security-reviewer, shard 1
+        [_finding("S1", "security-reviewer"), _finding("S2", "security-reviewer", 20)],
+        # logic-reviewer agrees on line 10 (different title, lower severity)
+        [
+            _finding(
+                "L1",
+                "logic-reviewer",
+                title="Unescaped input",
+                severity=ReviewSeverity.MEDIUM,
+            )
+        ],
+        # quality-reviewer repeats S1 word for word: a duplicate
+        [_finding("Q1", "quality-reviewer", title=" sql INJECTION ")],
+    ]
+
+
+def test_duplicates_are_dropped_on_arrival():
+    stream = FindingStream()
+    first, second, third = _batches()
+
+    assert [f.id for f in stream.add(first)] == ["S1", "S2"]
+    assert (stream.unique_count, stream.agreed_count) == (2, 0)
+
+    assert [f.id for f in stream.add(second)] == ["L1"]
+    assert (stream.unique_count, stream.agreed_count) == (3, 1)
+
+    assert stream.add(third) == []
+    assert (stream.unique_count, stream.agreed_count) == (3, 1)
+
+
+def test_agreeing_findings_are_merged():
+    stream = FindingStream()
+    for batch in _batches():
+        stream.add(batch)
+
+    findings, agreed_ids = stream.merge()
+
+    assert [f.id for f in findings] == ["S1", "S2"]
+    assert agreed_ids == ["S1"]
+    merged = findings[0]
+    assert merged.cross_validated
+    assert merged.confidence == pytest.approx(0.85)
+    assert merged.source_agents == ["security-reviewer", "logic-reviewer"]
+    assert merged.description == (
+        "security-reviewer: SQL injection | logic-reviewer: Unescaped input"
+    )
+    assert merged.evidence == "query = f'SELECT S1'\n---\nquery = f'SELECT L1'"
+    assert not findings[1].cross_validated
+
+
+def test_batching_does_not_change_the_result():
+    streamed = FindingStream()
+    for batch in _batches():
+        streamed.add(batch)
+    at_once = FindingStream()
+    at_once.add([f for batch in _batches() for f in batch])
+
+    def summary(stream):
+        findings, agreed_ids = stream.merge()
+        return [(f.id, f.confidence, f.source_agents) for f in findings], agreed_ids
+
+    assert summary(streamed) == summary(at_once)
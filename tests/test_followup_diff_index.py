@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Tests for the follow-up reviewer's single-pass diff scanning
+(runners/github/services/diff_scan.py).
+
+Covers:
+- Hunk ranges per file, including the inclusive end and omitted counts
+- Same resolutions as the per-finding diff rescan it replaces
+- One combined pass finding the first added-code match of each pattern
+- Resolving many findings against a large diff with one parse per hunk header
+"""
+
+import re
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add the services directory to path (diff_scan has no package imports)
+_services_dir = (
+    Path(__file__).parent.parent
+    / "apps"
+    / "backend"
+    / "runners"
+    / "github"
+    / "services"
+)
+if str(_services_dir) not in sys.path:
+    sys.path.insert(0, str(_services_dir))
+
+import diff_scan
+from diff_scan import AddedCodeScanner, DiffHunkIndex
+
+DIFF = """\
+diff --git a/src/app.py b/src/app.py
+--- a/src/app.py
++++ b/src/app.py
+@@ -10,3 +10,4 @@ def main():
+ context
++added
+ context
+ context
+@@ -40 +41 @@
+-old
++new
+diff --git a/src/new.py b/src/new.py
+new file mode 100644
+--- /dev/null
++++ b/src/new.py
+@@ -0,0 +1,3 @@
++a
++b
++c
+diff --git a/src/util.py b/src/util.py
+--- a/src/util.py
++++ b/src/util.py
+@@ -1,2 +1,2 @@
+-x = 1
++x = 2
+ y = 2
+"""
+
+
+def _legacy_line_appears_changed(file, line, diff):
+    """The per-finding rescan the follow-up reviewer used before."""
+    file_marker = f"--- a/{file}"
+    if file_marker not in diff:
+        return False
+    file_start = diff.find(file_marker)
+    next_file = diff.find("\n--- a/", file_start + 1)
+    file_diff = diff[file_start:next_file] if next_file > 0 else diff[file_start:]
+    for match in re.finditer(r"@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@", file_diff):
+        start_line = int(match.group(1))
+        count = int(match.group(2)) if match.group(2) else 1
+        if start_line <= line <= start_line + count:
+            return True
+    return False
+
+
+def _large_diff(files=200, hunks_per_file=20):
+    sections = []
+    for f in range(files):
+        sections.append(
+            f"diff --git a/pkg/mod_{f}.py b/pkg/mod_{f}.py\n"
+            f"--- a/pkg/mod_{f}.py\n+++ b/pkg/mod_{f}.py\n"
+        )
+        for h in range(hunks_per_file):
+            start = h * 50 + 1
+            sections.append(
+                f"@@ -{start},6 +{start},7 @@\n ctx\n-old\n+new\n+more\n ctx\n ctx\n"
+            )
+    return "".join(sections)
+
+
+class TestDiffHunkIndex:
+    def test_hunk_ranges(self):
+        hunks = DiffHunkIndex(DIFF)
+
+        assert hunks.has_file("src/app.py")
+        assert not hunks.has_file("src/new.py")  # New files have no "--- a/"
+        assert [hunks.line_changed("src/app.py", n) for n in (9, 10, 14, 15)] == [
+            False,
+            True,
+            True,  # start + count is counted as changed
+            False,
+        ]
+        # "@@ -40 +41 @@": count defaults to 1
+        assert hunks.line_changed("src/app.py", 42)
+        assert not hunks.line_changed("src/app.py", 43)
+        assert hunks.line_changed("src/util.py", 1)
+        assert not hunks.line_changed("src/other.py", 1)
+
+    def test_overlapping_hunks_are_merged(self):
+        diff = "--- a/f.py\n+++ b/f.py\n@@ -1,5 +1,5 @@\n@@ -3,10 +3,10 @@\n"
+        hunks = DiffHunkIndex(diff)
+
+        assert all(hunks.line_changed("f.py", n) for n in range(1, 14))
+        assert not hunks.line_changed("f.py", 14)
+
+    def test_matches_legacy_rescan(self):
+        diff = _large_diff(files=20, hunks_per_file=5)
+        hunks = DiffHunkIndex(diff)
+
+        for f in range(20):
+            for line in range(0, 260, 3):
+                file = f"pkg/mod_{f}.py"
+                assert hunks.line_changed(file, line) == _legacy_line_appears_changed(
+                    file, line, diff
+                ), (file, line)
+
+
+class TestAddedCodeScanner:
+    def test_first_added_match_per_pattern(self):
+        scanner = AddedCodeScanner([r"eval\s*\(", r"password\s*=", r"never"])
+        diff = (
+            " unchanged = eval(x)  # context lines, far from any added line\n" * 3
+            + " "
+            + "#" * 60
+            + "\n"
+            + "+result = EVAL (y)\n"
+            + "+password = 'x'\n"
+        )
+
+        found = scanner.first_added(diff)
+
+        assert list(found) == [0, 1]
+        assert diff[found[0] :].startswith("EVAL (y)")
+        assert diff[found[1] :].startswith("password")
+
+    def test_overlapping_patterns_are_all_found(self):
+        scanner = AddedCodeScanner([r"api[_-]?key\s*=", r"key\s*="])
+
+        assert scanner.first_added("+api_key = 1\n") == {0: 1, 1: 5}
+
+
+def test_benchmark_resolving_findings():
+    diff = _large_diff()
+    findings = [(f"pkg/mod_{i % 200}.py", (i * 7) % 1000 + 1) for i in range(2000)]
+
+    headers_parsed = 0
+    finditer = re.finditer
+
+    def counting_finditer(pattern, string, flags=0):
+        nonlocal headers_parsed
+        for match in finditer(pattern, string, flags):
+            headers_parsed += 1
+            yield match
+
+    with patch.object(re, "finditer", counting_finditer):
+        legacy = [_legacy_line_appears_changed(f, n, diff) for f, n in findings]
+    rescanned, headers_parsed = headers_parsed, 0
+
+    header = diff_scan._HUNK_HEADER
+    with patch.object(diff_scan, "_HUNK_HEADER", MagicMock(wraps=header)) as spy:
+        hunks = DiffHunkIndex(diff)
+        indexed = [hunks.line_changed(f, n) for f, n in findings]
+
+    assert indexed == legacy
+    # The index parses each of the 200 * 20 hunk headers once, the rescan
+    # parses a file's headers again for every finding about it
+    assert spy.match.call_count == 200 * 20
+    assert rescanned > 5 * spy.match.call_count
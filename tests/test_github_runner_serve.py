@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Tests for the GitHub runner's serve mode.
+
+Covers:
+- JSON-lines job protocol and control messages
+- Bounded concurrency of the worker pool
+- Per-job routing of output written by concurrent jobs
+- Orchestrators checked out per job: never shared, bounded, keyed without tokens
+- Benchmark: per-job latency of serve mode vs one-shot runs against a fake gh
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+# Add the github runner directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+
+from serve import JobServer, redirect_job_output
+
+from tests.runner_helpers import (
+    GITHUB_RUNNER,
+    python_command,
+    runner_command,
+)
+
+
+class EventLog:
+    """Collects emitted events."""
+
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, event):
+        self.events.append(event)
+
+    def of(self, job_id, event_type):
+        return [
+            e for e in self.events if e["id"] == job_id and e["event"] == event_type
+        ]
+
+
+async def _submit(server, emit, *requests):
+    for request in requests:
+        server.handle_line(json.dumps(request), emit)
+    await server.drain()
+
+
+class TestJobServer:
+    async def test_runs_job_and_routes_output(self):
+        async def run_job(argv):
+            print(f"running {' '.join(argv)}")
+            print("partial line without newline", end="")
+            return 3
+
+        emit = EventLog()
+        with redirect_job_output():
+            await _submit(JobServer(run_job), emit, {"id": "a", "argv": ["queue"]})
+
+        assert [e["line"] for e in emit.of("a", "output")] == [
+            "running queue",
+            "partial line without newline",
+        ]
+        (done,) = emit.of("a", "done")
+        assert done["exit_code"] == 3
+
+    async def test_concurrent_jobs_are_bounded_and_kept_apart(self):
+        running = 0
+        peak = 0
+
+        async def run_job(argv):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            for i in range(3):
+                print(f"{argv[0]} step {i}")
+                await asyncio.sleep(0.01)
+            # Output from asyncio.to_thread() is still attributed to the job
+            await asyncio.to_thread(print, f"{argv[0]} from thread")
+            running -= 1
+            return 0
+
+        emit = EventLog()
+        jobs = [{"id": f"job-{i}", "argv": [f"job-{i}"]} for i in range(6)]
+        with redirect_job_output():
+            await _submit(JobServer(run_job, max_workers=2), emit, *jobs)
+
+        assert peak == 2
+        for i in range(6):
+            assert [e["line"] for e in emit.of(f"job-{i}", "output")] == [
+                f"job-{i} step 0",
+                f"job-{i} step 1",
+                f"job-{i} step 2",
+                f"job-{i} from thread",
+            ]
+            assert emit.of(f"job-{i}", "done")[0]["exit_code"] == 0
+
+    async def test_system_exit_and_errors_become_exit_codes(self):
+        async def run_job(argv):
+            if argv == ["exit"]:
+                sys.exit(2)
+            raise RuntimeError("boom")
+
+        emit = EventLog()
+        with redirect_job_output():
+            await _submit(
+                JobServer(run_job),
+                emit,
+                {"id": "exit", "argv": ["exit"]},
+                {"id": "crash", "argv": ["crash"]},
+            )
+
+        assert emit.of("exit", "done")[0]["exit_code"] == 2
+        assert emit.of("crash", "done")[0]["exit_code"] == 1
+        stderr = [e["line"] for e in emit.of("crash", "output")]
+        assert "RuntimeError: boom" in stderr
+
+    async def test_control_messages_and_invalid_requests(self):
+        reloads = []
+
+        async def run_job(argv):
+            return 0
+
+        server = JobServer(run_job, on_reload=lambda: reloads.append(True))
+        emit = EventLog()
+        server.handle_line("not json", emit)
+        server.handle_line(json.dumps({"id": "p", "command": "ping"}), emit)
+        server.handle_line(json.dumps({"id": "r", "command": "reload"}), emit)
+        server.handle_line(json.dumps({"id": "x", "argv": "queue"}), emit)
+        server.handle_line(json.dumps({"id": "s", "command": "shutdown"}), emit)
+        server.handle_line(json.dumps({"id": "late", "argv": ["queue"]}), emit)
+        await server.drain()
+
+        assert [e["event"] for e in emit.events] == [
+            "error",
+            "pong",
+            "reloaded",
+            "error",
+            "shutting_down",
+            "error",
+        ]
+        assert reloads == [True]
+
+
+# ============================================================================
+# Benchmark against a fake gh
+# ============================================================================
+
+FAKE_GH = """\
+#!{python}
+import json, sys, time
+time.sleep({delay})
+args = sys.argv[1:]
+if args[:1] == ["--version"]:
+    print("gh version 2.99.0 (fake)")
+elif args[:2] == ["auth", "token"]:
+    print("ghp_fake")
+elif args[:2] == ["repo", "view"]:
+    print("octo/widgets")
+else:
+    print("[]")
+"""
+
+
+@pytest.fixture
+def fake_gh_env(tmp_path):
+    """Environment whose gh is a fake that answers after a short delay."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    gh = bin_dir / "gh"
+    gh.write_text(FAKE_GH.format(python=sys.executable, delay=0.05))
+    gh.chmod(0o755)
+
+    project = tmp_path / "project"
+    (project / ".auto-claude").mkdir(parents=True)
+
+    env = {k: v for k, v in os.environ.items() if k not in ("GITHUB_TOKEN", "DEBUG")}
+    env["GITHUB_CLI_PATH"] = str(gh)
+    env["PATH"] = f"{bin_dir}{os.pathsep}{env.get('PATH', '')}"
+    return env, project
+
+
+@pytest.mark.skipif(os.name == "nt", reason="the fake gh is a shebang script")
+def test_benchmark_serve_vs_one_shot(fake_gh_env):
+    env, project = fake_gh_env
+    argv = ["--project", str(project), "queue"]
+    jobs = 5
+
+    one_shot = []
+    for _ in range(jobs):
+        start = time.monotonic()
+        subprocess.run(
+            runner_command(GITHUB_RUNNER, *argv),
+            env=env,
+            check=True,
+            capture_output=True,
+        )
+        one_shot.append(time.monotonic() - start)
+
+    server = subprocess.Popen(
+        runner_command(GITHUB_RUNNER, "serve"),
+        env=env,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    served = []
+    try:
+        for i in range(jobs):
+            start = time.monotonic()
+            server.stdin.write(json.dumps({"id": str(i), "argv": argv}) + "\n")
+            server.stdin.flush()
+            while True:
+                event = json.loads(server.stdout.readline())
+                if event["event"] == "done":
+                    break
+            served.append(time.monotonic() - start)
+            assert event["exit_code"] == 0
+        server.stdin.write(json.dumps({"command": "shutdown"}) + "\n")
+        server.stdin.flush()
+        server.wait(timeout=30)
+    finally:
+        server.kill()
+
+    one_shot_ms = 1000 * sum(one_shot) / jobs
+    # The first job pays the cold start, like a one-shot run
+    warm_ms = 1000 * sum(served[1:]) / (jobs - 1)
+    print(
+        textwrap.dedent(
+            f"""
+            runner.py one-shot:  {one_shot_ms:8.1f} ms/job
+            runner.py serve:     {warm_ms:8.1f} ms/job (warm)
+            saved per job:       {one_shot_ms - warm_ms:8.1f} ms
+            """
+        )
+    )
+    assert warm_ms < one_shot_ms
+
+
+# ============================================================================
+# Orchestrator reuse across jobs
+# ============================================================================
+
+ORCHESTRATOR_POOL_SCRIPT = """
+import asyncio, importlib.util, json
+
+spec = importlib.util.spec_from_file_location("github_runner", sys.argv[1])
+runner = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(runner)
+
+
+class FakeOrchestrator:
+    def __init__(self, project_dir, config, progress_callback=None):
+        self.config = config
+
+
+runner.GitHubOrchestrator = FakeOrchestrator
+runner._idle_orchestrators = []
+used = []
+
+
+async def cmd_queue(args):
+    config = runner.GitHubRunnerConfig(token="ghp_secret", repo="octo/widgets")
+    orchestrator = runner.create_orchestrator(args, config)
+    used.append(id(orchestrator))
+    await asyncio.sleep(0.05)
+    return 0
+
+
+runner.COMMANDS["queue"] = cmd_queue
+
+
+async def main():
+    argv = ["--project", sys.argv[2], "queue"]
+    await asyncio.gather(runner.run_job(argv), runner.run_job(argv))
+    await runner.run_job(argv)
+    concurrent, sequential = used[:2], used[2]
+    await asyncio.gather(*(runner.run_job(argv) for _ in range(12)))
+    print(json.dumps({
+        "shared_concurrently": concurrent[0] == concurrent[1],
+        "reused": sequential in concurrent,
+        "idle": len(runner._idle_orchestrators),
+        "token_in_keys": "ghp_secret" in repr(runner._idle_orchestrators),
+    }))
+
+
+asyncio.run(main())
+"""
+
+
+def test_orchestrators_are_checked_out_per_job(tmp_path):
+    project = tmp_path / "project"
+    (project / ".auto-claude").mkdir(parents=True)
+
+    result = subprocess.run(
+        python_command(ORCHESTRATOR_POOL_SCRIPT, str(GITHUB_RUNNER), str(project)),
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert result.returncode == 0, result.stderr
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    assert report == {
+        "shared_concurrently": False,
+        "reused": True,
+        "idle": 8,
+        "token_in_keys": False,
+    }
@@ -0,0 +1,203 @@
+"""
+Tests for Shared Rate Limits
+============================
+
+Tests the cross-process token bucket and cost ledger used by the GitHub
+runners (runners/github/shared_limits.py).
+
+Covers:
+- Several processes share one bucket: the aggregate rate stays within the
+  limit and every process gets a fair share
+- Queued callers are served in order; try_acquire cannot jump the queue
+- Waiting for another process's write lock leaves the event loop running
+- Waiters of a dead process are dropped
+- The AI cost budget is shared across trackers
+- RateLimiter falls back to in-process limits when the store can't be opened
+"""
+
+import asyncio
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add the backend runners/github directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+
+import shared_limits
+from core import sqlite_store
+from rate_limiter import (
+    CostLimitExceeded,
+    RateLimiter,
+    SharedCostTracker,
+    SharedTokenBucket,
+    TokenBucket,
+)
+from shared_limits import SharedLimitStore
+
+CAPACITY = 5
+REFILL_RATE = 40.0  # tokens per second
+RUN_SECONDS = 1.5
+PROCESSES = 4
+
+
+def _hammer_bucket(state_dir: str, start_at: float) -> list[float]:
+    """Runner process: take tokens as fast as the shared bucket allows."""
+    bucket = SharedTokenBucket(
+        SharedLimitStore(Path(state_dir)), "github", CAPACITY, REFILL_RATE
+    )
+
+    async def run() -> list[float]:
+        await asyncio.sleep(max(0.0, start_at - time.time()))
+        taken = []
+        while time.time() < start_at + RUN_SECONDS:
+            if await bucket.acquire(timeout=0.5):
+                taken.append(time.time())
+        return taken
+
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SharedLimitStore(tmp_path)
+    yield store
+    store.close()
+
+
+class TestMultiProcess:
+    def test_aggregate_rate_stays_within_limit(self, tmp_path):
+        SharedLimitStore(tmp_path).close()  # Create the schema up front
+        start_at = time.time() + 2.0  # After every process has started
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(PROCESSES) as pool:
+            results = pool.starmap(
+                _hammer_bucket, [(str(tmp_path), start_at)] * PROCESSES
+            )
+
+        taken = sorted(t for result in results for t in result)
+        # Any interval may see at most a full bucket plus what refilled in it
+        for i in range(len(taken)):
+            for j in range(i, len(taken)):
+                allowed = CAPACITY + REFILL_RATE * (taken[j] - taken[i]) + 1
+                assert j - i + 1 <= allowed
+
+        # Processes that each believed they owned the bucket would have taken
+        # about PROCESSES times this (measured to the last acquisition, since
+        # a queued waiter may still get its token after the run ends)
+        elapsed = taken[-1] - start_at
+        assert len(taken) <= CAPACITY + REFILL_RATE * elapsed + 1
+        assert len(taken) >= REFILL_RATE * RUN_SECONDS * 0.5
+        # Fair acquisition: nobody is starved
+        fair_share = len(taken) / PROCESSES
+        assert all(len(result) >= fair_share * 0.5 for result in results)
+
+
+class TestSharedTokenBucket:
+    def test_buckets_share_tokens(self, store):
+        first = SharedTokenBucket(store, "github", capacity=10, refill_rate=0.001)
+        second = SharedTokenBucket(store, "github", capacity=10, refill_rate=0.001)
+
+        assert first.try_acquire(6) is True
+        assert second.available() == 4
+        assert second.try_acquire(6) is False
+
+    async def test_try_acquire_does_not_jump_the_queue(self, store):
+        bucket = SharedTokenBucket(store, "github", capacity=1, refill_rate=20.0)
+        assert bucket.try_acquire() is True
+
+        waiter = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0.01)
+        # The waiter is queued; tokens that refill are reserved for it
+        await asyncio.sleep(0.06)
+        assert bucket.try_acquire() is False
+
+        assert await waiter is True
+
+    async def test_timeout_leaves_the_queue(self, store):
+        bucket = SharedTokenBucket(store, "github", capacity=1, refill_rate=0.01)
+        bucket.try_acquire()
+
+        assert await bucket.acquire(timeout=0.1) is False
+
+        conn = store._connect()
+        assert conn.execute("SELECT COUNT(*) FROM waiters").fetchone()[0] == 0
+
+    async def test_waiting_for_the_write_lock_does_not_block_the_loop(self, tmp_path):
+        with patch.object(sqlite_store, "BUSY_TIMEOUT_SECONDS", 2.0):
+            store = SharedLimitStore(tmp_path)
+            bucket = SharedTokenBucket(store, "github", capacity=1, refill_rate=1.0)
+            holder = SharedLimitStore(tmp_path)
+            holder._connect().execute("BEGIN IMMEDIATE")  # Another process writes
+
+            waiter = asyncio.create_task(bucket.acquire())
+            started = time.monotonic()
+            await asyncio.sleep(0.1)
+
+            assert time.monotonic() - started < 1.0
+            assert not waiter.done()
+            holder._connect().execute("ROLLBACK")
+            assert await waiter is True
+            holder.close()
+
+    def test_dead_waiters_are_dropped(self, store):
+        bucket = SharedTokenBucket(store, "github", capacity=1, refill_rate=1000.0)
+        store.enqueue("github")  # A process that died while waiting
+
+        assert bucket.try_acquire() is False
+        with patch.object(
+            shared_limits.time,
+            "time",
+            return_value=time.time() + shared_limits.WAITER_TTL_SECONDS + 1,
+        ):
+            assert bucket.try_acquire() is True
+
+
+class TestSharedCostTracker:
+    def test_budget_is_shared(self, store):
+        review = SharedCostTracker(store, cost_limit=1.0)
+        triage = SharedCostTracker(store, cost_limit=1.0)
+
+        review.add_operation(100_000, 30_000, "claude-sonnet-4-5-20250929")  # $0.75
+
+        with pytest.raises(CostLimitExceeded):
+            triage.add_operation(100_000, 30_000, "claude-sonnet-4-5-20250929")
+        assert triage.total_cost == 0.0
+        assert triage.remaining_budget() == pytest.approx(0.25)
+
+    def test_old_operations_leave_the_window(self, store):
+        tracker = SharedCostTracker(store, cost_limit=1.0, budget_window=60.0)
+        tracker.add_operation(100_000, 30_000, "claude-sonnet-4-5-20250929")
+
+        with patch.object(shared_limits.time, "time", return_value=time.time() + 61.0):
+            assert tracker.remaining_budget() == 1.0
+
+
+class TestRateLimiterSharing:
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        RateLimiter.reset_instance()
+        yield
+        RateLimiter.reset_instance()
+
+    def test_state_dir_enables_sharing(self, tmp_path):
+        limiter = RateLimiter.get_instance(github_limit=10, state_dir=tmp_path)
+
+        assert limiter.shared is True
+        assert isinstance(limiter.github_bucket, SharedTokenBucket)
+        assert isinstance(limiter.cost_tracker, SharedCostTracker)
+
+    def test_unusable_state_dir_falls_back(self, tmp_path):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+
+        limiter = RateLimiter.get_instance(github_limit=10, state_dir=blocker)
+
+        assert limiter.shared is False
+        assert isinstance(limiter.github_bucket, TokenBucket)
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Tests for the GitLab MR review pipeline (runners/gitlab).
+
+Runs the client against a local fake GitLab API and covers:
+- Paginated diffs and commits (X-Next-Page), with the /changes fallback
+- Concurrent fetching of the MR context
+- Chunked review of large MRs as concurrent sessions
+- Per-file findings reused on re-review, keyed on the change's content SHA
+"""
+
+import asyncio
+import importlib
+import json
+import re
+import sys
+import threading
+import time
+import types
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add apps/backend to path for imports (idempotent guard)
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+# runners/gitlab/__init__.py pulls in the CLI runner; load the modules through
+# a bare package instead so their relative imports still resolve
+_gitlab_dir = _backend_dir / "runners" / "gitlab"
+if "gitlab_runner" not in sys.modules:
+    _package = types.ModuleType("gitlab_runner")
+    _package.__path__ = [str(_gitlab_dir)]
+    sys.modules["gitlab_runner"] = _package
+
+glab_client = importlib.import_module("gitlab_runner.glab_client")
+models = importlib.import_module("gitlab_runner.models")
+orchestrator = importlib.import_module("gitlab_runner.orchestrator")
+engine_module = importlib.import_module("gitlab_runner.services.mr_review_engine")
+
+PROJECT = "group/app"
+
+# =============================================================================
+# FAKE GITLAB API
+# =============================================================================
+
+
+def _file(path: str, body: str = "value = 1") -> dict:
+    return {"old_path": path, "new_path": path, "diff": f"@@ -0,0 +1 @@\n+{body}\n"}
+
+
+class _FakeGitLab:
+    """Minimal in-memory GitLab REST backend for one merge request."""
+
+    def __init__(self, files: int = 5, commits: int = 3):
+        self.files = [_file(f"src/module_{i}.py") for i in range(files)]
+        self.commits = [{"id": f"c{i}", "title": f"Commit {i}"} for i in range(commits)]
+        self.page_size = 2
+        self.diffs_missing = False
+        self.delay = 0.0
+        self.requests: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def handle(self, path: str, query: dict) -> tuple[int, object, dict]:
+        prefix = f"/api/v4/projects/{urllib.parse.quote(PROJECT, safe='')}"
+        prefix += "/merge_requests/7"
+        if path == prefix:
+            mr = {
+                "iid": 7,
+                "title": "Add modules",
+                "description": "Adds modules",
+                "author": {"username": "dev"},
+                "source_branch": "feature",
+                "target_branch": "main",
+                "state": "opened",
+                "sha": "abc123",
+            }
+            return 200, mr, {}
+        if path == f"{prefix}/changes":
+            return 200, {"changes": self.files}, {}
+        if path == f"{prefix}/diffs" and self.diffs_missing:
+            return 404, {"message": "404 Not Found"}, {}
+        if path in (f"{prefix}/diffs", f"{prefix}/commits"):
+            items = self.files if path.endswith("/diffs") else self.commits
+            page = int(query.get("page", ["1"])[0])
+            size = min(int(query.get("per_page", ["20"])[0]), self.page_size)
+            body = items[(page - 1) * size : page * size]
+            next_page = str(page + 1) if page * size < len(items) else ""
+            return 200, body, {"X-Next-Page": next_page}
+        return 404, {"message": "404 Not Found"}, {}
+
+
+@pytest.fixture
+def fake_gitlab():
+    """Serve a fake GitLab API on localhost."""
+    stub = _FakeGitLab()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            url = urllib.parse.urlsplit(self.path)
+            with stub._lock:
+                stub.requests.append(url.path)
+                stub.in_flight += 1
+                stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+            time.sleep(stub.delay)
+            status, payload, headers = stub.handle(
+                url.path, urllib.parse.parse_qs(url.query)
+            )
+            with stub._lock:
+                stub.in_flight -= 1
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    stub.url = f"http://127.0.0.1:{server.server_port}"
+
+    yield stub
+
+    server.shutdown()
+    server.server_close()
+
+
+def _client(stub, tmp_path):
+    config = glab_client.GitLabConfig(
+        token="glpat-test", project=PROJECT, instance_url=stub.url
+    )
+    return glab_client.GitLabClient(project_dir=tmp_path, config=config)
+
+
+# =============================================================================
+# CLIENT AND CONTEXT
+# =============================================================================
+
+
+class TestPagination:
+    def test_diffs_and_commits_follow_next_page(self, fake_gitlab, tmp_path):
+        client = _client(fake_gitlab, tmp_path)
+
+        diffs = client.get_mr_diffs(7)
+        commits = client.get_mr_commits(7)
+
+        assert [d["new_path"] for d in diffs] == [
+            f"src/module_{i}.py" for i in range(5)
+        ]
+        assert [c["id"] for c in commits] == ["c0", "c1", "c2"]
+        assert sum(p.endswith("/diffs") for p in fake_gitlab.requests) == 3
+        assert sum(p.endswith("/commits") for p in fake_gitlab.requests) == 2
+
+    def test_falls_back_to_changes_without_diffs_endpoint(self, fake_gitlab, tmp_path):
+        fake_gitlab.diffs_missing = True
+        client = _client(fake_gitlab, tmp_path)
+
+        diffs = client.get_mr_diffs(7)
+
+        assert len(diffs) == 5
+        assert fake_gitlab.requests[-1].endswith("/changes")
+
+    def test_other_errors_are_raised(self, fake_gitlab, tmp_path):
+        client = _client(fake_gitlab, tmp_path)
+
+        with pytest.raises(Exception, match="GitLab API error 404"):
+            client._fetch_all("/projects/group%2Fapp/merge_requests/8/diffs")
+
+
+class TestGatherContext:
+    async def test_fetches_mr_data_concurrently(self, fake_gitlab, tmp_path):
+        fake_gitlab.delay = 0.2
+        config = models.GitLabRunnerConfig(
+            token="glpat-test", project=PROJECT, instance_url=fake_gitlab.url
+        )
+        gitlab = orchestrator.GitLabOrchestrator(project_dir=tmp_path, config=config)
+
+        context = await gitlab._gather_mr_context(7)
+
+        assert context.title == "Add modules"
+        assert context.head_sha == "abc123"
+        assert len(context.changed_files) == 5
+        assert len(context.commits) == 3
+        assert context.total_additions == 5
+        assert fake_gitlab.max_in_flight >= 2
+
+
+# =============================================================================
+# CHUNKED, CACHED REVIEW
+# =============================================================================
+
+
+class AssistantMessage:
+    def __init__(self, text):
+        self.content = [TextBlock(text)]
+
+
+class TextBlock:
+    def __init__(self, text):
+        self.text = text
+
+
+class _FakeReviewer:
+    """Stands in for core.client: one finding per reviewed file."""
+
+    def __init__(self):
+        self.prompts: list[str] = []
+        self.models: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_on: str | None = None
+        # How the findings name their file (the model doesn't always match)
+        self.finding_path = lambda path: path
+
+    def reviewed_files(self) -> list[list[str]]:
+        return [re.findall(r"^\+\+\+ b/(.+)$", p, re.MULTILINE) for p in self.prompts]
+
+    def create_client(self, **kwargs):
+        reviewer = self
+        self.models.append(kwargs["model"])
+
+        class Client:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def query(self, prompt):
+                self.prompt = prompt
+                reviewer.prompts.append(prompt)
+
+            async def receive_response(self):
+                files = re.findall(r"^\+\+\+ b/(.+)$", self.prompt, re.MULTILINE)
+                reviewer.in_flight += 1
+                reviewer.max_in_flight = max(reviewer.max_in_flight, reviewer.in_flight)
+                await asyncio.sleep(0.05)
+                reviewer.in_flight -= 1
+                if reviewer.fail_on in files:
+                    raise ConnectionError("session dropped")
+                findings = [
+                    {
+                        "severity": "medium",
+                        "category": "quality",
+                        "title": f"Issue in {path}",
+                        "description": "Needs work",
+                        "file": reviewer.finding_path(path),
+                        "line": 1,
+                    }
+                    for path in files
+                ]
+                review = {"summary": "Reviewed", "verdict": "ready_to_merge"}
+                review["findings"] = findings
+                yield AssistantMessage(f"```json\n{json.dumps(review)}\n```")
+
+        return Client()
+
+
+@pytest.fixture
+def reviewer(monkeypatch):
+    fake = _FakeReviewer()
+    monkeypatch.setitem(
+        sys.modules, "core.client", SimpleNamespace(create_client=fake.create_client)
+    )
+    # Two files per chunk, at most two sessions at once
+    monkeypatch.setattr(engine_module, "MAX_CHUNK_DIFF_CHARS", 250)
+    monkeypatch.setattr(engine_module, "MAX_CONCURRENT_CHUNKS", 2)
+    return fake
+
+
+def _context(files: list[dict]):
+    return models.MRContext(
+        mr_iid=7,
+        title="Add modules",
+        description="Adds modules",
+        author="dev",
+        source_branch="feature",
+        target_branch="main",
+        state="opened",
+        changed_files=files,
+        diff="\n".join(f["diff"] for f in files),
+    )
+
+
+def _engine(tmp_path, model="claude-sonnet-4-5-20250929"):
+    config = models.GitLabRunnerConfig(token="glpat-test", project=PROJECT, model=model)
+    return engine_module.MRReviewEngine(
+        project_dir=tmp_path, gitlab_dir=tmp_path / "gitlab", config=config
+    )
+
+
+class TestChunkedReview:
+    async def test_large_mr_is_reviewed_in_concurrent_chunks(self, reviewer, tmp_path):
+        files = [_file(f"src/module_{i}.py") for i in range(6)]
+
+        findings, verdict, summary, blockers = await _engine(tmp_path).run_review(
+            _context(files)
+        )
+
+        assert reviewer.reviewed_files() == [
+            ["src/module_0.py", "src/module_1.py"],
+            ["src/module_2.py", "src/module_3.py"],
+            ["src/module_4.py", "src/module_5.py"],
+        ]
+        assert reviewer.max_in_flight == 2
+        assert sorted(f.file for f in findings) == [f["new_path"] for f in files]
+        assert verdict == models.MergeVerdict.READY_TO_MERGE
+        assert blockers == []
+        assert "part 1 of 3" in reviewer.prompts[0]
+
+    async def test_rereview_only_sends_changed_files(self, reviewer, tmp_path):
+        files = [_file(f"src/module_{i}.py") for i in range(6)]
+        engine = _engine(tmp_path)
+        await engine.run_review(_context(files))
+        reviewer.prompts.clear()
+
+        files[4] = _file("src/module_4.py", "value = 2")
+        findings, verdict, summary, _ = await engine.run_review(_context(files))
+
+        assert reviewer.reviewed_files() == [["src/module_4.py"]]
+        assert sorted(f.file for f in findings) == [f["new_path"] for f in files]
+        # Cached findings carry their severity into the verdict
+        assert verdict == models.MergeVerdict.MERGE_WITH_CHANGES
+        assert "5 unchanged file(s)" in summary
+
+        # Nothing changed: no session at all
+        reviewer.prompts.clear()
+        findings, _, _, _ = await engine.run_review(_context(files))
+        assert reviewer.prompts == []
+        assert len(findings) == 6
+
+    async def test_new_model_invalidates_cached_findings(self, reviewer, tmp_path):
+        files = [_file(f"src/module_{i}.py") for i in range(2)]
+        await _engine(tmp_path).run_review(_context(files))
+        reviewer.prompts.clear()
+
+        await _engine(tmp_path, model="claude-opus-4-5").run_review(_context(files))
+
+        assert reviewer.reviewed_files() == [["src/module_0.py", "src/module_1.py"]]
+
+    async def test_completed_chunks_are_cached_when_another_fails(
+        self, reviewer, tmp_path
+    ):
+        files = [_file(f"src/module_{i}.py") for i in range(4)]
+        engine = _engine(tmp_path)
+        reviewer.fail_on = "src/module_3.py"
+
+        with pytest.raises(RuntimeError, match="session dropped"):
+            await engine.run_review(_context(files))
+
+        reviewer.fail_on = None
+        reviewer.prompts.clear()
+        findings, _, _, _ = await engine.run_review(_context(files))
+
+        assert reviewer.reviewed_files() == [["src/module_2.py", "src/module_3.py"]]
+        assert len(findings) == 4
+
+    async def test_oversized_file_is_split_by_hunk(self, reviewer, tmp_path):
+        hunks = [
+            f"@@ -{i},0 +{i},2 @@\n+first_{i} = {'x' * 50}\n+second_{i} = 2\n"
+            for i in range(4)
+        ]
+        big = {
+            "old_path": "src/big.py",
+            "new_path": "src/big.py",
+            "diff": "".join(hunks),
+        }
+        engine = _engine(tmp_path)
+
+        findings, _, _, _ = await engine.run_review(_context([big]))
+
+        # Every hunk was sent whole, in parts that fit a chunk, and none cut
+        assert len(reviewer.prompts) > 1
+        for hunk in hunks:
+            assert sum(hunk in prompt for prompt in reviewer.prompts) == 1
+        assert not any("truncated" in prompt for prompt in reviewer.prompts)
+        assert "`src/big.py (part 1 of " in reviewer.prompts[0]
+        assert {f.file for f in findings} == {"src/big.py"}
+
+        # Cached once all parts were reviewed
+        reviewer.prompts.clear()
+        await engine.run_review(_context([big]))
+        assert reviewer.prompts == []
+
+    async def test_truncated_diff_is_not_cached(self, reviewer, monkeypatch, tmp_path):
+        monkeypatch.setattr(engine_module, "MAX_PROMPT_DIFF_CHARS", 300)
+        # One line longer than a chunk can't be split: the prompt is cut
+        minified = _file("static/app.min.js", "x" * 400)
+        engine = _engine(tmp_path)
+
+        await engine.run_review(_context([minified, _file("src/small.py")]))
+        assert any("truncated" in prompt for prompt in reviewer.prompts)
+        reviewer.prompts.clear()
+        await engine.run_review(_context([minified, _file("src/small.py")]))
+
+        assert reviewer.reviewed_files() == [["static/app.min.js"]]
+
+    async def test_finding_paths_are_normalized(self, reviewer, tmp_path):
+        paths = ["src/module_0.py", "src/module_1.py"]
+        files = [_file(path) for path in paths]
+        engine = _engine(tmp_path)
+        reviewer.finding_path = lambda path: (
+            f"./{path}" if path.endswith("0.py") else path.rsplit("/", 1)[-1]
+        )
+
+        findings, _, _, _ = await engine.run_review(_context(files))
+        assert sorted(f.file for f in findings) == paths
+
+        reviewer.prompts.clear()
+        findings, _, _, _ = await engine.run_review(_context(files))
+        assert reviewer.prompts == []
+        assert sorted(f.file for f in findings) == paths
+
+    async def test_chunk_with_a_finding_about_another_file_is_not_cached(
+        self, reviewer, tmp_path
+    ):
+        files = [_file(f"src/module_{i}.py") for i in range(4)]
+        engine = _engine(tmp_path)
+        reviewer.finding_path = lambda path: (
+            "src/config.py" if path == "src/module_3.py" else path
+        )
+
+        findings, _, _, _ = await engine.run_review(_context(files))
+        assert "src/config.py" in {f.file for f in findings}
+
+        reviewer.prompts.clear()
+        findings, _, _, _ = await engine.run_review(_context(files))
+        assert reviewer.reviewed_files() == [["src/module_2.py", "src/module_3.py"]]
+        assert "src/config.py" in {f.file for f in findings}
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent Graphiti embedding cache.
+
+Covers:
+- Repeated texts are embedded once, across embedder instances (sessions)
+- Batches send only the distinct misses to the provider, in one call
+- Entries are separated by provider, model and dimension
+- create_embedder wraps every provider unless the cache is disabled
+"""
+
+import hashlib
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add apps/backend to path for imports (idempotent guard)
+sys_path = Path(__file__).parent.parent / "apps" / "backend"
+if str(sys_path) not in sys.path:
+    sys.path.insert(0, str(sys_path))
+
+from integrations.graphiti.config import GraphitiConfig
+from integrations.graphiti.providers_pkg import factory
+from integrations.graphiti.providers_pkg.embedding_cache import (
+    CachedEmbedder,
+    EmbeddingCache,
+)
+
+DIMENSION = 8
+
+
+class FakeEmbedder:
+    """Deterministic embedder that records what it was asked to embed."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    @staticmethod
+    def vector(text: str) -> list[float]:
+        # Multiples of 1/256 survive the float32 round trip exactly
+        digest = hashlib.sha256(text.encode()).digest()
+        return [b / 256 for b in digest[:DIMENSION]]
+
+    async def create(self, input_data):
+        text = input_data if isinstance(input_data, str) else input_data[0]
+        self.calls.append([text])
+        return self.vector(text)
+
+    async def create_batch(self, input_data_list):
+        self.calls.append(list(input_data_list))
+        return [self.vector(text) for text in input_data_list]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = EmbeddingCache(tmp_path / "embedding_cache.db")
+    yield cache
+    cache.close()
+
+
+def _cached(cache, fake=None, model="fake-model"):
+    return CachedEmbedder(
+        fake or FakeEmbedder(), cache, "fake", model=model, dimension=DIMENSION
+    )
+
+
+async def test_repeated_texts_are_embedded_once_across_sessions(cache):
+    first_session = FakeEmbedder()
+    second_session = FakeEmbedder()
+
+    first = await _cached(cache, first_session).create("apps/backend/core/client.py")
+    embedder = _cached(cache, second_session)
+    second = await embedder.create(["apps/backend/core/client.py"])
+
+    assert first == second == FakeEmbedder.vector("apps/backend/core/client.py")
+    assert second_session.calls == []
+    assert embedder.cache_stats.hits == 1
+    assert embedder.cache_stats.hit_rate == 1.0
+
+
+async def test_batch_sends_only_distinct_misses(cache):
+    embedder = _cached(cache)
+    await embedder.create("pattern: retry with backoff")
+    embedder.embedder.calls.clear()
+
+    texts = [
+        "gotcha: stale cache",
+        "pattern: retry with backoff",
+        "gotcha: stale cache",
+    ]
+    vectors = await embedder.create_batch(texts)
+
+    assert vectors == [FakeEmbedder.vector(text) for text in texts]
+    assert embedder.embedder.calls == [["gotcha: stale cache"]]
+    assert str(embedder.cache_stats) == "2 hits, 2 misses (50.0% hit rate)"
+
+
+async def test_entries_are_separated_by_model(cache):
+    await _cached(cache, model="small").create("session insight")
+    other = FakeEmbedder()
+
+    await _cached(cache, other, model="large").create("session insight")
+
+    assert other.calls == [["session insight"]]
+
+
+async def test_uncacheable_input_passes_through(cache):
+    fake = FakeEmbedder()
+    embedder = _cached(cache, fake)
+
+    await embedder.create(["first", "second"])
+    await embedder.create(["first", "second"])
+
+    assert len(fake.calls) == 2
+    assert embedder.cache_stats.hits == embedder.cache_stats.misses == 0
+
+
+def test_oldest_entries_are_dropped(tmp_path):
+    cache = EmbeddingCache(tmp_path / "embedding_cache.db", max_entries=2)
+    for text in ("a", "b", "c"):
+        cache.put_many("fake", "m", DIMENSION, {text: FakeEmbedder.vector(text)})
+
+    assert set(cache.get_many("fake", "m", DIMENSION, ["a", "b", "c"])) == {"b", "c"}
+
+
+class TestCreateEmbedder:
+    def _config(self, tmp_path, **overrides):
+        return GraphitiConfig(
+            embedder_provider="openai",
+            openai_api_key="sk-test",
+            db_path=str(tmp_path),
+            **overrides,
+        )
+
+    def test_provider_embedder_is_wrapped(self, tmp_path):
+        fake = FakeEmbedder()
+        with patch.object(factory, "create_openai_embedder", return_value=fake):
+            embedder = factory.create_embedder(self._config(tmp_path))
+
+        assert isinstance(embedder, CachedEmbedder)
+        assert embedder.embedder is fake
+        assert (embedder.provider, embedder.model, embedder.dimension) == (
+            "openai",
+            "text-embedding-3-small",
+            1536,
+        )
+        assert (tmp_path / "embedding_cache.db").exists()
+
+    def test_cache_can_be_disabled(self, tmp_path):
+        fake = FakeEmbedder()
+        with patch.object(factory, "create_openai_embedder", return_value=fake):
+            embedder = factory.create_embedder(
+                self._config(tmp_path, embedding_cache=False)
+            )
+
+        assert embedder is fake
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Tests for the persisted reverse import graph used by the PR context gatherer.
+
+Covers:
+- Python and JS/TS import resolution (relative, aliases, index files, packages)
+- Persistence between processes and incremental updates from git changes
+- Benchmark: tree walks, file reads and git calls of per-file walks vs the
+  indexed graph on a synthetic large repo
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add apps/backend and the github runner directory to path (idempotent guard)
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+for _path in (_backend_dir, _backend_dir / "runners" / "github"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+import analysis.import_graph as import_graph_module
+from analysis.import_graph import (
+    ImportGraph,
+    clear_import_graphs,
+    get_import_graph,
+    iter_import_specifiers,
+)
+from context_gatherer import PRContextGatherer
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+def _commit_all(repo: Path, message: str = "Update") -> None:
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", message)
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    # Make sure the stat changes even on coarse-mtime filesystems
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A committed git repo with Python and TypeScript imports."""
+    repo = tmp_path / "repo"
+    (repo / ".auto-claude").mkdir(parents=True)
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test")
+    _write(repo / ".gitignore", ".auto-claude/\n")
+    _write(
+        repo / "tsconfig.json",
+        json.dumps({"compilerOptions": {"paths": {"@/*": ["web/src/*"]}}}),
+    )
+    _write(repo / "web/src/formatter.ts", "export const format = (s) => s;\n")
+    _write(repo / "web/src/widgets/index.ts", "export * from '../formatter';\n")
+    _write(repo / "web/src/app.tsx", "import { format } from './formatter';\n")
+    _write(repo / "web/src/lazy.ts", "const w = import('./widgets');\n")
+    _write(repo / "web/src/aliased.ts", "import { format } from '@/formatter';\n")
+    _write(repo / "web/src/cjs.js", "const f = require('./formatter');\n")
+    _write(repo / "web/src/standalone.ts", "import lodash from 'lodash';\n")
+    _write(repo / "svc/pkg/__init__.py", "")
+    _write(repo / "svc/pkg/billing.py", "def charge(): pass\n")
+    _write(repo / "svc/pkg/api.py", "from .billing import charge\n")
+    _write(repo / "svc/pkg/jobs.py", "from . import billing\n")
+    # Absolute import of a sibling package (svc/ is on sys.path when run)
+    _write(repo / "svc/worker.py", "import pkg.billing\n")
+    _commit_all(repo, "Initial commit")
+    clear_import_graphs()
+    yield repo
+    clear_import_graphs()
+
+
+def _graph(repo: Path) -> ImportGraph:
+    return get_import_graph(repo, {"@/*": ["web/src/*"]})
+
+
+class TestResolution:
+    def test_js_and_python_dependents(self, repo):
+        graph = _graph(repo)
+
+        assert graph.dependents("web/src/formatter.ts") == {
+            "web/src/app.tsx",
+            "web/src/aliased.ts",
+            "web/src/cjs.js",
+            "web/src/widgets/index.ts",
+        }
+        assert graph.dependents("web/src/widgets/index.ts") == {"web/src/lazy.ts"}
+        assert graph.dependents("svc/pkg/billing.py") == {
+            "svc/pkg/api.py",
+            "svc/pkg/jobs.py",
+            "svc/worker.py",
+        }
+        assert graph.dependents("web/src/standalone.ts") == set()
+
+    def test_specifiers(self):
+        assert iter_import_specifiers(
+            "import a from 'react';\nexport { b } from './b';\nimport '@/c';\n", ".ts"
+        ) == ["./b", "@/c"]
+        assert iter_import_specifiers(
+            "import os\nfrom ..pkg import mod\nfrom . import sibling\n", ".py"
+        ) == ["os", "..pkg", "..pkg.mod", ".sibling"]
+        assert iter_import_specifiers("def broken(:\n", ".py") == []
+
+    def test_gatherer_uses_graph(self, repo):
+        gatherer = PRContextGatherer(repo, pr_number=1)
+
+        with patch.object(import_graph_module.os, "walk") as walk:
+            dependents = gatherer._find_dependents("web/src/formatter.ts")
+            imports = gatherer._find_imports(
+                "import { format } from '@/formatter';\nimport './widgets';\n",
+                Path("web/src/new.ts"),
+            )
+
+        walk.assert_not_called()
+        assert "web/src/app.tsx" in dependents
+        assert {p.replace("\\", "/") for p in imports} == {
+            "web/src/formatter.ts",
+            "web/src/widgets/index.ts",
+        }
+
+
+class TestIncrementalUpdates:
+    def test_persisted_graph_is_reused_by_the_next_process(self, repo):
+        assert _graph(repo).parsed_files == 12
+        assert (repo / ".auto-claude" / "cache" / "import_graph.json").exists()
+
+        clear_import_graphs()
+        graph = _graph(repo)
+
+        assert graph.parsed_files == 0
+        assert "web/src/app.tsx" in graph.dependents("web/src/formatter.ts")
+
+    def test_only_changed_files_are_reparsed(self, repo):
+        _graph(repo)
+
+        # Committed edit, new untracked importer, and a deleted importer
+        _write(repo / "web/src/app.tsx", "export const app = 1;\n")
+        _commit_all(repo)
+        _write(repo / "web/src/report.ts", "import { format } from './formatter';\n")
+        (repo / "web/src/cjs.js").unlink()
+
+        clear_import_graphs()
+        graph = _graph(repo)
+
+        assert graph.parsed_files == 2
+        assert graph.dependents("web/src/formatter.ts") == {
+            "web/src/aliased.ts",
+            "web/src/report.ts",
+            "web/src/widgets/index.ts",
+        }
+
+    def test_reverted_working_tree_edit_is_picked_up(self, repo):
+        _graph(repo)
+        api = repo / "svc/pkg/api.py"
+        original = api.read_text()
+
+        _write(api, "import json\n")
+        assert "svc/pkg/api.py" not in _graph(repo).dependents("svc/pkg/billing.py")
+
+        # Back to the committed content: no longer in `git diff`, still re-checked
+        _write(api, original)
+        assert "svc/pkg/api.py" in _graph(repo).dependents("svc/pkg/billing.py")
+
+
+# ============================================================================
+# Benchmark on a synthetic large repository
+# ============================================================================
+
+MODULES = 40
+FILES_PER_MODULE = 30
+
+
+def _legacy_find_dependents(project_dir: Path, file_path: str) -> set[str]:
+    """The previous implementation: walk the tree and grep for the stem."""
+    stem = Path(file_path).stem
+    pattern = re.compile(rf"['\"].*{re.escape(stem)}['\"]")
+    dependents = set()
+    for root, dirs, files in os.walk(project_dir):
+        dirs[:] = [d for d in dirs if d not in import_graph_module.EXCLUDE_DIRS]
+        for filename in files:
+            if not filename.endswith((".ts", ".tsx", ".js", ".jsx")):
+                continue
+            full_path = Path(root) / filename
+            rel_path = full_path.relative_to(project_dir).as_posix()
+            if rel_path != file_path and pattern.search(full_path.read_text()):
+                dependents.add(rel_path)
+    return dependents
+
+
+@pytest.fixture
+def large_repo(tmp_path):
+    repo = tmp_path / "monorepo"
+    (repo / ".auto-claude").mkdir(parents=True)
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test")
+    (repo / ".gitignore").write_text(".auto-claude/\n")
+    for m in range(MODULES):
+        module_dir = repo / "packages" / f"mod{m}" / "src"
+        module_dir.mkdir(parents=True)
+        for f in range(FILES_PER_MODULE):
+            imports = "".join(
+                f"import {{ v{g} }} from './file{g}';\n" for g in range(f) if g > f - 4
+            )
+            (module_dir / f"file{f}.ts").write_text(
+                f"{imports}export const v{f} = {f};\n"
+            )
+    _commit_all(repo, "Initial commit")
+    clear_import_graphs()
+    yield repo
+    clear_import_graphs()
+
+
+def test_benchmark_walks_vs_indexed_graph(large_repo):
+    # A 40-file PR touching one file per module
+    changed = [f"packages/mod{m}/src/file10.ts" for m in range(MODULES)]
+    real_walk = os.walk
+    walks = []
+
+    def counting_walk(top, *args, **kwargs):
+        # Count tree walks, not the recursive calls of older os.walk versions
+        if Path(top) == large_repo:
+            walks.append(top)
+        return real_walk(top, *args, **kwargs)
+
+    real_read_text = Path.read_text
+    reads = []
+
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self)
+        return real_read_text(self, *args, **kwargs)
+
+    run_git = import_graph_module.run_git
+    with (
+        patch.object(os, "walk", counting_walk),
+        patch.object(Path, "read_text", counting_read_text),
+        patch.object(import_graph_module, "run_git", wraps=run_git) as git,
+    ):
+        legacy = {path: _legacy_find_dependents(large_repo, path) for path in changed}
+        legacy_walks, legacy_reads = len(walks), len(reads)
+
+        graph = get_import_graph(large_repo)
+        assert graph.parsed_files == MODULES * FILES_PER_MODULE
+
+        # The next review (new process) finds the persisted graph
+        walks.clear()
+        reads.clear()
+        git.reset_mock()
+        clear_import_graphs()
+        graph = get_import_graph(large_repo)
+        indexed = {path: graph.dependents(path) for path in changed}
+
+    assert legacy_walks == len(changed)
+    assert legacy_reads == len(changed) * (MODULES * FILES_PER_MODULE - 1)
+    # Reused: no walk and no source read, only ls-files, rev-parse and diff
+    assert walks == []
+    assert reads == []
+    assert git.call_count == 3
+    assert graph.parsed_files == 0
+    # The graph is exact where the stem grep also matched file10x/file1 lookalikes
+    for path in changed:
+        assert indexed[path] <= legacy[path]
+        assert indexed[path] == {
+            path.replace("file10", f"file{g}") for g in (11, 12, 13)
+        }
@@ -8,7 +8,11 @@ Tests validating all Phase 1-3 features work correctly:
 - Phase 3: Multi-agent cross-validation
 """
 
+import asyncio
+import dataclasses
+import re
 import sys
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -67,10 +71,40 @@ pydantic_models_spec = importlib.util.spec_from_file_location(
     backend_path / "runners" / "github" / "services" / "pydantic_models.py"
 )
 pydantic_models_module = importlib.util.module_from_spec(pydantic_models_spec)
+sys.modules.setdefault('pydantic_models', pydantic_models_module)  # For forward refs
 sys.modules['services.pydantic_models'] = pydantic_models_module
 pydantic_models_spec.loader.exec_module(pydantic_models_module)
 AgentAgreement = pydantic_models_module.AgentAgreement
 
+# Load finding_cache
+finding_cache_spec = importlib.util.spec_from_file_location(
+    "finding_cache",
+    backend_path / "runners" / "github" / "services" / "finding_cache.py"
+)
+finding_cache_module = importlib.util.module_from_spec(finding_cache_spec)
+sys.modules['finding_cache'] = finding_cache_module  # For its dataclasses
+sys.modules['services.finding_cache'] = finding_cache_module
+finding_cache_spec.loader.exec_module(finding_cache_module)
+
+# Load finding_stream
+finding_stream_spec = importlib.util.spec_from_file_location(
+    "finding_stream",
+    backend_path / "runners" / "github" / "services" / "finding_stream.py"
+)
+finding_stream_module = importlib.util.module_from_spec(finding_stream_spec)
+sys.modules['services.finding_stream'] = finding_stream_module
+finding_stream_spec.loader.exec_module(finding_stream_module)
+
+# Load context_packer
+context_packer_spec = importlib.util.spec_from_file_location(
+    "context_packer",
+    backend_path / "runners" / "github" / "services" / "context_packer.py"
+)
+context_packer_module = importlib.util.module_from_spec(context_packer_spec)
+sys.modules['context_packer'] = context_packer_module  # For its dataclasses
+sys.modules['services.context_packer'] = context_packer_module
+context_packer_spec.loader.exec_module(context_packer_module)
+
 
 # Load parallel_orchestrator_reviewer (contains ConfidenceTier, validation functions)
 orchestrator_spec = importlib.util.spec_from_file_location(
@@ -583,27 +617,32 @@ class TestReverseDepDetection:
         assert len(dependents_index) == 0
         assert len(dependents_main) == 0
 
-    def test_respects_file_limit(self, tmp_path):
-        """Large repo search should stop after reaching file limit."""
+    def test_large_repo_is_indexed_without_hanging(self, tmp_path):
+        """Dependents of a large (non-git) repo come from one indexed walk."""
         src_dir = tmp_path / "src"
         src_dir.mkdir()
         (src_dir / "unique_name.ts").write_text("export const x = 1;")
 
         gatherer = PRContextGathererIsolated(tmp_path, pr_number=1)
 
-        # Mock os.walk to generate more files than the limit (2000)
+        # Mock os.walk to generate more files than a per-file scan could afford
         # This simulates a large codebase without creating actual files
+        walks = []
+
         def mock_walk(path):
+            walks.append(path)
             # Yield a directory with 3000 TypeScript files
             yield (str(path), [], [f"file{i}.ts" for i in range(3000)])
 
-        with patch.object(_cg_module.os, "walk", mock_walk):
-            # The function should stop after max_files_to_check (2000) files
-            # and return gracefully without hanging
+        import analysis.import_graph as import_graph_module
+
+        with patch.object(import_graph_module.os, "walk", mock_walk):
             dependents = gatherer._find_dependents("src/unique_name.ts")
+            gatherer._find_dependents("src/other_name.ts")
 
-        # Should return a set (may be empty since mock files don't contain imports)
+        # Should return a set (empty since mock files don't exist)
         assert isinstance(dependents, set)
+        assert len(walks) == 1
 
 
 # =============================================================================
@@ -1130,3 +1169,331 @@ class TestIntegrationPipeline:
             finding = make_finding(confidence=confidence)
             tier = ConfidenceTier.get_tier(finding.confidence)
             assert tier == expected_tier, f"Confidence {confidence} should be {expected_tier}"
+
+
+# =============================================================================
+# Specialist Fan-Out: concurrent sessions with streaming findings
+# =============================================================================
+
+class TestSpecialistFanOut:
+    """Test the concurrent specialist sessions over sharded files."""
+
+    FILES = [f"src/mod_{i}.py" for i in range(4)]
+
+    @pytest.fixture
+    def reviewer(self, tmp_path, monkeypatch):
+        """Reviewer whose sessions are fake clients with per-job delays."""
+        from types import SimpleNamespace
+
+        from models import GitHubRunnerConfig
+
+        github_dir = tmp_path / ".auto-claude" / "github"
+        github_dir.mkdir(parents=True)
+        reviewer = ParallelOrchestratorReviewer(
+            project_dir=tmp_path,
+            github_dir=github_dir,
+            config=GitHubRunnerConfig(token="test-token", repo="test/repo"),
+        )
+        reviewer.progress = []
+        monkeypatch.setattr(
+            reviewer,
+            "_report_progress",
+            lambda phase, progress, message, **kw: reviewer.progress.append(
+                (time.monotonic(), progress, message)
+            ),
+        )
+        # Two files per shard, three sessions at a time
+        monkeypatch.setattr(orchestrator_module, "SPECIALIST_SHARD_TOKENS", 100)
+        monkeypatch.setattr(
+            orchestrator_module, "MAX_CONCURRENT_SPECIALIST_SESSIONS", 3
+        )
+
+        state = SimpleNamespace(running=0, max_running=0, prompts=[], ended={})
+        reviewer.sessions = state
+        reviewer.fail = set()
+        reviewer.unparseable = set()
+        reviewer.dismiss = set()
+        reviewer.validated = []
+
+        class FakeClient:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def query(self, prompt):
+                self.prompt = prompt
+
+        async def fake_stream(client, context_name, model):
+            agent = context_name.split(":", 1)[1]
+            if agent == orchestrator_module.FINDING_VALIDATOR:
+                # Confirms every finding, except those on reviewer.dismiss files
+                batch = re.findall(
+                    r"^### (\S+)\n- \*\*File\*\*: `([^`]+)`", client.prompt, re.M
+                )
+                reviewer.validated.extend(batch)
+                return {
+                    "error": None,
+                    "result_text": "",
+                    "structured_output": {
+                        "validations": [
+                            {
+                                "finding_id": finding_id,
+                                "validation_status": (
+                                    "dismissed_false_positive"
+                                    if path in reviewer.dismiss
+                                    else "confirmed_valid"
+                                ),
+                                "code_evidence": "x = eval(user_input)",
+                                "line_range": [3, 3],
+                                "explanation": "Checked the code at the cited line.",
+                                "evidence_verified_in_file": True,
+                            }
+                            for finding_id, path in batch
+                        ],
+                        "summary": f"{len(batch)} findings checked",
+                    },
+                }
+            shard = [f for f in self.FILES if f"### File: {f}\n" in client.prompt]
+            state.prompts.append((agent, shard))
+            state.running += 1
+            state.max_running = max(state.max_running, state.running)
+            # The logic reviewer is slow; everyone else is quick
+            await asyncio.sleep(0.2 if agent == "logic-reviewer" else 0.01)
+            state.running -= 1
+            state.ended[(agent, shard[0])] = time.monotonic()
+            if agent in reviewer.fail:
+                return {"error": "stream broke"}
+            if (agent, shard[0]) in reviewer.unparseable:
+                return {
+                    "error": None,
+                    "result_text": "Looks fine to me.",
+                    "structured_output": None,
+                }
+            findings = [
+                {
+                    "id": f"{agent}-{path}",
+                    "file": path,
+                    "line": 3,
+                    "title": f"{agent} issue",
+                    "description": f"Found by {agent}",
+                    "category": "security" if agent != "quality-reviewer" else "quality",
+                    "severity": "high",
+                    "evidence": "eval(user_input)",
+                }
+                for path in shard
+                if agent in ("security-reviewer", "logic-reviewer", "quality-reviewer")
+            ]
+            return {
+                "error": None,
+                "result_text": "",
+                "structured_output": {"findings": findings},
+            }
+
+        monkeypatch.setattr(
+            orchestrator_module, "create_client", lambda **kw: FakeClient()
+        )
+        monkeypatch.setattr(orchestrator_module, "process_sdk_stream", fake_stream)
+        # claude_agent_sdk is mocked at import time
+        monkeypatch.setattr(
+            orchestrator_module, "AgentDefinition", lambda **kw: SimpleNamespace(**kw)
+        )
+        return reviewer
+
+    def _context(self, ai_comments=()):
+        from types import SimpleNamespace
+
+        return SimpleNamespace(
+            pr_number=7,
+            title="Refactor modules",
+            author="dev",
+            base_branch="main",
+            head_branch="feature",
+            description="",
+            total_additions=40,
+            total_deletions=0,
+            commits=[],
+            ai_bot_comments=list(ai_comments),
+            changed_files=[
+                SimpleNamespace(
+                    path=path,
+                    status="modified",
+                    additions=10,
+                    deletions=0,
+                    patch="+x = eval(user_input)\n" * 7,  # ~38 tokens
+                )
+                for path in self.FILES
+            ],
+        )
+
+    async def test_specialists_review_every_shard_concurrently(self, reviewer):
+        stream = finding_stream_module.FindingStream()
+
+        findings, agents, unreviewed = await reviewer._run_specialists(
+            self._context(), Path("/repo"), "sonnet", None, stream
+        )
+
+        # 4 file reviewers x 2 shards, no AI triage without AI comments
+        assert sorted(reviewer.sessions.prompts) == sorted(
+            (agent, shard)
+            for agent in orchestrator_module.FILE_REVIEWERS
+            for shard in (self.FILES[:2], self.FILES[2:])
+        )
+        assert reviewer.sessions.max_running == 3
+        assert unreviewed == set()
+        assert agents == list(orchestrator_module.FILE_REVIEWERS)
+        assert len(findings) == stream.unique_count == 12
+        assert all(len(f.source_agents) == 1 for f in findings)
+
+        # Security and logic agree on every file
+        merged, agreed_ids = stream.merge()
+        assert len(agreed_ids) == 4
+        assert {tuple(f.source_agents) for f in merged if f.cross_validated} == {
+            ("security-reviewer", "logic-reviewer")
+        }
+
+    async def test_findings_stream_in_before_slow_sessions_finish(self, reviewer):
+        stream = finding_stream_module.FindingStream()
+
+        await reviewer._run_specialists(
+            self._context(), Path("/repo"), "sonnet", None, stream
+        )
+
+        last_logic_end = max(
+            ended
+            for (agent, _), ended in reviewer.sessions.ended.items()
+            if agent == "logic-reviewer"
+        )
+        first_report = next(
+            at for at, _, message in reviewer.progress if " 0 findings" not in message
+            and "findings" in message
+        )
+        assert first_report < last_logic_end
+        # Progress climbs from 40 to 50 as sessions finish
+        assert [p for _, p, _ in reviewer.progress][-1] == 50
+
+    async def test_failed_session_keeps_other_findings(self, reviewer):
+        reviewer.fail = {"quality-reviewer"}
+        stream = finding_stream_module.FindingStream()
+
+        findings, agents, unreviewed = await reviewer._run_specialists(
+            self._context(), Path("/repo"), "sonnet", None, stream
+        )
+
+        assert unreviewed == set(self.FILES)  # Quality never saw these files
+        assert "quality-reviewer" not in agents
+        assert len(findings) == 8
+
+    async def test_all_sessions_failing_fails_the_review(self, reviewer):
+        reviewer.fail = set(orchestrator_module.FILE_REVIEWERS)
+
+        with pytest.raises(RuntimeError, match="All specialist sessions failed"):
+            await reviewer._run_specialists(
+                self._context(),
+                Path("/repo"),
+                "sonnet",
+                None,
+                finding_stream_module.FindingStream(),
+            )
+
+    async def test_ai_triage_runs_once_over_commented_files(self, reviewer):
+        from types import SimpleNamespace
+
+        comments = [
+            SimpleNamespace(tool_name="CodeRabbit", created_at="", file=path, body="Nit")
+            for path in (None, self.FILES[3], self.FILES[1])
+        ]
+
+        await reviewer._run_specialists(
+            self._context(comments),
+            Path("/repo"),
+            "sonnet",
+            None,
+            finding_stream_module.FindingStream(),
+        )
+
+        triage = [s for a, s in reviewer.sessions.prompts if a == "ai-triage-reviewer"]
+        assert triage == [[self.FILES[1], self.FILES[3]]]
+
+    def _review_context(self, reviewer, monkeypatch):
+        """A PRContext stand-in for review(), with the PR's plumbing faked."""
+        from types import SimpleNamespace
+
+        @dataclasses.dataclass
+        class Context:
+            pr_number: int
+            title: str
+            description: str
+            author: str
+            base_branch: str
+            head_branch: str
+            changed_files: list
+            related_files: list
+            commits: list
+            ai_bot_comments: list
+            total_additions: int = 40
+            total_deletions: int = 0
+            head_sha: str = ""
+            has_merge_conflicts: bool = False
+            merge_state_status: str = ""
+
+        context = Context(
+            **{
+                **vars(self._context()),
+                "changed_files": [
+                    SimpleNamespace(**vars(f), content="x = eval(user_input)\n")
+                    for f in self._context().changed_files
+                ],
+                "related_files": [],
+            }
+        )
+
+        async def fetch_blobs(pr_number):
+            return {path: f"blob-{path}" for path in self.FILES}
+
+        monkeypatch.setattr(reviewer, "_fetch_file_blobs", fetch_blobs)
+        monkeypatch.setattr(reviewer, "_cleanup_stale_pr_worktrees", lambda: None)
+        monkeypatch.setattr(orchestrator_module, "resolve_model_id", lambda m: m)
+        monkeypatch.setattr(orchestrator_module, "get_thinking_budget", lambda t: None)
+        return context
+
+    async def test_rereview_skips_only_validated_files(self, reviewer, monkeypatch):
+        context = self._review_context(reviewer, monkeypatch)
+        # The logic reviewer's output on the second shard doesn't validate:
+        # its text fallback finds nothing, which mustn't be cached as clean
+        reviewer.unparseable = {("logic-reviewer", self.FILES[2])}
+
+        first = await reviewer.review(context)
+        reviewer.sessions.prompts.clear()
+        reviewer.unparseable = set()
+        second = await reviewer.review(context)
+
+        assert first.success and second.success
+        assert first.finding_reuse["files_reused"] == 0
+        assert second.finding_reuse["files_reused"] == 2
+        assert {tuple(shard) for _, shard in reviewer.sessions.prompts} == {
+            tuple(self.FILES[2:])
+        }
+        assert {f.file for f in second.findings} == set(self.FILES)
+
+    async def test_validator_dismisses_false_positives(self, reviewer, monkeypatch):
+        context = self._review_context(reviewer, monkeypatch)
+        reviewer.dismiss = {self.FILES[0]}
+
+        first = await reviewer.review(context)
+        validated = len(reviewer.validated)
+        second = await reviewer.review(context)
+
+        # Security and logic agree on every file, quality reports its own
+        assert validated == 8
+        assert orchestrator_module.FINDING_VALIDATOR in first.summary
+        for result in (first, second):
+            assert result.success
+            assert {f.file for f in result.findings} == set(self.FILES[1:])
+            assert {f.validation_status for f in result.findings} == {
+                "confirmed_valid"
+            }
+        # The verdicts were cached with the findings: nothing is validated again
+        assert second.finding_reuse["files_reused"] == 4
+        assert len(reviewer.validated) == validated
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Tests for the direct Linear GraphQL updater.
+
+Runs the updater against a local stub GraphQL endpoint and covers:
+- Keep-alive connection reuse and cached team/state lookups
+- Batching of status changes and comments into one request
+- Fallback to the mini-agent when the direct API fails, only for the
+  mutations of a batch that did not go through
+"""
+
+import json
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+# Add apps/backend to path for imports (idempotent guard)
+sys_path = Path(__file__).parent.parent / "apps" / "backend"
+if str(sys_path) not in sys.path:
+    sys.path.insert(0, str(sys_path))
+
+from integrations.linear import updater
+from integrations.linear.graphql_client import (
+    LinearAPIError,
+    LinearGraphQLClient,
+    reset_graphql_clients,
+)
+
+# =============================================================================
+# STUB LINEAR ENDPOINT
+# =============================================================================
+
+
+class _StubLinear:
+    """Minimal in-memory Linear GraphQL backend."""
+
+    def __init__(self):
+        self.requests: list[dict] = []
+        self.client_ports: set[int] = set()
+        self.comments: list[str] = []
+        self.issue_state: str | None = None
+        self.fail = False
+        # Comment bodies the batch mutation rejects (the rest go through)
+        self.rejected: set[str] = set()
+
+    def handle(self, payload: dict) -> dict:
+        query = payload["query"]
+        variables = payload.get("variables", {})
+        if query.startswith("query Teams"):
+            return {"data": {"teams": {"nodes": [{"id": "team-1"}]}}}
+        if query.startswith("query TeamStates"):
+            states = ["Todo", "In Progress", "In Review", "Done"]
+            nodes = [{"id": f"state-{n}", "name": n} for n in states]
+            return {"data": {"team": {"states": {"nodes": nodes}}}}
+        if query.startswith("query Issue"):
+            return {"data": {"issue": {"id": "uuid-1", "team": {"id": "team-1"}}}}
+        if query.startswith("mutation CreateIssue"):
+            issue = {"id": "uuid-1", "identifier": "VAL-1"}
+            return {"data": {"issueCreate": {"success": True, "issue": issue}}}
+        if query.startswith("mutation Batch"):
+            data, errors = {}, []
+            for alias, field_name in re.findall(r"(m\d+): (\w+)\(", query):
+                if field_name == "issueUpdate":
+                    state_id = variables[f"{alias}_input"]["stateId"]
+                    self.issue_state = state_id.removeprefix("state-")
+                elif field_name == "commentCreate":
+                    body = variables[f"{alias}_input"]["body"]
+                    if body in self.rejected:
+                        data[alias] = None
+                        errors.append({"message": "rejected", "path": [alias]})
+                        continue
+                    self.comments.append(body)
+                data[alias] = {"success": True}
+            return {"data": data, "errors": errors} if errors else {"data": data}
+        return {"errors": [{"message": "unknown operation"}]}
+
+
+@pytest.fixture
+def stub_linear(monkeypatch):
+    """Serve a stub Linear API on localhost and point the updater at it."""
+    stub = _StubLinear()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            length = int(self.headers["Content-Length"])
+            payload = json.loads(self.rfile.read(length))
+            stub.requests.append(payload)
+            stub.client_ports.add(self.client_address[1])
+            if stub.fail:
+                body = b"unavailable"
+                self.send_response(503)
+            else:
+                body = json.dumps(stub.handle(payload)).encode("utf-8")
+                self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    monkeypatch.setenv("LINEAR_API_KEY", "lin_api_test")
+    monkeypatch.setenv("LINEAR_API_URL", f"http://127.0.0.1:{server.server_port}/")
+    monkeypatch.delenv("LINEAR_TEAM_ID", raising=False)
+    monkeypatch.setattr(updater, "UPDATE_DEBOUNCE_SECONDS", 60.0)
+    reset_graphql_clients()
+    updater._pending_updates.clear()
+
+    yield stub
+
+    reset_graphql_clients()
+    updater._pending_updates.clear()
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def spec_dir(tmp_path):
+    spec = tmp_path / "spec"
+    spec.mkdir()
+    return spec
+
+
+# =============================================================================
+# CLIENT TESTS
+# =============================================================================
+
+
+class TestLinearGraphQLClient:
+    def test_reuses_connection_and_caches_states(self, stub_linear, monkeypatch):
+        client = LinearGraphQLClient("lin_api_test")
+
+        assert client.get_state_id("team-1", "In Progress") == "state-In Progress"
+        assert client.get_state_id("team-1", "done") == "state-Done"
+        assert client.get_team_id() == "team-1"
+        assert client.get_team_id() == "team-1"
+
+        # One states query + one teams query; everything else cached
+        assert client.request_count == 2
+        assert client.connections_opened == 1
+        assert len(stub_linear.client_ports) == 1
+
+    def test_team_id_from_env_skips_lookup(self, stub_linear, monkeypatch):
+        monkeypatch.setenv("LINEAR_TEAM_ID", "team-env")
+        client = LinearGraphQLClient("lin_api_test")
+
+        assert client.get_team_id() == "team-env"
+        assert client.request_count == 0
+
+    def test_unknown_state_raises(self, stub_linear):
+        client = LinearGraphQLClient("lin_api_test")
+
+        with pytest.raises(LinearAPIError):
+            client.get_state_id("team-1", "Nonexistent")
+
+    def test_http_error_raises(self, stub_linear):
+        stub_linear.fail = True
+        client = LinearGraphQLClient("lin_api_test")
+
+        with pytest.raises(LinearAPIError, match="503"):
+            client.get_team_id()
+
+    def test_invalid_url_rejected(self):
+        with pytest.raises(ValueError):
+            LinearGraphQLClient("lin_api_test", api_url="ftp://example.com")
+
+
+# =============================================================================
+# UPDATER TESTS
+# =============================================================================
+
+
+class TestLinearUpdater:
+    async def test_create_task_uses_direct_api(self, stub_linear, spec_dir):
+        state = await updater.create_linear_task(spec_dir, "Add feature")
+
+        assert state.task_id == "VAL-1"
+        assert state.team_id == "team-1"
+        assert updater.LinearTaskState.load(spec_dir).task_id == "VAL-1"
+
+    async def test_updates_are_batched_until_flush(self, stub_linear, spec_dir):
+        await updater.create_linear_task(spec_dir, "Add feature")
+        requests_before = len(stub_linear.requests)
+
+        assert await updater.linear_task_started(spec_dir)
+        assert await updater.linear_subtask_completed(spec_dir, "1.1", 1, 3)
+        assert await updater.linear_subtask_completed(spec_dir, "1.2", 2, 3)
+        # Nothing sent yet - still debouncing
+        assert len(stub_linear.requests) == requests_before
+
+        assert await updater.flush_linear_updates(spec_dir)
+
+        batch_requests = [
+            r for r in stub_linear.requests if r["query"].startswith("mutation Batch")
+        ]
+        assert len(batch_requests) == 1
+        assert stub_linear.issue_state == "In Progress"
+        assert stub_linear.comments == [
+            "Build started - planning phase initiated",
+            "Completed 1.1 (1/3 subtasks done)",
+            "Completed 1.2 (2/3 subtasks done)",
+        ]
+        assert updater.LinearTaskState.load(spec_dir).status == "In Progress"
+
+    async def test_lookups_cached_across_flushes(self, stub_linear, spec_dir):
+        await updater.create_linear_task(spec_dir, "Add feature")
+
+        await updater.update_linear_status(spec_dir, updater.STATUS_IN_PROGRESS)
+        await updater.flush_linear_updates(spec_dir)
+        await updater.update_linear_status(spec_dir, updater.STATUS_IN_REVIEW)
+        await updater.flush_linear_updates(spec_dir)
+
+        state_queries = [
+            r for r in stub_linear.requests if r["query"].startswith("query TeamStates")
+        ]
+        assert len(state_queries) == 1
+        assert stub_linear.issue_state == "In Review"
+        assert len(stub_linear.client_ports) == 1
+
+    async def test_debounced_flush_runs_automatically(
+        self, stub_linear, spec_dir, monkeypatch
+    ):
+        await updater.create_linear_task(spec_dir, "Add feature")
+        monkeypatch.setattr(updater, "UPDATE_DEBOUNCE_SECONDS", 0.05)
+
+        await updater.add_linear_comment(spec_dir, "first")
+        await updater.add_linear_comment(spec_dir, "second")
+        pending = updater._pending_updates[spec_dir.resolve()]
+        await pending.flush_task
+
+        assert stub_linear.comments == ["first", "second"]
+        assert spec_dir.resolve() not in updater._pending_updates
+
+    async def test_falls_back_to_agent_when_api_fails(
+        self, stub_linear, spec_dir, monkeypatch
+    ):
+        await updater.create_linear_task(spec_dir, "Add feature")
+        stub_linear.fail = True
+        agent = AsyncMock(return_value="Done")
+        monkeypatch.setattr(updater, "_run_linear_agent", agent)
+
+        await updater.update_linear_status(spec_dir, updater.STATUS_IN_REVIEW)
+        await updater.add_linear_comment(spec_dir, "QA validation started")
+        assert await updater.flush_linear_updates(spec_dir)
+
+        assert agent.await_count == 2
+        assert "In Review" in agent.await_args_list[0].args[0]
+        assert "QA validation started" in agent.await_args_list[1].args[0]
+        assert updater.LinearTaskState.load(spec_dir).status == "In Review"
+
+    async def test_only_failed_mutations_fall_back_to_agent(
+        self, stub_linear, spec_dir, monkeypatch
+    ):
+        await updater.create_linear_task(spec_dir, "Add feature")
+        stub_linear.rejected = {"second"}
+        agent = AsyncMock(return_value="Done")
+        monkeypatch.setattr(updater, "_run_linear_agent", agent)
+
+        await updater.update_linear_status(spec_dir, updater.STATUS_IN_REVIEW)
+        for comment in ("first", "second", "third"):
+            await updater.add_linear_comment(spec_dir, comment)
+        assert await updater.flush_linear_updates(spec_dir)
+
+        assert stub_linear.issue_state == "In Review"
+        assert stub_linear.comments == ["first", "third"]
+        assert agent.await_count == 1
+        assert "second" in agent.await_args.args[0]
+        assert updater.LinearTaskState.load(spec_dir).status == "In Review"
+
+    async def test_no_updates_without_task(self, stub_linear, spec_dir):
+        assert not await updater.add_linear_comment(spec_dir, "orphan")
+        assert await updater.flush_linear_updates(spec_dir)
+        assert stub_linear.requests == []
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared MCP server pool (core/mcp_pool.py).
+
+Covers:
+- Sessions sharing one warm instance through the local HTTP bridge
+- Instances started by the first session, not when the endpoint is handed out
+- Server processes started, per-session stdio servers vs. the warm pool
+- Supervisor restarting dead instances and stopping idle ones
+- Only allowlisted (stateless) command servers rewritten to pooled endpoints
+"""
+
+import json
+import subprocess
+import sys
+import textwrap
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from core.mcp_pool import MCPServerPool, pool_command_servers, shutdown_pool
+
+# Startup cost of the stub server (npx resolving and booting a Node server
+# takes seconds; this keeps the benchmark quick while dominating its noise)
+STARTUP_DELAY_SECONDS = 0.3
+
+STUB_SERVER = textwrap.dedent(
+    """
+    import json, os, sys, time
+
+    time.sleep(float(sys.argv[2]))
+    with open(sys.argv[1], "a") as f:
+        f.write(f"{os.getpid()}\\n")
+
+    def reply(message, result):
+        print(json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": result}),
+              flush=True)
+
+    for line in sys.stdin:
+        message = json.loads(line)
+        method = message.get("method")
+        if "id" not in message:
+            continue
+        if method == "initialize":
+            reply(message, {
+                "protocolVersion": message["params"]["protocolVersion"],
+                "capabilities": {"tools": {}},
+                "serverInfo": {"name": "stub", "version": "1.0"},
+            })
+        elif method == "tools/list":
+            reply(message, {"tools": [{"name": "echo", "inputSchema": {}}]})
+        elif method == "tools/call":
+            text = message["params"]["arguments"]["text"]
+            reply(message, {"content": [{"type": "text", "text": text}],
+                            "pid": os.getpid()})
+        else:
+            reply(message, {})
+    """
+)
+
+
+@pytest.fixture
+def stub(tmp_path):
+    script = tmp_path / "stub_mcp_server.py"
+    script.write_text(STUB_SERVER)
+    starts = tmp_path / "starts.txt"
+    starts.touch()
+    args = [str(script), str(starts), str(STARTUP_DELAY_SECONDS)]
+    return {"args": args, "starts": starts, "cwd": tmp_path}
+
+
+@pytest.fixture
+def pool():
+    pool = MCPServerPool(check_interval=None)
+    yield pool
+    pool.close()
+
+
+def _rpc(url: str, message: dict) -> dict | None:
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(message).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=30) as response:
+        body = response.read()
+    return json.loads(body) if body else None
+
+
+def _session(url: str, text: str) -> dict:
+    """What an agent session does: handshake, list tools, call one."""
+    init = _rpc(
+        url,
+        {
+            "jsonrpc": "2.0",
+            "id": 0,
+            "method": "initialize",
+            "params": {"protocolVersion": "2025-06-18", "capabilities": {}},
+        },
+    )
+    assert init["result"]["serverInfo"]["name"] == "stub"
+    assert _rpc(url, {"jsonrpc": "2.0", "method": "notifications/initialized"}) is None
+    tools = _rpc(url, {"jsonrpc": "2.0", "id": 1, "method": "tools/list"})
+    assert tools["id"] == 1
+    assert tools["result"]["tools"][0]["name"] == "echo"
+    call = _rpc(
+        url,
+        {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "method": "tools/call",
+            "params": {"name": "echo", "arguments": {"text": text}},
+        },
+    )
+    assert call["id"] == 2
+    assert call["result"]["content"][0]["text"] == text
+    return call["result"]
+
+
+def _stdio_session(stub: dict, text: str) -> None:
+    """The same session against its own stdio instance."""
+    process = subprocess.Popen(
+        [sys.executable, *stub["args"]],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        for i, (method, params) in enumerate(
+            [
+                ("initialize", {"protocolVersion": "2025-06-18"}),
+                ("tools/list", {}),
+                ("tools/call", {"name": "echo", "arguments": {"text": text}}),
+            ]
+        ):
+            message = {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            process.stdin.write(json.dumps(message) + "\n")
+            process.stdin.flush()
+            assert json.loads(process.stdout.readline())["id"] == i
+    finally:
+        process.kill()
+        process.wait()
+
+
+def _pids(stub: dict) -> list[str]:
+    return stub["starts"].read_text().split()
+
+
+def test_sessions_share_one_warm_instance(pool, stub):
+    url = pool.url_for("stub", sys.executable, stub["args"], stub["cwd"])
+
+    # Concurrent sessions all use the same request IDs
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        results = list(executor.map(lambda i: _session(url, f"s{i}"), range(12)))
+
+    assert len(_pids(stub)) == 1
+    assert {r["pid"] for r in results} == {int(_pids(stub)[0])}
+    # The same server from another session's config reuses the route
+    assert pool.url_for("stub", sys.executable, stub["args"], stub["cwd"]) == url
+
+
+def test_instance_starts_on_first_use(pool, stub):
+    url = pool.url_for("stub", sys.executable, stub["args"], stub["cwd"])
+    (server,) = pool.servers()
+
+    time.sleep(STARTUP_DELAY_SECONDS * 2)
+    assert not server.running
+    assert _pids(stub) == []
+
+    _session(url, "first")
+    assert server.running
+    assert len(_pids(stub)) == 1
+
+
+def test_bridge_rejects_unknown_paths(pool, stub):
+    url = pool.url_for("stub", sys.executable, stub["args"], stub["cwd"])
+    token = url.split("/")[-2]
+
+    for bad in (url.replace(token, "wrong-token"), url + "-other"):
+        with pytest.raises(urllib.error.HTTPError) as exc:
+            _rpc(bad, {"jsonrpc": "2.0", "id": 1, "method": "ping"})
+        assert exc.value.code == 404
+
+
+def test_sessions_start_one_server_process(pool, stub):
+    """Per-session stdio servers vs. the warm pool, over several sessions."""
+    sessions = 5
+
+    for i in range(sessions):
+        _stdio_session(stub, f"cold{i}")
+    assert len(_pids(stub)) == sessions
+
+    url = pool.url_for("stub", sys.executable, stub["args"], stub["cwd"])
+    for i in range(sessions):
+        _session(url, f"warm{i}")
+    assert len(_pids(stub)) == sessions + 1
+
+
+def test_dead_instance_is_restarted(pool, stub):
+    url = pool.url_for("stub", sys.executable, stub["args"], stub["cwd"])
+    first = _session(url, "before")["pid"]
+    (server,) = pool.servers()
+
+    server._process.kill()
+    server._process.wait()
+    pool.check_health()
+
+    assert server.running
+    assert _session(url, "after")["pid"] != first
+    assert len(_pids(stub)) == 2
+
+
+def test_idle_instance_is_stopped_and_restarted_on_demand(pool, stub):
+    url = pool.url_for("stub", sys.executable, stub["args"], stub["cwd"])
+    _session(url, "first")
+    (server,) = pool.servers()
+
+    pool.idle_seconds = 0
+    time.sleep(0.01)
+    pool.check_health()
+    assert not server.running
+
+    pool.idle_seconds = 3600
+    pool.check_health()  # Stopped instances aren't restarted by the supervisor
+    assert not server.running
+    assert _session(url, "again")["content"][0]["text"] == "again"
+    assert len(_pids(stub)) == 2
+
+
+def test_pool_command_servers_rewrites_allowlisted_servers(monkeypatch, stub):
+    servers = {
+        "stub": {"command": sys.executable, "args": stub["args"]},
+        "puppeteer": {"command": sys.executable, "args": stub["args"]},
+        "missing": {"command": "no-such-mcp-server-binary", "args": []},
+        "linear": {"type": "http", "url": "https://mcp.linear.app/mcp"},
+        "auto-claude": {"type": "sdk", "name": "auto-claude"},
+    }
+    allowlist = {"stub", "missing", "linear", "auto-claude"}
+    try:
+        pooled = pool_command_servers(servers, stub["cwd"], pooled_servers=allowlist)
+
+        assert pooled["stub"]["type"] == "http"
+        assert pooled["stub"]["url"].startswith("http://127.0.0.1:")
+        for name in ("puppeteer", "missing", "linear", "auto-claude"):
+            assert pooled[name] is servers[name]
+        _session(pooled["stub"]["url"], "pooled")
+
+        monkeypatch.setenv("MCP_SERVER_POOL_ENABLED", "false")
+        assert (
+            pool_command_servers(servers, stub["cwd"], pooled_servers=allowlist)
+            is servers
+        )
+    finally:
+        shutdown_pool()
+
+
+def test_only_stateless_servers_are_pooled_by_default(tmp_path):
+    servers = {
+        name: {"command": sys.executable, "args": []}
+        for name in ("context7", "puppeteer", "electron", "custom-tool")
+    }
+    try:
+        pooled = pool_command_servers(servers, cwd=tmp_path)
+
+        assert pooled["context7"]["type"] == "http"
+        for name in ("puppeteer", "electron", "custom-tool"):
+            assert pooled[name] is servers[name]
+    finally:
+        shutdown_pool()
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Tests for the structural semantic analyzer (merge/semantic_analysis).
+
+Covers:
+- Python: element extraction, method-level modifications, fallback on syntax errors
+- JavaScript/TypeScript: tolerant statement splitting, hook and component detection
+- Unnamed top-level statements (main blocks, calls) and guarded imports
+- Changes carry exact segments that file_merger can apply, or fall back to regex
+- Memoization by content hash (baseline parsed once across tasks)
+- Benchmark: many tasks against one baseline, parses uncached vs memoized
+"""
+
+import sys
+import textwrap
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add apps/backend to path for imports (idempotent guard)
+sys_path = Path(__file__).parent.parent / "apps" / "backend"
+if str(sys_path) not in sys.path:
+    sys.path.insert(0, str(sys_path))
+
+from merge import ChangeType, SemanticAnalyzer, TaskSnapshot, apply_single_task_changes
+from merge.semantic_analysis import structural_analyzer
+from merge.semantic_analysis.js_analyzer import extract_js_elements
+from merge.semantic_analysis.python_analyzer import extract_python_elements
+from merge.semantic_analysis.regex_analyzer import analyze_with_regex
+from merge.semantic_analysis.structural_analyzer import clear_analysis_cache
+
+PYTHON_BASE = textwrap.dedent(
+    '''\
+    """Users."""
+
+    import os
+    from typing import Any
+
+    LIMIT = 10
+
+
+    class UserService:
+        cache: dict = {}
+
+        def get(self, user_id):
+            return self.cache.get(user_id)
+
+        @staticmethod
+        def normalize(name):
+            return name.strip()
+
+
+    def main():
+        return UserService()
+    '''
+)
+
+TSX_BASE = textwrap.dedent(
+    """\
+    import React from 'react';
+    import { Button } from './Button';
+
+    const PATTERN = /[{]/;
+
+    /**
+     * The app.
+     */
+    export default function App() {
+      const label = "}";
+      return <Button>{label}</Button>;
+    }
+
+    export const Header = ({ title }: Props): JSX.Element => {
+      return <h1>{`${title} }`}</h1>;
+    };
+
+    interface Props {
+      title: string;
+    }
+    """
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_analysis_cache()
+    yield
+    clear_analysis_cache()
+
+
+def _by_target(analysis):
+    return {change.target: change for change in analysis.changes}
+
+
+class TestPythonAnalysis:
+    def test_extracts_top_level_elements(self):
+        elements = extract_python_elements(PYTHON_BASE)
+
+        assert list(elements) == [
+            "statement:1",  # The module docstring
+            "import:import os",
+            "import:from typing import Any",
+            "variable:LIMIT",
+            "class:UserService",
+            "function:main",
+        ]
+        members = elements["class:UserService"].metadata["members"]
+        assert members["method:UserService.normalize"].content.startswith(
+            "    @staticmethod\n"
+        )
+
+    def test_method_body_change_is_method_level(self):
+        after = PYTHON_BASE.replace(
+            "return name.strip()", "return name.strip().lower()"
+        )
+
+        analysis = SemanticAnalyzer().analyze_diff("users.py", PYTHON_BASE, after)
+
+        [change] = analysis.changes
+        assert change.change_type == ChangeType.MODIFY_METHOD
+        assert change.location == "method:UserService.normalize"
+        assert analysis.functions_modified == {"UserService.normalize"}
+        assert analysis.classes_modified == {"UserService"}
+        assert analysis.total_lines_changed == 2
+
+    def test_duplicate_method_body_changes_its_class_only(self):
+        baseline = textwrap.dedent(
+            """\
+            class Reader:
+                def open(self):
+                    return 1
+
+                def close(self):
+                    self.handle.close()
+
+
+            class Writer:
+                def open(self):
+                    return 2
+
+                def close(self):
+                    self.handle.close()
+            """
+        )
+        marker = baseline.rindex("self.handle.close()")
+        after = baseline[:marker] + "self.handle.flush()\n        self.handle.close()\n"
+
+        analysis = SemanticAnalyzer().analyze_diff("io.py", baseline, after)
+        snapshot = TaskSnapshot(
+            task_id="task-001",
+            task_intent="Flush before closing",
+            started_at=datetime.now(),
+            semantic_changes=analysis.changes,
+        )
+
+        # Writer.close alone also matches Reader.close
+        assert [(c.change_type, c.location) for c in analysis.changes] == [
+            (ChangeType.MODIFY_CLASS, "class:Writer")
+        ]
+        assert apply_single_task_changes(baseline, snapshot, "io.py") == after
+
+    def test_new_method_modifies_the_class(self):
+        after = PYTHON_BASE.replace(
+            "    @staticmethod",
+            "    def delete(self, user_id):\n        pass\n\n    @staticmethod",
+        )
+
+        analysis = SemanticAnalyzer().analyze_diff("users.py", PYTHON_BASE, after)
+
+        assert [c.change_type for c in analysis.changes] == [ChangeType.MODIFY_CLASS]
+
+    def test_additions_and_imports(self):
+        after = PYTHON_BASE.replace("import os\n", "import os\nimport sys\n") + (
+            "\n\ndef cli():\n    return main()\n"
+        )
+
+        changes = _by_target(
+            SemanticAnalyzer().analyze_diff("users.py", PYTHON_BASE, after)
+        )
+
+        assert changes["import sys"].change_type == ChangeType.ADD_IMPORT
+        assert changes["import sys"].location == "file_top"
+        assert changes["cli"].change_type == ChangeType.ADD_FUNCTION
+        assert changes["cli"].content_after == "def cli():\n    return main()\n"
+
+    def test_unnamed_statements_are_elements(self):
+        baseline = textwrap.dedent(
+            """\
+            def f():
+                return 1
+
+
+            if __name__ == "__main__":
+                f()
+            """
+        )
+        after = baseline.replace("return 1", "return 2").replace(
+            "    f()", "    print(f())"
+        )
+
+        analysis = SemanticAnalyzer().analyze_diff("tool.py", baseline, after)
+        snapshot = TaskSnapshot(
+            task_id="task-001",
+            task_intent="Print the result",
+            started_at=datetime.now(),
+            semantic_changes=analysis.changes,
+        )
+
+        assert [c.location for c in analysis.changes] == [
+            "function:f",
+            "statement:1",
+        ]
+        assert apply_single_task_changes(baseline, snapshot, "tool.py") == after
+
+    def test_guarded_import_is_an_import(self):
+        after = PYTHON_BASE.replace(
+            "from typing import Any\n",
+            "from typing import Any\n\ntry:\n    import yaml\nexcept ImportError:\n"
+            "    yaml = None\n",
+        )
+
+        analysis = SemanticAnalyzer().analyze_diff("users.py", PYTHON_BASE, after)
+
+        [change] = analysis.changes
+        assert change.change_type == ChangeType.ADD_IMPORT
+        assert "import yaml" in change.content_after
+
+    def test_changes_missing_lines_fall_back_to_regex(self):
+        # Comments between elements belong to no element
+        after = PYTHON_BASE.replace(
+            "return name.strip()", "return name.strip().lower()"
+        ).replace("\n\ndef main():", "\n\n# Entry point\ndef main():")
+
+        analysis = SemanticAnalyzer().analyze_diff("users.py", PYTHON_BASE, after)
+
+        regex = analyze_with_regex("users.py", PYTHON_BASE, after, ".py")
+        assert analysis.changes == regex.changes
+
+    def test_syntax_error_falls_back_to_regex(self):
+        after = PYTHON_BASE + "\ndef broken(:\n"
+
+        analysis = SemanticAnalyzer().analyze_diff("users.py", PYTHON_BASE, after)
+
+        assert [c.change_type for c in analysis.changes] == [ChangeType.ADD_FUNCTION]
+        assert analysis.changes[0].target == "broken"
+
+
+class TestJavaScriptAnalysis:
+    def test_statements_survive_unbalanced_literals(self):
+        elements = extract_js_elements(TSX_BASE)
+
+        assert list(elements) == [
+            "import:import React from 'react';",
+            "import:import { Button } from './Button';",
+            "variable:PATTERN",
+            "function:App",
+            "function:Header",
+            "interface:Props",
+        ]
+        # Leading doc comments belong to the declaration
+        assert elements["function:App"].content.startswith("/**\n")
+        assert elements["function:Header"].content.endswith("};\n")
+
+    def test_hook_addition(self):
+        after = TSX_BASE.replace(
+            "import React from 'react';",
+            "import React, { useState } from 'react';",
+        ).replace(
+            '  const label = "}";',
+            '  const label = "}";\n  const [open, setOpen] = useState(false);',
+        )
+
+        changes = _by_target(
+            SemanticAnalyzer().analyze_diff("App.tsx", TSX_BASE, after)
+        )
+
+        assert changes["App"].change_type == ChangeType.ADD_HOOK_CALL
+        assert changes["App"].location == "function:App"
+        assert (
+            changes["import React, { useState } from 'react';"].change_type
+            == ChangeType.ADD_IMPORT
+        )
+        assert changes["import React from 'react';"].change_type == (
+            ChangeType.REMOVE_IMPORT
+        )
+
+    def test_top_level_call_change_is_kept(self):
+        baseline = "const app = express();\n\napp.listen(3000);\n"
+        after = baseline.replace("3000", "4000")
+
+        analysis = SemanticAnalyzer().analyze_diff("server.js", baseline, after)
+        snapshot = TaskSnapshot(
+            task_id="task-001",
+            task_intent="Change port",
+            started_at=datetime.now(),
+            semantic_changes=analysis.changes,
+        )
+
+        [change] = analysis.changes
+        assert change.location == "statement:1"
+        assert apply_single_task_changes(baseline, snapshot, "server.js") == after
+
+    def test_changes_apply_to_baseline(self):
+        after = (
+            TSX_BASE.replace("<h1>", "<h1 className='title'>")
+            .replace("  title: string;", "  title: string;\n  subtitle?: string;")
+            .replace("\n", "\r\n")
+        ) + "\r\n\r\nexport function Footer() {\r\n  return null;\r\n}\r\n"
+        baseline = TSX_BASE.replace("\n", "\r\n")
+        analysis = SemanticAnalyzer().analyze_diff("App.tsx", baseline, after)
+        snapshot = TaskSnapshot(
+            task_id="task-001",
+            task_intent="Polish header",
+            started_at=datetime.now(),
+            semantic_changes=analysis.changes,
+        )
+
+        merged = apply_single_task_changes(baseline, snapshot, "App.tsx")
+
+        assert merged == after
+
+
+class TestMemoization:
+    def test_baseline_is_parsed_once_across_tasks(self):
+        analyzer = SemanticAnalyzer()
+        task_versions = [
+            PYTHON_BASE + f"\n\ndef task_{i}():\n    return {i}\n" for i in range(3)
+        ]
+
+        with patch.object(
+            structural_analyzer,
+            "EXTRACTORS",
+            {".py": _counting(extract_python_elements)},
+        ):
+            for after in task_versions:
+                analyzer.analyze_diff("a/users.py", PYTHON_BASE, after)
+            for after in task_versions:
+                analyzer.analyze_diff("b/users.py", PYTHON_BASE, after)
+            parsed = structural_analyzer.EXTRACTORS[".py"].calls
+
+        # One baseline + one per task version; the second round is all cached
+        assert parsed == 4
+
+    def test_cached_results_are_independent_copies(self):
+        analyzer = SemanticAnalyzer()
+        after = PYTHON_BASE.replace("LIMIT = 10", "LIMIT = 20")
+
+        first = analyzer.analyze_diff("a/users.py", PYTHON_BASE, after)
+        first.changes[0].metadata["seen"] = True
+        first.changes.clear()
+        second = analyzer.analyze_diff("b/users.py", PYTHON_BASE, after)
+
+        assert second.file_path == "b/users.py"
+        assert second.changes[0].change_type == ChangeType.MODIFY_VARIABLE
+        assert second.changes[0].metadata == {}
+
+
+def _counting(extract):
+    def wrapper(source):
+        wrapper.calls += 1
+        return extract(source)
+
+    wrapper.calls = 0
+    return wrapper
+
+
+# ============================================================================
+# Benchmark
+# ============================================================================
+
+
+def _merge_passes(analyzer, baseline: str, tasks: list[str], memoized: bool) -> int:
+    """Track, preview and merge: each task's diff is analyzed three times.
+
+    Returns how many versions were parsed.
+    """
+    extract = _counting(extract_python_elements)
+    with patch.object(structural_analyzer, "EXTRACTORS", {".py": extract}):
+        for _ in range(3):
+            for after in tasks:
+                if not memoized:
+                    clear_analysis_cache()
+                analyzer.analyze_diff("handlers.py", baseline, after)
+    return extract.calls
+
+
+def test_benchmark_tasks_against_one_baseline():
+    functions = "\n\n".join(
+        f"def handler_{i}(request):\n"
+        f"    value = request.get('key_{i}')\n"
+        f"    return value * {i}\n"
+        for i in range(300)
+    )
+    baseline = f"import os\nimport sys\n\n\n{functions}"
+    tasks = [
+        baseline.replace(f"* {i}\n", f"* {i + 1}\n")
+        + f"\n\ndef extra_{i}():\n    pass\n"
+        for i in range(0, 300, 15)
+    ]
+    analyzer = SemanticAnalyzer()
+
+    uncached = _merge_passes(analyzer, baseline, tasks, memoized=False)
+    clear_analysis_cache()
+    cached = _merge_passes(analyzer, baseline, tasks, memoized=True)
+
+    # Uncached, both versions are parsed on every pass; memoized, the
+    # baseline once and each task's version once
+    assert uncached == 3 * len(tasks) * 2
+    assert cached == 1 + len(tasks)
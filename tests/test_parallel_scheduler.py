@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Tests for the parallel subtask scheduler.
+
+Covers:
+- Picking the pending subtasks of a parallel-safe phase
+- Concurrent sessions in isolated worktrees (with a stub agent)
+- Deterministic, plan-ordered merge-back of commits and plan status
+- Conflicting subtasks are recorded as failed attempts and left pending
+- Subtasks repeating a change merged before them, and memory merged back
+"""
+
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+# Add apps/backend to path for imports (idempotent guard)
+sys_path = Path(__file__).parent.parent / "apps" / "backend"
+if str(sys_path) not in sys.path:
+    sys.path.insert(0, str(sys_path))
+
+from agents.parallel import ParallelSubtaskScheduler
+from core.progress import get_parallel_subtasks, is_build_complete
+from memory import append_gotcha, load_codebase_map, load_gotchas, update_codebase_map
+from recovery import RecoveryManager
+
+SESSION_SECONDS = 0.5
+SUBTASK_IDS = ["1.1", "1.2", "1.3", "1.4"]
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def _plan(parallel_safe: bool = True) -> dict:
+    return {
+        "feature": "Widgets",
+        "workflow_type": "feature",
+        "phases": [
+            {
+                "id": "phase-1",
+                "name": "Independent widgets",
+                "parallel_safe": parallel_safe,
+                "subtasks": [
+                    {"id": sid, "description": f"Widget {sid}", "status": "pending"}
+                    for sid in SUBTASK_IDS
+                ],
+            },
+            {
+                "id": "phase-2",
+                "name": "Wire up",
+                "depends_on": ["phase-1"],
+                "subtasks": [
+                    {
+                        "id": "2.1",
+                        "description": "Register widgets",
+                        "status": "pending",
+                    }
+                ],
+            },
+        ],
+    }
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A git repo with a spec whose first phase is parallel-safe."""
+    project = tmp_path / "repo"
+    project.mkdir()
+    _git(project, "init", "-q")
+    _git(project, "config", "user.email", "test@example.com")
+    _git(project, "config", "user.name", "Test")
+    (project / ".gitignore").write_text(".auto-claude/\n")
+    (project / "README.md").write_text("# Widgets\n")
+    _git(project, "add", ".")
+    _git(project, "commit", "-q", "-m", "Initial commit")
+
+    spec_dir = project / ".auto-claude" / "specs" / "001-widgets"
+    spec_dir.mkdir(parents=True)
+    (spec_dir / "implementation_plan.json").write_text(json.dumps(_plan()))
+    return project, spec_dir
+
+
+class StubClient:
+    """Stands in for the SDK client; remembers where the session runs."""
+
+    def __init__(self, cwd: Path, spec_dir: Path, model: str, **kwargs):
+        self.cwd = cwd
+        self.spec_dir = spec_dir
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _stub_agent(conflicting: set[str] = frozenset(), repeating: set[str] = frozenset()):
+    """A coder that takes SESSION_SECONDS, commits a file and completes its subtask.
+
+    Conflicting subtasks write their own content to one shared file; repeating
+    subtasks all make the same change to it. Each session records a gotcha and
+    a codebase discovery in its spec copy's memory.
+    """
+
+    async def run_agent_session(client, prompt, spec_dir, verbose, phase):
+        subtask_id = prompt
+        await asyncio.sleep(SESSION_SECONDS)
+
+        name = f"widget_{subtask_id}.txt"
+        content = f"{subtask_id}\n"
+        if subtask_id in conflicting:
+            name = "shared.txt"
+        elif subtask_id in repeating:
+            name, content = "shared.txt", "shared\n"
+        (client.cwd / name).write_text(content)
+        _git(client.cwd, "add", name)
+        _git(client.cwd, "commit", "-q", "-m", f"Implement {subtask_id}")
+
+        append_gotcha(client.spec_dir, f"Gotcha from {subtask_id}")
+        update_codebase_map(client.spec_dir, {name: f"Written by {subtask_id}"})
+
+        plan_file = client.spec_dir / "implementation_plan.json"
+        plan = json.loads(plan_file.read_text())
+        for phase_data in plan["phases"]:
+            for subtask in phase_data["subtasks"]:
+                if subtask["id"] == subtask_id:
+                    subtask["status"] = "completed"
+        plan_file.write_text(json.dumps(plan))
+        return "continue", ""
+
+    return run_agent_session
+
+
+async def _build_prompt(spec_dir, project_dir, subtask):
+    return subtask["id"]
+
+
+async def _run_batch(
+    project, spec_dir, max_parallel, conflicting=frozenset(), repeating=frozenset()
+):
+    recovery_manager = RecoveryManager(spec_dir, project)
+    scheduler = ParallelSubtaskScheduler(
+        project_dir=project,
+        spec_dir=spec_dir,
+        model="sonnet",
+        recovery_manager=recovery_manager,
+        build_prompt=_build_prompt,
+        max_parallel=max_parallel,
+    )
+    batch = get_parallel_subtasks(spec_dir, limit=len(SUBTASK_IDS))
+
+    with (
+        patch("agents.parallel.create_client", side_effect=StubClient),
+        patch("agents.parallel.run_agent_session", _stub_agent(conflicting, repeating)),
+        patch("agents.session.extract_session_insights", AsyncMock(return_value={})),
+        patch(
+            "agents.session.save_session_memory",
+            AsyncMock(return_value=(True, "file")),
+        ),
+    ):
+        start = time.monotonic()
+        results = await scheduler.run_batch(batch, first_session=1)
+        elapsed = time.monotonic() - start
+
+    return results, elapsed, recovery_manager
+
+
+def _subtask_statuses(spec_dir: Path) -> dict[str, str]:
+    plan = json.loads((spec_dir / "implementation_plan.json").read_text())
+    return {
+        subtask["id"]: subtask["status"]
+        for phase in plan["phases"]
+        for subtask in phase["subtasks"]
+    }
+
+
+class TestGetParallelSubtasks:
+    def test_returns_pending_subtasks_of_parallel_safe_phase(self, project):
+        _, spec_dir = project
+
+        batch = get_parallel_subtasks(spec_dir, limit=3)
+
+        assert [s["id"] for s in batch] == ["1.1", "1.2", "1.3"]
+        assert all(s["phase_id"] == "phase-1" for s in batch)
+
+    def test_serial_phase_yields_single_subtask(self, project):
+        _, spec_dir = project
+        (spec_dir / "implementation_plan.json").write_text(
+            json.dumps(_plan(parallel_safe=False))
+        )
+
+        assert [s["id"] for s in get_parallel_subtasks(spec_dir, limit=3)] == ["1.1"]
+
+
+class TestParallelSubtaskScheduler:
+    async def test_runs_sessions_concurrently(self, project):
+        project_dir, spec_dir = project
+        plan_before = (spec_dir / "implementation_plan.json").read_text()
+
+        _, serial_time, _ = await _run_batch(project_dir, spec_dir, max_parallel=1)
+
+        # Same batch again from scratch, four at a time
+        _git(project_dir, "reset", "-q", "--hard", "HEAD~4")
+        (spec_dir / "implementation_plan.json").write_text(plan_before)
+        results, parallel_time, _ = await _run_batch(
+            project_dir, spec_dir, max_parallel=4
+        )
+
+        assert results == [(sid, True) for sid in SUBTASK_IDS]
+        assert serial_time >= len(SUBTASK_IDS) * SESSION_SECONDS
+        # Roughly the concurrency factor (4x), with room for git overhead
+        assert parallel_time < serial_time / 2
+
+    async def test_merges_in_plan_order(self, project):
+        project_dir, spec_dir = project
+
+        results, _, recovery_manager = await _run_batch(
+            project_dir, spec_dir, max_parallel=4
+        )
+
+        assert [sid for sid, _ in results] == SUBTASK_IDS
+        log = _git(project_dir, "log", "--format=%s", "-4", "--reverse").splitlines()
+        assert log == [f"Implement {sid}" for sid in SUBTASK_IDS]
+        for sid in SUBTASK_IDS:
+            assert (project_dir / f"widget_{sid}.txt").read_text() == f"{sid}\n"
+
+        statuses = _subtask_statuses(spec_dir)
+        assert all(statuses[sid] == "completed" for sid in SUBTASK_IDS)
+        assert statuses["2.1"] == "pending"
+        assert not is_build_complete(spec_dir)
+        assert recovery_manager.get_attempt_count("1.3") == 1
+
+        # Worktrees are cleaned up
+        assert _git(project_dir, "worktree", "list").count("\n") == 0
+
+    async def test_conflicting_subtask_is_left_pending(self, project):
+        project_dir, spec_dir = project
+
+        results, _, recovery_manager = await _run_batch(
+            project_dir, spec_dir, max_parallel=4, conflicting={"1.2", "1.3"}
+        )
+
+        assert results == [("1.1", True), ("1.2", True), ("1.3", False), ("1.4", True)]
+        assert (project_dir / "shared.txt").read_text() == "1.2\n"
+        assert _git(project_dir, "status", "--porcelain") == ""
+
+        statuses = _subtask_statuses(spec_dir)
+        assert statuses["1.3"] == "pending"
+        assert recovery_manager.get_attempt_count("1.3") == 1
+        assert get_parallel_subtasks(spec_dir, limit=4)[0]["id"] == "1.3"
+
+    async def test_repeated_change_does_not_stop_the_merge(self, project):
+        project_dir, spec_dir = project
+
+        results, _, _ = await _run_batch(
+            project_dir, spec_dir, max_parallel=4, repeating={"1.2", "1.3"}
+        )
+
+        assert results == [(sid, True) for sid in SUBTASK_IDS]
+        assert (project_dir / "shared.txt").read_text() == "shared\n"
+        assert _git(project_dir, "status", "--porcelain") == ""
+        log = _git(project_dir, "log", "--format=%s", "-4", "--reverse").splitlines()
+        assert log == [f"Implement {sid}" for sid in SUBTASK_IDS]
+
+    async def test_session_memory_is_merged_back(self, project):
+        project_dir, spec_dir = project
+        append_gotcha(spec_dir, "Gotcha from an earlier session")
+
+        await _run_batch(project_dir, spec_dir, max_parallel=4)
+
+        assert load_gotchas(spec_dir) == ["Gotcha from an earlier session"] + [
+            f"Gotcha from {sid}" for sid in SUBTASK_IDS
+        ]
+        assert load_codebase_map(spec_dir) == {
+            f"widget_{sid}.txt": f"Written by {sid}" for sid in SUBTASK_IDS
+        }
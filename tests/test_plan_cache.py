@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared implementation_plan.json cache used by core.progress.
+
+Covers:
+- A plan is parsed once per version, however many progress calls read it
+- Rewrites are picked up, including same-size rewrites within mtime granularity
+- Only the most recently used plans are kept
+- Snapshots cannot be mutated by callers; returned subtasks are plain copies
+- Benchmark: status ticks on a large plan, parses re-parsed vs cached
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add apps/backend to path for imports (idempotent guard)
+sys_path = Path(__file__).parent.parent / "apps" / "backend"
+if str(sys_path) not in sys.path:
+    sys.path.insert(0, str(sys_path))
+
+from core import plan_cache as plan_cache_module
+from core.plan_cache import clear_plan_cache, load_plan
+from core.progress import (
+    count_subtasks,
+    count_subtasks_detailed,
+    get_current_phase,
+    get_next_subtask,
+    get_parallel_subtasks,
+    get_plan_summary,
+    get_progress_percentage,
+)
+from implementation_plan import ImplementationPlan
+
+
+def _plan(statuses: list[str], phases: int = 2) -> dict:
+    return {
+        "feature": "Cache",
+        "workflow_type": "feature",
+        "phases": [
+            {
+                "id": f"phase-{p}",
+                "phase": p + 1,
+                "name": f"Phase {p}",
+                "depends_on": [f"phase-{p - 1}"] if p else [],
+                "parallel_safe": True,
+                "subtasks": [
+                    {
+                        "id": f"{p}.{i}",
+                        "description": f"Subtask {p}.{i}",
+                        "status": status,
+                        "files_to_modify": [f"src/{p}_{i}.py"],
+                    }
+                    for i, status in enumerate(statuses)
+                ],
+            }
+            for p in range(phases)
+        ],
+    }
+
+
+def _write_plan(spec_dir: Path, plan: dict, age_seconds: float = 0) -> None:
+    plan_file = spec_dir / "implementation_plan.json"
+    plan_file.write_text(json.dumps(plan))
+    if age_seconds:
+        mtime = time.time_ns() - int(age_seconds * 1_000_000_000)
+        os.utime(plan_file, ns=(mtime, mtime))
+
+
+@pytest.fixture
+def spec_dir(tmp_path):
+    clear_plan_cache()
+    yield tmp_path
+    clear_plan_cache()
+
+
+class TestPlanCache:
+    def test_plan_is_parsed_once_per_version(self, spec_dir):
+        _write_plan(spec_dir, _plan(["completed", "pending"]), age_seconds=10)
+
+        with patch.object(
+            plan_cache_module, "PlanSnapshot", wraps=plan_cache_module.PlanSnapshot
+        ) as parse:
+            assert count_subtasks(spec_dir) == (2, 4)
+            assert get_progress_percentage(spec_dir) == 50.0
+            assert count_subtasks_detailed(spec_dir)["pending"] == 2
+            assert get_plan_summary(spec_dir)["completed_subtasks"] == 2
+            assert get_current_phase(spec_dir)["id"] == "phase-0"
+            assert get_next_subtask(spec_dir)["id"] == "0.1"
+            assert len(get_parallel_subtasks(spec_dir, limit=4)) == 1
+
+        assert parse.call_count == 1
+
+    def test_same_size_rewrite_is_picked_up(self, spec_dir):
+        plan_file = spec_dir / "implementation_plan.json"
+        _write_plan(spec_dir, _plan(["pending", "pending"]))
+        assert count_subtasks_detailed(spec_dir)["pending"] == 4
+
+        # Same size, and the same mtime on a coarse-timestamp filesystem
+        st = plan_file.stat()
+        _write_plan(spec_dir, _plan(["blocked", "pending"]))
+        os.utime(plan_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert plan_file.stat().st_size == st.st_size
+
+        assert get_next_subtask(spec_dir)["id"] == "0.1"
+
+    def test_settled_plan_is_not_reread(self, spec_dir):
+        _write_plan(spec_dir, _plan(["pending"]), age_seconds=10)
+        load_plan(spec_dir / "implementation_plan.json")
+
+        with patch.object(Path, "read_bytes") as read_bytes:
+            assert count_subtasks(spec_dir) == (0, 2)
+
+        read_bytes.assert_not_called()
+
+    def test_least_recently_used_plans_are_evicted(self, spec_dir, monkeypatch):
+        monkeypatch.setattr(plan_cache_module, "MAX_CACHED_PLANS", 2)
+        plan_files = []
+        for name in ("a", "b", "c"):
+            (spec_dir / name).mkdir()
+            _write_plan(spec_dir / name, _plan(["pending"]), age_seconds=10)
+            plan_files.append(spec_dir / name / "implementation_plan.json")
+
+        load_plan(plan_files[0])
+        load_plan(plan_files[1])
+        load_plan(plan_files[0])
+        load_plan(plan_files[2])
+
+        assert list(plan_cache_module._entries) == [
+            os.fspath(plan_files[0]),
+            os.fspath(plan_files[2]),
+        ]
+
+    def test_invalid_plan_falls_back_like_before(self, spec_dir):
+        (spec_dir / "implementation_plan.json").write_text("{not json")
+
+        assert count_subtasks(spec_dir) == (0, 0)
+        assert get_next_subtask(spec_dir) is None
+        assert get_plan_summary(spec_dir)["phases"] == []
+
+
+class TestImmutability:
+    def test_snapshot_is_read_only(self, spec_dir):
+        _write_plan(spec_dir, _plan(["pending"]))
+        snapshot = load_plan(spec_dir / "implementation_plan.json")
+
+        with pytest.raises(TypeError):
+            snapshot.plan["phases"][0]["subtasks"][0]["status"] = "completed"
+        with pytest.raises(TypeError):
+            snapshot.counts["completed"] = 1
+        with pytest.raises(AttributeError):
+            snapshot.phases[0]["subtasks"].append({})
+
+    def test_returned_subtasks_are_mutable_copies(self, spec_dir):
+        _write_plan(spec_dir, _plan(["pending", "pending"]), age_seconds=10)
+
+        subtask = get_next_subtask(spec_dir)
+        subtask["files_to_modify"].append("src/extra.py")
+        subtask["status"] = "in_progress"
+        summary = get_plan_summary(spec_dir)
+        summary["phases"][1]["depends_on"].append("phase-x")
+
+        assert get_next_subtask(spec_dir)["files_to_modify"] == ["src/0_0.py"]
+        assert get_plan_summary(spec_dir)["phases"][1]["depends_on"] == ["phase-0"]
+
+    def test_implementation_plan_load_reuses_the_parsed_plan(self, spec_dir):
+        plan_file = spec_dir / "implementation_plan.json"
+        _write_plan(spec_dir, _plan(["pending"]), age_seconds=10)
+        load_plan(plan_file)
+
+        with patch.object(plan_cache_module.json, "loads") as loads:
+            plan = ImplementationPlan.load(plan_file)
+
+        loads.assert_not_called()
+        assert plan.phases[0].subtasks[0].files_to_modify == ["src/0_0.py"]
+
+    def test_implementation_plan_load_returns_independent_plans(self, spec_dir):
+        plan_file = spec_dir / "implementation_plan.json"
+        _write_plan(spec_dir, _plan(["pending"]), age_seconds=10)
+
+        first = ImplementationPlan.load(plan_file)
+        first.phases[0].subtasks[0].description = "Changed"
+
+        assert ImplementationPlan.load(plan_file).phases[0].subtasks[0].description == (
+            "Subtask 0.0"
+        )
+
+
+# ============================================================================
+# Benchmark
+# ============================================================================
+
+
+def _status_tick(spec_dir: Path, reparse: bool) -> None:
+    """The progress calls the coder loop and status UI make per tick."""
+    for call in (
+        count_subtasks,
+        count_subtasks_detailed,
+        get_plan_summary,
+        get_next_subtask,
+        lambda spec_dir: get_parallel_subtasks(spec_dir, limit=4),
+    ):
+        if reparse:
+            clear_plan_cache()
+        call(spec_dir)
+
+
+def test_benchmark_status_tick(spec_dir):
+    ticks = 50
+    statuses = ["completed"] * 40 + ["pending"] * 10
+    _write_plan(spec_dir, _plan(statuses, phases=40), age_seconds=10)
+
+    with patch.object(
+        plan_cache_module, "PlanSnapshot", wraps=plan_cache_module.PlanSnapshot
+    ) as parse:
+        for _ in range(ticks):
+            _status_tick(spec_dir, reparse=True)
+        uncached = parse.call_count
+
+        clear_plan_cache()
+        parse.reset_mock()
+        for _ in range(ticks):
+            _status_tick(spec_dir, reparse=False)
+        cached = parse.call_count
+
+    # Five progress calls a tick, each parsing the plan unless it is cached
+    assert uncached == 5 * ticks
+    assert cached == 1
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Tests for per-file finding reuse across PR re-reviews
+(runners/github/services/finding_cache.py).
+
+Covers:
+- Files with an unchanged blob, patch and prompt version reuse their findings
+- A changed blob, patch or prompt version sends the file back for review
+- A change to a related changed file sends the file back for review
+- Reported token and time savings
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the backend directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+_services_dir = _github_dir / "services"
+
+if str(_services_dir) not in sys.path:
+    sys.path.insert(0, str(_services_dir))
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from finding_cache import (
+    FileReviewKey,
+    FindingCache,
+    estimate_tokens,
+    file_context_hash,
+    file_context_hashes,
+    prompt_version,
+)
+from models import PRReviewFinding, ReviewCategory, ReviewSeverity
+
+VERSION = prompt_version("sonnet", "medium", "review prompt")
+
+PATCHES = {
+    "src/auth.py": "@@ -1,2 +1,3 @@\n+token = request.args['token']\n" * 20,
+    "src/util.py": "@@ -5 +5 @@\n-x = 1\n+x = 2\n",
+}
+
+
+def _keys(blobs: dict[str, str], patches: dict[str, str] = PATCHES):
+    return [
+        FileReviewKey(
+            path=path,
+            blob_sha=blobs[path],
+            context_hash=file_context_hash(path, patch),
+            prompt_tokens=estimate_tokens(patch),
+        )
+        for path, patch in patches.items()
+    ]
+
+
+def _finding(file: str, title: str) -> PRReviewFinding:
+    return PRReviewFinding(
+        id=f"{file}:{title}",
+        severity=ReviewSeverity.HIGH,
+        category=ReviewCategory.SECURITY,
+        title=title,
+        description="Token read from the query string",
+        file=file,
+        line=2,
+        evidence="token = request.args['token']",
+        source_agents=["security-reviewer"],
+    )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = FindingCache(tmp_path / "pr" / "finding_cache.db")
+    # First review: auth.py has a finding, util.py none; "other.py" is an
+    # impact finding on a file outside the PR and isn't cached
+    cache.store(
+        _keys({"src/auth.py": "blob-a1", "src/util.py": "blob-u1"}),
+        VERSION,
+        [_finding("src/auth.py", "Token in URL"), _finding("other.py", "Caller")],
+        review_seconds=90.0,
+    )
+    yield cache
+    cache.close()
+
+
+def test_rebase_reuses_every_file(cache):
+    # A rebase onto an untouched base keeps blobs and patches
+    reused, stats = cache.lookup(
+        _keys({"src/auth.py": "blob-a1", "src/util.py": "blob-u1"}), VERSION
+    )
+
+    assert reused["src/util.py"] == []
+    (finding,) = reused["src/auth.py"]
+    assert finding.title == "Token in URL"
+    assert finding.severity == ReviewSeverity.HIGH
+    assert finding.source_agents == ["security-reviewer"]
+    assert stats.files_reused == 2
+    assert stats.tokens_saved == sum(estimate_tokens(p) for p in PATCHES.values())
+    assert stats.seconds_saved == pytest.approx(90.0)
+
+
+def test_one_line_fix_reviews_only_the_changed_file(cache):
+    patches = dict(PATCHES, **{"src/util.py": "@@ -5 +5 @@\n-x = 1\n+x = 3\n"})
+
+    reused, stats = cache.lookup(
+        _keys({"src/auth.py": "blob-a1", "src/util.py": "blob-u2"}, patches), VERSION
+    )
+
+    assert list(reused) == ["src/auth.py"]
+    assert stats.files_reused == 1
+    # The review time is split between the files by patch size
+    total_tokens = sum(estimate_tokens(p) for p in PATCHES.values())
+    assert stats.seconds_saved == pytest.approx(
+        90.0 * estimate_tokens(PATCHES["src/auth.py"]) / total_tokens
+    )
+
+
+def test_changed_context_is_a_miss(cache):
+    # Same blob, different patch: the base moved under the file
+    patches = dict(PATCHES, **{"src/auth.py": "@@ -9,2 +9,3 @@\n+pass\n"})
+
+    reused, _ = cache.lookup(
+        _keys({"src/auth.py": "blob-a1", "src/util.py": "blob-u1"}, patches), VERSION
+    )
+
+    assert list(reused) == ["src/util.py"]
+
+
+def test_new_prompt_version_invalidates_everything(cache):
+    reused, stats = cache.lookup(
+        _keys({"src/auth.py": "blob-a1", "src/util.py": "blob-u1"}),
+        prompt_version("opus", "medium", "review prompt"),
+    )
+
+    assert reused == {}
+    assert str(stats) == (
+        "0 file(s) reused, 0 reviewed (~0 prompt tokens and ~0s saved)"
+    )
+
+
+def test_oldest_entries_are_dropped(tmp_path):
+    cache = FindingCache(tmp_path / "finding_cache.db", max_entries=1)
+    for blob in ("blob-1", "blob-2"):
+        cache.store(
+            [FileReviewKey("a.py", blob, file_context_hash("a.py", ""))],
+            VERSION,
+            [],
+            review_seconds=1.0,
+        )
+
+    def cached(blob):
+        key = FileReviewKey("a.py", blob, file_context_hash("a.py", ""))
+        return cache.lookup([key], VERSION)[0]
+
+    assert cached("blob-1") == {}
+    assert cached("blob-2") == {"a.py": []}
+    cache.close()
+
+
+def test_change_to_a_related_file_is_a_miss():
+    files = {
+        "src/auth.py": ("from util import parse\n", PATCHES["src/auth.py"]),
+        "src/util.py": ("def parse(x):\n    return x\n", PATCHES["src/util.py"]),
+        "docs/guide.md": ("Usage\n", "@@ -1 +1 @@\n-Use\n+Usage\n"),
+    }
+    before = file_context_hashes([(p, *files[p]) for p in files])
+    # util.py changes its signature; auth.py imports it, the guide doesn't
+    files["src/util.py"] = ("def parse(x, y):\n", "@@ -1 +1 @@\n+def parse(x, y):\n")
+    after = file_context_hashes([(p, *files[p]) for p in files])
+
+    assert before["src/auth.py"] != after["src/auth.py"]
+    assert before["docs/guide.md"] == after["docs/guide.md"]
+    assert after["docs/guide.md"] == file_context_hash(
+        "docs/guide.md", files["docs/guide.md"][1]
+    )
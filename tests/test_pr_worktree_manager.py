@@ -8,6 +8,7 @@ Tests the worktree lifecycle management including cleanup policies.
 import os
 import shutil
 import subprocess
+import sys
 import tempfile
 import time
 from pathlib import Path
@@ -315,3 +316,85 @@ def test_get_worktree_info(temp_git_repo):
 
     # Cleanup
     manager.cleanup_all_worktrees()
+
+
+def test_list_files_from_git_index(temp_git_repo, monkeypatch):
+    """Worktree files come from git ls-files, cached per checked-out commit."""
+    repo_dir, _ = temp_git_repo
+    (repo_dir / "src" / "pkg").mkdir(parents=True)
+    (repo_dir / "src" / "pkg" / "app.py").write_text("print('hi')\n")
+    subprocess.run(["git", "add", "."], cwd=repo_dir, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "commit", "-m", "Add app"], cwd=repo_dir, check=True, capture_output=True
+    )
+    head_sha = subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=repo_dir,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+    pr_worktree_module.clear_tracked_files_cache()
+    manager = PRWorktreeManager(repo_dir, ".test-worktrees")
+    worktree_path = manager.create_worktree(head_sha, pr_number=7, auto_cleanup=False)
+    # Untracked files aren't part of the reviewed commit
+    (worktree_path / "scratch.log").write_text("noise")
+
+    git_calls = []
+    real_run = subprocess.run
+
+    def recording_run(args, *a, **kw):
+        git_calls.append(args[1])
+        return real_run(args, *a, **kw)
+
+    monkeypatch.setattr(pr_worktree_module.subprocess, "run", recording_run)
+    monkeypatch.setattr(
+        Path, "rglob", lambda *a, **kw: pytest.fail("worktree was walked")
+    )
+
+    files = manager.list_files(worktree_path)
+    assert files == {"test.txt", "src/pkg/app.py"}
+
+    # A second review of the same commit reuses the listing
+    assert manager.list_files(worktree_path) is files
+    assert git_calls.count("ls-files") == 1
+
+    monkeypatch.undo()
+    manager.cleanup_all_worktrees()
+    pr_worktree_module.clear_tracked_files_cache()
+
+
+@pytest.mark.skipif(
+    sys.platform != "linux", reason="needs a filesystem taking non-UTF-8 names"
+)
+def test_list_files_with_non_utf8_names(temp_git_repo):
+    """File names that aren't valid UTF-8 don't fail the listing."""
+    repo_dir, _ = temp_git_repo
+    name = os.fsdecode(b"caf\xe9.txt")  # Latin-1, as os.listdir() returns it
+    (repo_dir / name).write_text("latin-1 name\n")
+    subprocess.run(["git", "add", "."], cwd=repo_dir, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "commit", "-m", "Add file"],
+        cwd=repo_dir,
+        check=True,
+        capture_output=True,
+    )
+
+    pr_worktree_module.clear_tracked_files_cache()
+    manager = PRWorktreeManager(repo_dir, ".test-worktrees")
+    worktree_path = manager.create_worktree("HEAD", pr_number=8, auto_cleanup=False)
+
+    files = manager.list_files(worktree_path)
+
+    assert files == {"test.txt", name}
+    assert (worktree_path / name).exists()
+    manager.cleanup_all_worktrees()
+    pr_worktree_module.clear_tracked_files_cache()
+
+
+def test_list_files_outside_a_repo(tmp_path):
+    """No listing (rather than an error) when git can't read the directory."""
+    manager = PRWorktreeManager(tmp_path, ".test-worktrees")
+
+    assert manager.list_files(tmp_path) is None
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental project index refresh.
+
+Covers:
+- Only services whose manifests or entry points changed are re-analyzed
+- The refreshed index is identical to a full run
+- should_refresh_project_index ignores touched-but-unchanged files
+- Per-service invalidation of the client's project index cache, including
+  changes outside the services
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add apps/backend to path for imports (idempotent guard)
+sys_path = Path(__file__).parent.parent / "apps" / "backend"
+if str(sys_path) not in sys.path:
+    sys.path.insert(0, str(sys_path))
+
+from analysis.analyzers import ProjectAnalyzer, analyze_project, refresh_project_index
+from prompts_pkg.project_context import should_refresh_project_index
+
+
+def _write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+@pytest.fixture
+def monorepo(tmp_path):
+    """A monorepo with a web app, an API and a shared package."""
+    project = tmp_path / "repo"
+    _write_json(project / "package.json", {"name": "root", "private": True})
+    _write_json(
+        project / "apps" / "web" / "package.json",
+        {"name": "web", "dependencies": {"react": "^18.0.0", "@repo/shared": "*"}},
+    )
+    (project / "apps" / "web" / "src").mkdir()
+    (project / "apps" / "web" / "src" / "index.ts").write_text("export {}\n")
+    (project / "apps" / "api").mkdir(parents=True)
+    (project / "apps" / "api" / "requirements.txt").write_text("flask\n")
+    (project / "apps" / "api" / "main.py").write_text("print('api')\n")
+    _write_json(
+        project / "packages" / "shared" / "package.json",
+        {"name": "@repo/shared", "dependencies": {"lodash": "^4.0.0"}},
+    )
+    (project / ".auto-claude").mkdir()
+    return project
+
+
+@pytest.fixture
+def index_file(monorepo):
+    index = monorepo / ".auto-claude" / "project_index.json"
+    analyze_project(monorepo, index)
+    return index
+
+
+def _full_index(project: Path) -> dict:
+    """A from-scratch analysis, normalized through JSON like the saved index."""
+    return json.loads(json.dumps(ProjectAnalyzer(project).analyze()))
+
+
+def _without_stats(index: dict) -> dict:
+    """Drop the mtimes from fingerprints, which differ between runs."""
+    index = json.loads(json.dumps(index))
+    for group in [index["fingerprints"]["project"]] + [
+        s["files"] for s in index["fingerprints"]["services"].values()
+    ]:
+        for rel_path, (_, size, digest) in group.items():
+            group[rel_path] = [size, digest]
+    return index
+
+
+class TestIncrementalRefresh:
+    def test_fresh_index_needs_no_refresh(self, monorepo, index_file):
+        assert not should_refresh_project_index(monorepo)
+
+    def test_missing_or_legacy_index_needs_refresh(self, monorepo, index_file):
+        legacy = json.loads(index_file.read_text())
+        del legacy["fingerprints"]
+        index_file.write_text(json.dumps(legacy))
+        assert should_refresh_project_index(monorepo)
+
+        index_file.unlink()
+        assert should_refresh_project_index(monorepo)
+
+    def test_touch_without_change_is_not_a_refresh(self, monorepo, index_file):
+        pkg = monorepo / "apps" / "web" / "package.json"
+        pkg.write_text(pkg.read_text())
+        os.utime(pkg, ns=(1, 1))
+
+        assert not should_refresh_project_index(monorepo)
+
+    def test_only_changed_service_is_reanalyzed(self, monorepo, index_file):
+        _write_json(
+            monorepo / "apps" / "web" / "package.json",
+            {"name": "web", "dependencies": {"vue": "^3.0.0"}},
+        )
+        assert should_refresh_project_index(monorepo)
+
+        previous = json.loads(index_file.read_text())
+        analyzer = ProjectAnalyzer(monorepo)
+        analyzer.analyze(previous_index=previous)
+
+        assert analyzer.reanalyzed_services == ["web"]
+
+    def test_refreshed_index_matches_full_run(self, monorepo, index_file):
+        _write_json(
+            monorepo / "apps" / "web" / "package.json",
+            {"name": "web", "dependencies": {"vue": "^3.0.0"}},
+        )
+        (monorepo / "apps" / "api" / "main.py").write_text("print('changed')\n")
+
+        changed = refresh_project_index(monorepo, index_file)
+
+        # api was re-analyzed, but its index entry came out the same
+        assert changed == ["web"]
+        refreshed = json.loads(index_file.read_text())
+        assert _without_stats(refreshed) == _without_stats(_full_index(monorepo))
+        assert not should_refresh_project_index(monorepo)
+
+    def test_new_and_removed_services(self, monorepo, index_file):
+        _write_json(
+            monorepo / "packages" / "ui" / "package.json",
+            {"name": "@repo/ui", "dependencies": {"react": "^18.0.0"}},
+        )
+        assert should_refresh_project_index(monorepo)
+        assert refresh_project_index(monorepo, index_file) == ["ui"]
+
+        (monorepo / "apps" / "api" / "requirements.txt").unlink()
+        (monorepo / "apps" / "api" / "main.py").unlink()
+        assert should_refresh_project_index(monorepo)
+        # Frontends no longer consume the removed backend
+        assert sorted(refresh_project_index(monorepo, index_file)) == [
+            "api",
+            "ui",
+            "web",
+        ]
+
+        refreshed = json.loads(index_file.read_text())
+        assert "api" not in refreshed["services"]
+        assert _without_stats(refreshed) == _without_stats(_full_index(monorepo))
+
+    def test_unchanged_project_is_not_rewritten(self, monorepo, index_file):
+        before = index_file.stat().st_mtime_ns
+        os.utime(index_file, ns=(1, 1))
+
+        assert refresh_project_index(monorepo, index_file) == []
+        assert index_file.stat().st_mtime_ns == 1 != before
+
+
+class TestClientCacheInvalidation:
+    def test_invalidates_only_changed_services(self, monorepo, index_file):
+        from core.client import (
+            _PROJECT_INDEX_CACHE,
+            _get_cached_project_data,
+            invalidate_project_cache,
+        )
+
+        invalidate_project_cache()
+        try:
+            _get_cached_project_data(monorepo)
+            cached_index = _PROJECT_INDEX_CACHE[str(monorepo.resolve())][0]
+            api_entry = cached_index["services"]["api"]
+
+            _write_json(
+                monorepo / "apps" / "web" / "package.json",
+                {"name": "web", "dependencies": {"next": "^14.0.0"}},
+            )
+            changed = refresh_project_index(monorepo, index_file)
+            invalidate_project_cache(monorepo, changed)
+
+            patched_index, capabilities, _ = _PROJECT_INDEX_CACHE[
+                str(monorepo.resolve())
+            ]
+            assert patched_index["services"]["api"] is api_entry
+            assert patched_index["services"]["web"]["dependencies"] == ["next"]
+            assert capabilities["is_nextjs"]
+        finally:
+            invalidate_project_cache()
+
+    async def test_orchestrator_refreshes_project_wide_sections(
+        self, monorepo, index_file
+    ):
+        from types import SimpleNamespace
+
+        from core.client import (
+            _PROJECT_INDEX_CACHE,
+            _get_cached_project_data,
+            invalidate_project_cache,
+        )
+        from spec.pipeline.orchestrator import SpecOrchestrator
+
+        invalidate_project_cache()
+        try:
+            _get_cached_project_data(monorepo)
+            (monorepo / "docker-compose.yml").write_text(
+                "services:\n  db:\n    image: postgres\n"
+            )
+
+            # No service changed; only the infrastructure section did
+            await SpecOrchestrator._ensure_fresh_project_index(
+                SimpleNamespace(project_dir=monorepo)
+            )
+
+            cached_index = _PROJECT_INDEX_CACHE[str(monorepo.resolve())][0]
+            assert cached_index["infrastructure"]["docker_services"] == ["db"]
+        finally:
+            invalidate_project_cache()
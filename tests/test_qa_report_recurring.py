@@ -8,11 +8,15 @@ Tests the recurring issue detection functionality of qa/report.py including:
 - _issue_similarity()
 - has_recurring_issues()
 - get_recurring_issue_summary()
+- Same results as scoring every historical issue, on a long history
 """
 
+import random
 import sys
+from difflib import SequenceMatcher
 from pathlib import Path
 from typing import Dict, List, Tuple
+from unittest.mock import patch
 
 import pytest
 
@@ -432,3 +436,107 @@ class TestRecurringIssueSummary:
         summary = get_recurring_issue_summary(history)
         # Should not crash
         assert summary["total_issues"] == 0
+
+
+# =============================================================================
+# INDEXED LOOKUP TESTS
+# =============================================================================
+
+
+def _scan_recurring(current_issues, history, threshold=RECURRING_ISSUE_THRESHOLD):
+    """The all-pairs scan has_recurring_issues used before it was indexed."""
+    historical = [i for record in history for i in record.get("issues", [])]
+    counts = []
+    for current in current_issues:
+        count = 1 + sum(
+            1
+            for h in historical
+            if _issue_similarity(current, h) >= ISSUE_SIMILARITY_THRESHOLD
+        )
+        counts.append(count)
+    return [c for c in counts if c >= threshold]
+
+
+def _scan_unique_groups(history):
+    """The all-groups scan get_recurring_issue_summary used before."""
+    groups: dict[str, int] = {}
+    for record in history:
+        for issue in record.get("issues", []):
+            key = _normalize_issue_key(issue)
+            for existing in groups:
+                if (
+                    SequenceMatcher(None, key, existing).ratio()
+                    >= ISSUE_SIMILARITY_THRESHOLD
+                ):
+                    groups[existing] += 1
+                    break
+            else:
+                groups[key] = 1
+    return sorted(groups.values(), reverse=True)
+
+
+def _synthetic_history(iterations, issues_per_iteration, seed=7):
+    """QA history of a stubborn spec: recurring issues with small variations."""
+    rng = random.Random(seed)
+    subjects = ["auth token", "user model", "session cache", "api client", "form"]
+    problems = [
+        "missing null check in",
+        "unhandled exception in",
+        "type error in",
+        "missing test for",
+        "race condition in",
+    ]
+    prefixes = ["", "", "Error: ", "Bug: ", "Issue: "]
+
+    def issue():
+        subject = rng.choice(subjects)
+        return {
+            "title": f"{rng.choice(prefixes)}{rng.choice(problems)} {subject}",
+            "file": f"src/{subject.replace(' ', '_')}{rng.randint(1, 4)}.py",
+            "line": rng.choice([None, 12, 48, 120, 121, 310]),
+        }
+
+    return [
+        {"status": "rejected", "issues": [issue() for _ in range(issues_per_iteration)]}
+        for _ in range(iterations)
+    ], issue
+
+
+class TestIndexedLookup:
+    """The key index finds exactly the issues an all-pairs scan finds."""
+
+    def test_matches_all_pairs_scan(self) -> None:
+        history, make_issue = _synthetic_history(iterations=30, issues_per_iteration=10)
+        current = [make_issue() for _ in range(40)] + history[0]["issues"]
+
+        found, recurring = has_recurring_issues(current, history)
+
+        expected = _scan_recurring(current, history)
+        assert found == bool(expected)
+        assert [i["occurrence_count"] for i in recurring] == expected
+        summary = get_recurring_issue_summary(history)
+        groups = _scan_unique_groups(history)
+        assert summary["unique_issues"] == len(groups)
+        assert [c["occurrences"] for c in summary["most_common"]] == groups[:5]
+
+    def test_benchmark_long_history(self) -> None:
+        history, make_issue = _synthetic_history(
+            iterations=150, issues_per_iteration=20
+        )
+        current = [make_issue() for _ in range(5)]
+
+        ratio = SequenceMatcher.ratio
+        with patch.object(
+            SequenceMatcher, "ratio", autospec=True, side_effect=ratio
+        ) as spy:
+            expected = _scan_recurring(current, history)
+            scanned = spy.call_count
+            spy.reset_mock()
+            _, recurring = has_recurring_issues(current, history)
+            indexed = spy.call_count
+
+        assert [i["occurrence_count"] for i in recurring] == expected
+        # The scan scores every historical issue, the index only the keys
+        # whose lengths and characters can reach the threshold
+        assert scanned == len(current) * sum(len(r["issues"]) for r in history)
+        assert indexed * 10 < scanned
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite-backed recovery state store.
+
+Covers:
+- JSON exports stay in the existing attempt_history/build_commits format
+- Writes only mark the exports stale; flush() rewrites them
+- Migration of existing JSON state into a fresh database
+- Re-import when a JSON export is replaced (worktree sync)
+- Atomic updates from several processes at once
+"""
+
+import json
+import multiprocessing
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add apps/backend to path for imports (idempotent guard)
+sys_path = Path(__file__).parent.parent / "apps" / "backend"
+if str(sys_path) not in sys.path:
+    sys.path.insert(0, str(sys_path))
+
+from agents.utils import sync_spec_to_source
+from services.recovery import RecoveryManager
+from services.recovery_store import RECOVERY_DB_FILE, RecoveryStore
+
+
+@pytest.fixture
+def spec_dir(tmp_path):
+    spec = tmp_path / "spec"
+    spec.mkdir()
+    return spec
+
+
+def _read(path: Path) -> dict:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _record_attempts(spec_dir: str, worker: int, count: int) -> None:
+    manager = RecoveryManager(Path(spec_dir), Path(spec_dir))
+    for i in range(count):
+        manager.record_attempt(
+            subtask_id="shared",
+            session=worker * 1000 + i,
+            success=False,
+            approach=f"worker {worker} attempt {i}",
+            error="boom",
+        )
+
+
+class TestRecoveryStore:
+    def test_creates_database_and_exports(self, spec_dir):
+        RecoveryManager(spec_dir, spec_dir)
+        memory = spec_dir / "memory"
+
+        assert (memory / RECOVERY_DB_FILE).exists()
+        history = _read(memory / "attempt_history.json")
+        assert history["subtasks"] == {}
+        assert history["stuck_subtasks"] == []
+        assert "created_at" in history["metadata"]
+        commits = _read(memory / "build_commits.json")
+        assert commits["commits"] == []
+        assert commits["last_good_commit"] is None
+
+    def test_export_matches_json_format(self, spec_dir):
+        manager = RecoveryManager(spec_dir, spec_dir)
+        manager.record_attempt("1.1", 1, False, "first try", "failed")
+        manager.record_attempt("1.1", 2, True, "second try")
+        manager.record_attempt("1.2", 3, False, "other", "nope")
+        manager.mark_subtask_stuck("1.2", "gave up")
+        manager.record_good_commit("abc123", "1.1")
+        manager.flush()
+
+        history = _read(spec_dir / "memory" / "attempt_history.json")
+        assert list(history["subtasks"]) == ["1.1", "1.2"]
+        assert history["subtasks"]["1.1"]["status"] == "completed"
+        assert [a["approach"] for a in history["subtasks"]["1.1"]["attempts"]] == [
+            "first try",
+            "second try",
+        ]
+        assert history["subtasks"]["1.2"]["status"] == "stuck"
+        assert history["stuck_subtasks"][0]["subtask_id"] == "1.2"
+        assert history["stuck_subtasks"][0]["attempt_count"] == 1
+
+        commits = _read(spec_dir / "memory" / "build_commits.json")
+        assert commits["last_good_commit"] == "abc123"
+        assert commits["commits"][0]["subtask_id"] == "1.1"
+
+        assert manager.export_attempt_history()["subtasks"] == history["subtasks"]
+
+    def test_migrates_existing_json(self, spec_dir):
+        memory = spec_dir / "memory"
+        memory.mkdir()
+        legacy = {
+            "subtasks": {
+                "1.1": {
+                    "attempts": [
+                        {
+                            "session": 1,
+                            "timestamp": "2024-01-01T00:00:00",
+                            "approach": "legacy approach",
+                            "success": False,
+                            "error": "old error",
+                        }
+                    ],
+                    "status": "failed",
+                }
+            },
+            "stuck_subtasks": [],
+            "metadata": {"created_at": "2024-01-01T00:00:00", "last_updated": "x"},
+        }
+        (memory / "attempt_history.json").write_text(json.dumps(legacy))
+
+        manager = RecoveryManager(spec_dir, spec_dir)
+
+        assert manager.get_attempt_count("1.1") == 1
+        assert manager.get_subtask_history("1.1")["attempts"][0]["error"] == "old error"
+        history = _read(memory / "attempt_history.json")
+        assert history["metadata"]["created_at"] == "2024-01-01T00:00:00"
+
+    def test_reimports_json_synced_from_worktree(self, tmp_path):
+        main_spec = tmp_path / "main" / "spec"
+        worktree_spec = tmp_path / "worktree" / "spec"
+        main_spec.mkdir(parents=True)
+        worktree_spec.mkdir(parents=True)
+
+        main_manager = RecoveryManager(main_spec, tmp_path)
+        main_manager.record_attempt("1.1", 1, False, "main attempt", "err")
+
+        worktree_manager = RecoveryManager(worktree_spec, tmp_path)
+        worktree_manager.record_attempt("1.1", 2, True, "worktree attempt")
+        worktree_manager.record_good_commit("def456", "1.1")
+        worktree_manager.flush()
+
+        assert sync_spec_to_source(worktree_spec, main_spec)
+        # The database itself is never copied over the main project's copy
+        assert (main_spec / "memory" / RECOVERY_DB_FILE).exists()
+
+        # The long-lived main manager picks up the synced state
+        history = main_manager.get_subtask_history("1.1")
+        assert [a["approach"] for a in history["attempts"]] == ["worktree attempt"]
+        assert main_manager.get_last_good_commit() == "def456"
+
+    def test_writes_defer_the_export_to_flush(self, spec_dir):
+        manager = RecoveryManager(spec_dir, spec_dir)
+        history_file = spec_dir / "memory" / "attempt_history.json"
+        exported = history_file.read_text()
+
+        for session in range(3):
+            manager.record_attempt("1.1", session, False, f"try {session}", "err")
+
+        assert history_file.read_text() == exported
+        assert manager.get_attempt_count("1.1") == 3
+        assert manager.store.flush_exports()
+        assert len(_read(history_file)["subtasks"]["1.1"]["attempts"]) == 3
+        assert not manager.store.flush_exports()  # Nothing new to export
+
+        # A store opened later flushes what an earlier process left stale
+        manager.record_attempt("1.1", 3, True, "done")
+        RecoveryManager(spec_dir, spec_dir)
+        assert _read(history_file)["subtasks"]["1.1"]["status"] == "completed"
+
+    def test_reset_and_clear_are_atomic(self, spec_dir):
+        manager = RecoveryManager(spec_dir, spec_dir)
+        for session in range(3):
+            manager.record_attempt("1.1", session, False, f"try {session}", "err")
+        manager.mark_subtask_stuck("1.1", "stuck")
+
+        manager.reset_subtask("1.1")
+
+        assert manager.get_attempt_count("1.1") == 0
+        assert manager.get_stuck_subtasks() == []
+        assert manager.get_subtask_history("1.1")["status"] == "pending"
+
+    def test_recent_attempts_limit(self, spec_dir):
+        store = RecoveryStore(spec_dir / "memory")
+        for session in range(5):
+            store.record_attempt(
+                "1.1", {"session": session, "approach": f"a{session}", "success": False}
+            )
+
+        recent = store.get_attempts("1.1", limit=3)
+        assert [a["session"] for a in recent] == [2, 3, 4]
+
+    def test_concurrent_processes_do_not_lose_attempts(self, spec_dir):
+        RecoveryManager(spec_dir, spec_dir)
+        ctx = multiprocessing.get_context("spawn")
+        workers = [
+            ctx.Process(target=_record_attempts, args=(str(spec_dir), w, 10))
+            for w in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=120)
+            assert worker.exitcode == 0
+
+        manager = RecoveryManager(spec_dir, spec_dir)
+        assert manager.get_attempt_count("shared") == 40
+        history = _read(spec_dir / "memory" / "attempt_history.json")
+        assert len(history["subtasks"]["shared"]["attempts"]) == 40
@@ -7,15 +7,22 @@ Tests for hash computation and spec change detection:
 - File hash computation
 - Spec hash computation (spec.md + implementation_plan.json)
 - Approval validation based on hash comparison
+- Cached hashes: unchanged files aren't reread, edits are always seen
 """
 
+import hashlib
+import os
+import time
 from pathlib import Path
 
 import pytest
-
 from review import ReviewState
-from review.state import _compute_file_hash, _compute_spec_hash
-from tests.review_fixtures import review_spec_dir
+from review import state as review_state
+from review.state import (
+    _compute_file_hash,
+    _compute_spec_hash,
+    clear_file_hash_cache,
+)
 
 
 class TestSpecHashValidation:
@@ -177,3 +184,98 @@ class TestSpecHashValidation:
         # 4. Re-approve with new hash
         state.approve(review_spec_dir, approved_by="user")
         assert state.is_approval_valid(review_spec_dir)
+
+
+class TestCachedSpecHash:
+    """Tests for hashes cached against file stat signatures."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        clear_file_hash_cache()
+        yield
+        clear_file_hash_cache()
+
+    @pytest.fixture
+    def reads(self, monkeypatch):
+        """Count the files actually read and hashed."""
+        calls: list[Path] = []
+        hash_contents = review_state._hash_file_contents
+
+        def counting(file_path):
+            calls.append(Path(file_path))
+            return hash_contents(file_path)
+
+        monkeypatch.setattr(review_state, "_hash_file_contents", counting)
+        return calls
+
+    def test_unchanged_files_are_not_reread(
+        self, review_spec_dir: Path, reads, monkeypatch
+    ) -> None:
+        """Settled files are hashed once, then served from their stat."""
+        monkeypatch.setattr(review_state, "RACY_WINDOW_NS", 0)
+        state = ReviewState()
+        state.approve(review_spec_dir, approved_by="user", auto_save=False)
+
+        for _ in range(5):
+            assert state.is_approval_valid(review_spec_dir)
+
+        assert len(reads) == 2  # spec.md and implementation_plan.json, once
+
+    def test_recent_edit_with_same_size_is_detected(self, tmp_path: Path) -> None:
+        """Files modified within the racy window are rehashed every time."""
+        test_file = tmp_path / "spec.md"
+        test_file.write_text("content A")
+        before = _compute_file_hash(test_file)
+        mtime_ns = test_file.stat().st_mtime_ns
+
+        test_file.write_text("content B")
+        os.utime(test_file, ns=(mtime_ns, mtime_ns))  # Same size, same mtime
+
+        assert _compute_file_hash(test_file) != before
+
+    def test_edit_with_restored_mtime_is_detected(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        """Restoring mtime after an edit doesn't hide it (ctime changes)."""
+        test_file = tmp_path / "spec.md"
+        test_file.write_text("content A")
+        monkeypatch.setattr(review_state, "RACY_WINDOW_NS", 0)
+        stat = test_file.stat()
+        time.sleep(0.01)
+        before = _compute_file_hash(test_file)
+
+        time.sleep(0.01)
+        test_file.write_text("content B")
+        os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert _compute_file_hash(test_file) != before
+
+    def test_streamed_hash_matches_whole_file_hash(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        """Chunked hashing gives the same hash as hashing the decoded text."""
+        monkeypatch.setattr(review_state, "HASH_CHUNK_CHARS", 7)
+        test_file = tmp_path / "implementation_plan.json"
+        test_file.write_bytes("línea uno\r\nline two\r\n".encode() * 50)
+
+        expected = hashlib.md5(
+            test_file.read_text(encoding="utf-8").encode("utf-8"),
+            usedforsecurity=False,
+        ).hexdigest()
+        assert _compute_file_hash(test_file) == expected
+
+    def test_polling_large_plan_reads_it_once(
+        self, review_spec_dir: Path, reads, monkeypatch
+    ) -> None:
+        """Polling approval of an unchanged large plan is a stat, not a reread."""
+        plan = review_spec_dir / "implementation_plan.json"
+        plan.write_text('{"phases": [' + ", ".join(['{"subtasks": []}'] * 400_000))
+        monkeypatch.setattr(review_state, "RACY_WINDOW_NS", 0)
+        state = ReviewState()
+        state.approve(review_spec_dir, approved_by="user", auto_save=False)
+        reads.clear()
+
+        for _ in range(50):
+            assert state.is_approval_valid(review_spec_dir)
+
+        assert reads == []
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Smoke tests: the GitHub and GitLab runner CLIs start.
+
+Each runner puts its own directory first on sys.path and imports its own
+top-level "services" package; a backend module importing the backend's
+"services" package on the way shadows it and the runner fails at startup.
+The runners run in a fresh interpreter, as the UI starts them.
+"""
+
+import subprocess
+
+import pytest
+
+from tests.runner_helpers import (
+    BACKEND_DIR,
+    GITHUB_RUNNER,
+    GITLAB_RUNNER,
+    runner_command,
+)
+
+
+@pytest.mark.parametrize(
+    "runner,command",
+    [(GITHUB_RUNNER, "review-pr"), (GITLAB_RUNNER, "review-mr")],
+)
+def test_runner_cli_starts(runner, command):
+    for args in (["--help"], [command, "--help"]):
+        result = subprocess.run(
+            runner_command(runner, *args),
+            cwd=BACKEND_DIR,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert "usage:" in result.stdout
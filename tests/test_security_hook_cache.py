@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Tests for the bash security hook's verdict cache.
+
+Covers:
+- Repeated commands are answered from the cache without re-parsing
+- Profile changes invalidate cached verdicts
+- Verdicts that depend on repository state are never cached
+- Bounded LRU eviction
+- Benchmark: commands parsed on a recorded command corpus, uncached vs cached
+"""
+
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add apps/backend to path for imports (idempotent guard)
+sys_path = Path(__file__).parent.parent / "apps" / "backend"
+if str(sys_path) not in sys.path:
+    sys.path.insert(0, str(sys_path))
+
+from project.analyzer import ProjectAnalyzer
+from project_analyzer import BASE_COMMANDS
+from security import bash_security_hook, reset_profile_cache, reset_verdict_cache
+from security import hooks as hooks_module
+from security.constants import PROFILE_FILENAME, PROJECT_DIR_ENV_VAR
+from security.verdict_cache import VerdictCache, verdict_cache
+
+# Commands recorded from coder and QA sessions (duplicates kept on purpose)
+COMMAND_CORPUS = [
+    "git status",
+    "git diff --stat",
+    "ls -la",
+    "cat src/app.py",
+    "python -m pytest -q tests/test_app.py",
+    "git add -A && git status --porcelain",
+    "grep -rn 'def main' src | head -20",
+    "npm test",
+    "cd apps/web && npm run lint",
+    "find . -name '*.py' -not -path './node_modules/*' | wc -l",
+    "git status",
+    "pip install -r requirements.txt",
+    "python -c 'import app; print(app.__version__)'",
+    "rm -rf build/",
+    "git log --oneline -10",
+    "ls -la",
+    "pkill -f 'node server.js'",
+    "chmod +x scripts/dev.sh",
+    "cat package.json | jq .scripts",
+    "git diff HEAD~1 -- src/app.py",
+    "python -m pytest -q tests/test_app.py",
+    "curl -s http://localhost:3000/health",
+    "git status",
+    "npm test",
+    "echo $PATH && which python",
+    "sudo rm -rf /",
+    "mkdir -p src/components && touch src/components/Button.tsx",
+    "git diff --stat",
+    "sed -n 1,80p src/app.py",
+    "cat src/app.py",
+]
+
+
+def _write_profile(project_dir: Path, extra_commands: list[str]) -> None:
+    profile = {
+        "base_commands": sorted(BASE_COMMANDS | set(extra_commands)),
+        "stack_commands": [],
+        "script_commands": [],
+        "custom_commands": [],
+        "custom_scripts": {"shell_scripts": []},
+        "project_dir": str(project_dir),
+        "created_at": "",
+        "project_hash": ProjectAnalyzer(project_dir).compute_project_hash(),
+    }
+    profile_file = project_dir / PROFILE_FILENAME
+    profile_file.write_text(json.dumps(profile))
+    # Make sure the mtime changes even on coarse-mtime filesystems
+    st = profile_file.stat()
+    os.utime(profile_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    _write_profile(project_dir, ["python", "pip"])
+    monkeypatch.setenv(PROJECT_DIR_ENV_VAR, str(project_dir))
+    reset_profile_cache()
+    reset_verdict_cache()
+    yield project_dir
+    reset_profile_cache()
+    reset_verdict_cache()
+
+
+def _hook(command: str) -> dict:
+    return asyncio.run(
+        bash_security_hook({"tool_name": "Bash", "tool_input": {"command": command}})
+    )
+
+
+class TestVerdictCache:
+    def test_repeated_commands_are_not_reparsed(self, project):
+        with patch.object(
+            hooks_module, "extract_commands", wraps=hooks_module.extract_commands
+        ) as extract:
+            first = [_hook("git status"), _hook("npm test")]
+            second = [_hook("git status"), _hook("npm test"), _hook("  git status ")]
+
+        assert first == second[:2]
+        assert first[0] == {} and first[1]["decision"] == "block"
+        assert second[2] == {}
+        assert extract.call_count == 2
+        assert verdict_cache.hits == 3
+
+    def test_profile_change_invalidates_verdicts(self, project):
+        assert _hook("npm test")["decision"] == "block"
+
+        _write_profile(project, ["python", "pip", "npm"])
+
+        assert _hook("npm test") == {}
+
+    def test_git_commit_is_always_rescanned(self, project):
+        scans = []
+
+        def scan(command):
+            scans.append(command)
+            return False, "secrets found"
+
+        with patch.dict(hooks_module.VALIDATORS, {"git": scan}):
+            assert _hook("git commit -m 'wip'")["reason"] == "secrets found"
+            assert _hook("git commit -m 'wip'")["reason"] == "secrets found"
+            _hook("git log -1")
+            _hook("git log -1")
+
+        assert scans == ["git commit -m 'wip'", "git commit -m 'wip'", "git log -1"]
+
+    def test_lru_eviction(self):
+        cache = VerdictCache(max_size=2)
+        cache.put(("a",), (True, ""))
+        cache.put(("b",), (True, ""))
+        cache.get(("a",))
+        cache.put(("c",), (False, "no"))
+
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) == (True, "")
+        assert cache.get(("c",)) == (False, "no")
+        assert len(cache) == 2
+
+
+# ============================================================================
+# Benchmark
+# ============================================================================
+
+
+async def _parses(commands: list[str], reset_each_call: bool) -> int:
+    """Run the hook over the commands; returns how many were parsed."""
+    with patch.object(
+        hooks_module, "extract_commands", wraps=hooks_module.extract_commands
+    ) as extract:
+        for command in commands:
+            if reset_each_call:
+                reset_verdict_cache()
+            await bash_security_hook(
+                {"tool_name": "Bash", "tool_input": {"command": command}}
+            )
+    return extract.call_count
+
+
+def test_benchmark_hook_parses(project):
+    corpus = COMMAND_CORPUS * 20
+
+    uncached = asyncio.run(_parses(corpus, reset_each_call=True))
+    reset_verdict_cache()
+    cached = asyncio.run(_parses(corpus, reset_each_call=False))
+
+    assert uncached == len(corpus)
+    # Each distinct command is parsed once; the rest are cache hits
+    assert cached == len(set(corpus))
+    assert verdict_cache.hits == len(corpus) - len(set(corpus))
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental spec creation (spec/pipeline/phase_cache.py).
+
+Covers:
+- Independent phases are grouped into concurrent waves
+- Phases are reused while their inputs are unchanged and re-run when not
+- A phase's own in-place edits don't invalidate it
+- End to end: a re-run reuses every phase, an edited artifact re-runs only
+  the phases downstream of it, and the context-gathering phases overlap
+"""
+
+import asyncio
+import itertools
+import json
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# Add apps/backend to path for imports (idempotent guard)
+sys_path = Path(__file__).parent.parent / "apps" / "backend"
+if str(sys_path) not in sys.path:
+    sys.path.insert(0, str(sys_path))
+
+from spec import phases
+from spec.pipeline import orchestrator as orchestrator_module
+from spec.pipeline.phase_cache import MANIFEST_FILE, PhaseCache, plan_waves
+
+COMPLEX_PHASES = [
+    "historical_context",
+    "research",
+    "context",
+    "spec_writing",
+    "self_critique",
+    "planning",
+    "validation",
+]
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    project_dir = tmp_path / "project"
+    spec_dir = project_dir / ".auto-claude" / "specs" / "001-feature"
+    spec_dir.mkdir(parents=True)
+    (spec_dir / "requirements.json").write_text('{"task_description": "Add a"}')
+    return project_dir, spec_dir
+
+
+class TestPlanWaves:
+    def test_context_phases_run_together(self):
+        assert plan_waves(COMPLEX_PHASES) == [
+            ["historical_context", "research", "context"],
+            ["spec_writing"],
+            ["self_critique"],
+            ["planning"],
+            ["validation"],
+        ]
+
+    def test_uncached_phases_run_alone(self):
+        assert plan_waves(["historical_context", "quick_spec", "validation"]) == [
+            ["historical_context"],
+            ["quick_spec"],
+            ["validation"],
+        ]
+
+
+class TestPhaseCache:
+    def test_unchanged_inputs_are_reused(self, dirs):
+        project_dir, spec_dir = dirs
+        (spec_dir / "research.json").write_text("{}")
+        PhaseCache(project_dir, spec_dir).store("research", "Add a", "summary")
+
+        record = PhaseCache(project_dir, spec_dir).lookup("research", "Add a")
+
+        assert record["summary"] == "summary"
+
+    def test_changed_input_removes_stale_output(self, dirs):
+        project_dir, spec_dir = dirs
+        (spec_dir / "research.json").write_text("{}")
+        cache = PhaseCache(project_dir, spec_dir)
+        cache.store("research", "Add a")
+
+        (spec_dir / "requirements.json").write_text('{"task_description": "Add b"}')
+
+        assert cache.lookup("research", "Add a") is None
+        assert not (spec_dir / "research.json").exists()
+        assert (
+            "research"
+            not in json.loads((spec_dir / MANIFEST_FILE).read_text())["phases"]
+        )
+
+    def test_project_index_only_invalidates_project_phases(self, dirs):
+        project_dir, spec_dir = dirs
+        for name in ("research.json", "context.json"):
+            (spec_dir / name).write_text("{}")
+        cache = PhaseCache(project_dir, spec_dir)
+        cache.store("research", "Add a")
+        cache.store("context", "Add a")
+
+        (project_dir / ".auto-claude" / "project_index.json").write_text("{}")
+
+        assert cache.lookup("research", "Add a") is not None
+        assert cache.lookup("context", "Add a") is None
+
+    def test_own_edits_do_not_invalidate(self, dirs):
+        project_dir, spec_dir = dirs
+        cache = PhaseCache(project_dir, spec_dir)
+        (spec_dir / "spec.md").write_text("# Spec\n")
+        (spec_dir / "critique_report.json").write_text("{}")
+        # Self-critique rewrote spec.md before its fingerprint is taken
+        (spec_dir / "spec.md").write_text("# Spec\n\nFixed.\n")
+        cache.store("self_critique", "Add a")
+
+        assert cache.lookup("self_critique", "Add a") is not None
+
+        (spec_dir / "spec.md").write_text("# Spec\n\nEdited by hand.\n")
+        assert cache.lookup("self_critique", "Add a") is None
+        # spec.md belongs to spec_writing and is kept
+        assert (spec_dir / "spec.md").exists()
+
+
+# ============================================================================
+# End to end through SpecOrchestrator.run()
+# ============================================================================
+
+
+_writes = itertools.count()
+
+
+class FakePhases:
+    """Stands in for the agent-backed phases; writes each phase's outputs."""
+
+    def __init__(self):
+        self.ran: list[str] = []
+        self.running = 0
+        self.peak = 0
+
+    def phase(self, name: str, *writes: str, edits: str | None = None):
+        async def run(executor, *args):
+            self.ran.append(name)
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            await asyncio.sleep(0.02)
+            self.running -= 1
+            for output in writes:
+                # Agents never write the same text twice
+                (executor.spec_dir / output).write_text(f"{name} {next(_writes)}\n")
+            if edits:
+                with open(executor.spec_dir / edits, "a", encoding="utf-8") as f:
+                    f.write(f"{name} edit\n")
+            return phases.PhaseResult(name, True, list(writes), [], 0)
+
+        return run
+
+    def patches(self):
+        table = {
+            "phase_discovery": self.phase("discovery", "project_index.json"),
+            "phase_requirements": self.phase("requirements"),
+            "phase_historical_context": self.phase(
+                "historical_context", "graph_hints.json"
+            ),
+            "phase_research": self.phase("research", "research.json"),
+            "phase_context": self.phase("context", "context.json"),
+            "phase_spec_writing": self.phase("spec_writing", "spec.md"),
+            "phase_self_critique": self.phase(
+                "self_critique", "critique_report.json", edits="spec.md"
+            ),
+            "phase_planning": self.phase("planning", "implementation_plan.json"),
+            "phase_validation": self.phase("validation"),
+        }
+        return [
+            patch.object(phases.PhaseExecutor, name, fake)
+            for name, fake in table.items()
+        ]
+
+
+async def _run_pipeline(project_dir: Path, spec_dir: Path) -> FakePhases:
+    fake = FakePhases()
+    summaries = []
+
+    async def store_summary(self, phase_name):
+        summaries.append(phase_name)
+        self._phase_summaries[phase_name] = f"{phase_name} summary"
+
+    with (
+        patch.object(orchestrator_module, "get_task_logger", MagicMock()),
+        patch.multiple(
+            orchestrator_module.SpecOrchestrator,
+            _ensure_fresh_project_index=AsyncMock(),
+            _create_linear_task_if_enabled=AsyncMock(),
+            _run_review_checkpoint=MagicMock(return_value=True),
+            _store_phase_summary=store_summary,
+        ),
+    ):
+        for p in fake.patches():
+            p.start()
+        try:
+            orchestrator = orchestrator_module.SpecOrchestrator(
+                project_dir=project_dir,
+                spec_dir=spec_dir,
+                complexity_override="complex",
+            )
+            assert await orchestrator.run(interactive=False, auto_approve=True)
+        finally:
+            patch.stopall()
+    fake.summaries = summaries
+    fake.phase_summaries = orchestrator._phase_summaries
+    return fake
+
+
+class TestIncrementalPipeline:
+    async def test_rerun_reuses_unchanged_phases(self, dirs):
+        project_dir, spec_dir = dirs
+        first = await _run_pipeline(project_dir, spec_dir)
+        assert first.peak == 3  # historical_context, research and context
+
+        second = await _run_pipeline(project_dir, spec_dir)
+
+        # Requirements and validation are never cached
+        assert second.ran == ["requirements", "validation"]
+        assert second.summaries == ["requirements", "validation"]
+        # Cached summaries still reach later phases
+        assert second.phase_summaries["spec_writing"] == "spec_writing summary"
+
+    async def test_edited_artifact_reruns_downstream_phases(self, dirs):
+        project_dir, spec_dir = dirs
+        await _run_pipeline(project_dir, spec_dir)
+
+        (spec_dir / "research.json").write_text('{"packages": ["httpx"]}')
+        rerun = await _run_pipeline(project_dir, spec_dir)
+
+        assert rerun.ran == [
+            "requirements",
+            "spec_writing",
+            "self_critique",
+            "planning",
+            "validation",
+        ]
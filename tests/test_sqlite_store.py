@@ -0,0 +1,86 @@
+"""
+Tests for the SQLite Store Base
+===============================
+
+Tests the connection and transaction handling shared by the SQLite-backed
+stores (core/sqlite_store.py).
+
+Covers:
+- One WAL connection per thread, closed per thread
+- Transactions commit on success and roll back when the block raises
+- Trimming keeps the most recently inserted rows
+"""
+
+import sqlite3
+import threading
+
+import pytest
+from core.sqlite_store import SQLiteStore
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteStore(tmp_path / "nested" / "items.db", _SCHEMA)
+    yield store
+    store.close()
+
+
+def _keys(store):
+    return [row[0] for row in store._connect().execute("SELECT key FROM items")]
+
+
+def test_connections_are_per_thread(store):
+    conn = store._connect()
+    other = []
+    thread = threading.Thread(target=lambda: other.append(store._connect()))
+    thread.start()
+    thread.join()
+
+    assert store._connect() is conn
+    assert other[0] is not conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    store.close()
+    assert store._connect() is not conn
+
+
+def test_row_factory(tmp_path):
+    class RowStore(SQLiteStore):
+        row_factory = sqlite3.Row
+
+    store = RowStore(tmp_path / "rows.db", _SCHEMA)
+    with store._transaction() as conn:
+        conn.execute("INSERT INTO items VALUES ('a', '1')")
+        assert conn.execute("SELECT * FROM items").fetchone()["value"] == "1"
+    store.close()
+
+
+def test_transaction_rolls_back_on_error(store):
+    with store._transaction() as conn:
+        conn.execute("INSERT INTO items VALUES ('kept', '1')")
+
+    with pytest.raises(RuntimeError):
+        with store._transaction() as conn:
+            conn.execute("INSERT INTO items VALUES ('dropped', '2')")
+            raise RuntimeError("boom")
+
+    assert _keys(store) == ["kept"]
+    assert not store._connect().in_transaction
+
+
+def test_trim_keeps_most_recent_rows(store):
+    with store._transaction() as conn:
+        for i in range(5):
+            conn.execute("INSERT INTO items VALUES (?, ?)", (f"k{i}", "v"))
+        # Replacing an old row makes it the most recent one
+        conn.execute("INSERT OR REPLACE INTO items VALUES ('k0', 'new')")
+        store._trim(conn, "items", 3)
+
+    assert sorted(_keys(store)) == ["k0", "k3", "k4"]
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Tests for change-impacted test selection (analysis/test_impact.py).
+
+Covers:
+- Tests reaching a changed file through the import graph, transitively
+- Naming conventions (test_x.py, x.test.ts, __tests__/x.ts) scoped to the
+  changed file's ancestors
+- Fallback to the full suite when the mapping is uncertain
+- Commands that run only the selected files
+- Running the selected subset of a fixture repo
+- run_tests passing, with nothing run, when no test is impacted
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add apps/backend and the GitHub runner's services to path for imports
+# (idempotent guard)
+sys_path = Path(__file__).parent.parent / "apps" / "backend"
+for path in (
+    sys_path / "runners" / "github" / "services",
+    sys_path / "runners" / "github",
+    sys_path,
+):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from analysis.import_graph import clear_import_graphs
+from analysis.test_discovery import (
+    TestDiscovery,
+    TestDiscoveryResult,
+    TestFramework,
+)
+from analysis.test_impact import select_impacted_tests, selected_test_command
+from review_tools import run_tests
+
+FIXTURE = {
+    "pytest.ini": "[pytest]\ntestpaths = tests\n",
+    "shop/__init__.py": "",
+    "shop/money.py": "def cents(amount):\n    return round(amount * 100)\n",
+    "shop/billing.py": (
+        "from shop.money import cents\n\n\n"
+        "def charge(amount):\n    return cents(amount)\n"
+    ),
+    "shop/catalog.py": "ITEMS = ['book']\n",
+    "shop/orphan.py": "VALUE = 1\n",
+    "tests/test_billing.py": (
+        "from shop.billing import charge\n\n\n"
+        "def test_charge():\n    assert charge(1.5) == 150\n"
+    ),
+    "tests/test_catalog.py": (
+        "from shop.catalog import ITEMS\n\n\n"
+        "def test_items():\n    assert ITEMS == []  # Fails: proves it didn't run\n"
+    ),
+    "tests/fixtures/orders.json": "[]\n",
+    "web/src/format.ts": "export const format = (s: string) => s.trim();\n",
+    "web/src/format.test.ts": "import { format } from './format';\n",
+    "web/src/__tests__/layout.tsx": "it('renders', () => {});\n",
+    "web/src/layout.tsx": "export const Layout = () => null;\n",
+    "admin/tests/test_money.py": "def test_unrelated():\n    pass\n",
+    "README.md": "# Shop\n",
+}
+
+
+@pytest.fixture
+def project(tmp_path):
+    clear_import_graphs()
+    for rel_path, content in FIXTURE.items():
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    yield tmp_path
+    clear_import_graphs()
+
+
+class TestSelection:
+    def test_transitive_importers_and_naming(self, project):
+        selection = select_impacted_tests(project, ["shop/money.py"])
+
+        # test_billing imports money through billing; admin/tests/test_money.py
+        # is named after it but belongs to another package
+        assert selection.full_suite is False
+        assert selection.test_files == ["tests/test_billing.py"]
+
+    def test_js_naming_conventions(self, project):
+        selection = select_impacted_tests(
+            project, ["web/src/format.ts", "web/src/layout.tsx"]
+        )
+
+        assert selection.test_files == [
+            "web/src/__tests__/layout.tsx",
+            "web/src/format.test.ts",
+        ]
+
+    def test_changed_tests_select_themselves(self, project):
+        selection = select_impacted_tests(
+            project, ["tests/test_catalog.py", "README.md"]
+        )
+
+        assert selection.test_files == ["tests/test_catalog.py"]
+
+    def test_unmapped_files_are_reported(self, project):
+        selection = select_impacted_tests(
+            project, ["shop/billing.py", "shop/orphan.py"]
+        )
+
+        assert selection.test_files == ["tests/test_billing.py"]
+        assert selection.unmapped_files == ["shop/orphan.py"]
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            ["pytest.ini"],
+            ["tests/conftest.py"],
+            ["shop/billing.py", "tests/fixtures/orders.json"],
+            ["shop/billing.py", "services/api/main.go"],
+            ["shop/removed.py"],
+            ["shop/orphan.py"],
+        ],
+    )
+    def test_uncertain_mapping_runs_full_suite(self, project, changed):
+        assert select_impacted_tests(project, changed).full_suite is True
+
+    def test_docs_only_change_selects_nothing(self, project):
+        selection = select_impacted_tests(project, ["README.md"])
+
+        assert selection.full_suite is False
+        assert selection.test_files == []
+
+
+class TestSelectedCommand:
+    def _info(self, name, command):
+        return TestDiscoveryResult(
+            frameworks=[TestFramework(name=name, type="unit", command=command)],
+            test_command=command,
+            has_tests=True,
+        )
+
+    def test_commands(self):
+        files = ["tests/test_a.py", "web/a b.test.ts"]
+
+        assert (
+            selected_test_command(self._info("pytest", "pytest"), files)
+            == "pytest tests/test_a.py"
+        )
+        assert (
+            selected_test_command(
+                self._info("unittest", "python -m unittest discover"), files
+            )
+            == "python -m unittest tests/test_a.py"
+        )
+        assert (
+            selected_test_command(self._info("jest", "pnpm test"), files)
+            == "pnpm test -- 'web/a b.test.ts'"
+        )
+        assert (
+            selected_test_command(self._info("vitest", "npx vitest run"), files)
+            == "npx vitest run 'web/a b.test.ts'"
+        )
+
+    def test_frameworks_without_file_arguments(self):
+        assert (
+            selected_test_command(self._info("go_test", "go test ./..."), ["a_test.go"])
+            is None
+        )
+
+
+class TestFixtureRepo:
+    def _run(self, project, command):
+        # Run with this interpreter's pytest, the way run_tests runs commands
+        command = command.replace(
+            "pytest", f"{sys.executable} -m pytest -p no:cacheprovider", 1
+        )
+        return subprocess.run(
+            command, shell=True, cwd=project, capture_output=True, text=True
+        )
+
+    def test_selected_subset_runs_and_passes(self, project):
+        test_info = TestDiscovery().discover(project)
+        selection = select_impacted_tests(project, ["shop/money.py"])
+
+        command = selected_test_command(test_info, selection.test_files)
+        selected = self._run(project, command)
+        full_suite = self._run(project, test_info.test_command)
+
+        assert command == "pytest tests/test_billing.py"
+        assert selected.returncode == 0, selected.stdout
+        assert "1 passed" in selected.stdout
+        # test_catalog.py fails: the full suite is what the selection avoids
+        assert full_suite.returncode != 0
+
+    async def test_docs_only_change_passes_without_running(self, project):
+        result = await run_tests(project, changed_files=["README.md"])
+
+        assert result.skipped is True
+        assert result.passed is True
+        assert result.executed is False
+        assert result.error is None
+        assert result.test_files == []